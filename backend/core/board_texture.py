@@ -0,0 +1,187 @@
+"""
+Precomputed board texture table.
+
+Board texture depends only on the board's rank multiset and how its suits
+are distributed, so every board reduces to a small signature and the
+features are computed once per signature. At startup the table fills in
+every flop: all 22,100 flop bitmasks point at the texture of their
+signature, which covers all 1,755 canonical flops. Turn and river
+textures are derived incrementally from the previous street by adding one
+card's rank and suit to the signature, and memoized per signature.
+
+Boards are 52-bit masks with bit ``rank_index * 4 + suit_index``, so
+``lookup(mask)`` on a flop is a single dict access.
+
+``get_texture_table()`` returns the shared table used by postflop bots and
+hands-review annotations.
+"""
+
+from itertools import combinations
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+
+CARD_BIT = {r + s: 1 << (ri * 4 + si) for ri, r in enumerate(RANKS) for si, s in enumerate(SUITS)}
+SUIT_MASKS = tuple(sum(1 << (ri * 4 + si) for ri in range(13)) for si in range(4))
+
+# Turn/river masks remembered before the memo is reset
+MAX_LATER_BOARDS = 100000
+
+# (sorted rank values with multiplicity, suit counts high to low)
+Signature = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+class BoardTexture(NamedTuple):
+    type: str  # "dry", "medium" or "wet"
+    wetness: float  # largest suit group / board size
+    dynamism: float  # share of adjacent ranks within two of each other
+    paired: bool
+    trips: bool
+    max_suit: int
+    flush_possible: bool  # three or more of one suit
+    flush_draw: bool  # two of a suit with cards to come
+    straight_possible: bool  # three distinct ranks fit in a five-rank window
+    straight_draw: bool  # two ranks in a straight window with cards to come
+    high_card: str  # "ace", "broadway", "middle" or "low"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+def board_mask(cards: Iterable[str]) -> int:
+    mask = 0
+    for card in cards:
+        mask |= CARD_BIT[card]
+    return mask
+
+
+def _mask_signature(mask: int) -> Signature:
+    values = []
+    for ri in range(13):
+        count = bin((mask >> (ri * 4)) & 0xF).count("1")
+        values.extend([ri + 2] * count)
+    suits = sorted((bin(mask & m).count("1") for m in SUIT_MASKS), reverse=True)
+    return tuple(values), tuple(c for c in suits if c)
+
+
+def _max_in_window(values: Tuple[int, ...]) -> int:
+    """Most distinct ranks inside any five-rank straight window (aces play low too)."""
+    distinct = set(values)
+    if 14 in distinct:
+        distinct.add(1)
+    return max(sum(1 for v in range(low, low + 5) if v in distinct) for low in range(1, 11))
+
+
+def compute_texture(signature: Signature) -> BoardTexture:
+    values, suit_counts = signature
+    n = len(values)
+    max_suit = suit_counts[0] if suit_counts else 0
+    wetness = max_suit / n
+
+    connected = sum(1 for a, b in zip(values, values[1:]) if b - a <= 2)
+    dynamism = connected / (n - 1) if n > 1 else 0.0
+
+    if wetness >= 0.6 or dynamism >= 0.7:
+        board_type = "wet"
+    elif wetness <= 0.4 and dynamism <= 0.3:
+        board_type = "dry"
+    else:
+        board_type = "medium"
+
+    ranks_in_window = _max_in_window(values)
+    cards_to_come = 5 - n
+    top = values[-1]
+    return BoardTexture(
+        type=board_type,
+        wetness=wetness,
+        dynamism=dynamism,
+        paired=n != len(set(values)),
+        trips=any(values.count(v) >= 3 for v in set(values)),
+        max_suit=max_suit,
+        flush_possible=max_suit >= 3,
+        flush_draw=max_suit == 2 and cards_to_come > 0,
+        straight_possible=ranks_in_window >= 3,
+        straight_draw=ranks_in_window == 2 and cards_to_come > 0,
+        high_card="ace" if top == 14 else "broadway" if top >= 10 else "middle" if top >= 7 else "low",
+    )
+
+
+class TextureTable:
+    """Board texture by bitmask: flops precomputed, turns and rivers derived incrementally."""
+
+    def __init__(self):
+        self._by_signature: Dict[Signature, BoardTexture] = {}
+        self._flops: Dict[int, BoardTexture] = {}
+        self._signatures: Dict[int, Signature] = {}
+        self._later: Dict[int, BoardTexture] = {}
+        self._build_flops()
+
+    def _build_flops(self) -> None:
+        cards = [(bit, RANKS.index(card[0]) + 2, card[1]) for card, bit in CARD_BIT.items()]
+        for (b1, v1, s1), (b2, v2, s2), (b3, v3, s3) in combinations(cards, 3):
+            mask = b1 | b2 | b3
+            if s1 == s2 == s3:
+                suits = (3,)
+            elif s1 == s2 or s1 == s3 or s2 == s3:
+                suits = (2, 1)
+            else:
+                suits = (1, 1, 1)
+            signature = (tuple(sorted((v1, v2, v3))), suits)
+            texture = self._by_signature.get(signature)
+            if texture is None:
+                texture = self._by_signature[signature] = compute_texture(signature)
+            self._flops[mask] = texture
+            self._signatures[mask] = signature
+
+    def _texture(self, signature: Signature) -> BoardTexture:
+        texture = self._by_signature.get(signature)
+        if texture is None:
+            texture = self._by_signature[signature] = compute_texture(signature)
+        return texture
+
+    def lookup(self, mask: int) -> BoardTexture:
+        texture = self._flops.get(mask) or self._later.get(mask)
+        if texture is None:
+            texture = self._remember(mask, self._texture(_mask_signature(mask)))
+        return texture
+
+    def lookup_cards(self, board: Iterable[str]) -> BoardTexture:
+        return self.lookup(board_mask(board))
+
+    def extend(self, mask: int, card: str) -> Tuple[int, BoardTexture]:
+        """Texture after dealing ``card`` onto board ``mask`` (turn or river)."""
+        bit = CARD_BIT[card]
+        signature = self._signatures.get(mask) or _mask_signature(mask)
+        values, suit_counts = signature
+        rank_value = RANKS.index(card[0]) + 2
+        suit_count = bin(mask & SUIT_MASKS[SUITS.index(card[1])]).count("1")
+
+        counts = list(suit_counts)
+        if suit_count:
+            counts[counts.index(suit_count)] += 1
+        else:
+            counts.append(1)
+        new_signature = (tuple(sorted(values + (rank_value,))), tuple(sorted(counts, reverse=True)))
+        new_mask = mask | bit
+        return new_mask, self._remember(new_mask, self._texture(new_signature))
+
+    def _remember(self, mask: int, texture: BoardTexture) -> BoardTexture:
+        if len(self._later) >= MAX_LATER_BOARDS:
+            self._later.clear()
+        self._later[mask] = texture
+        return texture
+
+    @property
+    def num_signatures(self) -> int:
+        return len(self._by_signature)
+
+
+_texture_table: Optional[TextureTable] = None
+
+
+def get_texture_table() -> TextureTable:
+    global _texture_table
+    if _texture_table is None:
+        _texture_table = TextureTable()
+    return _texture_table
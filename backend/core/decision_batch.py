@@ -0,0 +1,20 @@
+"""
+Batch decision helpers.
+
+Engines that can decide many points at once expose
+``get_decisions_batch(requests)``, where each request is the argument tuple
+their ``get_decision`` takes, and return decisions in request order.
+``decide_batch`` calls it when available and falls back to one
+``get_decision`` per request otherwise.
+"""
+
+from typing import Any, List, Sequence, Tuple
+
+
+def decide_batch(engine, requests: Sequence[Tuple[Any, ...]]) -> List[Any]:
+    """Decisions for ``requests`` from ``engine``, batched when it supports it."""
+    batch = getattr(engine, "get_decisions_batch", None)
+    if callable(batch):
+        return list(batch(requests))
+    return [engine.get_decision(*request) for request in requests]
+
@@ -14,11 +14,32 @@ Key principles:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from .hand_model import ActionType
 from .poker_types import Player
 
 
+class SimpleGameState:
+    """GameState-like view of a game state dict, as strategies expect."""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.players = data.get('players', [])
+        self.board = data.get('board', [])
+        self.pot = data.get('pot', 0.0)
+        self.current_bet = data.get('current_bet', 0.0)
+        self.street = data.get('street', 'preflop')
+        self.dealer_position = data.get('dealer_position', 0)
+        self.action_player = data.get('action_player', 0)
+        self.big_blind = data.get('big_blind', 2.0)
+        # Smallest legal raise increment; at least a big blind
+        self.min_raise = data.get('min_raise') or self.big_blind
+
+
+def _as_game_state(game_state):
+    # Create a simple GameState-like object with required attributes
+    return SimpleGameState(game_state) if isinstance(game_state, dict) else game_state
+
+
 class DecisionEngine(ABC):
     """
     Abstract base class for poker decision engines.
@@ -60,6 +81,15 @@ class DecisionEngine(ABC):
         """Reset the decision engine to its initial state."""
         pass
     
+    def get_decisions_batch(self, requests: Sequence[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Get decisions for many (player_index, game_state) points, in order.
+        
+        Engines that can share work across decision points (parallel tables,
+        corpus analysis) override this; the default asks one at a time.
+        """
+        return [self.get_decision(player_index, game_state) for player_index, game_state in requests]
+    
     def get_session_info(self) -> Dict[str, Any]:
         """
         Get information about the current session state.
@@ -115,76 +145,25 @@ class GTODecisionEngine(DecisionEngine):
         strategy = self.gto_strategies[player_index]
         
         try:
-            # Extract player and game state information
-            players = game_state.get('players', [])
-            if player_index >= len(players):
-                raise IndexError(f"Player index {player_index} out of range")
-            
-            # Get player dict and convert to Player object
-            player_dict = players[player_index]
-            
-            # Import Player class
-            from .poker_types import Player
-            
-            # Create a proper Player object from the dictionary
-            player = Player(
-                name=player_dict.get('name', f'Player_{player_index}'),
-                stack=player_dict.get('stack', 1000.0),
-                position=self._get_position_name(player_index, len(players)),
-                is_human=player_dict.get('is_human', False),
-                is_active=not player_dict.get('has_folded', False),
-                cards=player_dict.get('cards', []),
-                current_bet=player_dict.get('current_bet', 0.0)
-            )
-            
-            # Set additional attributes that might be useful
-            player.index = player_index
+            player = self._make_player(player_index, game_state)
             
             print(f"🎯 GTO_PLAYER_CREATED: {player.name} at {player.position} with cards {player.cards}")
             print(f"🎯 GTO_PLAYER_CREATED: Stack=${player.stack}, bet=${player.current_bet}")
             
             
             # Convert game_state dict to GameState object if needed
-            if isinstance(game_state, dict):
-                # Create a simple GameState-like object with required attributes
-                class SimpleGameState:
-                    def __init__(self, data):
-                        self.players = data.get('players', [])
-                        self.board = data.get('board', [])
-                        self.pot = data.get('pot', 0.0)
-                        self.current_bet = data.get('current_bet', 0.0)
-                        self.street = data.get('street', 'preflop')
-                        self.dealer_position = data.get('dealer_position', 0)
-                        self.action_player = data.get('action_player', 0)
-                
-                game_state_obj = SimpleGameState(game_state)
-            else:
-                game_state_obj = game_state
+            game_state_obj = _as_game_state(game_state)
             
             # Get GTO decision using the improved strategy engine
             print(f"🎯 GTO_STRATEGY_INPUT: Position={player.position}, Cards={player.cards}")
             print(f"🎯 GTO_STRATEGY_INPUT: Street={game_state_obj.street}, Current_bet={game_state_obj.current_bet}")
             print(f"🎯 GTO_STRATEGY_INPUT: Player_bet={player.current_bet}, Stack=${player.stack}")
             
-            action, amount = strategy.get_gto_action(player, game_state_obj)
+            action, amount = strategy.get_gto_bot_action(player, game_state_obj)
             
             print(f"🎯 GTO_STRATEGY_OUTPUT: Action={action}, Amount={amount}")
             
-            
-            self.decision_count += 1
-            
-            # Create explanation based on action and street
-            street = game_state.get('street', 'preflop')
-            explanation = self._generate_explanation(action, amount, street, player)
-            
-            # Return formatted decision
-            return {
-                'action': action,
-                'amount': amount,
-                'explanation': explanation,
-                'confidence': 0.8,  # GTO decisions have high confidence
-                'decision_number': self.decision_count
-            }
+            return self._format_decision(action, amount, game_state, player)
             
         except Exception as e:
             # Debug: Log the actual error to understand what's failing
@@ -204,6 +183,100 @@ class GTODecisionEngine(DecisionEngine):
                 'confidence': 0.0
             }
     
+    def get_decisions_batch(self, requests: Sequence[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Get decisions for many (player_index, game_state) points at once.
+        
+        Each distinct game state is converted once, strategies that support
+        it decide their share of the batch in one call (sharing hand and
+        board features), and per-decision debug logging is skipped.
+        Decisions are returned in request order.
+        """
+        decisions: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        views: Dict[int, Any] = {}
+        groups: Dict[int, List[Tuple[int, Player, Dict[str, Any]]]] = {}
+        
+        for slot, (player_index, game_state) in enumerate(requests):
+            if player_index not in self.gto_strategies:
+                decisions[slot] = self._fallback_decision(f"Invalid player index {player_index}")
+                continue
+            try:
+                player = self._make_player(player_index, game_state)
+            except Exception as e:
+                decisions[slot] = self._fallback_decision(f"GTO engine error: {str(e)}")
+                continue
+            if id(game_state) not in views:
+                views[id(game_state)] = _as_game_state(game_state)
+            groups.setdefault(player_index, []).append((slot, player, game_state))
+        
+        for player_index, items in groups.items():
+            strategy = self.gto_strategies[player_index]
+            points = [(player, views[id(game_state)]) for _, player, game_state in items]
+            try:
+                if hasattr(strategy, 'get_gto_bot_actions_batch'):
+                    actions = strategy.get_gto_bot_actions_batch(points)
+                else:
+                    actions = [strategy.get_gto_bot_action(player, state) for player, state in points]
+            except Exception as e:
+                print(f"🚨 GTO_ENGINE_ERROR: batch for player {player_index}: {e}")
+                for slot, _, _ in items:
+                    decisions[slot] = self._fallback_decision(f"GTO engine error: {str(e)}")
+                continue
+            for (slot, player, game_state), (action, amount) in zip(items, actions):
+                decisions[slot] = self._format_decision(action, amount, game_state, player)
+        
+        return decisions
+    
+    def _make_player(self, player_index: int, game_state: Dict[str, Any]) -> Player:
+        """Player object for ``player_index`` from a game state dict."""
+        # Extract player and game state information
+        players = game_state.get('players', [])
+        if player_index >= len(players):
+            raise IndexError(f"Player index {player_index} out of range")
+        
+        # Get player dict and convert to Player object
+        player_dict = players[player_index]
+        
+        # Create a proper Player object from the dictionary
+        player = Player(
+            name=player_dict.get('name', f'Player_{player_index}'),
+            stack=player_dict.get('stack', 1000.0),
+            position=self._get_position_name(player_index, len(players)),
+            is_human=player_dict.get('is_human', False),
+            is_active=not player_dict.get('has_folded', False),
+            cards=player_dict.get('cards', []),
+            current_bet=player_dict.get('current_bet', 0.0)
+        )
+        
+        # Set additional attributes that might be useful
+        player.index = player_index
+        return player
+    
+    def _format_decision(self, action: ActionType, amount: float, game_state: Dict[str, Any], player) -> Dict[str, Any]:
+        self.decision_count += 1
+        
+        # Create explanation based on action and street
+        street = game_state.get('street', 'preflop')
+        explanation = self._generate_explanation(action, amount, street, player)
+        
+        # Return formatted decision
+        return {
+            'action': action,
+            'amount': amount,
+            'explanation': explanation,
+            'confidence': 0.8,  # GTO decisions have high confidence
+            'decision_number': self.decision_count
+        }
+    
+    @staticmethod
+    def _fallback_decision(explanation: str) -> Dict[str, Any]:
+        return {
+            'action': ActionType.FOLD,
+            'amount': 0.0,
+            'explanation': explanation,
+            'confidence': 0.0
+        }
+    
     def _generate_explanation(self, action: ActionType, amount: float, street: str, player) -> str:
         """Generate a human-readable explanation for the GTO decision."""
         position = getattr(player, 'position', 'Unknown')
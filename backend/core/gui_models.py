@@ -18,9 +18,11 @@ Version 2.0 (2025-07-29) - Professional Theme Enhancement
 
 import json
 import os
-from typing import List, Dict, Any, Optional, Set
+from typing import Callable, List, Dict, Any, Optional, Set
 from dataclasses import dataclass, field
 
+from .preflop_lookup import normalize_notation, tier_for_strength
+
 # --- Professional Poker App Theme (User's Final Design) ---
 THEME = {
     # Base Colors - User's final professional color scheme
@@ -333,6 +335,10 @@ class StrategyData:
     tiers: List[HandStrengthTier] = field(default_factory=list)
     strategy_dict: Dict[str, Any] = field(default_factory=dict)
     current_strategy_file: Optional[str] = None
+    # Dense tables for bots (see strategy_compiler); replaced whole on reload
+    compiled: Optional[Any] = field(default=None, repr=False, compare=False)
+    # (watcher, listener) registered by watch_strategy_file
+    _watch: Optional[Any] = field(default=None, repr=False, compare=False)
 
     def add_tier(self, tier: HandStrengthTier):
         """Adds a new tier and sorts the list by strength."""
@@ -455,6 +461,7 @@ class StrategyData:
             self.strategy_dict = strategy_data
             self._create_tiers_from_strategy(strategy_data)
             self.current_strategy_file = filename
+            self._compile_current_strategy()
             return True
         except Exception as e:
             print(f"⚠️ Error loading strategy file, generating default: {e}")
@@ -467,15 +474,85 @@ class StrategyData:
             print(f"💾 Saved default strategy to {default_filename}")
             return True
 
+    def _compile_current_strategy(self):
+        """Compile the loaded strategy file into dense tables (best effort)."""
+        try:
+            try:
+                from .strategy_compiler import compile_file
+            except ImportError:
+                from core.strategy_compiler import compile_file
+            self.compiled = compile_file(self.current_strategy_file)
+        except Exception as e:
+            print(f"⚠️ Could not compile strategy file: {e}")
+            self.compiled = None
+
+    def watch_strategy_file(self, interval: float = 1.0,
+                            dispatch: Optional[Callable[[Callable[[], None]], None]] = None):
+        """
+        Hot-reload the current strategy file: when it changes on disk the
+        compiled tables, strategy dict and tiers are replaced without a restart.
+        All three come from the same read of the file and each is replaced
+        whole. Pass ``dispatch`` (e.g. ``lambda fn: root.after(0, fn)``) to
+        apply the swap on the UI thread instead of the watcher thread.
+        Returns the watcher (or None if there is no file to watch).
+        """
+        if not self.current_strategy_file or not os.path.exists(self.current_strategy_file):
+            return None
+        try:
+            from .strategy_compiler import get_strategy_watcher
+        except ImportError:
+            from core.strategy_compiler import get_strategy_watcher
+
+        watcher = get_strategy_watcher(self.current_strategy_file)
+        watcher.interval = interval
+        self.stop_watching()
+        self.compiled = watcher.current
+
+        def on_reload(compiled, strategy_data):
+            try:
+                tiers = self._tiers_from_strategy(strategy_data)
+            except Exception as e:
+                print(f"⚠️ Strategy reload: keeping current strategy ({e})")
+                return
+
+            def apply():
+                self.strategy_dict = strategy_data
+                if tiers is not None:
+                    self.tiers = tiers
+                self.compiled = compiled
+
+            if dispatch is None:
+                apply()
+            else:
+                dispatch(apply)
+
+        watcher.add_listener(on_reload)
+        self._watch = (watcher, on_reload)
+        watcher.start()
+        return watcher
+
+    def stop_watching(self):
+        """Detach from the strategy watcher registered by watch_strategy_file."""
+        if self._watch is not None:
+            watcher, listener = self._watch
+            watcher.remove_listener(listener)
+            self._watch = None
+
     def _create_tiers_from_strategy(self, strategy_data: Dict[str, Any]):
         """Creates tiers from strategy data."""
-        self.tiers.clear()
+        tiers = self._tiers_from_strategy(strategy_data)
+        if tiers is None:
+            self.load_default_tiers()
+            return
+        self.tiers = tiers
+
+    def _tiers_from_strategy(self, strategy_data: Dict[str, Any]) -> Optional[List[HandStrengthTier]]:
+        """New tier list for strategy data; None if it has no preflop table."""
         hand_strength_table = strategy_data.get(
             "hand_strength_tables", {}
         ).get("preflop", {})
         if not hand_strength_table:
-            self.load_default_tiers()
-            return
+            return None
 
         tier_colors = {
             "Premium": "#FF0000",
@@ -486,18 +563,10 @@ class StrategyData:
         }
         strength_groups = {}
         for hand, strength in hand_strength_table.items():
-            if strength >= 80:
-                tier_name, min_hs, max_hs = "Premium", 80, 100
-            elif strength >= 65:
-                tier_name, min_hs, max_hs = "Strong", 65, 79
-            elif strength >= 50:
-                tier_name, min_hs, max_hs = "Playable", 50, 64
-            elif strength >= 35:
-                tier_name, min_hs, max_hs = "Speculative", 35, 49
-            elif strength >= 20:
-                tier_name, min_hs, max_hs = "Marginal", 20, 34
-            else:
+            band = tier_for_strength(strength)
+            if band is None:
                 continue  # Skip unplayable hands
+            tier_name, min_hs, max_hs = band
 
             if tier_name not in strength_groups:
                 strength_groups[tier_name] = {
@@ -508,9 +577,9 @@ class StrategyData:
                 }
             strength_groups[tier_name]["hands"].add(hand)
 
-        for tier_name, data in strength_groups.items():
-            self.tiers.append(HandStrengthTier(name=tier_name, **data))
-        self.tiers.sort(key=lambda t: t.min_hs, reverse=True)
+        tiers = [HandStrengthTier(name=tier_name, **data) for tier_name, data in strength_groups.items()]
+        tiers.sort(key=lambda t: t.min_hs, reverse=True)
+        return tiers
 
     def save_strategy_to_file(self, filename: str) -> bool:
         """Saves current strategy data to a JSON file."""
@@ -987,6 +1056,11 @@ class HandFormatHelper:
     @staticmethod
     def normalize_hand_format(hand: str) -> str:
         """Normalize hand format to standard notation."""
+        # Known hole cards / hand classes come straight from the preflop table
+        notation = normalize_notation(hand)
+        if notation is not None:
+            return notation
+
         # Remove any extra spaces and convert to uppercase
         hand = hand.strip().upper()
 
@@ -0,0 +1,151 @@
+"""
+Precomputed preflop lookup.
+
+Every ordered pair of hole cards (2,652 of them, i.e. all 1,326 combos in
+both orders) maps to a ``PreflopEntry`` with the hand's notation
+("AKs", "TT", "72o"), its index in the 13x13 hand grid, the engine's
+preflop strength (0-100) and its tier. Hole cards can be given as strings
+(``"Ah", "Kd"``) or as card ints (``rank_index * 4 + suit_index``, the
+layout used by ``board_texture`` and the solver), so a decision-time
+lookup is a single dict or list access.
+
+The grid is aces first: pairs on the diagonal, suited hands above it,
+offsuit below. ``GRID[row][col]`` is the notation shown in that cell.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+RANK_VALUES: Dict[str, int] = {r: i + 2 for i, r in enumerate(RANKS)}
+CARD_INDEX: Dict[str, int] = {r + s: ri * 4 + si for ri, r in enumerate(RANKS) for si, s in enumerate(SUITS)}
+
+# Tier bands (name, min_hs, max_hs); hands below the last band are unplayable
+TIERS: Tuple[Tuple[str, int, int], ...] = (
+    ("Premium", 80, 100),
+    ("Strong", 65, 79),
+    ("Playable", 50, 64),
+    ("Speculative", 35, 49),
+    ("Marginal", 20, 34),
+)
+
+_GRID_RANKS = RANKS[::-1]
+
+
+def _grid() -> Tuple[Tuple[str, ...], ...]:
+    rows = []
+    for i, high in enumerate(_GRID_RANKS):
+        row = []
+        for j, low in enumerate(_GRID_RANKS):
+            if i == j:
+                row.append(high + high)
+            elif i < j:
+                row.append(high + low + "s")
+            else:
+                row.append(low + high + "o")
+        rows.append(tuple(row))
+    return tuple(rows)
+
+
+GRID = _grid()
+HAND_CLASSES: Tuple[str, ...] = tuple(hand for row in GRID for hand in row)
+HAND_INDEX: Dict[str, int] = {hand: i for i, hand in enumerate(HAND_CLASSES)}
+
+
+class PreflopEntry(NamedTuple):
+    notation: str
+    index: int  # position in HAND_CLASSES / GRID (row * 13 + col)
+    strength: int  # 0-100, GTOStrategyEngine's preflop scale
+    tier: Optional[str]
+
+
+def tier_for_strength(strength: float) -> Optional[Tuple[str, int, int]]:
+    """(name, min_hs, max_hs) of the tier band holding ``strength``, or None."""
+    for band in TIERS:
+        if strength >= band[1]:
+            return band
+    return None
+
+
+def _strength(high: int, low: int, suited: bool) -> int:
+    """Rule-based preflop strength for rank values ``high >= low``."""
+    if high == low:
+        if high >= 14:
+            return 95  # AA
+        elif high >= 12:
+            return 90  # KK, QQ
+        elif high >= 10:
+            return 85  # JJ, TT
+        elif high >= 8:
+            return 80  # 99, 88
+        elif high >= 6:
+            return 75  # 77, 66
+        return 70 + high  # 55-22
+
+    if suited:
+        if high == 14:
+            return 85  # any suited ace
+        elif high >= 12:
+            return 70 + low
+        return 60 + low
+
+    if high == 14:
+        return 80  # any offsuit ace
+    elif high >= 12:
+        return 65 + low
+    return 55 + low
+
+
+def _entry(a: int, b: int) -> PreflopEntry:
+    high, low = max(a // 4, b // 4), min(a // 4, b // 4)
+    suited = a % 4 == b % 4
+    if high == low:
+        notation = RANKS[high] * 2
+    else:
+        notation = RANKS[high] + RANKS[low] + ("s" if suited else "o")
+    strength = _strength(high + 2, low + 2, suited)
+    band = tier_for_strength(strength)
+    return PreflopEntry(notation, HAND_INDEX[notation], strength, band[0] if band else None)
+
+
+# [a * 52 + b] for card ints a != b; None on the diagonal
+_BY_INT: List[Optional[PreflopEntry]] = [
+    _entry(a, b) if a != b else None for a in range(52) for b in range(52)
+]
+_BY_CARDS: Dict[Tuple[str, str], PreflopEntry] = {
+    (ca, cb): _BY_INT[a * 52 + b]
+    for ca, a in CARD_INDEX.items() for cb, b in CARD_INDEX.items() if a != b
+}
+
+# Class notation in any case / rank order -> canonical notation ("kas" -> "AKs")
+_CLASS_ALIASES: Dict[str, str] = {}
+for _hand in HAND_CLASSES:
+    for _alias in (_hand, _hand[1] + _hand[0] + _hand[2:]):
+        _CLASS_ALIASES[_alias.upper()] = _hand
+
+
+def lookup(card1, card2) -> Optional[PreflopEntry]:
+    """Entry for two hole cards (strings like "Ah" or card ints), None if invalid."""
+    if isinstance(card1, int) and isinstance(card2, int):
+        if 0 <= card1 < 52 and 0 <= card2 < 52:
+            return _BY_INT[card1 * 52 + card2]
+        return None
+    return _BY_CARDS.get((card1, card2))
+
+
+def lookup_cards(cards: Iterable) -> Optional[PreflopEntry]:
+    """Entry for a two-card hole list, None if it is not exactly two valid cards."""
+    cards = tuple(cards)
+    if len(cards) != 2:
+        return None
+    return lookup(*cards)
+
+
+def normalize_notation(hand: str) -> Optional[str]:
+    """Canonical class notation for "AhKs", "AKs", "kas", "TT" ...; None if unrecognized."""
+    hand = hand.strip()
+    if len(hand) == 4:
+        entry = _BY_CARDS.get((hand[0].upper() + hand[1].lower(), hand[2].upper() + hand[3].lower()))
+        if entry is not None:
+            return entry.notation
+    return _CLASS_ALIASES.get(hand.upper())
@@ -9,7 +9,7 @@ This is a pure poker rules engine that:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Protocol, Set
+from typing import List, Dict, Any, Callable, Optional, Protocol, Set, Tuple
 from enum import Enum
 import time
 
@@ -64,6 +64,15 @@ class DecisionEngineProtocol(Protocol):
         """
         pass
     
+    def get_decisions_batch(self, requests: List[Tuple[str, GameState]]) -> List[tuple]:
+        """
+        Get decisions for many (player_name, game_state) points, in order.
+        
+        Optional: callers go through ``decision_batch.decide_batch``, which
+        falls back to ``get_decision`` for engines without it.
+        """
+        pass
+    
     def has_decision_for_player(self, player_name: str) -> bool:
         """Check if engine has a decision for the specified player."""
         pass
@@ -304,7 +313,8 @@ class PurePokerStateMachine:
         self.transition_to(PokerState.PREFLOP_BETTING)
         print(f"🃏 FIXED_PPSM: Hand {self.hand_number} started, action on {self.game_state.players[self.action_player_index].name}")
     
-    def replay_hand_model(self, hand_model) -> Dict[str, Any]:
+    def replay_hand_model(self, hand_model,
+                          on_step: Optional[Callable[[Optional[Dict[str, Any]]], None]] = None) -> Dict[str, Any]:
         """
         Replay a Hand Model object through PPSM using HandModelDecisionEngine.
         
@@ -313,6 +323,7 @@ class PurePokerStateMachine:
         
         Args:
             hand_model: Hand model object with standardized format
+            on_step: Optional observer, see play_hand_with_decision_engine
             
         Returns:
             Dict with replay results and validation metrics
@@ -326,9 +337,10 @@ class PurePokerStateMachine:
         hand_decision_engine = HandModelDecisionEngineAdapter(hand_model)
         
         # Use the decision engine interface
-        return self.play_hand_with_decision_engine(hand_decision_engine, hand_model)
+        return self.play_hand_with_decision_engine(hand_decision_engine, hand_model, on_step=on_step)
     
-    def play_hand_with_decision_engine(self, decision_engine: DecisionEngineProtocol, hand_model=None) -> Dict[str, Any]:
+    def play_hand_with_decision_engine(self, decision_engine: DecisionEngineProtocol, hand_model=None,
+                                       on_step: Optional[Callable[[Optional[Dict[str, Any]]], None]] = None) -> Dict[str, Any]:
         """
         Play a hand using any DecisionEngine implementation.
         
@@ -337,6 +349,9 @@ class PurePokerStateMachine:
         Args:
             decision_engine: Any decision engine implementing DecisionEngineProtocol
             hand_model: Optional hand model for result comparison
+            on_step: Optional observer called with None once the blinds are
+                posted, then after every executed action with a dict of
+                actor, action_type, amount and ok
             
         Returns:
             Dict with play results and validation metrics
@@ -350,6 +365,8 @@ class PurePokerStateMachine:
         
         # Start the hand
         self.start_hand()
+        if on_step:
+            on_step(None)
         
         # Play results tracking
         play_results = {
@@ -416,6 +433,9 @@ class PurePokerStateMachine:
                             # Convert and execute the action
                             if self._is_valid_action(current_player, ppsm_action_type, ppsm_amount):
                                 success = self.execute_action(current_player, ppsm_action_type, ppsm_amount)
+                                if on_step:
+                                    on_step({"actor": current_player.name, "action_type": ppsm_action_type,
+                                             "amount": ppsm_amount, "ok": bool(success)})
                                 if success:
                                     play_results['successful_actions'] += 1
                                 else:
@@ -1118,6 +1138,8 @@ class PurePokerStateMachine:
             "street_commit_sum": sum(p.current_bet for p in self.game_state.players),
             "pot": self.game_state.displayed_pot(),
             "current_bet": self.game_state.current_bet,
+            "big_blind": self.config.big_blind,
+            "min_raise": self.game_state.round_state.last_full_raise_size or self.config.big_blind,
             "board": self.game_state.board,
             "street": self.game_state.street,
             "current_state": self.current_state.value,
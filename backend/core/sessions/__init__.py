@@ -10,6 +10,7 @@ from .hands_review_session import HandsReviewSession
 from .gto_session import GTOSession
 from .practice_session import PracticeSession
 from .live_session import LiveSession
+from .icm import ICMCalculator, PushFoldChart, build_push_fold_chart, get_push_fold_chart
 
 __all__ = [
     'BasePokerSession',
@@ -17,4 +18,8 @@ __all__ = [
     'GTOSession', 
     'PracticeSession',
     'LiveSession',
+    'ICMCalculator',
+    'PushFoldChart',
+    'build_push_fold_chart',
+    'get_push_fold_chart',
 ]
@@ -9,8 +9,14 @@ from .base_session import BasePokerSession
 from ..pure_poker_state_machine import PurePokerStateMachine, GameConfig
 from ..poker_types import Player
 from ..hand_model import ActionType
+from ..decision_batch import decide_batch
 from ..providers import GTODeck, StandardRules, AutoAdvancementController
 
+try:
+    from gto.suit_isomorphism import get_spot_cache
+except ImportError:
+    from backend.gto.suit_isomorphism import get_spot_cache
+
 
 class GTOSession(BasePokerSession):
     """
@@ -28,6 +34,8 @@ class GTOSession(BasePokerSession):
         self.decision_engines = decision_engines or {}
         self.seed = seed
         self.hand_count = 0
+        # Spot cache counters at session start, for the per-session hit rate
+        self._spot_cache_start = get_spot_cache().snapshot()
         
     def initialize_session(self) -> bool:
         """Initialize GTO session with auto-advance providers."""
@@ -154,6 +162,68 @@ class GTOSession(BasePokerSession):
             print(f"❌ GTO_SESSION: Error executing bot action: {e}")
             return False
     
+    @staticmethod
+    def execute_bot_actions_batch(sessions: List["GTOSession"]) -> List[bool]:
+        """
+        Execute the next bot action on many tables at once.
+        
+        Tables whose action player shares a decision engine are decided in
+        one ``get_decisions_batch`` call, so the engine can share work across
+        them. Returns, per session, whether an action was executed.
+        """
+        results = [False] * len(sessions)
+        pending = []  # (slot, session, player, decision)
+        batches: Dict[int, List] = {}
+        engines: Dict[int, Any] = {}
+        
+        for slot, session in enumerate(sessions):
+            try:
+                action_player = session.get_action_player()
+                if not action_player:
+                    continue
+                engine = session.decision_engines.get(action_player.name)
+                if not engine:
+                    pending.append((slot, session, action_player, session._get_default_gto_decision(action_player)))
+                    continue
+                engines[id(engine)] = engine
+                request = (session.fpsm.action_player_index, session.fpsm.get_game_info())
+                batches.setdefault(id(engine), []).append((slot, session, action_player, request))
+            except Exception as e:
+                print(f"❌ GTO_SESSION: Error preparing bot action: {e}")
+        
+        for key, items in batches.items():
+            try:
+                decisions = decide_batch(engines[key], [request for *_, request in items])
+            except Exception as e:
+                print(f"❌ GTO_SESSION: Error in batched decisions: {e}")
+                continue
+            for (slot, session, action_player, _), decision in zip(items, decisions):
+                pending.append((slot, session, action_player, decision))
+        
+        for slot, session, action_player, decision in sorted(pending, key=lambda p: p[0]):
+            if not decision or 'action' not in decision:
+                continue
+            try:
+                results[slot] = session.execute_action(
+                    action_player, decision['action'], decision.get('amount', 0.0))
+            except Exception as e:
+                print(f"❌ GTO_SESSION: Error executing bot action: {e}")
+        return results
+    
+    @staticmethod
+    def run_hands_batch(sessions: List["GTOSession"], max_actions: int = 100) -> List[bool]:
+        """Run one hand on every table, advancing all tables a batched action at a time."""
+        started = [session.start_hand() for session in sessions]
+        live = [s for s, ok in zip(sessions, started) if ok]
+        for _ in range(max_actions):
+            live = [s for s in live if s.session_active and not s.is_hand_complete()]
+            if not live:
+                break
+            acted = GTOSession.execute_bot_actions_batch(live)
+            live = [s for s, ok in zip(live, acted) if ok]
+        print(f"🤖 GTO_SESSION: Ran {sum(started)} hands in batch")
+        return started
+    
     def _get_default_gto_decision(self, player: Player) -> Dict[str, Any]:
         """Get a default GTO decision (simplified strategy)."""
         valid_actions = self.get_valid_actions_for_player(player)
@@ -222,4 +292,5 @@ class GTOSession(BasePokerSession):
             "session_type": "GTO",
             "seed": self.seed,
             "players": self.config.num_players,
+            "spot_cache": get_spot_cache().get_stats(since=self._spot_cache_start),
         }
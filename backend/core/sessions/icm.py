@@ -0,0 +1,279 @@
+"""
+ICM (Malmuth-Harville) tournament equity for practice and generation sessions.
+
+``ICMCalculator(payouts).equities(stacks)`` returns each stack's $EV. Under
+Malmuth-Harville a player finishes first with probability stack / total
+chips, and each later place is drawn the same way from the players left.
+The exact mode walks the subsets of already-placed players as bitmasks,
+level by level (one level per paid place), so every subset's probability
+is computed once rather than once per finishing order. Full final tables
+cost a few thousand states.
+
+When the subset count would exceed ``max_exact_states`` (large fields with
+many paid places), finishing orders are sampled instead. Harville is a
+Plackett-Luce model, so ranking players by ``Exp(1) / stack`` draws an
+order with exactly those probabilities.
+
+``build_push_fold_chart`` turns ICM into a shove/call chart for one spot.
+A shover and a single caller iterate best responses over the 169 hand
+classes, valuing each outcome by ICM instead of chips. It needs the
+solver's preflop equity matrix (NumPy). Decision engines consult
+``get_push_fold_chart`` and ``PushFoldChart.action``.
+"""
+
+import heapq
+import random
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from math import comb
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..preflop_lookup import lookup_cards
+
+try:
+    from gto.solver.equity import load_equity_matrix
+    from gto.solver.hand_classes import CLASS_COMBOS, HAND_CLASSES
+except ImportError:
+    try:
+        from backend.gto.solver.equity import load_equity_matrix
+        from backend.gto.solver.hand_classes import CLASS_COMBOS, HAND_CLASSES
+    except ImportError:  # NumPy not installed: ICM works, charts are unavailable
+        load_equity_matrix = None
+        CLASS_COMBOS = HAND_CLASSES = None
+
+MAX_EXACT_STATES = 250000
+DEFAULT_SAMPLES = 20000
+
+
+class ICMCalculator:
+    """$EV per stack vector for one payout structure, cached per stack vector."""
+
+    def __init__(self, payouts: Sequence[float], max_exact_states: int = MAX_EXACT_STATES,
+                 samples: int = DEFAULT_SAMPLES, seed: int = 0, max_cache: int = 4096):
+        if not payouts:
+            raise ValueError("payouts must not be empty")
+        self.payouts = tuple(float(p) for p in payouts)
+        self.max_exact_states = max_exact_states
+        self.samples = samples
+        self.seed = seed
+        self.max_cache = max_cache
+        self._cache: "OrderedDict[Tuple, Tuple[Tuple[float, ...], ...]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def exact_states(self, players: int) -> int:
+        """Subsets the exact mode visits for ``players`` live stacks."""
+        return sum(comb(players, k) for k in range(min(len(self.payouts), players)))
+
+    def equities(self, stacks: Sequence[float], approximate: Optional[bool] = None) -> List[float]:
+        """$EV of each stack (0 for busted ones), in the order given."""
+        places = self.place_probabilities(stacks, approximate)
+        return [sum(p * prize for p, prize in zip(row, self.payouts)) for row in places]
+
+    def equity(self, stacks: Sequence[float], seat: int) -> float:
+        return self.equities(stacks)[seat]
+
+    def place_probabilities(self, stacks: Sequence[float],
+                            approximate: Optional[bool] = None) -> List[List[float]]:
+        """P(player i finishes in paid place k), one row per stack."""
+        stacks = tuple(float(s) for s in stacks)
+        if any(s < 0 for s in stacks):
+            raise ValueError("stacks must be non-negative")
+        live = [i for i, s in enumerate(stacks) if s > 0]
+        if approximate is None:
+            approximate = self.exact_states(len(live)) > self.max_exact_states
+
+        key = (stacks, approximate)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        else:
+            self.misses += 1
+            live_stacks = [stacks[i] for i in live]
+            if approximate:
+                rows = self._sampled(live_stacks)
+            else:
+                rows = self._exact(live_stacks)
+            cached = [tuple(0.0 for _ in self.payouts) for _ in stacks]
+            for i, row in zip(live, rows):
+                cached[i] = tuple(row)
+            cached = self._cache[key] = tuple(cached)
+            while len(self._cache) > self.max_cache:
+                self._cache.popitem(last=False)
+        return [list(row) for row in cached]
+
+    def _exact(self, stacks: List[float]) -> List[List[float]]:
+        n = len(stacks)
+        paid = min(len(self.payouts), n)
+        total = sum(stacks)
+        places = [[0.0] * len(self.payouts) for _ in range(n)]
+        # mask of players holding the top places -> (probability, their chips)
+        level: Dict[int, Tuple[float, float]] = {0: (1.0, 0.0)}
+        for place in range(paid):
+            last = place == paid - 1
+            following: Dict[int, Tuple[float, float]] = {}
+            for mask, (prob, placed) in level.items():
+                rest = total - placed
+                for i in range(n):
+                    bit = 1 << i
+                    if mask & bit:
+                        continue
+                    p = prob * stacks[i] / rest
+                    places[i][place] += p
+                    if not last:
+                        nxt = mask | bit
+                        prev = following.get(nxt)
+                        following[nxt] = (p + prev[0] if prev else p, placed + stacks[i])
+            level = following
+        return places
+
+    def _sampled(self, stacks: List[float]) -> List[List[float]]:
+        n = len(stacks)
+        paid = min(len(self.payouts), n)
+        rng = random.Random(self.seed)
+        counts = [[0] * len(self.payouts) for _ in range(n)]
+        players = range(n)
+        for _ in range(self.samples):
+            keys = [rng.expovariate(s) for s in stacks]
+            for place, i in enumerate(heapq.nsmallest(paid, players, key=keys.__getitem__)):
+                counts[i][place] += 1
+        return [[c / self.samples for c in row] for row in counts]
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+
+@dataclass
+class PushFoldChart:
+    """Shove range for the pusher and call range for the caller in one spot."""
+
+    push: Dict[str, bool]
+    call: Dict[str, bool]
+    push_margin: Dict[str, float] = field(repr=False)  # $EV(shove) - $EV(fold)
+    call_margin: Dict[str, float] = field(repr=False)  # $EV(call) - $EV(fold)
+    iterations: int = 0
+
+    def action(self, cards: Sequence[str], facing_shove: bool = False) -> str:
+        """"push"/"fold" for the shover, "call"/"fold" when ``facing_shove``."""
+        entry = lookup_cards(cards)
+        if entry is None:
+            return "fold"
+        if facing_shove:
+            return "call" if self.call.get(entry.notation) else "fold"
+        return "push" if self.push.get(entry.notation) else "fold"
+
+    def push_range(self) -> List[str]:
+        return [h for h, p in self.push.items() if p]
+
+    def call_range(self) -> List[str]:
+        return [h for h, c in self.call.items() if c]
+
+
+def _outcome_stacks(stacks: Sequence[float], pusher: int, caller: int, posted: Sequence[float],
+                    winner: Optional[int], called: bool) -> List[float]:
+    """Stacks after the hand: ``winner`` takes the pot (None when the pusher folds)."""
+    after = [s - p for s, p in zip(stacks, posted)]
+    pot = sum(posted)
+    if called:
+        risk = min(stacks[pusher], stacks[caller])
+        for seat in (pusher, caller):
+            after[seat] = stacks[seat] - risk
+        pot = sum(posted) - posted[pusher] - posted[caller] + 2 * risk
+    after[caller if winner is None else winner] += pot
+    return after
+
+
+def build_push_fold_chart(calculator: ICMCalculator, stacks: Sequence[float], pusher: int,
+                          caller: int, posted: Sequence[float], equity_matrix=None,
+                          max_iterations: int = 500) -> PushFoldChart:
+    """
+    ICM shove/call chart for ``pusher`` shoving into ``caller`` (everyone else folded).
+
+    ``posted`` holds each seat's blind and ante, already in the pot.
+    Starting from any-two shove and call, both sides repeatedly best-respond
+    to the other's average strategy (fictitious play) until the averaged
+    ranges are best responses to each other.
+    """
+    if load_equity_matrix is None:
+        raise RuntimeError("push/fold charts need NumPy and the GTO solver")
+    eq = load_equity_matrix(verbose=False) if equity_matrix is None else equity_matrix
+
+    def icm(winner, called):
+        after = _outcome_stacks(stacks, pusher, caller, posted, winner, called)
+        ev = calculator.equities(after)
+        # A player busted in this hand takes the place below the survivors
+        survivors = sum(1 for chips in after if chips > 0)
+        for seat in (pusher, caller):
+            if after[seat] <= 0 < stacks[seat]:
+                ev[seat] = calculator.payouts[survivors] if survivors < len(calculator.payouts) else 0.0
+        return ev
+
+    fold = icm(None, False)
+    steal = icm(pusher, False)
+    pusher_wins = icm(pusher, True)
+    caller_wins = icm(caller, True)
+
+    weights = CLASS_COMBOS
+    push = weights > 0  # averaged strategies, starting from any-two shove / any-two call
+    call = weights > 0
+    push_avg = push.astype(float)
+    call_avg = call.astype(float)
+    iterations = 0
+    for iterations in range(1, max_iterations + 1):
+        # Caller: call when $EV(call) beats letting the steal through
+        shoves = weights * push_avg
+        eq_call = (eq @ shoves) / max(shoves.sum(), 1e-12)
+        call_margin = (eq_call * caller_wins[caller] + (1 - eq_call) * pusher_wins[caller]
+                       - steal[caller])
+
+        # Pusher: shove when $EV(shove) beats folding
+        calls = weights * call_avg
+        p_call = calls.sum() / weights.sum()
+        eq_push = (eq @ calls) / max(calls.sum(), 1e-12)
+        push_margin = ((1 - p_call) * steal[pusher]
+                       + p_call * (eq_push * pusher_wins[pusher] + (1 - eq_push) * caller_wins[pusher])
+                       - fold[pusher])
+
+        # Fictitious play: each side moves toward its best response
+        step = 1.0 / (iterations + 1)
+        push_avg += step * ((push_margin > 0) - push_avg)
+        call_avg += step * ((call_margin > 0) - call_avg)
+        new_push, new_call = push_avg > 0.5, call_avg > 0.5
+        settled = ((new_push == (push_margin > 0)).all() and (new_call == (call_margin > 0)).all())
+        push, call = new_push, new_call
+        if settled and iterations > 1:
+            break
+
+    return PushFoldChart(
+        push={h: bool(p) for h, p in zip(HAND_CLASSES, push)},
+        call={h: bool(c) for h, c in zip(HAND_CLASSES, call)},
+        push_margin={h: float(m) for h, m in zip(HAND_CLASSES, push_margin)},
+        call_margin={h: float(m) for h, m in zip(HAND_CLASSES, call_margin)},
+        iterations=iterations,
+    )
+
+
+_charts: "OrderedDict[Tuple, PushFoldChart]" = OrderedDict()
+MAX_CHARTS = 256
+
+
+def get_push_fold_chart(payouts: Sequence[float], stacks: Sequence[float], pusher: int,
+                        caller: int, posted: Sequence[float]) -> PushFoldChart:
+    """Shared, memoized chart for a spot, so decision engines can consult it per hand."""
+    key = (tuple(payouts), tuple(stacks), pusher, caller, tuple(posted))
+    chart = _charts.get(key)
+    if chart is None:
+        chart = build_push_fold_chart(ICMCalculator(payouts), stacks, pusher, caller, posted)
+        _charts[key] = chart
+        while len(_charts) > MAX_CHARTS:
+            _charts.popitem(last=False)
+    else:
+        _charts.move_to_end(key)
+    return chart
@@ -0,0 +1,332 @@
+"""
+Strategy compiler with hot reload.
+
+Turns a strategy JSON (``modern_strategy.json``) into dense, index-addressed
+tables so bots do integer lookups instead of nested string-keyed dict walks
+at decision time:
+
+- ``hand_strength``: preflop strength for all 169 hand classes
+- ``postflop_values``: strength per postflop hand category
+- ``open_rules`` / ``vs_raise``: per-position preflop thresholds and sizings
+- ``postflop_rules[role][street][position]``: (val_thresh, check_thresh, sizing)
+- ``open_table`` / ``vs_raise_table``: the resulting preflop decision for every
+  position and hand class
+
+The compiled form is cached next to the source as ``<name>.compiled.json``,
+keyed by a hash of the source. ``StrategyWatcher`` polls the source file and
+swaps in a freshly compiled strategy with a single reference assignment, so
+running sessions pick it up between decisions without a restart.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .preflop_lookup import HAND_CLASSES, HAND_INDEX
+
+# Bump when the compiled layout changes so stale caches are rebuilt
+COMPILER_VERSION = 1
+
+POSITIONS = ("UTG", "MP", "CO", "BTN", "SB", "BB")
+STREETS = ("flop", "turn", "river")
+ROLES = ("pfa", "caller")
+POSTFLOP_CATEGORIES = (
+    "high_card", "pair", "top_pair", "over_pair", "two_pair", "set", "straight",
+    "flush", "full_house", "quads", "straight_flush", "gutshot_draw",
+    "open_ended_draw", "flush_draw", "combo_draw", "nut_flush_draw",
+    "nut_straight_draw", "overcard_draw", "backdoor_flush", "backdoor_straight",
+    "pair_plus_draw", "set_plus_draw",
+)
+
+FOLD, CALL, RAISE = 0, 1, 2
+ACTION_NAMES = ("fold", "call", "raise")
+
+
+POSITION_INDEX = {p: i for i, p in enumerate(POSITIONS)}
+STREET_INDEX = {s: i for i, s in enumerate(STREETS)}
+ROLE_INDEX = {r: i for i, r in enumerate(ROLES)}
+CATEGORY_INDEX = {c: i for i, c in enumerate(POSTFLOP_CATEGORIES)}
+
+NO_THRESHOLD = 1000.0  # position without a rule: never opens / continues
+
+
+@dataclass(frozen=True)
+class CompiledStrategy:
+    """Dense strategy tables; immutable so it can be swapped atomically."""
+
+    source_hash: str
+    hand_strength: Tuple[float, ...]
+    postflop_values: Tuple[float, ...]
+    open_rules: Tuple[Tuple[float, float], ...]  # (threshold, sizing) per position
+    vs_raise: Tuple[Tuple[float, float, float], ...]  # (value, call, sizing) per position
+    postflop_rules: Tuple[Tuple[Tuple[Tuple[float, float, float], ...], ...], ...]
+    open_table: Tuple[Tuple[int, ...], ...]  # [position][hand] -> FOLD / RAISE
+    vs_raise_table: Tuple[Tuple[int, ...], ...]  # [position][hand] -> FOLD / CALL / RAISE
+
+    def strength(self, hand: str) -> float:
+        index = HAND_INDEX.get(hand)
+        return self.hand_strength[index] if index is not None else 0.0
+
+    def open_decision(self, position: str, hand: str) -> Tuple[str, float]:
+        pos = POSITION_INDEX.get(position)
+        index = HAND_INDEX.get(hand)
+        if pos is None or index is None:
+            return "fold", 0.0
+        return ACTION_NAMES[self.open_table[pos][index]], self.open_rules[pos][1]
+
+    def vs_raise_decision(self, position: str, hand: str) -> Tuple[str, float]:
+        pos = POSITION_INDEX.get(position)
+        index = HAND_INDEX.get(hand)
+        if pos is None or index is None:
+            return "fold", 0.0
+        return ACTION_NAMES[self.vs_raise_table[pos][index]], self.vs_raise[pos][2]
+
+    def postflop_rule(self, role: str, street: str, position: str) -> Optional[Tuple[float, float, float]]:
+        """(val_thresh, check_thresh, sizing), or None if the strategy has no rule."""
+        try:
+            rule = self.postflop_rules[ROLE_INDEX[role]][STREET_INDEX[street]][POSITION_INDEX[position]]
+        except KeyError:
+            return None
+        return None if rule[0] >= NO_THRESHOLD else rule
+
+    def postflop_value(self, category: str) -> float:
+        index = CATEGORY_INDEX.get(category)
+        return self.postflop_values[index] if index is not None else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "source_hash": self.source_hash,
+            "hand_strength": list(self.hand_strength),
+            "postflop_values": list(self.postflop_values),
+            "open_rules": [list(r) for r in self.open_rules],
+            "vs_raise": [list(r) for r in self.vs_raise],
+            "postflop_rules": [[[list(p) for p in s] for s in r] for r in self.postflop_rules],
+            "open_table": [list(t) for t in self.open_table],
+            "vs_raise_table": [list(t) for t in self.vs_raise_table],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompiledStrategy":
+        return cls(
+            source_hash=data["source_hash"],
+            hand_strength=tuple(data["hand_strength"]),
+            postflop_values=tuple(data["postflop_values"]),
+            open_rules=tuple(tuple(r) for r in data["open_rules"]),
+            vs_raise=tuple(tuple(r) for r in data["vs_raise"]),
+            postflop_rules=tuple(tuple(tuple(tuple(p) for p in s) for s in r)
+                                 for r in data["postflop_rules"]),
+            open_table=tuple(tuple(t) for t in data["open_table"]),
+            vs_raise_table=tuple(tuple(t) for t in data["vs_raise_table"]),
+        )
+
+
+def strategy_hash(raw: bytes) -> str:
+    digest = hashlib.sha256(f"v{COMPILER_VERSION}".encode("utf-8"))
+    digest.update(raw)
+    return digest.hexdigest()
+
+
+def _postflop_rule(rule: Optional[Dict[str, Any]]) -> Tuple[float, float, float]:
+    if not rule:
+        return NO_THRESHOLD, NO_THRESHOLD, 0.0
+    return (float(rule.get("val_thresh", NO_THRESHOLD)),
+            float(rule.get("check_thresh", NO_THRESHOLD)),
+            float(rule.get("sizing", 0.0)))
+
+
+def compile_strategy(strategy: Dict[str, Any], source_hash: str = "") -> CompiledStrategy:
+    """Compile a strategy dict (the ``modern_strategy.json`` layout)."""
+    tables = strategy.get("hand_strength_tables", {})
+    preflop_hs = tables.get("preflop", {})
+    postflop_hs = tables.get("postflop", {})
+    hand_strength = tuple(float(preflop_hs.get(h, 0.0)) for h in HAND_CLASSES)
+
+    preflop = strategy.get("preflop", {})
+    open_src = preflop.get("open_rules", {})
+    vs_src = preflop.get("vs_raise", {})
+    open_rules = tuple(
+        (float(open_src[p].get("threshold", NO_THRESHOLD)), float(open_src[p].get("sizing", 0.0)))
+        if p in open_src else (NO_THRESHOLD, 0.0)
+        for p in POSITIONS
+    )
+    vs_raise = tuple(
+        (float(vs_src[p].get("value_thresh", NO_THRESHOLD)),
+         float(vs_src[p].get("call_thresh", NO_THRESHOLD)),
+         float(vs_src[p].get("sizing", 0.0)))
+        if p in vs_src else (NO_THRESHOLD, NO_THRESHOLD, 0.0)
+        for p in POSITIONS
+    )
+
+    postflop = strategy.get("postflop", {})
+    postflop_rules = tuple(
+        tuple(
+            tuple(_postflop_rule(postflop.get(role, {}).get(street, {}).get(p)) for p in POSITIONS)
+            for street in STREETS
+        )
+        for role in ROLES
+    )
+
+    open_table = tuple(
+        tuple(RAISE if hs >= threshold else FOLD for hs in hand_strength)
+        for threshold, _ in open_rules
+    )
+    vs_raise_table = tuple(
+        tuple(RAISE if hs >= value else CALL if hs >= call else FOLD for hs in hand_strength)
+        for value, call, _ in vs_raise
+    )
+    return CompiledStrategy(
+        source_hash=source_hash,
+        hand_strength=hand_strength,
+        postflop_values=tuple(float(postflop_hs.get(c, 0.0)) for c in POSTFLOP_CATEGORIES),
+        open_rules=open_rules,
+        vs_raise=vs_raise,
+        postflop_rules=postflop_rules,
+        open_table=open_table,
+        vs_raise_table=vs_raise_table,
+    )
+
+
+def compiled_path(source_path: str) -> str:
+    root, _ = os.path.splitext(source_path)
+    return root + ".compiled.json"
+
+
+def load_file(source_path: str) -> Tuple[Dict[str, Any], CompiledStrategy]:
+    """
+    Strategy dict and compiled strategy for a JSON file, both from the same
+    read. The compiled form comes from the cache next to it when current.
+    Raises ValueError for invalid JSON or an unexpected strategy layout.
+    """
+    with open(source_path, "rb") as f:
+        raw = f.read()
+    strategy = json.loads(raw.decode("utf-8"))
+    if not isinstance(strategy, dict):
+        raise ValueError("strategy file must hold a JSON object")
+    source_hash = strategy_hash(raw)
+    cache_path = compiled_path(source_path)
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("source_hash") == source_hash:
+            return strategy, CompiledStrategy.from_dict(cached)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    try:
+        compiled = compile_strategy(strategy, source_hash)
+    except (AttributeError, KeyError, TypeError) as e:
+        # Valid JSON in the wrong shape, e.g. {"open_rules": {"BTN": 5}}
+        raise ValueError(f"unexpected strategy layout: {e!r}") from e
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(compiled.to_dict(), f)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"⚠️ StrategyCompiler: Could not write cache: {e}")
+    return strategy, compiled
+
+
+def compile_file(source_path: str) -> CompiledStrategy:
+    """Compiled strategy for a JSON file, from the cache next to it when current."""
+    return load_file(source_path)[1]
+
+
+class StrategyWatcher:
+    """
+    Holds the current compiled strategy for a file and reloads it on change.
+
+    Readers take ``watcher.current`` once per decision; a reload builds the
+    new strategy completely before replacing that reference. Listeners get
+    ``(compiled, strategy)``, both built from the same read of the file.
+    ``poll()`` checks the file now; ``start()`` polls on a daemon thread.
+    """
+
+    def __init__(self, source_path: str, interval: float = 1.0):
+        self.source_path = source_path
+        self.interval = interval
+        self.strategy, self.current = load_file(source_path)
+        self.reload_count = 0
+        self._signature = self._file_signature()
+        self._listeners: List[Callable[[CompiledStrategy, Dict[str, Any]], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.source_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def add_listener(self, callback: Callable[[CompiledStrategy, Dict[str, Any]], None]) -> None:
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[CompiledStrategy, Dict[str, Any]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def poll(self) -> bool:
+        """Reload if the source changed; True when a new strategy was swapped in."""
+        signature = self._file_signature()
+        if signature is None or signature == self._signature:
+            return False
+        try:
+            strategy, compiled = load_file(self.source_path)
+        except (OSError, ValueError) as e:
+            # Half-written or invalid file: keep the current strategy until
+            # the next edit (which changes the signature again)
+            self._signature = signature
+            print(f"⚠️ StrategyWatcher: Keeping current strategy ({e})")
+            return False
+        self._signature = signature
+        if compiled.source_hash == self.current.source_hash:
+            return False
+        self.strategy = strategy
+        self.current = compiled
+        self.reload_count += 1
+        print(f"🔄 StrategyWatcher: Reloaded {os.path.basename(self.source_path)}")
+        for callback in list(self._listeners):
+            try:
+                callback(compiled, strategy)
+            except Exception as e:
+                print(f"⚠️ StrategyWatcher: Reload listener failed: {e}")
+        return True
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(self.interval):
+                try:
+                    self.poll()
+                except Exception as e:
+                    # Never let one bad edit end hot reload
+                    print(f"⚠️ StrategyWatcher: Poll failed: {e}")
+
+        self._thread = threading.Thread(target=run, name="strategy-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+            self._thread = None
+
+
+_watchers: Dict[str, StrategyWatcher] = {}
+
+
+def get_strategy_watcher(source_path: str) -> StrategyWatcher:
+    """Shared watcher per strategy file, so every session sees the same reloads."""
+    key = os.path.abspath(source_path)
+    if key not in _watchers:
+        _watchers[key] = StrategyWatcher(source_path)
+    return _watchers[key]
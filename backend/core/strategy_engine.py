@@ -5,12 +5,35 @@ This module contains the GTO (Game Theory Optimal) strategy implementation,
 including preflop ranges, hand strength evaluation, and bot action logic.
 """
 
-from typing import Tuple, Optional, Dict, List, Any
+from typing import Tuple, Optional, Dict, List, Any, Sequence
 import random
 
 # Import shared types from types module
 from .hand_model import ActionType
 from .poker_types import Player, GameState
+from .board_texture import get_texture_table
+from .preflop_lookup import RANK_VALUES, lookup_cards
+
+try:
+    from gto.suit_isomorphism import canonical_key, get_spot_cache
+except ImportError:
+    from backend.gto.suit_isomorphism import canonical_key, get_spot_cache
+
+try:
+    from gto.solver.hand_strength import get_hand_strength_service
+except ImportError:
+    try:
+        from backend.gto.solver.hand_strength import get_hand_strength_service
+    except ImportError:  # NumPy not installed: fall back to rank counting
+        get_hand_strength_service = None
+
+# Postflop cutoffs on the HS percentile scale (0-100, see
+# get_postflop_hand_strength). On random flops they bet about 45% of
+# holdings when checked to, raise about 20% facing a bet, and fold the
+# bottom 30% (or anything priced out by the pot odds).
+POSTFLOP_BET_HS = 55
+POSTFLOP_RAISE_HS = 80
+POSTFLOP_CALL_FLOOR_HS = 30
 
 
 class GTOStrategyEngine:
@@ -21,6 +44,7 @@ class GTOStrategyEngine:
         self.strategy_data = strategy_data
         self.gto_preflop_ranges = {}
         self._initialize_gto_ranges()
+        self.texture_table = get_texture_table()
 
     def _initialize_gto_ranges(self):
         """Initialize GTO preflop ranges for 6-max poker."""
@@ -166,6 +190,12 @@ class GTOStrategyEngine:
             },
         }
 
+        # Solved tables (backend/tools/solve_preflop.py --out) override the defaults
+        if isinstance(self.strategy_data, dict):
+            solved = self.strategy_data.get("gto_preflop_ranges")
+            if solved:
+                self.gto_preflop_ranges.update(solved)
+
     def get_gto_bot_action(
         self, player: Player, game_state: GameState
     ) -> Tuple[ActionType, float]:
@@ -201,6 +231,21 @@ class GTOStrategyEngine:
         # NEW: Comprehensive stack validation
         return self._validate_stack_limits(player, action, amount, call_amount)
 
+    def get_gto_bot_actions_batch(
+        self, requests: Sequence[Tuple[Player, GameState]]
+    ) -> List[Tuple[ActionType, float]]:
+        """
+        Get GTO bot actions for many (player, game_state) points at once.
+
+        Preflop features are table lookups and postflop features come from
+        the shared spot cache, so points on the same (suit-isomorphic) spot
+        are computed once across the batch. Results are in request order.
+        """
+        return [
+            self.get_gto_bot_action(player, game_state)
+            for player, game_state in requests
+        ]
+
     def _validate_stack_limits(
         self,
         player: Player,
@@ -340,10 +385,47 @@ class GTOStrategyEngine:
         call_amount: float,
         pot_odds: float,
     ) -> Tuple[ActionType, float]:
-        """Get GTO postflop action with FIXED validation."""
-        strength = self.get_postflop_hand_strength(
-            player.cards, game_state.board
+        """Get GTO postflop action with FIXED validation.
+
+        Features and decisions are cached per suit-isomorphic spot, so
+        spots that differ only by suits are computed once.
+        """
+        cache = get_spot_cache()
+        spot = (type(self).__name__, canonical_key(player.cards, game_state.board))
+        strength, texture = cache.get_or_compute(
+            ("features", spot),
+            lambda: (
+                self.get_postflop_hand_strength(player.cards, game_state.board),
+                self.classify_board_texture(game_state.board),
+            ),
         )
+        decision_key = (
+            "postflop",
+            spot,
+            call_amount,
+            pot_odds,
+            player.stack,
+            game_state.pot,
+            game_state.current_bet,
+            game_state.min_raise,
+            game_state.big_blind,
+        )
+        return cache.get_or_compute(
+            decision_key,
+            lambda: self._postflop_action_for_spot(
+                player, game_state, call_amount, pot_odds, strength, texture
+            ),
+        )
+
+    def _postflop_action_for_spot(
+        self,
+        player: Player,
+        game_state: GameState,
+        call_amount: float,
+        pot_odds: float,
+        strength: int,
+        texture: Dict[str, Any],
+    ) -> Tuple[ActionType, float]:
         facing_bet = call_amount > 0
 
         # FIXED: Calculate minimum raise properly
@@ -356,9 +438,6 @@ class GTOStrategyEngine:
             else float("inf")
         )
 
-        # Board texture analysis
-        texture = self.classify_board_texture(game_state.board)
-
         # Bet sizing based on board texture
         if texture["type"] == "dry":
             bet_size = game_state.pot * 0.6
@@ -388,8 +467,8 @@ class GTOStrategyEngine:
 
         if facing_bet:
             # Facing a bet
-            value_thresh = 70  # Raise nuts only
-            call_thresh = pot_odds * 100
+            value_thresh = POSTFLOP_RAISE_HS  # Raise strong hands only
+            call_thresh = pot_odds * 100  # HS vs the price of calling
             if strength >= value_thresh:
                 # FIXED: Ensure raise meets minimum requirement and round to
                 # proper poker bet
@@ -399,7 +478,7 @@ class GTOStrategyEngine:
                     return ActionType.RAISE, raise_amount
                 else:
                     return ActionType.CALL, call_amount
-            elif strength > call_thresh and strength > 30:  # Call medium
+            elif strength > call_thresh and strength > POSTFLOP_CALL_FLOOR_HS:  # Call medium
                 return ActionType.CALL, call_amount
             elif call_amount == 0:
                 return ActionType.CHECK, 0.0
@@ -407,7 +486,7 @@ class GTOStrategyEngine:
                 return ActionType.FOLD, 0.0
         else:
             # No bet to call
-            if strength >= 70:
+            if strength >= POSTFLOP_BET_HS:
                 # FIXED: Ensure bet meets minimum requirement and round to
                 # proper poker bet
                 bet_amount = max(game_state.min_raise, bet_size)
@@ -422,83 +501,30 @@ class GTOStrategyEngine:
                 return ActionType.CHECK, 0.0
 
     def get_preflop_hand_strength(self, cards: List[str]) -> int:
-        """Get preflop hand strength (0-100)."""
-        if len(cards) != 2:
-            return 0
-
-        rank1, rank2 = cards[0][0], cards[1][0]
-        suited = cards[0][1] == cards[1][1]
-
-        # High card values
-        rank_values = {
-            "2": 2,
-            "3": 3,
-            "4": 4,
-            "5": 5,
-            "6": 6,
-            "7": 7,
-            "8": 8,
-            "9": 9,
-            "T": 10,
-            "J": 11,
-            "Q": 12,
-            "K": 13,
-            "A": 14,
-        }
-
-        val1, val2 = rank_values[rank1], rank_values[rank2]
-
-        # Pairs
-        if val1 == val2:
-            if val1 >= 14:
-                return 95  # AA
-            elif val1 >= 12:
-                return 90  # KK
-            elif val1 >= 10:
-                return 85  # QQ
-            elif val1 >= 8:
-                return 80  # JJ
-            elif val1 >= 6:
-                return 75  # TT
-            else:
-                return 70 + val1  # 99-22
-
-        # Suited
-        if suited:
-            if val1 == 14 or val2 == 14:  # AKs, AQs, etc.
-                if max(val1, val2) >= 12:
-                    return 85
-                elif max(val1, val2) >= 10:
-                    return 80
-                else:
-                    return 75
-            elif val1 >= 12 or val2 >= 12:  # KQs, KJs, etc.
-                return 70 + min(val1, val2)
-            else:
-                return 60 + min(val1, val2)
-
-        # Offsuit
-        else:
-            if val1 == 14 or val2 == 14:  # AKo, AQo, etc.
-                if max(val1, val2) >= 12:
-                    return 80
-                elif max(val1, val2) >= 10:
-                    return 75
-                else:
-                    return 70
-            elif val1 >= 12 or val2 >= 12:  # KQo, KJo, etc.
-                return 65 + min(val1, val2)
-            else:
-                return 55 + min(val1, val2)
+        """Get preflop hand strength (0-100), from the precomputed preflop table."""
+        entry = lookup_cards(cards)
+        return entry.strength if entry is not None else 0
 
     def get_postflop_hand_strength(
         self, cards: List[str], board: List[str]
     ) -> int:
-        """Get postflop hand strength (0-100)."""
+        """Get postflop hand strength (0-100).
+
+        The hand's percentile against every opponent holding on this board,
+        from the evaluator-backed hand-strength service.
+        """
         if not board or len(cards) != 2:
             return 0
 
-        # Simple hand strength calculation
+        if get_hand_strength_service is not None:
+            try:
+                hs = get_hand_strength_service().hand_strength(cards, board)
+                return int(round(hs * 100))
+            except (ValueError, KeyError, IndexError):
+                pass  # Malformed cards: use the simple calculation
+
+        # Simple hand strength calculation; each made-hand class scores the
+        # median HS of that class on random boards so the cutoffs still apply
         all_cards = cards + board
         ranks = [card[0] for card in all_cards]
         suits = [card[1] for card in all_cards]
@@ -517,109 +543,35 @@ class GTOStrategyEngine:
         max_suit_count = max(suit_counts.values()) if suit_counts else 0
 
         if max_rank_count >= 4:
-            return 95  # Four of a kind
+            return 99  # Four of a kind
         elif max_rank_count == 3 and len(rank_counts) == 2:
-            return 90  # Full house
+            return 97  # Full house
         elif max_suit_count >= 5:
-            return 85  # Flush
+            return 93  # Flush
         elif max_rank_count == 3:
-            return 80  # Three of a kind
+            return 90  # Three of a kind
         elif len([c for c in rank_counts.values() if c == 2]) == 2:
-            return 75  # Two pair
+            return 77  # Two pair
         elif max_rank_count == 2:
-            return 70  # One pair
+            return 60  # One pair
         else:
-            return 60  # High card
+            return 25  # High card
 
     def classify_board_texture(self, board: List[str]) -> Dict[str, Any]:
-        """Classify board texture for postflop strategy."""
+        """Classify board texture for postflop strategy.
+
+        Looked up in the precomputed texture table; besides ``type``,
+        ``wetness`` and ``dynamism`` the result carries paired-ness,
+        flush/straight availability and the high-card class.
+        """
         if not board:
             return {"type": "dry", "dynamism": 0.0, "wetness": 0.0}
-
-        ranks = [card[0] for card in board]
-        suits = [card[1] for card in board]
-
-        # Count suits
-        suit_counts = {}
-        for suit in suits:
-            suit_counts[suit] = suit_counts.get(suit, 0) + 1
-
-        # Calculate wetness (flush potential)
-        max_suit = max(suit_counts.values()) if suit_counts else 0
-        wetness = max_suit / len(board)
-
-        # Calculate dynamism (straight potential)
-        rank_values = {
-            "2": 2,
-            "3": 3,
-            "4": 4,
-            "5": 5,
-            "6": 6,
-            "7": 7,
-            "8": 8,
-            "9": 9,
-            "T": 10,
-            "J": 11,
-            "Q": 12,
-            "K": 13,
-            "A": 14,
-        }
-        values = [rank_values[r] for r in ranks]
-        values.sort()
-
-        # Check for connected cards
-        connected = 0
-        for i in range(len(values) - 1):
-            if values[i + 1] - values[i] <= 2:
-                connected += 1
-
-        dynamism = connected / (len(values) - 1) if len(values) > 1 else 0.0
-
-        # Determine board type
-        if wetness >= 0.6 or dynamism >= 0.7:
-            board_type = "wet"
-        elif wetness <= 0.4 and dynamism <= 0.3:
-            board_type = "dry"
-        else:
-            board_type = "medium"
-
-        return {"type": board_type, "wetness": wetness, "dynamism": dynamism}
+        return self.texture_table.lookup_cards(board).to_dict()
 
     def get_hand_notation(self, cards: List[str]) -> str:
         """Convert cards to hand notation (e.g., 'AKs', 'TT')."""
-        if len(cards) != 2:
-            return ""
-
-        rank1, rank2 = cards[0][0], cards[1][0]
-        suited = cards[0][1] == cards[1][1]
-
-        if rank1 == rank2:
-            return rank1 + rank1  # e.g., "TT"
-        else:
-            # Order by rank value
-            rank_values = {
-                "2": 2,
-                "3": 3,
-                "4": 4,
-                "5": 5,
-                "6": 6,
-                "7": 7,
-                "8": 8,
-                "9": 9,
-                "T": 10,
-                "J": 11,
-                "Q": 12,
-                "K": 13,
-                "A": 14,
-            }
-
-            if rank_values[rank1] > rank_values[rank2]:
-                high, low = rank1, rank2
-            else:
-                high, low = rank2, rank1
-
-            suffix = "s" if suited else "o"
-            return high + low + suffix  # e.g., "AKs", "AJo"
+        entry = lookup_cards(cards)
+        return entry.notation if entry is not None else ""
 
     def is_hand_in_range(self, hand: str, range_list: List[str]) -> bool:
         """Check if hand is in the given range."""
@@ -678,21 +630,7 @@ class GTOStrategyEngine:
         if not hand or len(hand) < 2:
             return 0
 
-        rank_values = {
-            "2": 2,
-            "3": 3,
-            "4": 4,
-            "5": 5,
-            "6": 6,
-            "7": 7,
-            "8": 8,
-            "9": 9,
-            "T": 10,
-            "J": 11,
-            "Q": 12,
-            "K": 13,
-            "A": 14,
-        }
+        rank_values = RANK_VALUES
 
         # Pairs
         if len(hand) == 2 and hand[0] == hand[1]:
@@ -1,4 +1,5 @@
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+from backend.core.decision_batch import decide_batch
 from backend.core.pure_poker_state_machine import DecisionEngineProtocol
 from backend.core.poker_types import ActionType as PPSMActionType, GameState as PPSMGameState
 from .unified_types import ActionType, StandardGameState, PlayerState, UnifiedDecisionEngineProtocol
@@ -17,6 +18,19 @@ class GTODecisionEngineAdapter(DecisionEngineProtocol):
             print(f"❌ GTODecisionEngineAdapter Error: {e}")
             return PPSMActionType.FOLD, None
 
+    def get_decisions_batch(self, requests: List[Tuple[str, PPSMGameState]]) -> List[Optional[Tuple[PPSMActionType, Optional[float]]]]:
+        """Convert each distinct PPSM state once and let the engine decide the whole batch."""
+        try:
+            converted = {}
+            for _, game_state in requests:
+                if id(game_state) not in converted:
+                    converted[id(game_state)] = self._convert_to_standard_game_state(game_state)
+            decisions = decide_batch(self.gto_engine, [(name, converted[id(gs)]) for name, gs in requests])
+            return [(PPSMActionType[action.name], amount) for action, amount in decisions]
+        except Exception as e:
+            print(f"❌ GTODecisionEngineAdapter Error: {e}")
+            return [(PPSMActionType.FOLD, None) for _ in requests]
+
     def _convert_to_standard_game_state(self, ppsm_game_state: PPSMGameState) -> StandardGameState:
         players = tuple(
             PlayerState(
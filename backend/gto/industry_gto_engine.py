@@ -1,13 +1,25 @@
 import random
-from typing import Optional, Tuple
+from collections import Counter
+from typing import List, Optional, Tuple
 
 from .unified_types import ActionType, StandardGameState, UnifiedDecisionEngineProtocol
 
+try:
+    from .solver.hand_strength import get_hand_strength_service
+except ImportError:  # NumPy not installed: fall back to rank counting
+    get_hand_strength_service = None
+
+# Postflop cutoffs on the HS percentile scale (0-1): bet the top ~15% of
+# holdings, continue with the better half, bluff or give up with the rest
+BET_HS = 0.85
+CONTINUE_HS = 0.5
+
 class IndustryGTOEngine(UnifiedDecisionEngineProtocol):
     def __init__(self, player_count: int, stack_depth: float = 100.0, aggression_factor: float = 1.0):
         self.player_count = player_count
         self.stack_depth = stack_depth
         self.aggression_factor = aggression_factor
+        self._batch_cache = None
         print(f"🧠 IndustryGTOEngine: Initialized for {player_count} players.")
 
     def get_decision(self, player_name: str, game_state: StandardGameState) -> Tuple[ActionType, Optional[float]]:
@@ -20,6 +32,22 @@ class IndustryGTOEngine(UnifiedDecisionEngineProtocol):
 
         return self._get_postflop_decision(player, game_state)
 
+    def get_decisions_batch(self, requests: List[Tuple[str, StandardGameState]]) -> List[Tuple[ActionType, Optional[float]]]:
+        """Decisions in request order; board profiles and hand classes are shared across the batch."""
+        self._batch_cache = {}
+        try:
+            return [self.get_decision(player_name, game_state) for player_name, game_state in requests]
+        finally:
+            self._batch_cache = None
+
+    def _cached(self, kind, key, compute):
+        if self._batch_cache is None:
+            return compute()
+        cache_key = (kind, key)
+        if cache_key not in self._batch_cache:
+            self._batch_cache[cache_key] = compute()
+        return self._batch_cache[cache_key]
+
     def _get_preflop_decision(self, player, game_state) -> Tuple[ActionType, Optional[float]]:
         is_open_pot = game_state.current_bet_to_call <= 10
         if is_open_pot:
@@ -35,38 +63,49 @@ class IndustryGTOEngine(UnifiedDecisionEngineProtocol):
 
     def _get_postflop_decision(self, player, game_state) -> Tuple[ActionType, Optional[float]]:
         equity = self._simulate_equity(player.cards, game_state.board)
-        if equity > 0.7:
+        if equity > BET_HS:
             return ActionType.BET, float(game_state.pot) * 0.66
-        if equity > 0.4:
+        if equity > CONTINUE_HS:
             return (ActionType.CALL, float(game_state.current_bet_to_call)) if game_state.current_bet_to_call > 0 else (ActionType.CHECK, None)
         if random.random() < 0.15 * self.aggression_factor:
             return ActionType.BET, float(game_state.pot) * 0.5
         return (ActionType.FOLD, None) if game_state.current_bet_to_call > 0 else (ActionType.CHECK, None)
 
+    def _rank_key(self, cards):
+        return self._cached('ranks', tuple(cards), lambda: ''.join(
+            sorted([c[0] for c in cards], key=lambda r: '23456789TJQKA'.index(r), reverse=True)))
+
     def _is_premium_hand(self, cards):
-        ranks = sorted([c[0] for c in cards], key=lambda r: '23456789TJQKA'.index(r), reverse=True)
-        return ''.join(ranks) in ['AA', 'KK', 'QQ', 'AK']
+        return self._rank_key(cards) in ['AA', 'KK', 'QQ', 'AK']
 
     def _is_strong_hand(self, cards):
-        ranks = sorted([c[0] for c in cards], key=lambda r: '23456789TJQKA'.index(r), reverse=True)
-        return ''.join(ranks) in ['JJ', 'TT', 'AQ', 'AJ', 'KQ'] or self._is_premium_hand(cards)
+        return self._rank_key(cards) in ['JJ', 'TT', 'AQ', 'AJ', 'KQ'] or self._is_premium_hand(cards)
 
     def _is_playable_hand(self, cards):
         return self._is_strong_hand(cards)
 
+    def _board_profile(self, board):
+        return self._cached('board', tuple(board), lambda: (
+            Counter(c[0] for c in board), Counter(c[1] for c in board)))
+
     def _simulate_equity(self, hole_cards, board):
-        hand_strength = 0
-        all_cards = hole_cards + board
-        ranks = [c[0] for c in all_cards]
-        suits = [c[1] for c in all_cards]
-        rank_counts = {r: ranks.count(r) for r in set(ranks)}
-        if 4 in rank_counts.values(): hand_strength = 0.95
-        elif 3 in rank_counts.values() and 2 in rank_counts.values(): hand_strength = 0.9
-        elif 3 in rank_counts.values(): hand_strength = 0.7
-        elif list(rank_counts.values()).count(2) >= 2: hand_strength = 0.6
-        elif 2 in rank_counts.values(): hand_strength = 0.5
-        suit_counts = {s: suits.count(s) for s in set(suits)}
-        if 5 in suit_counts.values(): hand_strength = max(hand_strength, 0.85)
+        if get_hand_strength_service is not None:
+            try:
+                return get_hand_strength_service().hand_strength(hole_cards, board)
+            except (ValueError, KeyError, IndexError):
+                pass
+        # Rank counting fallback: each class scores its median HS on random boards
+        hand_strength = 0.25
+        board_ranks, board_suits = self._board_profile(board)
+        rank_counts = board_ranks + Counter(c[0] for c in hole_cards)
+        suit_counts = board_suits + Counter(c[1] for c in hole_cards)
+        counts = list(rank_counts.values())
+        if 4 in counts: hand_strength = 0.99
+        elif 3 in counts and 2 in counts: hand_strength = 0.97
+        elif 3 in counts: hand_strength = 0.9
+        elif counts.count(2) >= 2: hand_strength = 0.77
+        elif 2 in counts: hand_strength = 0.6
+        if 5 in suit_counts.values(): hand_strength = max(hand_strength, 0.93)
         return hand_strength
 
     def has_decision_for_player(self, player_name: str) -> bool:
@@ -0,0 +1,28 @@
+"""
+Preflop solver: vectorized CFR+ / discounted CFR over the 169 hand classes
+for push/fold and open/3-bet abstractions (2-9 players, any stack depth),
+plus the evaluator-backed postflop hand-strength service, Bayesian
+opponent range tracking and range-vs-range equity.
+
+Requires NumPy.
+"""
+
+from .cfr import ALGORITHMS, CFR_PLUS, DCFR, PreflopSolver
+from .equity import compute_equity_matrix, load_equity_matrix
+from .game_tree import GAMES, OPEN_3BET, POSITION_NAMES, PUSH_FOLD, GameConfig, build_tree
+from .hand_classes import CLASS_INDEX, HAND_CLASSES, hand_class
+from .hand_strength import HandStrengthService, get_hand_strength_service
+from .range_equity import RangeEquityEngine, combo_weights
+from .range_tracker import RangeTracker, StrategyEnginePolicy
+from .ranges import range_summary, save_ranges, to_gto_preflop_ranges
+
+__all__ = [
+    "ALGORITHMS", "CFR_PLUS", "DCFR", "PreflopSolver",
+    "compute_equity_matrix", "load_equity_matrix",
+    "GAMES", "OPEN_3BET", "POSITION_NAMES", "PUSH_FOLD", "GameConfig", "build_tree",
+    "CLASS_INDEX", "HAND_CLASSES", "hand_class",
+    "HandStrengthService", "get_hand_strength_service",
+    "RangeEquityEngine", "combo_weights",
+    "RangeTracker", "StrategyEnginePolicy",
+    "range_summary", "save_ranges", "to_gto_preflop_ranges",
+]
@@ -0,0 +1,258 @@
+"""
+Vectorized CFR+ / discounted CFR over the preflop game trees.
+
+Every information set is a (public node, hand class) pair, so regrets and
+strategies for a node are (169, actions) arrays and one tree walk updates
+all 169 classes of every player at once. Card removal is modelled pairwise
+through the class blocker matrix; folded players contribute their
+prior-weighted action probabilities.
+"""
+
+import json
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from .equity import load_equity_matrix
+from .game_tree import GameConfig, Node, build_tree
+from .hand_classes import CLASS_PRIOR, NUM_CLASSES, blocker_matrix
+
+
+CFR_PLUS = "cfr+"
+DCFR = "dcfr"
+ALGORITHMS = (CFR_PLUS, DCFR)
+
+
+def regret_matching(regrets: np.ndarray) -> np.ndarray:
+    positive = np.maximum(regrets, 0.0)
+    total = positive.sum(axis=1, keepdims=True)
+    uniform = np.full_like(regrets, 1.0 / regrets.shape[1])
+    return np.where(total > 0, positive / np.where(total > 0, total, 1.0), uniform)
+
+
+def _normalize(sums: np.ndarray) -> np.ndarray:
+    total = sums.sum(axis=1, keepdims=True)
+    uniform = np.full_like(sums, 1.0 / sums.shape[1])
+    return np.where(total > 0, sums / np.where(total > 0, total, 1.0), uniform)
+
+
+class PreflopSolver:
+    """CFR+ or DCFR (alpha, beta, gamma) solver for a GameConfig."""
+
+    def __init__(self, config: GameConfig, equity: Optional[np.ndarray] = None,
+                 algorithm: str = DCFR, alpha: float = 1.5, beta: float = 0.0,
+                 gamma: float = 2.0):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {ALGORITHMS}")
+        self.config = config
+        self.algorithm = algorithm
+        self.alpha, self.beta, self.gamma = alpha, beta, gamma
+        self.root, self.decisions = build_tree(config)
+        self.n = config.players
+
+        eq = equity if equity is not None else load_equity_matrix()
+        blockers = blocker_matrix()
+        # P(villain class | hero class) under card removal
+        self.cond = blockers / blockers.sum(axis=1, keepdims=True)
+        r = config.oop_realization
+        self._share_all_in = self.cond * eq
+        self._share_oop = self.cond * (r * eq)
+        self._share_ip = self.cond * (1.0 - r * (1.0 - eq))
+
+        self.regrets = [np.zeros((NUM_CLASSES, len(d.actions))) for d in self.decisions]
+        self.strategy_sum = [np.zeros_like(r) for r in self.regrets]
+        self.iteration = 0
+        self.elapsed = 0.0
+        self.history: List[Dict[str, float]] = []
+
+    # Strategies
+    def current_strategy(self) -> List[np.ndarray]:
+        return [regret_matching(r) for r in self.regrets]
+
+    def average_strategy(self) -> List[np.ndarray]:
+        return [_normalize(s) for s in self.strategy_sum]
+
+    # Tree walk
+    @staticmethod
+    def _excluding_each(factors: np.ndarray) -> np.ndarray:
+        """Row i: product of every other player's factor (prefix/suffix products)."""
+        out = np.ones_like(factors)
+        out[1:] = np.cumprod(factors[:-1], axis=0)
+        out[:-1] *= np.cumprod(factors[:0:-1], axis=0)[::-1]
+        return out
+
+    def _terminal_values(self, node: Node, reach: np.ndarray, factors: np.ndarray) -> np.ndarray:
+        invested = np.asarray(node.invested)
+        pot = invested.sum()
+        others = self._excluding_each(factors)
+        values = -invested[:, None] * others
+        if len(node.live) == 1:
+            winner = node.live[0]
+            values[winner] += pot * others[winner]
+            return values
+
+        a, b = node.live
+        keep = [i for i in range(self.n) if i != a and i != b]
+        rest = np.prod(factors[keep], axis=0) if keep else np.ones(NUM_CLASSES)
+        for hero, villain in ((a, b), (b, a)):
+            if node.all_in:
+                share = self._share_all_in
+            elif hero == node.in_position:
+                share = self._share_ip
+            else:
+                share = self._share_oop
+            values[hero] = rest * (pot * (share @ reach[villain]) - invested[hero] * factors[villain])
+        return values
+
+    def _walk(self, node: Node, reach: np.ndarray, factors: np.ndarray,
+              strategy: List[np.ndarray], regrets: Optional[list] = None,
+              contributions: Optional[list] = None, best_response: bool = False):
+        """Counterfactual values per player (and best-response values if asked)."""
+        if node.is_terminal:
+            values = self._terminal_values(node, reach, factors)
+            return (values, values) if best_response else values
+
+        k = node.player
+        sigma = strategy[node.index]
+        child_values = []
+        child_br = []
+        for a, child in enumerate(node.children):
+            child_reach = reach.copy()
+            child_reach[k] = reach[k] * sigma[:, a]
+            child_factors = factors.copy()
+            child_factors[k] = self.cond @ child_reach[k]
+            result = self._walk(child, child_reach, child_factors, strategy,
+                                regrets, contributions, best_response)
+            if best_response:
+                child_values.append(result[0])
+                child_br.append(result[1])
+            else:
+                child_values.append(result)
+
+        stacked = np.stack(child_values)          # (actions, players, classes)
+        values = stacked.sum(axis=0)
+        action_values = stacked[:, k, :].T        # (classes, actions)
+        values[k] = (sigma * action_values).sum(axis=1)
+
+        if regrets is not None:
+            regrets[node.index] = action_values - values[k][:, None]
+            contributions[node.index] = reach[k][:, None] * sigma
+        if best_response:
+            br_stacked = np.stack(child_br)
+            br = br_stacked.sum(axis=0)
+            br[k] = br_stacked[:, k, :].max(axis=0)
+            return values, br
+        return values
+
+    def _root_arrays(self):
+        return np.ones((self.n, NUM_CLASSES)), np.ones((self.n, NUM_CLASSES))
+
+    # Training
+    def iterate(self) -> None:
+        """One simultaneous-update iteration over the whole tree."""
+        t = self.iteration + 1
+        strategy = self.current_strategy()
+        inst = [None] * len(self.decisions)
+        contributions = [None] * len(self.decisions)
+        reach, factors = self._root_arrays()
+        self._walk(self.root, reach, factors, strategy, inst, contributions)
+
+        if self.algorithm == CFR_PLUS:
+            for d in range(len(self.decisions)):
+                self.regrets[d] = np.maximum(self.regrets[d] + inst[d], 0.0)
+                self.strategy_sum[d] += t * contributions[d]
+        else:
+            pos = t ** self.alpha / (t ** self.alpha + 1.0)
+            neg = t ** self.beta / (t ** self.beta + 1.0)
+            keep = ((t - 1) / t) ** self.gamma
+            for d in range(len(self.decisions)):
+                r = self.regrets[d] + inst[d]
+                self.regrets[d] = np.where(r > 0, r * pos, r * neg)
+                self.strategy_sum[d] = self.strategy_sum[d] * keep + contributions[d]
+        self.iteration = t
+
+    def exploitability(self) -> float:
+        """Mean per-player gain (bb/hand) from best-responding to the average strategy."""
+        reach, factors = self._root_arrays()
+        values, br = self._walk(self.root, reach, factors, self.average_strategy(),
+                                best_response=True)
+        return float(np.mean((br - values) @ CLASS_PRIOR))
+
+    def solve(self, iterations: int, eval_every: int = 25,
+              checkpoint_path: Optional[str] = None, checkpoint_every: int = 0,
+              callback: Optional[Callable[["PreflopSolver"], None]] = None) -> Dict[str, float]:
+        """Run ``iterations`` more iterations; returns throughput and exploitability."""
+        start = time.perf_counter()
+        train_s = 0.0
+        for _ in range(iterations):
+            t0 = time.perf_counter()
+            self.iterate()
+            train_s += time.perf_counter() - t0
+            if eval_every and self.iteration % eval_every == 0:
+                self._record()
+            if checkpoint_path and checkpoint_every and self.iteration % checkpoint_every == 0:
+                self.save_checkpoint(checkpoint_path)
+            if callback:
+                callback(self)
+        if not self.history or self.history[-1]["iteration"] != self.iteration:
+            self._record()
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+        self.elapsed += time.perf_counter() - start
+
+        return {
+            "iterations": iterations,
+            "total_iterations": self.iteration,
+            "seconds": round(time.perf_counter() - start, 3),
+            "iterations_per_sec": round(iterations / train_s, 1) if train_s else 0.0,
+            "exploitability_bb": self.history[-1]["exploitability_bb"],
+            "exploitability_mbb": round(self.history[-1]["exploitability_bb"] * 1000, 2),
+        }
+
+    def _record(self) -> None:
+        self.history.append({"iteration": self.iteration,
+                             "exploitability_bb": self.exploitability()})
+
+    # Checkpoints
+    def _meta(self) -> dict:
+        return {
+            "config": self.config.to_dict(),
+            "algorithm": self.algorithm,
+            "alpha": self.alpha,
+            "beta": self.beta,
+            "gamma": self.gamma,
+            "iteration": self.iteration,
+            "elapsed": self.elapsed,
+            "history": self.history,
+            "nodes": [d.key for d in self.decisions],
+        }
+
+    def save_checkpoint(self, path: str) -> str:
+        arrays = {f"regrets_{i}": r for i, r in enumerate(self.regrets)}
+        arrays.update({f"sum_{i}": s for i, s in enumerate(self.strategy_sum)})
+        with open(path, "wb") as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(self._meta())), **arrays)
+        return path
+
+    def load_checkpoint(self, path: str) -> None:
+        """Resume from ``path``; the checkpoint must match this solver's tree."""
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta["config"] != self.config.to_dict() or meta["nodes"] != [d.key for d in self.decisions]:
+                raise ValueError(f"Checkpoint {path} was made for a different game")
+            self.regrets = [data[f"regrets_{i}"] for i in range(len(self.decisions))]
+            self.strategy_sum = [data[f"sum_{i}"] for i in range(len(self.decisions))]
+        self.algorithm = meta["algorithm"]
+        self.alpha, self.beta, self.gamma = meta["alpha"], meta["beta"], meta["gamma"]
+        self.iteration = meta["iteration"]
+        self.elapsed = meta["elapsed"]
+        self.history = meta["history"]
+
+    @classmethod
+    def from_checkpoint(cls, path: str, equity: Optional[np.ndarray] = None) -> "PreflopSolver":
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+        solver = cls(GameConfig(**meta["config"]), equity=equity, algorithm=meta["algorithm"])
+        solver.load_checkpoint(path)
+        return solver
@@ -0,0 +1,100 @@
+"""
+Preflop all-in equity between the 169 hand classes.
+
+``compute_equity_matrix`` runs stratified Monte Carlo: each round deals one
+card-disjoint combo pair and a random board for every class pair i <= j, so
+every matchup gets the same number of samples. The matrix is symmetric
+(``eq[j, i] == 1 - eq[i, j]``) and cached on disk by ``load_equity_matrix``.
+"""
+
+import os
+import time
+from typing import Optional
+
+import numpy as np
+
+from .evaluator import evaluate7
+from .hand_classes import COMBOS, NUM_CLASSES, class_members
+
+
+DEFAULT_ROUNDS = 256
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data"
+)
+
+
+def _pick(members, classes, rng):
+    """One random combo (index) from each requested class."""
+    out = np.empty(len(classes), dtype=np.int64)
+    for c in np.unique(classes):
+        rows = np.flatnonzero(classes == c)
+        out[rows] = rng.choice(members[c], size=len(rows))
+    return out
+
+
+def compute_equity_matrix(rounds: int = DEFAULT_ROUNDS, seed: int = 0,
+                          verbose: bool = False) -> np.ndarray:
+    """(169, 169) equity of class i against class j, ties counting half."""
+    rng = np.random.default_rng(seed)
+    members = class_members()
+    ii, jj = np.triu_indices(NUM_CLASSES)
+    n = len(ii)
+    wins = np.zeros(n)
+    start = time.perf_counter()
+
+    for r in range(rounds):
+        a = _pick(members, ii, rng)
+        b = _pick(members, jj, rng)
+        # Redeal villain combos that share a card with hero's
+        for _ in range(64):
+            ca, cb = COMBOS[a], COMBOS[b]
+            clash = ((ca[:, :1] == cb) | (ca[:, 1:] == cb)).any(axis=1)
+            if not clash.any():
+                break
+            b[clash] = _pick(members, jj[clash], rng)
+
+        hero, villain = COMBOS[a], COMBOS[b]
+        keys = rng.random((n, 52))
+        rows = np.arange(n)[:, None]
+        keys[rows, hero] = 2.0
+        keys[rows, villain] = 2.0
+        board = np.argpartition(keys, 5, axis=1)[:, :5]
+
+        s1 = evaluate7(np.hstack([hero, board]))
+        s2 = evaluate7(np.hstack([villain, board]))
+        wins += (s1 > s2) + 0.5 * (s1 == s2)
+        if verbose and (r + 1) % 16 == 0:
+            print(f"🎲 Equity: {r + 1}/{rounds} rounds ({time.perf_counter() - start:.1f}s)")
+
+    eq = np.empty((NUM_CLASSES, NUM_CLASSES))
+    eq[ii, jj] = wins / rounds
+    eq[jj, ii] = 1.0 - wins / rounds
+    np.fill_diagonal(eq, 0.5)
+    return eq
+
+
+def load_equity_matrix(rounds: int = DEFAULT_ROUNDS, seed: int = 0,
+                       cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                       verbose: bool = True) -> np.ndarray:
+    """Equity matrix from the on-disk cache, computing (and saving) it if missing."""
+    path = None
+    if cache_dir:
+        path = os.path.join(cache_dir, f"preflop_equity_r{rounds}_s{seed}.npy")
+        if os.path.exists(path):
+            try:
+                eq = np.load(path)
+                if eq.shape == (NUM_CLASSES, NUM_CLASSES):
+                    return eq
+            except Exception:
+                pass
+
+    if verbose:
+        print(f"🎲 Computing preflop equity matrix ({rounds} rounds)...")
+    eq = compute_equity_matrix(rounds, seed, verbose=verbose)
+    if path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(path, eq)
+        except Exception as e:
+            print(f"⚠️ Could not cache equity matrix: {e}")
+    return eq
@@ -0,0 +1,103 @@
+"""
+Vectorized 7-card hand evaluator.
+
+``evaluate7`` scores a batch of 7-card hands at once; a higher score is a
+better hand. Scores pack the category (0 = high card ... 8 = straight
+flush) above five 4-bit kicker ranks, so they compare directly.
+"""
+
+import numpy as np
+
+
+HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT, FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH = range(9)
+
+_RANK_BITS = (1 << np.arange(13)).astype(np.int64)
+_RANKS = np.arange(13)
+
+
+def _top(mask: np.ndarray, k: int) -> np.ndarray:
+    """Highest ``k`` ranks set in each row of a (N, 13) mask (0 where missing)."""
+    desc = mask[:, ::-1]
+    order = np.argsort(~desc, axis=1, kind="stable")[:, :k]
+    ranks = 12 - order
+    present = np.take_along_axis(desc, order, axis=1)
+    return np.where(present, ranks, 0)
+
+
+def _straight_high(bits: np.ndarray) -> np.ndarray:
+    """High rank of the best straight in a rank bitmask, or -1."""
+    # Bit 0 is the ace playing low, bit r + 1 is rank r
+    wide = (bits << 1) | ((bits >> 12) & 1)
+    high = np.full(bits.shape, -1, dtype=np.int64)
+    for top in range(3, 13):
+        hit = ((wide >> (top - 3)) & 31) == 31
+        high = np.where(hit, top, high)
+    return high
+
+
+def _pack(category, kickers) -> np.ndarray:
+    score = np.asarray(category, dtype=np.int64) << 20
+    for i in range(kickers.shape[1]):
+        score = score | (kickers[:, i].astype(np.int64) << (16 - 4 * i))
+    return score
+
+
+def evaluate7(cards: np.ndarray) -> np.ndarray:
+    """Scores for an (N, 7) array of card indices."""
+    cards = np.asarray(cards)
+    n = cards.shape[0]
+    ranks = cards // 4
+    suits = cards % 4
+
+    counts = (ranks[:, :, None] == _RANKS).sum(axis=1)
+    suit_counts = (suits[:, :, None] == np.arange(4)).sum(axis=1)
+    present = counts > 0
+    bits = present @ _RANK_BITS
+
+    flush_suit = suit_counts.argmax(axis=1)
+    has_flush = suit_counts.max(axis=1) >= 5
+    in_flush = suits == flush_suit[:, None]
+    flush_bits = np.where(in_flush, 1 << ranks, 0).sum(axis=1)
+    flush_mask = (flush_bits[:, None] >> _RANKS) & 1 == 1
+
+    straight = _straight_high(bits)
+    straight_flush = np.where(has_flush, _straight_high(flush_bits), -1)
+
+    quads = counts == 4
+    trips = counts == 3
+    pairs = counts == 2
+    n_trips = trips.sum(axis=1)
+    n_pairs = pairs.sum(axis=1)
+    zeros = np.zeros((n, 4), dtype=np.int64)
+
+    quad_rank = _top(quads, 1)
+    trip_rank = _top(trips, 1)
+    pair_top = _top(pairs, 2)
+    not_quad = present & (_RANKS != quad_rank)
+    not_trip = present & (_RANKS != trip_rank)
+    # Full house: the best trips plus the best other pair (a second trips counts)
+    boat_pair = _top((counts >= 2) & (_RANKS != trip_rank), 1)
+    not_pairs = present & (_RANKS != pair_top[:, :1]) & (_RANKS != pair_top[:, 1:2])
+    not_pair = present & (_RANKS != pair_top[:, :1])
+
+    candidates = [
+        (straight_flush >= 0, STRAIGHT_FLUSH,
+         np.hstack([straight_flush[:, None], zeros])),
+        (quads.any(axis=1), QUADS, np.hstack([quad_rank, _top(not_quad, 1), zeros[:, :3]])),
+        ((n_trips >= 1) & ((n_trips >= 2) | (n_pairs >= 1)), FULL_HOUSE,
+         np.hstack([trip_rank, boat_pair, zeros[:, :3]])),
+        (has_flush, FLUSH, _top(flush_mask, 5)),
+        (straight >= 0, STRAIGHT, np.hstack([straight[:, None], zeros])),
+        (n_trips >= 1, TRIPS, np.hstack([trip_rank, _top(not_trip, 2), zeros[:, :2]])),
+        (n_pairs >= 2, TWO_PAIR, np.hstack([pair_top, _top(not_pairs, 1), zeros[:, :2]])),
+        (n_pairs == 1, PAIR, np.hstack([pair_top[:, :1], _top(not_pair, 3), zeros[:, :1]])),
+    ]
+
+    score = _pack(np.full(n, HIGH_CARD), _top(present, 5))
+    for condition, category, kickers in reversed(candidates):
+        score = np.where(condition, _pack(np.full(n, category), kickers), score)
+    return score
+
+
+def category(score) -> np.ndarray:
+    return np.asarray(score) >> 20
@@ -0,0 +1,194 @@
+"""
+Public betting trees for the preflop abstractions.
+
+Both games share one shape: players act in order until someone opens
+(``PUSH_FOLD`` opens all-in, ``OPEN_3BET`` opens to ``open_size``). After
+the open, the first player to continue ends the round of responses and
+the hand is heads-up from there; a 3-bet lets the opener fold, call or
+jam, and a jam gets a call or fold. Calls that are not all-in go to a
+showdown where the out-of-position player realizes ``oop_realization`` of
+its equity.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+PUSH_FOLD = "push_fold"
+OPEN_3BET = "open_3bet"
+GAMES = (PUSH_FOLD, OPEN_3BET)
+
+FOLD, CALL, RAISE = "fold", "call", "raise"
+
+POSITION_NAMES: Dict[int, List[str]] = {
+    2: ["SB", "BB"],
+    3: ["BTN", "SB", "BB"],
+    4: ["CO", "BTN", "SB", "BB"],
+    5: ["UTG", "CO", "BTN", "SB", "BB"],
+    6: ["UTG", "MP", "CO", "BTN", "SB", "BB"],
+    7: ["UTG", "UTG+1", "MP", "CO", "BTN", "SB", "BB"],
+    8: ["UTG", "UTG+1", "MP", "MP+1", "CO", "BTN", "SB", "BB"],
+    9: ["UTG", "UTG+1", "UTG+2", "MP", "MP+1", "CO", "BTN", "SB", "BB"],
+}
+
+
+@dataclass
+class GameConfig:
+    """Preflop abstraction parameters (chip amounts in big blinds)."""
+    game: str = PUSH_FOLD
+    players: int = 2
+    stack_bb: float = 10.0
+    small_blind: float = 0.5
+    big_blind: float = 1.0
+    ante: float = 0.0
+    open_size: float = 2.5
+    three_bet_multiplier: float = 3.0
+    oop_realization: float = 0.85
+
+    def __post_init__(self):
+        if self.game not in GAMES:
+            raise ValueError(f"Unknown game {self.game!r}; expected one of {GAMES}")
+        if not 2 <= self.players <= 9:
+            raise ValueError("players must be between 2 and 9")
+        if self.stack_bb <= self.big_blind:
+            raise ValueError("stack_bb must exceed the big blind")
+
+    @property
+    def positions(self) -> List[str]:
+        return POSITION_NAMES[self.players]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class Node:
+    """Decision (``player`` >= 0) or terminal node of the public tree."""
+    key: str
+    player: int = -1
+    actions: Tuple[str, ...] = ()
+    children: List["Node"] = field(default_factory=list)
+    # Terminal payoff description
+    invested: Tuple[float, ...] = ()
+    live: Tuple[int, ...] = ()
+    all_in: bool = False
+    in_position: int = -1
+    index: int = -1  # decision node slot in the solver arrays
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.player < 0
+
+
+def _postflop_order(seat: int, n: int) -> int:
+    """Postflop acting order: blinds first, then the rest in seat order."""
+    if n == 2:
+        return 1 - seat  # heads-up the SB/button acts last
+    if seat == n - 2:
+        return 0
+    if seat == n - 1:
+        return 1
+    return seat + 2
+
+
+class TreeBuilder:
+    """Builds the public tree for a GameConfig; ``decisions`` lists decision nodes."""
+
+    def __init__(self, config: GameConfig):
+        self.config = config
+        self.n = config.players
+        self.decisions: List[Node] = []
+
+    def build(self) -> Node:
+        self.decisions = []
+        return self._opener(0)
+
+    # Helpers
+    def _posted(self) -> List[float]:
+        cfg = self.config
+        posted = [cfg.ante] * self.n
+        posted[self.n - 2] += cfg.small_blind
+        posted[self.n - 1] += cfg.big_blind
+        return posted
+
+    def _decision(self, key: str, player: int, actions, children) -> Node:
+        node = Node(key=key, player=player, actions=tuple(actions), children=list(children))
+        node.index = len(self.decisions)
+        self.decisions.append(node)
+        return node
+
+    def _terminal(self, key: str, bets: Dict[int, float], live, all_in=False) -> Node:
+        ante = self.config.ante
+        invested = list(self._posted())
+        for seat, to_amount in bets.items():
+            invested[seat] = ante + to_amount
+        in_position = -1
+        if len(live) == 2:
+            in_position = max(live, key=lambda s: _postflop_order(s, self.n))
+        return Node(key=key, invested=tuple(invested), live=tuple(live),
+                    all_in=all_in, in_position=in_position)
+
+    def _label(self, seat: int) -> str:
+        return self.config.positions[seat]
+
+    # Tree
+    def _opener(self, p: int) -> Node:
+        n = self.n
+        name = self._label(p)
+        if p == n - 1:
+            # Folded round to the big blind
+            return self._terminal(f"walk:{name}", {}, (p,))
+        cfg = self.config
+        stack = cfg.stack_bb
+        open_to = stack if cfg.game == PUSH_FOLD else min(cfg.open_size, stack)
+        fold = self._opener(p + 1)
+        raise_ = self._responder(p, p + 1, open_to)
+        return self._decision(f"open:{name}", p, (FOLD, RAISE), (fold, raise_))
+
+    def _responder(self, p: int, q: int, open_to: float) -> Node:
+        n = self.n
+        opener = self._label(p)
+        if q == n:
+            return self._terminal(f"steal:{opener}", {p: open_to}, (p,))
+        stack = self.config.stack_bb
+        name = self._label(q)
+        key = f"vs_open:{opener}:{name}"
+        fold = self._responder(p, q + 1, open_to)
+        call = self._terminal(f"{key}:call", {p: open_to, q: open_to}, (p, q),
+                              all_in=open_to >= stack)
+        if open_to >= stack:
+            return self._decision(key, q, (FOLD, CALL), (fold, call))
+
+        three_bet_to = min(open_to * self.config.three_bet_multiplier, stack)
+        three_bet = self._vs_three_bet(p, q, open_to, three_bet_to)
+        return self._decision(key, q, (FOLD, CALL, RAISE), (fold, call, three_bet))
+
+    def _vs_three_bet(self, p: int, q: int, open_to: float, three_bet_to: float) -> Node:
+        stack = self.config.stack_bb
+        key = f"vs_3bet:{self._label(p)}:{self._label(q)}"
+        fold = self._terminal(f"{key}:fold", {p: open_to, q: three_bet_to}, (q,))
+        call = self._terminal(f"{key}:call", {p: three_bet_to, q: three_bet_to}, (p, q),
+                              all_in=three_bet_to >= stack)
+        if three_bet_to >= stack:
+            return self._decision(key, p, (FOLD, CALL), (fold, call))
+
+        vs_jam_key = f"vs_jam:{self._label(q)}:{self._label(p)}"
+        vs_jam = self._decision(vs_jam_key, q, (FOLD, CALL), (
+            self._terminal(f"{vs_jam_key}:fold", {p: stack, q: three_bet_to}, (p,)),
+            self._terminal(f"{vs_jam_key}:call", {p: stack, q: stack}, (p, q), all_in=True),
+        ))
+        return self._decision(key, p, (FOLD, CALL, RAISE), (fold, call, vs_jam))
+
+
+def build_tree(config: GameConfig) -> Tuple[Node, List[Node]]:
+    """Root node and decision nodes (indexed by ``Node.index``)."""
+    builder = TreeBuilder(config)
+    root = builder.build()
+    return root, builder.decisions
+
+
+def find_node(decisions: List[Node], key: str) -> Optional[Node]:
+    for node in decisions:
+        if node.key == key:
+            return node
+    return None
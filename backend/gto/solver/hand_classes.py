@@ -0,0 +1,93 @@
+"""
+The 169 preflop hand classes and their 1,326 concrete combos.
+
+Cards are ints 0-51 with ``rank = card // 4`` (0 = deuce, 12 = ace) and
+``suit = card % 4``. Classes are laid out as the usual 13x13 grid, aces
+first: the diagonal holds pairs, above it suited hands, below it offsuit.
+"""
+
+from itertools import combinations
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+NUM_CLASSES = 169
+NUM_COMBOS = 1326
+
+
+def card_index(card: str) -> int:
+    """'As' -> 51."""
+    return RANKS.index(card[0].upper()) * 4 + SUITS.index(card[1].lower())
+
+
+def card_str(index: int) -> str:
+    return RANKS[index // 4] + SUITS[index % 4]
+
+
+def _build_labels() -> List[str]:
+    labels = []
+    for row in range(12, -1, -1):
+        for col in range(12, -1, -1):
+            if row == col:
+                labels.append(RANKS[row] * 2)
+            elif col < row:
+                labels.append(RANKS[row] + RANKS[col] + "s")
+            else:
+                labels.append(RANKS[col] + RANKS[row] + "o")
+    return labels
+
+
+HAND_CLASSES: List[str] = _build_labels()
+CLASS_INDEX: Dict[str, int] = {label: i for i, label in enumerate(HAND_CLASSES)}
+
+
+def class_of(c1: int, c2: int) -> int:
+    """Class index of a two-card combo."""
+    r1, r2 = c1 // 4, c2 // 4
+    if r1 < r2:
+        r1, r2 = r2, r1
+    if r1 == r2:
+        return CLASS_INDEX[RANKS[r1] * 2]
+    suffix = "s" if c1 % 4 == c2 % 4 else "o"
+    return CLASS_INDEX[RANKS[r1] + RANKS[r2] + suffix]
+
+
+def hand_class(cards: Sequence[str]) -> str:
+    """['As', 'Kd'] -> 'AKo'."""
+    return HAND_CLASSES[class_of(card_index(cards[0]), card_index(cards[1]))]
+
+
+def _build_combos() -> Tuple[np.ndarray, np.ndarray]:
+    combos = np.array(list(combinations(range(52), 2)), dtype=np.int16)
+    classes = np.array([class_of(int(a), int(b)) for a, b in combos], dtype=np.int16)
+    return combos, classes
+
+
+COMBOS, COMBO_CLASS = _build_combos()
+# CARD_COMBOS[c] marks the combos that use card c
+CARD_COMBOS = np.zeros((52, NUM_COMBOS), dtype=bool)
+CARD_COMBOS[COMBOS[:, 0], np.arange(NUM_COMBOS)] = True
+CARD_COMBOS[COMBOS[:, 1], np.arange(NUM_COMBOS)] = True
+# Combos per class: 6 for pairs, 4 suited, 12 offsuit
+CLASS_COMBOS = np.bincount(COMBO_CLASS, minlength=NUM_CLASSES).astype(np.float64)
+CLASS_PRIOR = CLASS_COMBOS / NUM_COMBOS
+
+
+def class_members() -> List[np.ndarray]:
+    """Combo indices for each class."""
+    return [np.flatnonzero(COMBO_CLASS == i) for i in range(NUM_CLASSES)]
+
+
+def blocker_matrix() -> np.ndarray:
+    """W[i, j]: number of card-disjoint combo pairs between classes i and j."""
+    incidence = np.zeros((NUM_COMBOS, 52), dtype=np.float32)
+    rows = np.arange(NUM_COMBOS)
+    incidence[rows, COMBOS[:, 0]] = 1
+    incidence[rows, COMBOS[:, 1]] = 1
+    disjoint = (incidence @ incidence.T) == 0
+    member = np.zeros((NUM_CLASSES, NUM_COMBOS), dtype=np.float64)
+    member[COMBO_CLASS, rows] = 1
+    return member @ disjoint.astype(np.float64) @ member.T
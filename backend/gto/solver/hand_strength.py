@@ -0,0 +1,158 @@
+"""
+Evaluator-backed postflop hand strength.
+
+``HandStrengthService.hand_strength(hole, board)`` is the hand's percentile
+against every opponent holding the board and hole cards leave possible
+(HS: wins plus half the ties). ``evaluate(..., potential=True)`` adds the
+one-card lookahead figures: HS² (mean squared strength over the next card),
+positive potential (behind now, ahead after) and negative potential (ahead
+now, behind after).
+
+Boards are canonicalized up to suit permutation, and the scores of all
+hole combos on a canonical board are evaluated once with ``evaluate7`` and
+kept in an LRU, as are finished per-spot results. A repeated spot costs a
+cache lookup.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from ..suit_isomorphism import SpotCache, canonical_groups
+from .evaluator import evaluate7
+from .hand_classes import COMBOS, card_index
+
+# Index of each two-card combo in COMBOS, by (low card, high card)
+_COMBO_INDEX = np.full((52, 52), -1, dtype=np.int32)
+_COMBO_INDEX[COMBOS[:, 0], COMBOS[:, 1]] = np.arange(len(COMBOS))
+_COMBO_INDEX[COMBOS[:, 1], COMBOS[:, 0]] = np.arange(len(COMBOS))
+
+Spot = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+@lru_cache(maxsize=65536)
+def _spot_key(hole: Tuple, board: Tuple) -> Spot:
+    hole = [card_index(c) if isinstance(c, str) else int(c) for c in hole]
+    board = [card_index(c) if isinstance(c, str) else int(c) for c in board]
+    if len(hole) != 2 or not 3 <= len(board) <= 5 or len(set(hole + board)) != len(hole) + len(board):
+        raise ValueError(f"need two hole cards and a 3-5 card board, got {hole} / {board}")
+    # Showdown strength ignores card order, so the whole board is one group
+    return canonical_groups((board, hole))[1]
+
+
+class HandStrengthService:
+    """HS, HS² and hand potential for (hole, board), cached by canonical board."""
+
+    def __init__(self, max_boards: int = 512, max_spots: int = 50000):
+        self._boards = SpotCache(max_boards)
+        self._spots = SpotCache(max_spots)
+
+    def board_scores(self, board: Tuple[int, ...]) -> np.ndarray:
+        """Score of every combo on ``board`` (-1 where the combo uses a board card)."""
+        def compute():
+            live = ~np.isin(COMBOS, board).any(axis=1)
+            hands = np.hstack([COMBOS[live], np.tile(np.array(board, dtype=np.int16), (live.sum(), 1))])
+            scores = np.full(len(COMBOS), -1, dtype=np.int64)
+            scores[live] = evaluate7(hands)
+            return scores
+        return self._boards.get_or_compute(board, compute)
+
+    @staticmethod
+    def _parse(hole, board) -> Spot:
+        return _spot_key(tuple(hole), tuple(board))
+
+    def hand_strength(self, hole, board) -> float:
+        """Percentile of ``hole`` against all opponent holdings on ``board`` (0-1)."""
+        return self.evaluate(hole, board)["hs"]
+
+    def evaluate(self, hole, board, potential: bool = False) -> Dict[str, float]:
+        """``{"hs": ...}``, plus ``hs2``, ``ppot`` and ``npot`` when ``potential`` is set."""
+        board_key, hole_key = self._parse(hole, board)
+        result = self._spots.get_or_compute(
+            (board_key, hole_key), lambda: {"hs": self._strength(board_key, hole_key)})
+        if potential and "hs2" not in result:
+            result.update(self._potential(board_key, hole_key))
+        return dict(result)
+
+    def _strength(self, board: Tuple[int, ...], hole: Tuple[int, ...]) -> float:
+        scores = self.board_scores(board)
+        hero = scores[_COMBO_INDEX[hole[0], hole[1]]]
+        opp = scores[(scores >= 0) & ~np.isin(COMBOS, hole).any(axis=1)]
+        wins = np.count_nonzero(hero > opp)
+        ties = np.count_nonzero(hero == opp)
+        return float((wins + 0.5 * ties) / len(opp))
+
+    def _potential(self, board: Tuple[int, ...], hole: Tuple[int, ...]) -> Dict[str, float]:
+        if len(board) == 5:
+            hs = self._strength(board, hole)
+            return {"hs2": hs * hs, "ppot": 0.0, "npot": 0.0}
+
+        dead = set(board) | set(hole)
+        opponents = COMBOS[~np.isin(COMBOS, list(dead)).any(axis=1)]
+        board_arr = np.array(board, dtype=np.int16)
+        now_scores = self.board_scores(board)
+        hero_now = now_scores[_COMBO_INDEX[hole[0], hole[1]]]
+        opp_now = now_scores[_COMBO_INDEX[opponents[:, 0], opponents[:, 1]]]
+        now = np.sign(hero_now - opp_now)  # 1 ahead, 0 tied, -1 behind
+
+        # Every (next card, opponent) pair not sharing a card
+        nexts = np.array([c for c in range(52) if c not in dead], dtype=np.int16)
+        pairs_card = np.repeat(nexts, len(opponents))
+        pairs_opp = np.tile(np.arange(len(opponents)), len(nexts))
+        live = (opponents[pairs_opp, 0] != pairs_card) & (opponents[pairs_opp, 1] != pairs_card)
+        pairs_card, pairs_opp = pairs_card[live], pairs_opp[live]
+
+        shared = np.hstack([np.tile(board_arr, (len(pairs_card), 1)), pairs_card[:, None]])
+        opp_later = evaluate7(np.hstack([opponents[pairs_opp], shared]))
+        hero_hands = np.hstack([np.tile(np.array(hole, dtype=np.int16), (len(nexts), 1)),
+                                np.tile(board_arr, (len(nexts), 1)), nexts[:, None]])
+        hero_later = evaluate7(hero_hands)[np.searchsorted(nexts, pairs_card)]
+        later = np.sign(hero_later - opp_later)
+
+        before = now[pairs_opp]
+        totals = {s: np.count_nonzero(before == s) for s in (1, 0, -1)}
+        hp = {(a, b): np.count_nonzero((before == a) & (later == b))
+              for a in (1, 0, -1) for b in (1, 0, -1)}
+        ppot_den = totals[-1] + totals[0] / 2
+        npot_den = totals[1] + totals[0] / 2
+        ppot = (hp[-1, 1] + hp[-1, 0] / 2 + hp[0, 1] / 2) / ppot_den if ppot_den else 0.0
+        npot = (hp[1, -1] + hp[1, 0] / 2 + hp[0, -1] / 2) / npot_den if npot_den else 0.0
+
+        # HS² over the next card: strength per card, squared, averaged
+        won = (later == 1) + 0.5 * (later == 0)
+        per_card = np.bincount(np.searchsorted(nexts, pairs_card), weights=won, minlength=len(nexts))
+        counts = np.bincount(np.searchsorted(nexts, pairs_card), minlength=len(nexts))
+        hs_next = per_card / np.maximum(counts, 1)
+        return {"hs2": float(np.mean(hs_next ** 2)), "ppot": float(ppot), "npot": float(npot)}
+
+    def combo_strengths(self, board) -> np.ndarray:
+        """HS of every one of the 1,326 combos on ``board`` (0 for combos using a board card).
+
+        Blockers between the two hands are ignored, which keeps this a
+        single sort per board.
+        """
+        key = tuple(sorted(card_index(c) if isinstance(c, str) else int(c) for c in board))
+
+        def compute():
+            scores = self.board_scores(key)
+            live = scores >= 0
+            ordered = np.sort(scores[live])
+            below = np.searchsorted(ordered, scores, side="left")
+            equal = np.searchsorted(ordered, scores, side="right") - below - 1
+            hs = (below + 0.5 * equal) / max(len(ordered) - 1, 1)
+            return np.where(live, hs, 0.0)
+        return self._boards.get_or_compute(("hs",) + key, compute)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"boards": self._boards.get_stats(), "spots": self._spots.get_stats()}
+
+
+_hand_strength_service: Optional[HandStrengthService] = None
+
+
+def get_hand_strength_service() -> HandStrengthService:
+    global _hand_strength_service
+    if _hand_strength_service is None:
+        _hand_strength_service = HandStrengthService()
+    return _hand_strength_service
@@ -0,0 +1,227 @@
+"""
+Range-vs-range equity.
+
+``RangeEquityEngine.equity(ranges, board)`` returns each range's share of
+the pot when the ranges see the board through to showdown. Ranges are
+weights over the 1,326 combos (or anything ``combo_weights`` accepts: a
+class list, a class -> weight dict, a compiled ``gto_preflop_ranges``
+entry). Hands that share a card with each other, the board or the dead
+cards never meet, so every result is card-removal aware.
+
+Heads up on the turn and river, every compatible (hand, hand, runout) is
+enumerated using the evaluator's per-board score tables. On the flop and
+preflop, and in multi-way pots, hands and runouts are sampled in
+vectorized batches; multi-way sampling is spread over a process pool.
+
+Results are cached by (canonical board, range hashes): the board is
+relabelled to its suit-canonical form and the ranges are relabelled with
+it, so suit-symmetric ranges share entries across isomorphic boards.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .evaluator import evaluate7
+from .hand_classes import (
+    CARD_COMBOS, CLASS_INDEX, COMBO_CLASS, COMBOS, NUM_CLASSES, NUM_COMBOS, card_index,
+)
+from ..suit_isomorphism import SUIT_PERMUTATIONS, SpotCache, canonical_groups, relabel
+from .hand_strength import _COMBO_INDEX, HandStrengthService, get_hand_strength_service
+
+DEFAULT_SAMPLES = 20000
+
+
+def _build_combo_permutations() -> np.ndarray:
+    """PERM[p, i]: index of combo i after relabelling suits with permutation p."""
+    out = np.empty((len(SUIT_PERMUTATIONS), NUM_COMBOS), dtype=np.int32)
+    for p, perm in enumerate(SUIT_PERMUTATIONS):
+        mapped = COMBOS - COMBOS % 4 + np.array(perm)[COMBOS % 4]
+        out[p] = _COMBO_INDEX[mapped[:, 0], mapped[:, 1]]
+    return out
+
+
+_COMBO_PERMUTATIONS = _build_combo_permutations()
+# Combos sharing no card
+_COMPATIBLE = ~(CARD_COMBOS.T.astype(np.int16) @ CARD_COMBOS.astype(np.int16)).astype(bool)
+
+
+def _cards(cards: Iterable) -> List[int]:
+    return [card_index(c) if isinstance(c, str) else int(c) for c in cards]
+
+
+def combo_weights(spec) -> np.ndarray:
+    """(1326,) weights from a combo or class vector, class list/dict, range entry or hole cards."""
+    if spec is None:
+        return np.ones(NUM_COMBOS)
+    if isinstance(spec, np.ndarray):
+        if spec.shape == (NUM_CLASSES,):
+            return spec[COMBO_CLASS].astype(np.float64)
+        return spec.astype(np.float64).reshape(NUM_COMBOS)
+    if isinstance(spec, dict):
+        if "frequencies" in spec:
+            return combo_weights(spec["frequencies"])
+        if "range" in spec:
+            return combo_weights(spec["range"]) * float(spec.get("freq", 1.0))
+        by_class = np.zeros(NUM_CLASSES)
+        for label, weight in spec.items():
+            by_class[CLASS_INDEX[label]] = weight
+        return by_class[COMBO_CLASS]
+    spec = list(spec)
+    if len(spec) == 2 and all(isinstance(c, str) and len(c) == 2 and c[1] in "cdhs" for c in spec):
+        hole = _cards(spec)  # exact hole cards
+        weights = np.zeros(NUM_COMBOS)
+        weights[_COMBO_INDEX[hole[0], hole[1]]] = 1.0
+        return weights
+    by_class = np.zeros(NUM_CLASSES)
+    by_class[[CLASS_INDEX[label] for label in spec]] = 1.0
+    return by_class[COMBO_CLASS]
+
+
+def range_hash(weights: np.ndarray) -> str:
+    return hashlib.sha1(np.ascontiguousarray(weights, dtype=np.float64).tobytes()).hexdigest()[:16]
+
+
+def sample_equity(weights: np.ndarray, board: Sequence[int], samples: int, seed: int) -> Tuple[np.ndarray, int]:
+    """Summed pot shares per range over ``samples`` compatible deals, and the deal count.
+
+    ``weights`` is (players, 1326) with dead-card combos already zeroed.
+    """
+    rng = np.random.default_rng(seed)
+    players = weights.shape[0]
+    probs = weights / weights.sum(axis=1, keepdims=True)
+    board = np.array(board, dtype=np.int16)
+    to_come = 5 - len(board)
+    totals = np.zeros(players)
+    dealt = 0
+    for _ in range(20):
+        need = samples - dealt
+        if need <= 0:
+            break
+        draw = int(need * 1.5) + 16
+        picks = np.stack([rng.choice(NUM_COMBOS, size=draw, p=probs[k]) for k in range(players)], axis=1)
+        holes = COMBOS[picks].reshape(draw, 2 * players)  # (draw, 2 * players)
+
+        ordered = np.sort(holes, axis=1)
+        ok = ~(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        if len(board):
+            ok &= ~np.isin(holes, board).any(axis=1)
+        holes = holes[ok][:need]
+        m = len(holes)
+        if m == 0:
+            continue
+
+        if to_come:
+            keys = rng.random((m, 52))
+            keys[np.arange(m)[:, None], holes] = 2.0
+            if len(board):
+                keys[:, board] = 2.0
+            runout = np.argpartition(keys, to_come, axis=1)[:, :to_come]
+            full = np.hstack([np.tile(board, (m, 1)), runout]) if len(board) else runout
+        else:
+            full = np.tile(board, (m, 1))
+
+        scores = np.stack([evaluate7(np.hstack([holes[:, 2 * k:2 * k + 2], full]))
+                           for k in range(players)], axis=1)
+        winners = scores == scores.max(axis=1, keepdims=True)
+        totals += (winners / winners.sum(axis=1, keepdims=True)).sum(axis=0)
+        dealt += m
+    return totals, dealt
+
+
+class RangeEquityEngine:
+    """Card-removal-aware equity between weighted ranges, cached by canonical board."""
+
+    def __init__(self, samples: int = DEFAULT_SAMPLES, workers: Optional[int] = None,
+                 seed: int = 0, max_cache: int = 4096,
+                 service: Optional[HandStrengthService] = None):
+        self.samples = samples
+        self.workers = min(4, os.cpu_count() or 1) if workers is None else workers
+        self.seed = seed
+        self.service = service or get_hand_strength_service()
+        self._cache = SpotCache(max_cache)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def equity(self, ranges: Sequence, board: Iterable = (), dead: Iterable = (),
+               samples: Optional[int] = None) -> List[float]:
+        """Each range's pot share on ``board`` (exhaustive heads-up on turn/river, sampled otherwise)."""
+        if len(ranges) < 2:
+            raise ValueError("need at least two ranges")
+        board, dead = _cards(board), _cards(dead)
+        if len(board) > 5 or len(board) in (1, 2):
+            raise ValueError(f"board must have 0 or 3-5 cards, got {len(board)}")
+        samples = samples or self.samples
+
+        p = canonical_groups((board, dead))[0]
+        weights = np.stack([combo_weights(r) for r in ranges])[:, np.argsort(_COMBO_PERMUTATIONS[p])]
+        board, dead = relabel(board, p), relabel(dead, p)
+        blocked = CARD_COMBOS[list(board) + list(dead)].any(axis=0)
+        weights[:, blocked] = 0.0
+        if (weights.sum(axis=1) <= 0).any():
+            raise ValueError("a range has no combos left after card removal")
+
+        key = (board, dead, tuple(range_hash(w) for w in weights), samples)
+        return list(self._cache.get_or_compute(key, lambda: self._compute(weights, board, samples)))
+
+    def _compute(self, weights: np.ndarray, board: Tuple[int, ...], samples: int) -> Tuple[float, ...]:
+        if len(weights) == 2 and len(board) >= 4:
+            return self._exact_heads_up(weights[0], weights[1], board)
+        if len(weights) > 2 and self.workers > 1:
+            totals, dealt = self._sample_on_pool(weights, board, samples)
+        else:
+            totals, dealt = sample_equity(weights, board, samples, self.seed)
+        if dealt == 0:
+            raise ValueError("ranges cannot be dealt together")
+        return tuple(float(t) for t in totals / dealt)
+
+    def _exact_heads_up(self, wa: np.ndarray, wb: np.ndarray, board: Tuple[int, ...]) -> Tuple[float, float]:
+        used = set(board)
+        runouts = [()] if len(board) == 5 else [(c,) for c in range(52) if c not in used]
+        win = total = 0.0
+        for runout in runouts:
+            full = tuple(sorted(board + runout))
+            scores = self.service.board_scores(full)
+            live = scores >= 0
+            ia = np.flatnonzero((wa > 0) & live)
+            ib = np.flatnonzero((wb > 0) & live)
+            if not len(ia) or not len(ib):
+                continue
+            pair_weights = np.outer(wa[ia], wb[ib]) * _COMPATIBLE[np.ix_(ia, ib)]
+            diff = scores[ia][:, None] - scores[ib][None, :]
+            win += (pair_weights * ((diff > 0) + 0.5 * (diff == 0))).sum()
+            total += pair_weights.sum()
+        if total <= 0:
+            raise ValueError("ranges cannot be dealt together")
+        equity = float(win / total)
+        return equity, 1.0 - equity
+
+    def _sample_on_pool(self, weights: np.ndarray, board: Tuple[int, ...], samples: int):
+        chunk = -(-samples // self.workers)
+        try:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [self._pool.submit(sample_equity, weights, board, chunk, self.seed + i)
+                       for i in range(self.workers)]
+            results = [f.result() for f in futures]
+        except Exception as e:
+            print(f"⚠️ RangeEquityEngine: process pool unavailable ({e}), sampling in-process")
+            self.workers = 1
+            return sample_equity(weights, board, samples, self.seed)
+        return sum(r[0] for r in results), sum(r[1] for r in results)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_stats(self):
+        return self._cache.get_stats()
@@ -0,0 +1,190 @@
+"""
+Bayesian opponent range tracking.
+
+``RangeTracker`` keeps a weight per hole-card combo (1,326 of them) for
+every seat in one (seats, 1326) array. Dealt board cards and revealed hole
+cards zero out every combo that uses them, for all seats at once. Each
+observed action multiplies the actor's weights by the likelihood of that
+action for each combo under the acting engine's policy (Bayes' rule up to
+normalization).
+
+Policies are vectorized: ``likelihood(action, **context)`` returns a
+(1326,) array. ``StrategyEnginePolicy`` models ``GTOStrategyEngine``:
+preflop from its position ranges and frequencies, postflop from the
+strength thresholds it acts on, with hand strength per combo taken from
+the hand-strength service.
+"""
+
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from .hand_classes import (
+    CARD_COMBOS, COMBO_CLASS, COMBOS, HAND_CLASSES, NUM_CLASSES, NUM_COMBOS, card_index,
+    card_str,
+)
+from .hand_strength import HandStrengthService, get_hand_strength_service
+
+AGGRESSIVE = ("bet", "raise", "all_in", "allin")
+
+
+def _cards(cards: Iterable) -> list:
+    return [card_index(c) if isinstance(c, str) else int(c) for c in cards]
+
+
+def action_name(action) -> str:
+    """'raise' for ActionType.RAISE, 'RAISE' or 'raise'."""
+    return str(getattr(action, "value", action)).lower()
+
+
+class StrategyEnginePolicy:
+    """Per-combo action likelihoods for ``GTOStrategyEngine``'s decision rules.
+
+    ``floor`` keeps a little weight on every live combo so off-model play
+    does not wipe a range out.
+    """
+
+    def __init__(self, engine, floor: float = 0.02, service: Optional[HandStrengthService] = None):
+        self.engine = engine
+        self.floor = floor
+        self.service = service or get_hand_strength_service()
+        self._preflop: Dict[tuple, tuple] = {}
+        # Preflop strength per class, from one representative combo each
+        representative = {}
+        for combo, cls in zip(COMBOS, COMBO_CLASS):
+            representative.setdefault(int(cls), combo)
+        cards = [[card_str(int(a)), card_str(int(b))] for a, b in
+                 (representative[i] for i in range(NUM_CLASSES))]
+        self._class_strength = np.array([engine.get_preflop_hand_strength(c) for c in cards])
+
+    def _preflop_table(self, position: str, spot: str):
+        key = (position, spot)
+        if key not in self._preflop:
+            entry = self.engine.gto_preflop_ranges.get(position, {}).get(spot)
+            if entry is None:
+                in_range = np.zeros(NUM_CLASSES, dtype=bool)
+                freq = 0.0
+            else:
+                in_range = np.array([self.engine.is_hand_in_range(h, entry["range"]) for h in HAND_CLASSES])
+                freq = float(entry.get("freq", 1.0))
+            self._preflop[key] = (in_range[COMBO_CLASS], freq)
+        return self._preflop[key]
+
+    def likelihood(self, action, street: str = "preflop", board: Sequence = (),
+                   position: str = "", spot: str = "rfi", facing_bet: bool = True,
+                   pot_odds: float = 0.0, **_) -> np.ndarray:
+        name = action_name(action)
+        if street == "preflop" or not board:
+            p = self._preflop_likelihood(name, position, spot)
+        else:
+            p = self._postflop_likelihood(name, board, facing_bet, pot_odds)
+        return np.maximum(p, self.floor)
+
+    def _preflop_likelihood(self, name: str, position: str, spot: str) -> np.ndarray:
+        in_range, freq = self._preflop_table(position, spot)
+        plays = in_range * freq
+        if name == "fold":
+            return 1.0 - plays
+        if name == "check":
+            return np.ones(NUM_COMBOS)
+        strong = (self._class_strength >= 80)[COMBO_CLASS]
+        if spot == "rfi":
+            return plays if name in AGGRESSIVE else np.zeros(NUM_COMBOS)
+        if name in AGGRESSIVE:
+            return plays * strong
+        return plays * ~strong  # call
+
+    def _postflop_likelihood(self, name: str, board, facing_bet: bool, pot_odds: float) -> np.ndarray:
+        strength = self.service.combo_strengths(board) * 100
+        value = strength >= 70
+        if name in AGGRESSIVE:
+            return value.astype(float)
+        if not facing_bet:
+            return (~value).astype(float)  # check
+        calls = ~value & (strength > max(30.0, pot_odds * 100))
+        if name == "call":
+            return calls.astype(float)
+        return (~value & ~calls).astype(float)  # fold
+
+
+class RangeTracker:
+    """Weights over the 1,326 hole-card combos for every seat."""
+
+    def __init__(self, num_seats: int, policy=None):
+        self.num_seats = num_seats
+        self.policy = policy
+        self.weights = np.ones((num_seats, NUM_COMBOS))
+        self._dead = np.zeros(NUM_COMBOS, dtype=bool)
+
+    def reset(self) -> None:
+        """New hand: every combo equally likely for every seat."""
+        self.weights.fill(1.0)
+        self._dead.fill(False)
+
+    def set_range(self, seat: int, class_weights: Dict[str, float]) -> None:
+        """Seed a seat from class weights such as a ``gto_preflop_ranges`` ``frequencies`` table."""
+        by_class = np.array([class_weights.get(h, 0.0) for h in HAND_CLASSES])
+        self.weights[seat] = by_class[COMBO_CLASS] * ~self._dead
+
+    def remove_cards(self, cards: Iterable, seats: Optional[Sequence[int]] = None) -> None:
+        """Zero every combo using ``cards`` (board cards, or known cards of other seats)."""
+        cards = _cards(cards)
+        if not cards:
+            return
+        blocked = CARD_COMBOS[cards].any(axis=0)
+        if seats is None:
+            self._dead |= blocked
+            self.weights[:, blocked] = 0.0
+        else:
+            self.weights[np.asarray(seats)[:, None], blocked] = 0.0
+
+    def deal_board(self, cards: Iterable) -> None:
+        self.remove_cards(cards)
+
+    def reveal(self, seat: int, hole: Iterable) -> None:
+        """A seat's hole cards are known: its range collapses, others lose those cards."""
+        hole = _cards(hole)
+        combo = CARD_COMBOS[hole[0]] & CARD_COMBOS[hole[1]]
+        self.weights[seat] = combo.astype(float)
+        others = [s for s in range(self.num_seats) if s != seat]
+        if others:
+            self.remove_cards(hole, seats=others)
+
+    def observe(self, seat: int, likelihood: np.ndarray) -> None:
+        """Bayes update of ``seat``'s weights by per-combo action likelihoods."""
+        updated = self.weights[seat] * likelihood
+        total = updated.sum()
+        if total > 0:
+            self.weights[seat] = updated / total * NUM_COMBOS
+        # An action the model gives zero weight everywhere is ignored
+
+    def observe_action(self, seat: int, action, policy=None, **context) -> None:
+        """Update ``seat`` from an observed action under ``policy`` (default: the tracker's)."""
+        policy = policy or self.policy
+        if policy is None:
+            return
+        self.observe(seat, policy.likelihood(action, **context))
+
+    def range_of(self, seat: int) -> np.ndarray:
+        """Normalized combo probabilities for ``seat``."""
+        weights = self.weights[seat]
+        total = weights.sum()
+        return weights / total if total > 0 else weights
+
+    def class_weights(self, seat: int) -> np.ndarray:
+        """Probability mass per hand class (169)."""
+        return np.bincount(COMBO_CLASS, weights=self.range_of(seat), minlength=NUM_CLASSES)
+
+    def strength_vs_range(self, hole: Iterable, seat: int, board: Iterable,
+                          service: Optional[HandStrengthService] = None) -> float:
+        """HS of ``hole`` against ``seat``'s weighted range on the current board."""
+        service = service or get_hand_strength_service()
+        hole, board = _cards(hole), _cards(board)
+        key = tuple(sorted(board))
+        scores = service.board_scores(key)
+        hero = scores[CARD_COMBOS[hole[0]] & CARD_COMBOS[hole[1]]][0]
+        weights = self.range_of(seat) * ~CARD_COMBOS[hole].any(axis=0) * (scores >= 0)
+        total = weights.sum()
+        if total <= 0:
+            return 0.0
+        return float((weights * ((hero > scores) + 0.5 * (hero == scores))).sum() / total)
@@ -0,0 +1,113 @@
+"""
+Range tables from solved strategies.
+
+``to_gto_preflop_ranges`` turns a solver's average strategy into the
+``GTOStrategyEngine.gto_preflop_ranges`` shape::
+
+    {"BTN": {"rfi": {"range": ["AA", "AKs", ...], "freq": 0.97,
+                     "frequencies": {"AA": 1.0, ...}},
+             "vs_rfi": {...}, "vs_three_bet": {...}}, ...}
+
+``range`` lists the classes played at least ``threshold`` of the time and
+``freq`` is their combo-weighted average frequency. ``frequencies`` keeps
+the full mixed strategy. Where a position faces several openers, the
+frequencies are averaged by how often each spot is reached.
+"""
+
+import json
+from typing import Dict, List
+
+import numpy as np
+
+from .cfr import PreflopSolver
+from .game_tree import FOLD, RAISE, Node
+from .hand_classes import CLASS_COMBOS, CLASS_INDEX, CLASS_PRIOR, HAND_CLASSES, NUM_CLASSES
+
+
+def spot_weights(solver: PreflopSolver) -> Dict[str, float]:
+    """Probability that each decision node is reached, ignoring its player's own actions."""
+    strategy = solver.average_strategy()
+    weights: Dict[str, float] = {}
+
+    def walk(node: Node, reach: np.ndarray) -> None:
+        if node.is_terminal:
+            return
+        k = node.player
+        others = [i for i in range(solver.n) if i != k]
+        weights[node.key] = float(np.prod(reach[others] @ CLASS_PRIOR))
+        sigma = strategy[node.index]
+        for a, child in enumerate(node.children):
+            child_reach = reach.copy()
+            child_reach[k] = reach[k] * sigma[:, a]
+            walk(child, child_reach)
+
+    walk(solver.root, np.ones((solver.n, NUM_CLASSES)))
+    return weights
+
+
+def _range_entry(freqs: np.ndarray, threshold: float) -> dict:
+    in_range = freqs >= threshold
+    combos = CLASS_COMBOS[in_range]
+    return {
+        "range": [HAND_CLASSES[i] for i in np.flatnonzero(in_range)],
+        "freq": round(float(freqs[in_range] @ combos / combos.sum()), 3) if combos.size else 0.0,
+        "frequencies": {HAND_CLASSES[i]: round(float(freqs[i]), 3)
+                        for i in range(NUM_CLASSES) if freqs[i] >= 0.001},
+    }
+
+
+def _blend(nodes: List[Node], strategy, weights, continue_actions) -> np.ndarray:
+    total = np.zeros(NUM_CLASSES)
+    weight_sum = 0.0
+    for node in nodes:
+        w = weights.get(node.key, 0.0)
+        cols = [node.actions.index(a) for a in node.actions if a in continue_actions]
+        total += w * strategy[node.index][:, cols].sum(axis=1)
+        weight_sum += w
+    return total / weight_sum if weight_sum > 0 else total
+
+
+def to_gto_preflop_ranges(solver: PreflopSolver, threshold: float = 0.5) -> Dict[str, dict]:
+    """Ranges per position: ``rfi`` (open/shove), ``vs_rfi`` and ``vs_three_bet`` (continue)."""
+    strategy = solver.average_strategy()
+    weights = spot_weights(solver)
+    continue_actions = {a for d in solver.decisions for a in d.actions if a != FOLD}
+    ranges: Dict[str, dict] = {}
+
+    for seat, position in enumerate(solver.config.positions):
+        spots = {"rfi": [], "vs_rfi": [], "vs_three_bet": []}
+        for node in solver.decisions:
+            kind = node.key.split(":")[0]
+            if node.player != seat:
+                continue
+            if kind == "open":
+                spots["rfi"].append(node)
+            elif kind == "vs_open":
+                spots["vs_rfi"].append(node)
+            elif kind == "vs_3bet":
+                spots["vs_three_bet"].append(node)
+
+        entry = {}
+        for name, nodes in spots.items():
+            actions = {RAISE} if name == "rfi" else continue_actions
+            entry[name] = _range_entry(_blend(nodes, strategy, weights, actions), threshold)
+        ranges[position] = entry
+    return ranges
+
+
+def range_summary(ranges: Dict[str, dict]) -> Dict[str, Dict[str, float]]:
+    """Fraction of all combos in each position's ranges."""
+    summary = {}
+    for position, spots in ranges.items():
+        summary[position] = {
+            name: round(sum(CLASS_PRIOR[CLASS_INDEX[h]] * f
+                            for h, f in spot["frequencies"].items()), 3)
+            for name, spot in spots.items()
+        }
+    return summary
+
+
+def save_ranges(ranges: Dict[str, dict], path: str, meta: dict = None) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta or {}, "gto_preflop_ranges": ranges}, f, indent=2)
+    return path
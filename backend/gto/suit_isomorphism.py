@@ -0,0 +1,166 @@
+"""
+Suit-isomorphic canonical spots and an LRU spot cache.
+
+Two (hole cards, board) situations that differ only by a relabelling of
+suits are strategically identical: Ah Kh on Qh 7h 2c plays exactly like
+As Ks on Qs 7s 2d. ``canonical_key`` maps every situation to one
+representative of its suit-isomorphism class, so features and decisions
+computed for one member can be reused for all of them. Flops collapse
+from 22,100 to 1,755 classes.
+
+``canonical_groups`` is the underlying canonicalizer on card indices
+(``rank_index * 4 + suit_index``, the layout used by the solver); it also
+returns the winning suit permutation so callers can relabel ranges with it.
+
+``SpotCache`` is the LRU that postflop features, decisions and solver
+results are stored in; ``get_spot_cache()`` returns the shared instance.
+
+Pure standard library, so both the bots and the NumPy solver import it.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import combinations, permutations
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+
+# Suit relabellings: SUIT_PERMUTATIONS[p][suit_index] -> new suit index
+SUIT_PERMUTATIONS: Tuple[Tuple[int, ...], ...] = tuple(permutations(range(4)))
+
+Key = Tuple[Tuple[str, ...], ...]
+
+
+def card_index(card) -> int:
+    """Card index for "Ah" / "AH" (or an index already); ValueError if invalid."""
+    if isinstance(card, int):
+        if 0 <= card < 52:
+            return card
+    elif isinstance(card, str) and len(card) == 2:
+        rank, suit = RANKS.find(card[0].upper()), SUITS.find(card[1].lower())
+        if rank >= 0 and suit >= 0:
+            return rank * 4 + suit
+    raise ValueError(f"invalid card {card!r}")
+
+
+def relabel(cards: Sequence[int], p: int, ordered: bool = False) -> Tuple[int, ...]:
+    """Card indices after applying suit permutation ``p`` (sorted unless ``ordered``)."""
+    perm = SUIT_PERMUTATIONS[p]
+    mapped = tuple(c - c % 4 + perm[c % 4] for c in cards)
+    return mapped if ordered else tuple(sorted(mapped))
+
+
+@lru_cache(maxsize=65536)
+def _canonical_groups(groups: Tuple[Tuple[int, ...], ...],
+                      ordered: Tuple[bool, ...]) -> Tuple[int, Tuple[Tuple[int, ...], ...]]:
+    best, best_p = None, 0
+    for p in range(len(SUIT_PERMUTATIONS)):
+        mapped = tuple(relabel(g, p, o) for g, o in zip(groups, ordered))
+        if best is None or mapped < best:
+            best, best_p = mapped, p
+    return best_p, best
+
+
+def canonical_groups(groups: Sequence[Sequence[int]],
+                     ordered: Sequence[bool] = ()) -> Tuple[int, Tuple[Tuple[int, ...], ...]]:
+    """
+    (permutation index, relabelled groups) for the suit relabelling that
+    makes the groups lexicographically smallest. Each group is sorted after
+    relabelling unless its ``ordered`` flag is set.
+    """
+    groups = tuple(tuple(g) for g in groups)
+    flags = tuple(ordered) + (False,) * (len(groups) - len(ordered))
+    return _canonical_groups(groups, flags)
+
+
+@lru_cache(maxsize=65536)
+def _canonical(hole: Tuple, board: Tuple) -> Key:
+    try:
+        hole_ix = tuple(card_index(c) for c in hole)
+        board_ix = tuple(card_index(c) for c in board)
+    except ValueError:
+        # Not real cards: key on them as given
+        return tuple(hole), tuple(board[:3]), tuple(board[3:])
+    _, groups = canonical_groups((hole_ix, board_ix[:3], board_ix[3:]), (False, False, True))
+    return tuple(tuple(RANKS[c // 4] + SUITS[c % 4] for c in g) for g in groups)
+
+
+def canonical_key(hole_cards: Iterable[str], board: Iterable[str] = ()) -> Key:
+    """Suit-isomorphic key for a spot: (hole, flop, turn/river) after the best suit relabelling.
+
+    Hole cards and flop cards are unordered; turn and river keep their order.
+    """
+    return _canonical(tuple(hole_cards), tuple(board))
+
+
+def canonical_board(board: Iterable[str]) -> Tuple[str, ...]:
+    """Suit-isomorphic key for a board alone."""
+    _, flop, later = canonical_key((), board)
+    return flop + later
+
+
+def canonical_flops() -> Dict[Tuple[str, ...], int]:
+    """Every strategically distinct flop with the number of raw flops it stands for."""
+    deck = [r + s for r in RANKS for s in SUITS]
+    counts: Dict[Tuple[str, ...], int] = {}
+    for flop in combinations(deck, 3):
+        key = canonical_board(flop)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+class SpotCache:
+    """LRU of per-spot features and decisions, with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 50000):
+        self.maxsize = max(1, int(maxsize))
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = compute()
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def snapshot(self) -> Tuple[int, int]:
+        """Counters to diff against later with ``get_stats(since=...)``."""
+        return self.hits, self.misses
+
+    def get_stats(self, since: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        hits, misses = self.hits, self.misses
+        if since is not None:
+            hits, misses = hits - since[0], misses - since[1]
+        total = hits + misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": (hits / total) if total else 0.0,
+        }
+
+
+_spot_cache: Optional[SpotCache] = None
+
+
+def get_spot_cache() -> SpotCache:
+    global _spot_cache
+    if _spot_cache is None:
+        _spot_cache = SpotCache()
+    return _spot_cache
@@ -28,6 +28,8 @@ class StandardGameState:
 class UnifiedDecisionEngineProtocol(Protocol):
     def get_decision(self, player_name: str, game_state: StandardGameState) -> Tuple[ActionType, Optional[float]]:
         ...
+    def get_decisions_batch(self, requests: List[Tuple[str, StandardGameState]]) -> List[Tuple[ActionType, Optional[float]]]:
+        ...
     def has_decision_for_player(self, player_name: str) -> bool:
         ...
     def reset_for_new_hand(self) -> None:
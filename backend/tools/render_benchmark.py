@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Headless table render benchmark.
+
+Renders full poker tables through RendererPipeline onto a RecordingCanvas
+(no Tk display needed) and reports, for each table size, the canvas items
+created per frame and the render time per component.
+
+Usage:
+    python backend/tools/render_benchmark.py                 # 2-9 seats
+    python backend/tools/render_benchmark.py --seats 6 9 --frames 50
+    python backend/tools/render_benchmark.py --json > render_bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add backend to path for imports
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from ui.tableview.recording_canvas import HeadlessCanvasManager
+from ui.tableview.layer_manager import LayerManager
+from ui.tableview.renderer_pipeline import RendererPipeline
+from ui.tableview.components.table_felt import TableFelt
+from ui.tableview.components.seats import Seats
+from ui.tableview.components.community import Community
+from ui.tableview.components.pot_display import PotDisplay
+from ui.tableview.components.bet_display import BetDisplay
+from ui.tableview.components.dealer_button import DealerButton
+from ui.tableview.components.player_highlighting import PlayerHighlighting
+
+
+POSITIONS = {
+    2: ["BTN", "BB"],
+    3: ["BTN", "SB", "BB"],
+    4: ["CO", "BTN", "SB", "BB"],
+    5: ["HJ", "CO", "BTN", "SB", "BB"],
+    6: ["UTG", "HJ", "CO", "BTN", "SB", "BB"],
+    7: ["UTG", "MP", "HJ", "CO", "BTN", "SB", "BB"],
+    8: ["UTG", "UTG1", "MP", "HJ", "CO", "BTN", "SB", "BB"],
+    9: ["UTG", "UTG1", "UTG2", "MP", "HJ", "CO", "BTN", "SB", "BB"],
+}
+HOLE_CARDS = [["As", "Kd"], ["Qh", "Qc"], ["7s", "6s"], ["Jd", "Tc"], ["9h", "9d"],
+              ["Ac", "5c"], ["Kh", "Js"], ["4d", "4s"], ["8c", "7c"]]
+BOARDS = [[], ["2c", "7h", "Td"], ["2c", "7h", "Td", "Js"], ["2c", "7h", "Td", "Js", "3d"]]
+STREETS = ["PREFLOP", "FLOP", "TURN", "RIVER"]
+
+
+def make_components():
+    """Same component stack as PokerTableRenderer."""
+    return [
+        TableFelt(),
+        Seats(),
+        Community(),
+        BetDisplay(),
+        PotDisplay(),
+        DealerButton(),
+        PlayerHighlighting(),
+    ]
+
+
+def make_state(seat_count, frame):
+    """A mid-hand table state; the acting seat and street advance per frame."""
+    acting = frame % seat_count
+    street = (frame // seat_count) % len(STREETS)
+    seats = []
+    for i, position in enumerate(POSITIONS[seat_count]):
+        bet = 0 if street else (10 if position == "SB" else 20 if position == "BB" else 0)
+        if i < acting:
+            bet = max(bet, 60)
+        seats.append({
+            "name": f"Player {i + 1}",
+            "stack": 1000 - bet,
+            "cards": HOLE_CARDS[i],
+            "position": position,
+            "current_bet": bet,
+            "bet": bet,
+            "acting": i == acting,
+            "folded": i == (acting + 2) % seat_count and seat_count > 3,
+            "last_action": "raise" if i < acting else "",
+        })
+    pot = 30 + 60 * acting + 120 * street
+    return {
+        "seats": seats,
+        "board": BOARDS[street],
+        "street": STREETS[street],
+        "pot": {"amount": pot},
+        "dealer": {"position": POSITIONS[seat_count].index("BTN")},
+    }
+
+
+class TimedComponent:
+    """Wraps a component to measure its render time and items created."""
+
+    def __init__(self, component):
+        self.component = component
+        self.name = component.__class__.__name__
+        self.ms = []
+        self.items = []
+
+    def render(self, state, canvas_manager, layer_manager):
+        canvas = canvas_manager.canvas
+        created = canvas.created
+        start = time.perf_counter()
+        try:
+            self.component.render(state, canvas_manager, layer_manager)
+        finally:
+            self.ms.append((time.perf_counter() - start) * 1000.0)
+            self.items.append(canvas.created - created)
+
+
+def _p95(values):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
+def bench_table(seat_count, frames=20, width=1200, height=800):
+    cm = HeadlessCanvasManager(width=width, height=height)
+    timed = [TimedComponent(c) for c in make_components()]
+    pipeline = RendererPipeline(cm, LayerManager(cm.canvas, None), timed)
+
+    frame_ms = []
+    frame_items = []
+    sink = io.StringIO()
+    for frame in range(frames):
+        state = make_state(seat_count, frame)
+        before = cm.canvas.created
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            pipeline.render_once(state)
+        frame_ms.append((time.perf_counter() - start) * 1000.0)
+        frame_items.append(cm.canvas.created - before)
+        sink.seek(0)
+        sink.truncate()
+
+    return {
+        "seats": seat_count,
+        "frames": frames,
+        "items_per_frame": round(statistics.mean(frame_items), 1),
+        "live_items": len(cm.canvas.items),
+        "frame_ms_mean": round(statistics.mean(frame_ms), 3),
+        "frame_ms_p95": round(_p95(frame_ms), 3),
+        "canvas_ops_per_frame": {
+            op: round(count / frames, 1) for op, count in sorted(cm.canvas.ops.items())
+        },
+        "components": {
+            t.name: {
+                "ms_mean": round(statistics.mean(t.ms), 3),
+                "ms_p95": round(_p95(t.ms), 3),
+                "items_per_frame": round(statistics.mean(t.items), 1),
+            }
+            for t in timed
+        },
+    }
+
+
+def run_benchmark(seat_counts=range(2, 10), frames=20, width=1200, height=800):
+    return [bench_table(n, frames, width, height) for n in seat_counts]
+
+
+def print_report(results):
+    names = list(results[0]["components"]) if results else []
+    print("⏱️ Headless render benchmark (ms per frame / items created per frame)")
+    header = f"{'seats':>5} {'items':>7} {'frame ms':>9} {'p95':>7}  " + "  ".join(
+        f"{n[:14]:>14}" for n in names
+    )
+    print(header)
+    for r in results:
+        cells = "  ".join(
+            f"{c['ms_mean']:>7.2f}/{c['items_per_frame']:<6.0f}" for c in r["components"].values()
+        )
+        print(f"{r['seats']:>5} {r['items_per_frame']:>7.0f} {r['frame_ms_mean']:>9.2f} "
+              f"{r['frame_ms_p95']:>7.2f}  {cells}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seats", type=int, nargs="+", default=list(range(2, 10)),
+                        choices=range(2, 10), metavar="N", help="table sizes (2-9)")
+    parser.add_argument("--frames", type=int, default=20, help="frames per table size")
+    parser.add_argument("--width", type=int, default=1200)
+    parser.add_argument("--height", type=int, default=800)
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.seats, max(1, args.frames), args.width, args.height)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
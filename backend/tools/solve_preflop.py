@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Solve a preflop abstraction and write gto_preflop_ranges tables.
+
+Runs vectorized CFR+ / DCFR for push/fold or open/3-bet games at a given
+stack depth and table size, printing exploitability as it converges and
+the iteration throughput. Checkpoints can be written and resumed.
+
+Usage:
+    python backend/tools/solve_preflop.py --players 6 --stack 10 --iterations 500
+    python backend/tools/solve_preflop.py --game open_3bet --players 9 --stack 40 \\
+        --checkpoint solve.npz --out ranges.json
+    python backend/tools/solve_preflop.py --resume solve.npz --iterations 500
+    python backend/tools/solve_preflop.py --bench --iterations 50   # throughput, 2-9 players
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Add backend to path for imports
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from gto.solver import (
+    ALGORITHMS, DCFR, GAMES, PUSH_FOLD, GameConfig, PreflopSolver,
+    load_equity_matrix, range_summary, save_ranges, to_gto_preflop_ranges,
+)
+from gto.solver.equity import DEFAULT_ROUNDS
+
+
+def run_bench(game, stack, iterations, algorithm, equity):
+    rows = []
+    for players in range(2, 10):
+        solver = PreflopSolver(GameConfig(game=game, players=players, stack_bb=stack),
+                               equity=equity, algorithm=algorithm)
+        stats = solver.solve(iterations, eval_every=0)
+        rows.append({"players": players, "nodes": len(solver.decisions), **stats})
+    return rows
+
+
+def print_bench(rows):
+    print("⏱️ Preflop solver throughput")
+    print(f"{'players':>7} {'nodes':>6} {'iter/s':>9} {'expl mbb':>9}")
+    for r in rows:
+        print(f"{r['players']:>7} {r['nodes']:>6} {r['iterations_per_sec']:>9.1f} "
+              f"{r['exploitability_mbb']:>9.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", choices=GAMES, default=PUSH_FOLD)
+    parser.add_argument("--players", type=int, default=2, choices=range(2, 10), metavar="N")
+    parser.add_argument("--stack", type=float, default=10.0, help="effective stack in bb")
+    parser.add_argument("--ante", type=float, default=0.0)
+    parser.add_argument("--open-size", type=float, default=2.5)
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default=DCFR)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--eval-every", type=int, default=50)
+    parser.add_argument("--equity-rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--checkpoint", help="write a checkpoint here (and at --checkpoint-every)")
+    parser.add_argument("--checkpoint-every", type=int, default=0)
+    parser.add_argument("--resume", help="continue from a checkpoint")
+    parser.add_argument("--out", help="write gto_preflop_ranges JSON here")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--bench", action="store_true", help="throughput for 2-9 players")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    equity = load_equity_matrix(rounds=args.equity_rounds)
+
+    if args.bench:
+        rows = run_bench(args.game, args.stack, max(1, args.iterations), args.algorithm, equity)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            print_bench(rows)
+        return 0
+
+    if args.resume:
+        solver = PreflopSolver.from_checkpoint(args.resume, equity=equity)
+        print(f"📂 Resumed {args.resume} at iteration {solver.iteration}")
+    else:
+        config = GameConfig(game=args.game, players=args.players, stack_bb=args.stack,
+                            ante=args.ante, open_size=args.open_size)
+        solver = PreflopSolver(config, equity=equity, algorithm=args.algorithm)
+
+    def report(s):
+        if args.eval_every and s.iteration % args.eval_every == 0 and not args.json:
+            print(f"  iter {s.iteration:>6}  exploitability "
+                  f"{s.history[-1]['exploitability_bb'] * 1000:8.2f} mbb/hand")
+
+    stats = solver.solve(args.iterations, eval_every=args.eval_every,
+                         checkpoint_path=args.checkpoint or args.resume,
+                         checkpoint_every=args.checkpoint_every, callback=report)
+    ranges = to_gto_preflop_ranges(solver, threshold=args.threshold)
+    if args.out:
+        save_ranges(ranges, args.out, meta={"config": solver.config.to_dict(), **stats})
+
+    if args.json:
+        print(json.dumps({"stats": stats, "gto_preflop_ranges": ranges}, indent=2))
+    else:
+        print(f"✅ {stats['total_iterations']} iterations, {stats['iterations_per_sec']} iter/s, "
+              f"exploitability {stats['exploitability_mbb']} mbb/hand")
+        for position, spots in range_summary(ranges).items():
+            print(f"  {position:<6} " + "  ".join(f"{k} {v:.1%}" for k, v in spots.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import importlib
 import tkinter as tk
 from tkinter import ttk
 import uuid
@@ -7,17 +8,77 @@ from .services.service_container import ServiceContainer
 from .services.timer_manager import TimerManager
 from .services.theme_manager import ThemeManager
 from .services.hands_repository import HandsRepository, StudyMode
+from .services.startup_profiler import FIRST_WINDOW, get_startup_profiler
 from .state.store import Store
 from .state.reducers import root_reducer
-from .mvu.hands_review_integrated import MVUHandsReviewTabIntegrated
-from .tabs.practice_session_tab import PracticeSessionTab
-from .tabs.gto_session_tab import GTOSessionTab
 
 from .menu_integration import add_theme_manager_to_menu
 
 
+# Tabs are imported and built on first selection (order: Practice, GTO,
+# Hands Review - main product features only)
+TAB_SPECS = (
+    ("Practice Session", ".tabs.practice_session_tab", "PracticeSessionTab"),
+    ("GTO Session", ".tabs.gto_session_tab", "GTOSessionTab"),
+    ("Hands Review (MVU)", ".mvu.hands_review_integrated", "MVUHandsReviewTabIntegrated"),
+)
+
+
+class LazyTab(ttk.Frame):
+    """
+    Notebook placeholder that imports and builds its tab on first selection.
+
+    Once built, attribute lookups fall through to the real tab so theme and
+    font refresh hooks (on_show, _refresh_ui_colors, ...) keep working.
+    """
+
+    def __init__(self, parent, title: str, module: str, class_name: str, services):
+        super().__init__(parent)
+        self.title = title
+        self.module = module
+        self.class_name = class_name
+        self.services = services
+        self.tab = None
+        self.error = None
+        self._placeholder = ttk.Label(self, text=f"Loading {title}…", anchor="center")
+        self._placeholder.pack(fill="both", expand=True)
+
+    @property
+    def built(self) -> bool:
+        return self.tab is not None or self.error is not None
+
+    def ensure_built(self):
+        """Build the real tab once; returns it, or None if it failed."""
+        if self.built:
+            return self.tab
+        try:
+            TabClass = getattr(
+                importlib.import_module(self.module, package=__package__),
+                self.class_name,
+            )
+            tab = TabClass(self, self.services)
+            self._placeholder.destroy()
+            tab.pack(fill="both", expand=True)
+            self.tab = tab
+        except Exception as e:
+            self.error = e
+            self._placeholder.config(text=f"⚠️ {self.title} unavailable: {e}")
+            print(f"❌ Error building tab {self.title}: {e}")
+        return self.tab
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        tab = self.__dict__.get("tab")
+        if tab is None:
+            raise AttributeError(name)
+        return getattr(tab, name)
+
+
 class AppShell(ttk.Frame):
     def __init__(self, root):
+        profiler = get_startup_profiler()
+        self.profiler = profiler
         super().__init__(root)
         self.root = root  # Store root reference for menu integration
         self.pack(fill="both", expand=True)
@@ -26,22 +87,36 @@ class AppShell(ttk.Frame):
 
         # app-scoped services
         self.services = ServiceContainer()
-        self.services.provide_app("event_bus", EventBus())
-        self.services.provide_app("theme", ThemeManager())
-        self.services.provide_app("hands_repository", HandsRepository())
+        with profiler.phase("event_bus"):
+            self.services.provide_app("event_bus", EventBus())
+        with profiler.phase("theme_manager"):
+            self.services.provide_app("theme", ThemeManager())
+        with profiler.phase("hands_repository (start)"):
+            # Hand libraries load on a worker thread, off the first-window path
+            self.services.provide_app("hands_repository", HandsRepository(background=True))
         
         # Create global GameDirector for action sequencing
-        from .services.game_director import GameDirector
-        game_director = GameDirector(event_bus=self.services.get_app("event_bus"))
-        self.services.provide_app("game_director", game_director)
+        with profiler.phase("game_director"):
+            from .services.game_director import GameDirector
+            game_director = GameDirector(event_bus=self.services.get_app("event_bus"))
+            self.services.provide_app("game_director", game_director)
+            # Single per-frame ticker for scheduled events and all canvas tweens
+            from .services.animation_engine import get_animation_engine
+            animation_engine = get_animation_engine()
+            game_director.attach_animation_engine(animation_engine)
+            game_director.start_frame_loop(root)
+            self.services.provide_app("animation_engine", animation_engine)
         
-        # Create global EffectBus service for sound management
-        from .services.effect_bus import EffectBus
-        effect_bus = EffectBus(
-            game_director=game_director,
-            event_bus=self.services.get_app("event_bus")
-        )
-        self.services.provide_app("effect_bus", effect_bus)
+        # Create global EffectBus service for sound management; the mixer
+        # and sound files are initialized after the first window appears
+        with profiler.phase("effect_bus"):
+            from .services.effect_bus import EffectBus
+            effect_bus = EffectBus(
+                game_director=game_director,
+                event_bus=self.services.get_app("event_bus"),
+                defer_audio=True,
+            )
+            self.services.provide_app("effect_bus", effect_bus)
         
         # Create architecture compliant hands review controller
         from .services.hands_review_event_controller import HandsReviewEventController
@@ -60,11 +135,12 @@ class AppShell(ttk.Frame):
         store = Store(initial_state, root_reducer)
         self.services.provide_app("store", store)
         
-        hands_review_controller = HandsReviewEventController(
-            event_bus=self.services.get_app("event_bus"),
-            store=store,
-            services=self.services
-        )
+        with profiler.phase("hands_review_controller"):
+            hands_review_controller = HandsReviewEventController(
+                event_bus=self.services.get_app("event_bus"),
+                store=store,
+                services=self.services
+            )
         self.services.provide_app("hands_review_controller", hands_review_controller)
         
         # Subscribe to voice events to keep architecture event-driven
@@ -103,31 +179,68 @@ class AppShell(ttk.Frame):
         self.services.provide_app("store", Store(initial_state, root_reducer))
 
         # Create menu system
-        self._create_menu_system()
+        with profiler.phase("menus"):
+            self._create_menu_system()
         
-        # tabs (order: Practice, GTO, Hands Review - main product features only)
-        self._add_tab("Practice Session", PracticeSessionTab)
-        self._add_tab("GTO Session", GTOSessionTab)
-        self._add_tab("Hands Review (MVU)", MVUHandsReviewTabIntegrated)
+        # tabs: placeholders now, the selected one is built immediately
+        for title, module, class_name in TAB_SPECS:
+            self._add_tab(title, module, class_name)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
         # Bind global font size shortcuts (Cmd/Ctrl - and =)
         self._bind_font_shortcuts(root)
 
-    def _add_tab(self, title: str, TabClass):
+        # Deferred startup work runs once the first window is drawn
+        root.after_idle(self._after_first_window)
+
+    def _add_tab(self, title: str, module: str, class_name: str):
         session_id = str(uuid.uuid4())
         timers = TimerManager(self)
         self.services.provide_session(session_id, "timers", timers)
 
-        # Update active tab in shared store
-        store = self.services.get_app("store")
-        store.dispatch({"type": "SET_ACTIVE_TAB", "name": title})
-        
-        # Create tab with services
-        tab = TabClass(self.notebook, self.services)
+        tab = LazyTab(self.notebook, title, module, class_name, self.services)
         self.notebook.add(tab, text=title)
-        
-        # Call on_show if available
-        if hasattr(tab, "on_show"):
-            tab.on_show()
+
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab on first selection and mark it active."""
+        try:
+            tab = self.notebook.nametowidget(self.notebook.select())
+        except Exception:
+            return
+        if not isinstance(tab, LazyTab):
+            return
+
+        # Update active tab in shared store
+        self.services.get_app("store").dispatch({"type": "SET_ACTIVE_TAB", "name": tab.title})
+
+        if tab.built:
+            return
+        deferred = FIRST_WINDOW in self.profiler.marks
+        with self.profiler.phase(f"tab: {tab.title}", deferred=deferred):
+            built = tab.ensure_built()
+            # Call on_show if available
+            if built is not None and hasattr(built, "on_show"):
+                built.on_show()
+
+    def _after_first_window(self):
+        """Mixer/sound init and the startup report, after the first window."""
+        profiler = self.profiler
+        profiler.mark(FIRST_WINDOW)
+        with profiler.phase("audio (mixer + sounds)", deferred=True):
+            try:
+                self.services.get_app("effect_bus").init_audio()
+            except Exception as e:
+                print(f"⚠️ Deferred audio init failed: {e}")
+        self._poll_hands_loaded()
+
+    def _poll_hands_loaded(self):
+        repo = self.services.get_app("hands_repository")
+        if not repo.is_loaded():
+            self.root.after(50, self._poll_hands_loaded)
+            return
+        self.profiler.record("hands_repository (background)", repo.load_ms, deferred=True)
+        if not self.profiler.reported:
+            self.profiler.print_report()
 
     def _create_menu_system(self):
         """Create the application menu system."""
@@ -181,17 +294,6 @@ class AppShell(ttk.Frame):
             if hasattr(theme_manager, 'reload'):
                 theme_manager.reload()
             
-            # Force rebuild themes to pick up any live changes
-            try:
-                from .services.theme_factory import build_all_themes
-                themes = build_all_themes()
-                # Register updated themes
-                for name, tokens in themes.items():
-                    theme_manager.register(name, tokens)
-                print(f"🔄 Rebuilt and registered {len(themes)} themes")
-            except Exception as e:
-                print(f"⚠️ Theme rebuild warning: {e}")
-            
             # Refresh all tabs with new theme
             for i in range(self.notebook.index("end")):
                 try:
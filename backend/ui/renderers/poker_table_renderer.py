@@ -5,6 +5,7 @@ This component ONLY renders – no business logic, no state management.
 
 from __future__ import annotations
 
+import weakref
 from typing import Any, Dict, List, Optional, Callable
 from tkinter import ttk
 
@@ -23,6 +24,28 @@ from ..tableview.components.player_highlighting import PlayerHighlighting
 from ..table.state import PokerTableState
 
 
+def _table_profilers(tables) -> List[Any]:
+    """Distinct profilers behind the registered tables (usually the shared one)."""
+    profilers: Dict[int, Any] = {}
+    for table in list(tables):
+        renderer = getattr(table, "renderer", None)
+        if renderer is not None:
+            profilers.setdefault(id(renderer.profiler), renderer.profiler)
+    return list(profilers.values())
+
+
+def toggle_profiler_overlays(tables) -> None:
+    for profiler in _table_profilers(tables):
+        profiler.toggle_overlay()
+    for table in list(tables):
+        table._redraw_profiler_overlay()
+
+
+def dump_profilers(tables) -> None:
+    for profiler in _table_profilers(tables):
+        profiler.dump_json()
+
+
 class PokerTableRenderer(ttk.Frame):
     """
     Pure rendering component for poker table.
@@ -76,6 +99,7 @@ class PokerTableRenderer(ttk.Frame):
                 )
                 print(f"🔧 PokerTableRenderer: Renderer created: {self.renderer is not None}")
                 print(f"🔧 PokerTableRenderer: Renderer object: {self.renderer}")
+                self._bind_profiler_keys()
                 
                 # Grid now that canvas exists
                 try:
@@ -119,8 +143,31 @@ class PokerTableRenderer(ttk.Frame):
             except Exception:
                 pass
 
+    def _bind_profiler_keys(self) -> None:
+        """F3 toggles the render profiler overlay, Shift+F3 dumps it to JSON.
+
+        Bound once per app: every table registers on the root, and one key
+        press acts on each profiler once and redraws every table.
+        """
+        try:
+            root = self._root()
+            tables = getattr(root, "_profiler_tables", None)
+            if tables is None:
+                tables = root._profiler_tables = weakref.WeakSet()
+                root.bind_all("<F3>", lambda _e: toggle_profiler_overlays(tables), add="+")
+                root.bind_all("<Shift-F3>", lambda _e: dump_profilers(tables), add="+")
+            tables.add(self)
+        except Exception:
+            pass
+
+    def _redraw_profiler_overlay(self) -> None:
+        if self.renderer is not None and self.current_state is not None:
+            self.renderer.render_once(self.current_state.__dict__)
+
     def render(self, state: PokerTableState) -> None:
-        if state != self.current_state:
+        # Identity check first: reducers share unchanged sub-objects, so an
+        # identical state object means nothing to redraw
+        if state is not self.current_state and state != self.current_state:
             # Check if renderer is initialized
             has_attr = hasattr(self, 'renderer')
             is_not_none = has_attr and self.renderer is not None
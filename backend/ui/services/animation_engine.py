@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+AnimationEngine - Single-ticker tween engine for canvas animations.
+
+All chip, card and highlight animations register tweens here instead of
+running their own chains of Tk ``after()`` callbacks. One per-frame tick
+(driven by GameDirector.update) advances every active tween and applies the
+resulting canvas moves in a single batch.
+"""
+from __future__ import annotations
+
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .theme_utils import ease_in_out_cubic
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - pow(1 - t, 3)
+
+
+def ease_in_cubic(t: float) -> float:
+    return t * t * t
+
+
+def smoothstep(t: float) -> float:
+    return t * t * (3 - 2 * t)
+
+
+EASINGS: Dict[str, Callable[[float], float]] = {
+    "linear": linear,
+    "ease_in_cubic": ease_in_cubic,
+    "ease_out_cubic": ease_out_cubic,
+    "ease_in_out_cubic": ease_in_out_cubic,
+    "smoothstep": smoothstep,
+}
+
+
+@dataclass
+class Tween:
+    id: int
+    group: str
+    duration_ms: float
+    easing: Callable[[float], float]
+    # Movement tweens: translate ``item`` (id or tag) from start to end
+    canvas: Any = None
+    item: Any = None
+    start: Tuple[float, float] = (0.0, 0.0)
+    end: Tuple[float, float] = (0.0, 0.0)
+    arc_height: float = 0.0
+    # Callback tweens: on_update(eased_t) each frame
+    on_update: Optional[Callable[[float], None]] = None
+    on_complete: Optional[Callable[[], None]] = None
+    # Cleanup when cancelled before completing (e.g. delete temporary items)
+    on_cancel: Optional[Callable[[], None]] = None
+    elapsed_ms: float = 0.0
+    _applied: Tuple[float, float] = (0.0, 0.0)
+
+
+class AnimationEngine:
+    """
+    Central registry of active tweens advanced by one per-frame tick.
+
+    The engine is normally ticked by GameDirector.update(). If no director
+    frame loop is attached, the engine drives itself with a single Tk
+    ``after()`` loop on the first canvas it animates, and only while tweens
+    are active.
+    """
+
+    def __init__(self, frame_ms: int = 16) -> None:
+        self.frame_ms = max(1, int(frame_ms))
+        self._tweens: Dict[int, Tween] = {}
+        self._ids = itertools.count(1)
+        self._last_tick_ms: Optional[float] = None
+        self.driver_attached = False
+        self._self_driver = None
+        self._self_driver_after = None
+
+        # Stats
+        self.frames = 0
+        self.last_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+        self.tweens_started = 0
+        self.tweens_completed = 0
+        self.tweens_cancelled = 0
+
+    # Registration
+    def add_tween(
+        self,
+        canvas,
+        item,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        duration_ms: float,
+        easing: str | Callable[[float], float] = "ease_in_out_cubic",
+        arc_height: float = 0.0,
+        group: str = "default",
+        on_complete: Optional[Callable[[], None]] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """Move a canvas item (id or tag) from ``start`` to ``end``.
+
+        The item is assumed to currently sit at ``start``; the engine applies
+        relative ``canvas.move`` deltas so ovals, images and text all work.
+        """
+        tween = Tween(
+            id=next(self._ids),
+            group=group,
+            duration_ms=max(1.0, float(duration_ms)),
+            easing=self._resolve_easing(easing),
+            canvas=canvas,
+            item=item,
+            start=(float(start[0]), float(start[1])),
+            end=(float(end[0]), float(end[1])),
+            arc_height=float(arc_height),
+            on_complete=on_complete,
+            on_cancel=on_cancel,
+        )
+        return self._register(tween, canvas)
+
+    def add_callback(
+        self,
+        on_update: Callable[[float], None],
+        duration_ms: float,
+        easing: str | Callable[[float], float] = "linear",
+        group: str = "default",
+        on_complete: Optional[Callable[[], None]] = None,
+        canvas=None,
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """Call ``on_update(eased_t)`` every frame for ``duration_ms``."""
+        tween = Tween(
+            id=next(self._ids),
+            group=group,
+            duration_ms=max(1.0, float(duration_ms)),
+            easing=self._resolve_easing(easing),
+            on_update=on_update,
+            on_complete=on_complete,
+            on_cancel=on_cancel,
+        )
+        return self._register(tween, canvas)
+
+    def add_delay(
+        self,
+        delay_ms: float,
+        on_complete: Callable[[], None],
+        group: str = "default",
+        canvas=None,
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> int:
+        """Run ``on_complete`` after ``delay_ms`` on the animation clock."""
+        return self.add_callback(
+            lambda _t: None, delay_ms, group=group,
+            on_complete=on_complete, canvas=canvas, on_cancel=on_cancel,
+        )
+
+    # Cancellation
+    def cancel(self, tween_id: int) -> bool:
+        tween = self._tweens.pop(tween_id, None)
+        if tween is None:
+            return False
+        self._finish_cancelled([tween])
+        return True
+
+    def cancel_group(self, group: str) -> int:
+        """Cancel a group's tweens, running their ``on_cancel`` cleanup."""
+        cancelled = [tw for tw in self._tweens.values() if tw.group == group]
+        for tween in cancelled:
+            del self._tweens[tween.id]
+        self._finish_cancelled(cancelled)
+        return len(cancelled)
+
+    def cancel_all(self) -> None:
+        cancelled = list(self._tweens.values())
+        self._tweens.clear()
+        self._finish_cancelled(cancelled)
+
+    def _finish_cancelled(self, tweens: List[Tween]) -> None:
+        self.tweens_cancelled += len(tweens)
+        for tween in tweens:
+            if tween.on_cancel:
+                try:
+                    tween.on_cancel()
+                except Exception as e:
+                    print(f"⚠️ AnimationEngine: on_cancel error: {e}")
+
+    # Ticking
+    def tick(self, now_ms: Optional[float] = None) -> None:
+        """Advance every active tween by the time since the previous tick."""
+        if now_ms is None:
+            now_ms = self._now_ms()
+        if not self._tweens:
+            self._last_tick_ms = now_ms
+            return
+
+        dt = self.frame_ms if self._last_tick_ms is None else now_ms - self._last_tick_ms
+        self._last_tick_ms = now_ms
+        started = self._now_ms()
+
+        finished: List[Tween] = []
+        for tween in list(self._tweens.values()):
+            tween.elapsed_ms += max(0.0, dt)
+            t = min(1.0, tween.elapsed_ms / tween.duration_ms)
+            eased = tween.easing(t)
+            try:
+                if tween.on_update is not None:
+                    tween.on_update(eased)
+                else:
+                    self._apply_move(tween, t, eased)
+            except Exception:
+                # Canvas item deleted underneath us; drop the tween
+                t = 1.0
+            if t >= 1.0:
+                finished.append(tween)
+
+        for tween in finished:
+            if self._tweens.pop(tween.id, None) is None:
+                continue
+            self.tweens_completed += 1
+            if tween.on_complete:
+                try:
+                    tween.on_complete()
+                except Exception as e:
+                    print(f"⚠️ AnimationEngine: on_complete error: {e}")
+
+        frame_ms = self._now_ms() - started
+        self.frames += 1
+        self.last_frame_ms = frame_ms
+        self.max_frame_ms = max(self.max_frame_ms, frame_ms)
+
+    def _apply_move(self, tween: Tween, t: float, eased: float) -> None:
+        (x0, y0), (x1, y1) = tween.start, tween.end
+        dx = (x1 - x0) * eased
+        dy = (y1 - y0) * eased - tween.arc_height * math.sin(math.pi * t)
+        ax, ay = tween._applied
+        if dx != ax or dy != ay:
+            tween.canvas.move(tween.item, dx - ax, dy - ay)
+            tween._applied = (dx, dy)
+
+    # Status
+    def active_count(self, group: Optional[str] = None) -> int:
+        if group is None:
+            return len(self._tweens)
+        return sum(1 for tw in self._tweens.values() if tw.group == group)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "active_tweens": len(self._tweens),
+            "frames": self.frames,
+            "last_frame_ms": round(self.last_frame_ms, 3),
+            "max_frame_ms": round(self.max_frame_ms, 3),
+            "tweens_started": self.tweens_started,
+            "tweens_completed": self.tweens_completed,
+            "tweens_cancelled": self.tweens_cancelled,
+        }
+
+    # Internals
+    def _register(self, tween: Tween, canvas) -> int:
+        self._tweens[tween.id] = tween
+        self.tweens_started += 1
+        if len(self._tweens) == 1:
+            # Restart the frame clock after an idle period
+            self._last_tick_ms = None
+        self._ensure_driver(canvas)
+        return tween.id
+
+    def _ensure_driver(self, widget) -> None:
+        """Self-drive with one after() loop when no director is ticking us."""
+        if self.driver_attached or self._self_driver_after is not None:
+            return
+        if widget is not None and hasattr(widget, "after"):
+            self._self_driver = widget
+        if self._self_driver is None:
+            return
+        try:
+            self._self_driver_after = self._self_driver.after(
+                self.frame_ms, self._self_drive
+            )
+        except Exception:
+            self._self_driver_after = None
+
+    def _self_drive(self) -> None:
+        self._self_driver_after = None
+        if self.driver_attached:
+            return
+        self.tick()
+        if self._tweens:
+            self._ensure_driver(None)
+
+    def _resolve_easing(self, easing) -> Callable[[float], float]:
+        if callable(easing):
+            return easing
+        return EASINGS.get(easing, ease_in_out_cubic)
+
+    def _now_ms(self) -> float:
+        return time.perf_counter() * 1000.0
+
+
+_animation_engine: Optional[AnimationEngine] = None
+
+
+def get_animation_engine() -> AnimationEngine:
+    """Get the process-wide animation engine."""
+    global _animation_engine
+    if _animation_engine is None:
+        _animation_engine = AnimationEngine()
+    return _animation_engine
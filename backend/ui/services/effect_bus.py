@@ -10,6 +10,8 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 from dataclasses import dataclass, field
 
+from .effect_queue import EffectQueue
+
 # Import VoiceManager for human voice announcements
 try:
     from ...utils.voice_manager import VoiceManager
@@ -22,6 +24,19 @@ except ImportError:
         except ImportError:
             VoiceManager = None
 
+try:
+    from ...utils.sound_preloader import PRIORITY_HIGH, SoundPreloader
+except ImportError:
+    try:
+        from utils.sound_preloader import PRIORITY_HIGH, SoundPreloader
+    except ImportError:
+        from backend.utils.sound_preloader import PRIORITY_HIGH, SoundPreloader
+
+
+def _decode_sound(path: str):
+    import pygame
+    return pygame.mixer.Sound(path)
+
 
 # Minimal effect representation
 @dataclass
@@ -31,28 +46,53 @@ class Effect:
     name: Optional[str] = None
     ms: int = 200
     args: Dict[str, Any] = field(default_factory=dict)
+    channel: Optional[str] = None  # coalescing/drop channel; defaults to type
+    priority: Optional[int] = None  # lower plays first; defaults by type
 
 
 class EffectBus:
-    def __init__(self, game_director=None, sound_manager=None, event_bus=None, renderer=None):
+    def __init__(self, game_director=None, sound_manager=None, event_bus=None, renderer=None,
+                 defer_audio: bool = False):
         self.director = game_director
         self.sound = sound_manager
         self.event_bus = event_bus
         self.renderer = renderer
         self.enabled = True
-        self.effects: List[Effect] = []
+        # Pending effects: priority ordered, coalesced per channel
+        self.queue = EffectQueue()
         self.next_id = 0
         
+        # Sound effects and voices decode off the Tk thread; decoding starts
+        # once the mixer is up (init_audio)
+        self.preloader = SoundPreloader(_decode_sound, start=False)
+
         # Initialize VoiceManager for human voice announcements
         self.voice_manager = None
         if VoiceManager:
             try:
-                self.voice_manager = VoiceManager()
+                self.voice_manager = VoiceManager(preloader=self.preloader)
                 print("🔊 EffectBus: VoiceManager initialized for human voice announcements")
             except Exception as e:
                 print(f"⚠️ EffectBus: VoiceManager not available: {e}")
         
-        # Initialize pygame mixer for audio
+        # Load sound configuration from file
+        self.sound_mapping = {}
+        self.config: Dict[str, Any] = {}
+        self._load_sound_config()
+        
+        # Mixer and sound files; deferred callers run init_audio() once the
+        # first window is up. ``sounds`` maps a sound name to its preloader key.
+        self.pygame_available = False
+        self.audio_initialized = False
+        self.sounds: Dict[str, str] = {}
+        if not defer_audio:
+            self.init_audio()
+    
+    def init_audio(self):
+        """Initialize the pygame mixer and load sound files (idempotent)."""
+        if self.audio_initialized:
+            return
+        self.audio_initialized = True
         try:
             import pygame
             pygame.mixer.init(
@@ -60,17 +100,11 @@ class EffectBus:
             )
             self.pygame_available = True
             print("🔊 EffectBus: Pygame mixer initialized for audio")
+            # Sounds and voices decode in the background now that the mixer is up
+            self.preloader.start()
         except Exception as e:
             self.pygame_available = False
             print(f"⚠️ EffectBus: Pygame mixer not available: {e}")
-        
-        # Load sound configuration from file
-        self.sound_mapping = {}
-        self.config: Dict[str, Any] = {}
-        self._load_sound_config()
-        
-        # Load sound files
-        self.sounds = {}
         self._load_sounds()
     
     def _load_sound_config(self):
@@ -100,6 +134,12 @@ class EffectBus:
                 # Optional base directory for sounds
                 self.sound_dir_hint = Path(config.get("sound_directory", "sounds"))
 
+                # Queue the voice lines now so the first announcement is decoded
+                if self.voice_manager:
+                    self.voice_manager.register_voice_files(
+                        config.get("voice_sounds", {}), self.voice_type
+                    )
+
                 print(f"🔊 EffectBus: Loaded sound config with {len(self.sound_mapping)} mappings")
             else:
                 print(f"⚠️ EffectBus: Sound config file not found: {config_file}")
@@ -146,9 +186,21 @@ class EffectBus:
         try:
             if self.event_bus is not None:
                 self.event_bus.subscribe("effect_bus:animate", self._on_animation_request)
+                # Queued sounds/animations are stale once playback jumps
+                self.event_bus.subscribe("game_director:seek", self._on_seek)
         except Exception:
             pass
 
+    @property
+    def effects(self) -> List[Effect]:
+        """Pending effects in the order they will be processed."""
+        return self.queue.pending()
+
+    def _on_seek(self, payload=None):
+        dropped = self.queue.drop_stale()
+        if dropped:
+            print(f"🔊 EffectBus: Dropped {dropped} stale effects after seek")
+
     def _resolve_sound_path(self, rel_or_abs: str) -> Optional[Path]:
         """Resolve a sound path robustly across likely locations."""
         try:
@@ -178,28 +230,42 @@ class EffectBus:
         return None
 
     def _load_sounds(self):
-        """Load all available sound files."""
+        """Queue all available sound files on the background preloader."""
         if not self.pygame_available:
             return
             
         try:
-            import pygame
             for action, filename in self.sound_mapping.items():
                 resolved = self._resolve_sound_path(filename)
                 if resolved and resolved.exists() and resolved.stat().st_size > 100:
-                    try:
-                        sound = pygame.mixer.Sound(str(resolved))
-                        self.sounds[action.upper()] = sound
-                        print(f"🔊 EffectBus: Loaded sound {action} -> {resolved}")
-                    except Exception as e:
-                        print(f"⚠️ EffectBus: Failed to load {filename}: {e}")
+                    # Keyed by file so actions sharing a file decode it once
+                    key = self._sound_key(resolved)
+                    self.preloader.register(key, str(resolved), PRIORITY_HIGH)
+                    self.sounds[action.upper()] = key
                 else:
                     print(f"⚠️ EffectBus: Sound file not found or empty: {filename}")
                     
-            print(f"🔊 EffectBus: Loaded {len(self.sounds)} sound files")
+            print(f"🔊 EffectBus: Queued {len(self.sounds)} sound files")
         except Exception as e:
             print(f"⚠️ EffectBus: Error loading sounds: {e}")
 
+    def _sound_key(self, resolved: Path) -> str:
+        return f"sound:{resolved.resolve()}"
+
+    def _get_sound(self, sound_name: str):
+        """Decoded sound for a name without blocking; None while it decodes."""
+        key = self.sounds.get(sound_name)
+        if key is None:
+            # Not in the preloaded mapping: queue the file so a later play finds it
+            sound_file = self.sound_mapping.get(sound_name.upper(), "")
+            resolved = self._resolve_sound_path(sound_file) if sound_file else None
+            if not resolved:
+                return None
+            key = self._sound_key(resolved)
+            self.preloader.register(key, str(resolved))
+            self.sounds[sound_name] = key
+        return self.preloader.get(key)
+
     def add_effect(self, effect: Effect) -> str:
         """Add an effect to the queue."""
         if not self.enabled:
@@ -207,7 +273,10 @@ class EffectBus:
             
         effect.id = f"{effect.type}_{self.next_id}"
         self.next_id += 1
-        self.effects.append(effect)
+        queued_id = self.queue.push(effect)
+        if queued_id != effect.id:
+            # Coalesced into an identical pending effect on the same channel
+            return queued_id
         
         # Notify event bus
         if self.event_bus:
@@ -220,44 +289,41 @@ class EffectBus:
         
         return effect.id
 
+    def _fast_forwarding(self) -> bool:
+        """True while the director skips effects (turbo playback)."""
+        return bool(getattr(self.director, "fast_forward", False))
+
+    def remove_effect(self, effect_id: str) -> bool:
+        """Remove a pending effect by id."""
+        return self.queue.remove(effect_id)
+
     def add_sound_effect(self, sound_name: str, ms: int = 200):
         """Add sound effect with proper gating, even if pygame audio fails."""
+        if self._fast_forwarding():
+            return
+        # Collapse bursts of the same sound (e.g. chips during an all-in)
+        # into one; the first play's gate already covers the burst
+        if self.queue.coalesce_immediate("sound", sound_name):
+            return
+
         # try to play; don't crash if mixer is unavailable
         played = False
         try:
             if hasattr(self, 'pygame_available') and self.pygame_available:
-                import pygame
-                # First try to use pre-loaded sound from self.sounds
-                if sound_name in self.sounds:
+                # Decoded sounds come from the preloader; a sound that is not
+                # ready yet is skipped rather than decoded on the Tk thread
+                sound = self._get_sound(sound_name)
+                if sound is not None:
                     try:
-                        sound = self.sounds[sound_name]
                         sound.set_volume(self.master_volume)
                         sound.play()
                         played = True
-                        print(f"🔊 EffectBus: Playing pre-loaded sound: {sound_name}")
+                        print(f"🔊 EffectBus: Playing sound: {sound_name}")
                     except Exception as e:
-                        print(f"⚠️ EffectBus: Failed to play pre-loaded sound {sound_name}: {e}")
+                        print(f"⚠️ EffectBus: Failed to play sound {sound_name}: {e}")
                         played = False
-                else:
-                    # Fallback: try to load from file mapping
-                    sound_file = self.sound_mapping.get(sound_name.upper(), "")
-                    if sound_file:
-                        resolved = self._resolve_sound_path(sound_file)
-                        try:
-                            if resolved and resolved.exists():
-                                sound = pygame.mixer.Sound(str(resolved))
-                                sound.set_volume(self.master_volume)
-                                sound.play()
-                                played = True
-                                print(f"🔊 EffectBus: Playing sound {sound_name} -> {resolved}")
-                            else:
-                                print(f"⚠️ EffectBus: Could not resolve sound path for {sound_file}")
-                                played = False
-                        except Exception as e:
-                            print(f"⚠️ EffectBus: Failed to play {sound_file}: {e}")
-                            played = False
-                    else:
-                        print(f"⚠️ EffectBus: No sound mapping found for {sound_name}")
+                elif sound_name not in self.sounds:
+                    print(f"⚠️ EffectBus: No sound mapping found for {sound_name}")
         except Exception as e:
             print(f"⚠️ EffectBus: Error in add_sound_effect: {e}")
             played = False
@@ -283,6 +349,8 @@ class EffectBus:
 
     def add_animation_effect(self, name: str, ms: int = 250, args: dict | None = None):
         """Add animation effect with proper gating."""
+        if self._fast_forwarding():
+            return
         args = args or {}
         if self.event_bus:
             self.event_bus.publish("effect_bus:animate", {"name": name, "ms": ms, "args": args})
@@ -340,6 +408,8 @@ class EffectBus:
 
     def add_poker_action_effects(self, action_type: str, player_name: str = ""):
         """Add poker action effects with proper sound mapping and gating."""
+        if self._fast_forwarding():
+            return
         action_type = (action_type or "").upper()
         
         # Debug: log what we're receiving
@@ -359,13 +429,15 @@ class EffectBus:
 
         # Add voice announcements for key actions via event bus and direct playback
         voice_action = self._map_action_to_voice(action_type)
+        if voice_action and self.queue.coalesce_immediate("voice", voice_action):
+            voice_action = ""
         if self.voice_enabled and voice_action and hasattr(self, 'voice_manager') and self.voice_manager:
             try:
                 print(f"🔊 DEBUG: Playing voice for action '{action_type}' -> '{voice_action}'")
                 self.voice_manager.play_action_voice(voice_action.lower(), 0)
             except Exception as e:
                 print(f"🔊 DEBUG: Voice playback failed: {e}")
-        elif self.voice_enabled:
+        elif self.voice_enabled and voice_action:
             # 1) Publish event for listeners
             if self.event_bus:
                 self.event_bus.publish(
@@ -408,17 +480,14 @@ class EffectBus:
         if not self.enabled:
             return
             
-        # Process effects
-        for effect in self.effects[:]:
+        # Process effects in priority order; stale ones are dropped by the queue
+        for effect in self.queue.drain():
             if effect.type == "sound":
                 self._play_sound(effect)
             elif effect.type == "animation":
                 self._start_animation(effect)
             elif effect.type == "banner":
                 self._show_banner(effect)
-            
-            # Remove processed effects
-            self.effects.remove(effect)
 
     def _play_sound(self, effect: Effect):
         """Play a sound effect."""
@@ -432,9 +501,11 @@ class EffectBus:
                 if self.director:
                     self.director.gate_begin()
                 
-                # Play the sound
+                # Play the sound if it has finished decoding
+                sound = self._get_sound(sound_name)
                 try:
-                    self.sounds[sound_name].play()
+                    if sound is not None:
+                        sound.play()
                 except Exception:
                     pass
                 print(f"🔊 EffectBus: Playing sound: {sound_name}")
@@ -512,7 +583,7 @@ class EffectBus:
 
     def clear_queue(self):
         """Clear all pending effects."""
-        self.effects.clear()
+        self.queue.clear()
 
     def stop_all_effects(self):
         """Stop all running effects."""
@@ -528,7 +599,8 @@ class EffectBus:
         """Get current status."""
         return {
             "enabled": self.enabled,
-            "effects_count": len(self.effects),
+            "effects_count": len(self.queue),
+            "queue": self.queue.get_stats(),
             "sounds_loaded": len(self.sounds),
             "pygame_available": self.pygame_available
         }
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+EffectQueue - Priority queue behind EffectBus.
+
+Effects drain in (priority, arrival) order. Identical effects on the same
+channel inside a short window are coalesced into one, effects queued
+before a seek are dropped as stale, and removal by id is O(1) (removed
+entries are skipped lazily when the heap is drained).
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Lower drains first
+PRIORITY_BY_TYPE = {
+    "sound": 10,
+    "voice": 10,
+    "animation": 20,
+    "banner": 30,
+}
+DEFAULT_PRIORITY = 50
+
+# Channels whose pending effects are meaningless after a seek
+DROP_ON_SEEK = {"sound", "voice", "animation"}
+
+
+class EffectQueue:
+    """
+    Heap of pending effects with per-channel coalescing and drop policies.
+
+    Effects are any objects with ``type``, ``name`` and ``id`` attributes
+    (see effect_bus.Effect). The channel is ``effect.channel`` when set,
+    otherwise the effect type.
+    """
+
+    def __init__(
+        self,
+        coalesce_window_ms: int = 80,
+        max_age_ms: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.coalesce_window_ms = max(0, int(coalesce_window_ms))
+        # Effects older than this when drained are dropped (per channel)
+        self.max_age_ms: Dict[str, int] = dict(max_age_ms or {"sound": 1000, "voice": 1500})
+
+        self._heap: List[Tuple[int, int, str]] = []
+        self._entries: Dict[str, Tuple[Any, float]] = {}  # id -> (effect, enqueued_ms)
+        self._pending_by_key: Dict[Tuple[str, Any], str] = {}
+        self._last_immediate: Dict[Tuple[str, Any], float] = {}
+        self._seq = itertools.count()
+
+        # Counters
+        self.queued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.processed = 0
+
+    # Queueing
+    def push(self, effect: Any, priority: Optional[int] = None) -> str:
+        """Queue ``effect``; returns its id, or the id it was coalesced into."""
+        now = self._now_ms()
+        key = self._key(effect)
+        existing_id = self._pending_by_key.get(key)
+        if existing_id is not None:
+            existing = self._entries.get(existing_id)
+            if existing is not None and now - existing[1] <= self.coalesce_window_ms:
+                self.coalesced += 1
+                args = getattr(existing[0], "args", None)
+                if isinstance(args, dict):
+                    args["coalesced"] = args.get("coalesced", 1) + 1
+                return existing_id
+
+        if priority is None:
+            priority = getattr(effect, "priority", None)
+        if priority is None:
+            priority = PRIORITY_BY_TYPE.get(getattr(effect, "type", ""), DEFAULT_PRIORITY)
+
+        seq = next(self._seq)
+        effect_id = getattr(effect, "id", None) or f"effect_{seq}"
+        effect.id = effect_id
+        self._entries[effect_id] = (effect, now)
+        self._pending_by_key[key] = effect_id
+        heapq.heappush(self._heap, (int(priority), seq, effect_id))
+        self.queued += 1
+        return effect_id
+
+    def coalesce_immediate(self, channel: str, name: Any) -> bool:
+        """
+        For effects played straight away rather than queued: True when the
+        same channel/name already fired inside the coalescing window.
+        """
+        now = self._now_ms()
+        key = (channel, name)
+        last = self._last_immediate.get(key)
+        if last is not None and now - last <= self.coalesce_window_ms:
+            self.coalesced += 1
+            return True
+        self._last_immediate[key] = now
+        if len(self._last_immediate) > 256:
+            cutoff = now - self.coalesce_window_ms
+            self._last_immediate = {
+                k: t for k, t in self._last_immediate.items() if t >= cutoff
+            }
+        return False
+
+    # Removal
+    def remove(self, effect_id: str) -> bool:
+        """O(1) removal; the heap slot is skipped when drained."""
+        entry = self._entries.pop(effect_id, None)
+        if entry is None:
+            return False
+        self._forget_key(entry[0], effect_id)
+        self._compact()
+        return True
+
+    def drop_stale(self, channels: Optional[set] = None) -> int:
+        """Drop pending effects on ``channels`` (e.g. after a seek)."""
+        channels = DROP_ON_SEEK if channels is None else channels
+        self._last_immediate.clear()
+        stale = [
+            eid for eid, (effect, _) in self._entries.items()
+            if self._channel(effect) in channels
+        ]
+        for eid in stale:
+            self.remove(eid)
+        self.dropped += len(stale)
+        return len(stale)
+
+    def clear(self) -> int:
+        count = len(self._entries)
+        self.dropped += count
+        self._entries.clear()
+        self._pending_by_key.clear()
+        self._last_immediate.clear()
+        self._heap.clear()
+        return count
+
+    # Draining
+    def drain(self) -> List[Any]:
+        """
+        Pop every pending effect in priority order, skipping stale ones.
+
+        Effects queued while the caller processes the result wait for the
+        next drain, like the list snapshot this replaces.
+        """
+        now = self._now_ms()
+        ready: List[Any] = []
+        while self._heap:
+            _, _, effect_id = heapq.heappop(self._heap)
+            entry = self._entries.pop(effect_id, None)
+            if entry is None:
+                continue  # removed or dropped
+            effect, enqueued_ms = entry
+            self._forget_key(effect, effect_id)
+            max_age = self.max_age_ms.get(self._channel(effect))
+            if max_age is not None and now - enqueued_ms > max_age:
+                self.dropped += 1
+                continue
+            self.processed += 1
+            ready.append(effect)
+        return ready
+
+    def pending(self) -> List[Any]:
+        return [
+            self._entries[eid][0]
+            for _, _, eid in sorted(self._heap)
+            if eid in self._entries
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._entries),
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "processed": self.processed,
+        }
+
+    # Internals
+    def _channel(self, effect: Any) -> str:
+        return getattr(effect, "channel", None) or getattr(effect, "type", "")
+
+    def _key(self, effect: Any) -> Tuple[str, Any]:
+        return (self._channel(effect), getattr(effect, "name", None))
+
+    def _forget_key(self, effect: Any, effect_id: str) -> None:
+        key = self._key(effect)
+        if self._pending_by_key.get(key) == effect_id:
+            del self._pending_by_key[key]
+
+    def _compact(self) -> None:
+        # Rebuild when removed slots dominate so the heap stays small
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [item for item in self._heap if item[2] in self._entries]
+            heapq.heapify(self._heap)
+
+    def _now_ms(self) -> float:
+        return time.perf_counter() * 1000.0
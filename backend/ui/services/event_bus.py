@@ -1,5 +1,23 @@
-from collections import defaultdict
-from typing import Any, Callable, Dict, List
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+Handler = Callable[[Any], None]
+
+# Topic segments are separated by ":"; "*" matches one segment and a
+# trailing "#" matches zero or more remaining segments.
+SEPARATOR = ":"
+WILDCARD_ONE = "*"
+WILDCARD_REST = "#"
+
+
+class _TrieNode:
+    __slots__ = ("children", "handlers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.handlers: List[Handler] = []
 
 
 class EventBus:
@@ -9,10 +27,24 @@ class EventBus:
     Topics should be namespaced using a session identifier to prevent
     cross-talk between tabs/sessions.
     Example: f"{session_id}:ui:action".
+
+    Subscriptions may use wildcards: "game_director:*" matches one segment
+    after the prefix and "session1:#" matches everything under "session1".
+    Handler lists are resolved once per topic and cached until the
+    subscriptions change, so publishing to a topic nobody listens to is a
+    single dict lookup.
     """
 
     def __init__(self) -> None:
-        self._subs: Dict[str, List[Callable[[Any], None]]] = defaultdict(list)
+        self._root = _TrieNode()
+        self._resolved: Dict[str, Tuple[Handler, ...]] = {}
+        self._deferred: Deque[Tuple[str, Any]] = deque()
+
+        # Stats: per-topic publish counts always; handler latency only
+        # while profiling is on (it costs two clock reads per handler)
+        self.profiling = False
+        self._publish_counts: Dict[str, int] = {}
+        self._handler_ms: Dict[str, List[float]] = {}  # topic -> [calls, total, max]
 
     def topic(self, session_id: str, name: str) -> str:
         return f"{session_id}:{name}"
@@ -20,19 +52,130 @@ class EventBus:
     def subscribe(
         self, topic: str, handler: Callable[[Any], None]
     ) -> Callable[[], None]:
-        self._subs[topic].append(handler)
+        node = self._root
+        for part in topic.split(SEPARATOR):
+            node = node.children.setdefault(part, _TrieNode())
+        node.handlers.append(handler)
+        self._resolved.clear()
 
         def unsubscribe() -> None:
             try:
-                self._subs[topic].remove(handler)
+                node.handlers.remove(handler)
             except ValueError:
-                pass
+                return
+            self._resolved.clear()
 
         return unsubscribe
 
+    def subscribe_prefix(
+        self, prefix: str, handler: Callable[[Any], None]
+    ) -> Callable[[], None]:
+        """Subscribe to every topic under ``prefix`` (e.g. "effect_bus")."""
+        return self.subscribe(f"{prefix.rstrip(SEPARATOR)}{SEPARATOR}{WILDCARD_REST}", handler)
+
+    def has_subscribers(self, topic: str) -> bool:
+        """True if publishing ``topic`` would reach any handler."""
+        return bool(self._handlers_for(topic))
+
     def publish(self, topic: str, payload: Any) -> None:
-        # Copy list to avoid mutation during iteration
-        for handler in list(self._subs.get(topic, [])):
-            handler(payload)
+        handlers = self._resolved.get(topic)
+        if handlers is None:
+            handlers = self._handlers_for(topic)
+        self._publish_counts[topic] = self._publish_counts.get(topic, 0) + 1
+        if not handlers:
+            return
+        if not self.profiling:
+            for handler in handlers:
+                handler(payload)
+            return
+        for handler in handlers:
+            start = time.perf_counter()
+            try:
+                handler(payload)
+            finally:
+                self._record_latency(topic, (time.perf_counter() - start) * 1000.0)
+
+    # Deferred dispatch
+    def publish_deferred(self, topic: str, payload: Any) -> None:
+        """Queue an event for the next drain_deferred() (once per frame)."""
+        if self.has_subscribers(topic):
+            self._deferred.append((topic, payload))
+        else:
+            self._publish_counts[topic] = self._publish_counts.get(topic, 0) + 1
+
+    def drain_deferred(self, max_events: Optional[int] = None) -> int:
+        """Publish queued events; events queued while draining wait a frame."""
+        count = len(self._deferred)
+        if max_events is not None:
+            count = min(count, max(0, int(max_events)))
+        for _ in range(count):
+            topic, payload = self._deferred.popleft()
+            try:
+                self.publish(topic, payload)
+            except Exception as e:
+                print(f"⚠️ EventBus: deferred handler error on {topic}: {e}")
+        return count
+
+    def pending_deferred(self) -> int:
+        return len(self._deferred)
+
+    # Stats
+    def get_stats(self) -> Dict[str, Any]:
+        topics: Dict[str, Dict[str, Any]] = {}
+        for topic, count in self._publish_counts.items():
+            entry: Dict[str, Any] = {"published": count}
+            timing = self._handler_ms.get(topic)
+            if timing:
+                calls, total, worst = timing
+                entry.update({
+                    "handler_calls": int(calls),
+                    "handler_mean_ms": round(total / calls, 3),
+                    "handler_max_ms": round(worst, 3),
+                })
+            topics[topic] = entry
+        return {
+            "topics": topics,
+            "deferred_pending": len(self._deferred),
+            "profiling": self.profiling,
+        }
+
+    def reset_stats(self) -> None:
+        self._publish_counts.clear()
+        self._handler_ms.clear()
+
+    # Internals
+    def _handlers_for(self, topic: str) -> Tuple[Handler, ...]:
+        handlers = self._resolved.get(topic)
+        if handlers is None:
+            found: List[Handler] = []
+            self._collect(self._root, topic.split(SEPARATOR), 0, found)
+            handlers = tuple(found)
+            if len(self._resolved) > 4096:
+                self._resolved.clear()
+            self._resolved[topic] = handlers
+        return handlers
 
+    def _collect(self, node: _TrieNode, parts: List[str], i: int,
+                 out: List[Handler]) -> None:
+        rest = node.children.get(WILDCARD_REST)
+        if rest is not None:
+            out.extend(rest.handlers)
+        if i == len(parts):
+            out.extend(node.handlers)
+            return
+        exact = node.children.get(parts[i])
+        if exact is not None:
+            self._collect(exact, parts, i + 1, out)
+        one = node.children.get(WILDCARD_ONE)
+        if one is not None and parts[i] != WILDCARD_ONE:
+            self._collect(one, parts, i + 1, out)
 
+    def _record_latency(self, topic: str, ms: float) -> None:
+        timing = self._handler_ms.get(topic)
+        if timing is None:
+            self._handler_ms[topic] = [1, ms, ms]
+        else:
+            timing[0] += 1
+            timing[1] += ms
+            if ms > timing[2]:
+                timing[2] = ms
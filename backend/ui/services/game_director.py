@@ -6,11 +6,10 @@ GameDirector - Centralized timing, autoplay, and effect sequencing
 from __future__ import annotations
 
 import time
-import heapq
-import itertools
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, Optional, Callable
 from enum import Enum
-from dataclasses import dataclass
+
+from .timer_wheel import TimerWheel
 
 
 class PlaybackState(Enum):
@@ -19,15 +18,14 @@ class PlaybackState(Enum):
     PAUSED = "paused"
 
 
-@dataclass
-class _Scheduled:
-    due_ms: int
-    seq: int
-    event: Dict[str, Any]
-    callback: Optional[Callable]
+# Effect gate events that fast-forward mode never schedules
+GATED_EVENT_TYPES = {"SOUND_COMPLETE", "ANIM_COMPLETE"}
 
 
 class GameDirector:
+    # Speeds at or above this switch to fast-forward; back to 1x leaves it
+    FAST_FORWARD_SPEED = 4.0
+
     def __init__(self, event_bus=None):
         self.event_bus = event_bus
         self.playback_state = PlaybackState.STOPPED
@@ -38,11 +36,18 @@ class GameDirector:
         self.on_advance_callback: Optional[Callable[[int], None]] = None
         self.on_step_change_callback: Optional[Callable[[int], None]] = None
 
-        self._q: List[tuple] = []  # (due_ms, seq, event, callback)
-        self._seq = itertools.count()
+        # Pending (event, callback) pairs on the monotonic clock
+        self._wheel = TimerWheel(clock_ns=lambda: self._now_ns())
         self._gate_count = 0
-        self._cancelled = set()
-        self._last_now = self._now_ms()
+        self.animation_engine = None
+        self._frame_root = None
+        self._frame_after_id = None
+        self._frame_ms = 16
+        # Fast-forward: advance logical steps without effect gating and
+        # render once per frame instead of once per step
+        self.fast_forward = False
+        self.fast_forward_budget_ms = 8.0
+        self.skipped_gates = 0
         print("🎬 GameDirector: Initialized")
 
     # Wiring
@@ -55,6 +60,48 @@ class GameDirector:
     def set_step_change_callback(self, callback: Callable[[int], None]): 
         self.on_step_change_callback = callback
 
+    def attach_animation_engine(self, engine) -> None:
+        """Tick ``engine`` from update() so all tweens share one frame."""
+        self.animation_engine = engine
+        if engine is not None and self._frame_root is not None:
+            engine.driver_attached = True
+
+    def start_frame_loop(self, tk_root, frame_ms: int = 16) -> None:
+        """Drive update() from a single Tk after() loop (one per app)."""
+        if self.animation_engine is None:
+            from .animation_engine import get_animation_engine
+            self.attach_animation_engine(get_animation_engine())
+        self._frame_root = tk_root
+        self._frame_ms = max(1, int(frame_ms))
+        self.animation_engine.driver_attached = True
+        if self._frame_after_id is None:
+            self._frame_after_id = tk_root.after(self._frame_ms, self._on_frame)
+
+    def stop_frame_loop(self) -> None:
+        if self._frame_root is not None and self._frame_after_id is not None:
+            try:
+                self._frame_root.after_cancel(self._frame_after_id)
+            except Exception:
+                pass
+        self._frame_after_id = None
+        self._frame_root = None
+        if self.animation_engine is not None:
+            self.animation_engine.driver_attached = False
+
+    def _on_frame(self) -> None:
+        self._frame_after_id = None
+        try:
+            self.update(self._frame_ms)
+        except Exception as e:
+            print(f"⚠️ GameDirector: frame error: {e}")
+        if self._frame_root is not None:
+            try:
+                self._frame_after_id = self._frame_root.after(
+                    self._frame_ms, self._on_frame
+                )
+            except Exception:
+                self._frame_after_id = None
+
     def set_total_steps(self, total: int):
         self.total_steps = max(0, int(total))
         print(f"🎬 GameDirector: Total steps set to {self.total_steps}")
@@ -80,7 +127,7 @@ class GameDirector:
 
     def stop(self) -> None:
         self.playback_state = PlaybackState.STOPPED
-        self._q.clear()
+        self._wheel.clear()
         self._gate_count = 0
         print("🎬 GameDirector: STOP")
 
@@ -95,22 +142,67 @@ class GameDirector:
 
     def seek(self, step_index: int) -> None:
         # Cancel pending tokens and reset gate count
-        self._q.clear()
+        self._wheel.clear()
         self._gate_count = 0
         self.current_step = max(0, min(int(step_index),
                                        self.total_steps - 1))
+        # Let effect sinks drop anything queued for the old position
+        try:
+            if self.event_bus:
+                self.event_bus.publish("game_director:seek", {"step": self.current_step})
+        except Exception:
+            pass
         if self.on_step_change_callback:
             self.on_step_change_callback(self.current_step)
 
     def set_speed(self, multiplier: float) -> None:
         self.speed = max(0.1, float(multiplier))
         print(f"🎬 GameDirector: Speed={self.speed}x")
+        if self.speed >= self.FAST_FORWARD_SPEED:
+            self.set_fast_forward(True)
+        elif self.speed <= 1.0:
+            self.set_fast_forward(False)
+
+    def set_fast_forward(self, enabled: bool) -> None:
+        """Skip effect gating and intermediate renders while enabled."""
+        enabled = bool(enabled)
+        if enabled == self.fast_forward:
+            return
+        self.fast_forward = enabled
+        if enabled:
+            # Drop pending effect gates; nobody will see those effects
+            self._wheel.cancel_if(
+                lambda item: item[0].get("type") in GATED_EVENT_TYPES
+            )
+            self._gate_count = 0
+        print(f"🎬 GameDirector: Fast-forward {'ON' if enabled else 'OFF'}")
+        try:
+            if self.event_bus:
+                self.event_bus.publish("game_director:fast_forward", {"enabled": enabled})
+        except Exception:
+            pass
+        if self.playback_state == PlaybackState.PLAYING and self._gate_count == 0:
+            self._schedule_next_auto()
+
+    def fast_forward_to(self, step_index: int) -> None:
+        """Advance logical steps up to ``step_index`` and render only the last."""
+        target = max(0, min(int(step_index), self.total_steps))
+        advanced = False
+        while self.current_step < target:
+            self.current_step += 1
+            advanced = True
+            if self.on_advance_callback:
+                self.on_advance_callback(self.current_step)
+        if advanced and self.on_step_change_callback:
+            self.on_step_change_callback(self.current_step)
 
     def set_autoplay_interval(self, ms: int) -> None:
         self.autoplay_interval_ms = max(60, int(ms))
 
     # Gate controls (effects)
     def gate_begin(self) -> None:
+        if self.fast_forward:
+            return
         self._gate_count += 1
         print(f"🎬 GameDirector: GATE ++ ({self._gate_count})")
 
@@ -140,41 +232,53 @@ class GameDirector:
     def schedule(self, delay_ms: int, event: Dict[str, Any],
                  callback: Optional[Callable] = None) -> str:
         """Schedule an event with delay."""
+        if self.fast_forward and event.get("type") in GATED_EVENT_TYPES:
+            # Effects are skipped in fast-forward, so are their gates
+            self.skipped_gates += 1
+            return "skipped"
         # Use defensive speed scaling: divide delay by speed multiplier (faster -> shorter delay)
         scaled_delay = int(delay_ms / max(0.1, float(self.speed)))
-        due_ms = self._now_ms() + scaled_delay
-        seq = next(self._seq)
-        heapq.heappush(self._q, (due_ms, seq, event, callback))
+        timer_id = self._wheel.schedule(scaled_delay, (event, callback))
         # Telemetry: publish scheduled event for diagnostics
         try:
-            if self.event_bus:
+            if self._telemetry_wanted("game_director:scheduled"):
                 self.event_bus.publish("game_director:scheduled", {"delay_ms": delay_ms, "event": event})
         except Exception:
             pass
 
-        return f"{seq}"
+        return f"{timer_id}"
 
     def cancel(self, token: str) -> None:
+        """Cancel a scheduled event by the token schedule() returned."""
         try:
-            seq = int(token[1:])
-            self._cancelled.add(seq)
-        except Exception:
+            self._wheel.cancel(int(token))
+        except (TypeError, ValueError):
             pass
 
+    def cancel_all(self) -> None:
+        """Cancel every pending event (autoplay and effect gates)."""
+        self._wheel.clear()
+        self._gate_count = 0
+
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """Timer counts and dispatch latency histogram (due vs. actual)."""
+        return self._wheel.get_stats()
+
     def update(self, dt_ms: int = 16) -> None:
-        """Update the director - process scheduled events."""
-        now = self._now_ms()
-        while self._q and self._q[0][0] <= now:
-            due_ms, seq, event, callback = heapq.heappop(self._q)
+        """Update the director - dispatch every event due this tick as one batch."""
+        for event, callback in self._wheel.advance():
             # Publish dispatch telemetry so callers can trace scheduling behavior
             try:
-                if self.event_bus:
+                if self._telemetry_wanted("game_director:dispatch"):
                     self.event_bus.publish("game_director:dispatch", event)
             except Exception:
                 pass
 
             if event.get("type") == "AUTO_ADVANCE":
-                self._advance_once()
+                if self.fast_forward:
+                    self._advance_batch()
+                else:
+                    self._advance_once()
                 # Only schedule next if gate is closed and we're playing
                 if (self._gate_count == 0 and
                         self.playback_state == PlaybackState.PLAYING):
@@ -183,14 +287,51 @@ class GameDirector:
                 if callback:
                     callback()
 
+        # Deliver events other services deferred to this frame
+        drain = getattr(self.event_bus, "drain_deferred", None)
+        if drain is not None:
+            drain()
+
+        # Advance every active tween in the same frame
+        if self.animation_engine is not None:
+            self.animation_engine.tick()
+
     # Internals
     def _schedule_next_auto(self) -> None:
-        """Schedule the next autoplay step."""
+        """Schedule the next autoplay step (replacing any pending one)."""
+        # One autoplay chain only: play(), gate_end() and fast-forward toggles
+        # can all land here while an AUTO_ADVANCE is still pending
+        self._wheel.cancel_if(lambda item: item[0].get("type") == "AUTO_ADVANCE")
         if (self.playback_state == PlaybackState.PLAYING and
                 self.current_step < self.total_steps):
+            if self.fast_forward:
+                # Next frame; _advance_batch bounds the work per frame
+                self._wheel.schedule(1, ({"type": "AUTO_ADVANCE"}, None))
+                return
             self.schedule(self.autoplay_interval_ms,
                          {"type": "AUTO_ADVANCE"})
 
+    def _advance_batch(self) -> None:
+        """Fast-forward: advance steps within the frame budget, render once."""
+        deadline = time.perf_counter() + self.fast_forward_budget_ms / 1000.0
+        advanced = False
+        while self.current_step < self.total_steps:
+            self.current_step += 1
+            advanced = True
+            if self.on_advance_callback:
+                self.on_advance_callback(self.current_step)
+            if time.perf_counter() >= deadline:
+                break
+        if advanced and self.on_step_change_callback:
+            self.on_step_change_callback(self.current_step)
+
+    def _telemetry_wanted(self, topic: str) -> bool:
+        """Skip building telemetry payloads nobody is listening for."""
+        if not self.event_bus:
+            return False
+        has_subscribers = getattr(self.event_bus, "has_subscribers", None)
+        return has_subscribers(topic) if has_subscribers else True
+
     def _advance_once(self) -> None:
         """Advance one step forward."""
         if self.current_step < self.total_steps:
@@ -200,9 +341,13 @@ class GameDirector:
             if self.on_step_change_callback:
                 self.on_step_change_callback(self.current_step)
 
+    def _now_ns(self) -> int:
+        """Monotonic clock; immune to wall-clock jumps."""
+        return time.monotonic_ns()
+
     def _now_ms(self) -> int:
         """Get current time in milliseconds."""
-        return int(time.time() * 1000)
+        return self._now_ns() // 1_000_000
 
 
 class NoopDirector:
@@ -218,9 +363,12 @@ class NoopDirector:
     def step_back(self, n: int = 1) -> None: pass
     def seek(self, step_index: int) -> None: pass
     def set_speed(self, multiplier: float) -> None: pass
+    def set_fast_forward(self, enabled: bool) -> None: pass
+    def fast_forward_to(self, step_index: int) -> None: pass
     def set_autoplay_interval(self, ms: int) -> None: pass
     def schedule(self, delay_ms: int, event: Dict[str, Any], callback: Optional[Callable] = None) -> str: return "noop"
     def cancel(self, token: str) -> None: pass
+    def cancel_all(self) -> None: pass
     def gate_begin(self) -> None: pass
     def gate_end(self) -> None: pass
     def notify_animation_complete(self) -> None: pass
@@ -1,5 +1,7 @@
 import json
 import os
+import threading
+import time
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
@@ -58,21 +60,46 @@ class HandsFilter:
         return True
 
 class HandsRepository:
-    """Repository for managing poker hands data."""
+    """Repository for managing poker hands data.
+
+    With ``background=True`` the hand libraries load on a worker thread so
+    the first window is not blocked; callers see an empty repository until
+    ``is_loaded()`` turns true.
+    """
     
-    def __init__(self):
+    def __init__(self, background: bool = False):
         self.legendary_hands: List[Dict[str, Any]] = []
         self.bot_hands: List[Dict[str, Any]] = []
         self.imported_hands: List[Dict[str, Any]] = []
         self.collections: Dict[str, List[str]] = {}  # collection_name -> [hand_ids]
         self.current_filter = HandsFilter()
-        self._load_hands()
+        self.load_ms: float = 0.0
+        self._loaded = threading.Event()
+        if background:
+            threading.Thread(
+                target=self._load_hands, name="hands-loader", daemon=True
+            ).start()
+        else:
+            self._load_hands()
     
     def _load_hands(self):
         """Load hands from various sources."""
-        self._load_legendary_hands()
-        # TODO: Load bot hands and imported hands
-        self._create_default_collections()
+        start = time.perf_counter()
+        try:
+            self._load_legendary_hands()
+            # TODO: Load bot hands and imported hands
+            self._create_default_collections()
+        finally:
+            self.load_ms = (time.perf_counter() - start) * 1000.0
+            self._loaded.set()
+    
+    def is_loaded(self) -> bool:
+        """True once the hand libraries have finished loading."""
+        return self._loaded.is_set()
+    
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Block until loading finishes; returns False on timeout."""
+        return self._loaded.wait(timeout)
     
     def _load_legendary_hands(self):
         """Load legendary hands from data directory."""
@@ -89,18 +116,21 @@ class HandsRepository:
                     with open(path, 'r', encoding='utf-8') as f:
                         data = json.load(f)
                     
+                    hands = []
                     if isinstance(data, list):
-                        self.legendary_hands = data
+                        hands = data
                     elif isinstance(data, dict) and 'hands' in data:
-                        self.legendary_hands = data['hands']
+                        hands = data['hands']
                     
                     # Ensure each hand has required metadata
-                    for i, hand in enumerate(self.legendary_hands):
+                    for i, hand in enumerate(hands):
                         if 'source' not in hand:
                             hand['source'] = 'legendary'
                         if 'hand_id' not in hand:
                             hand['hand_id'] = f'legendary_{i+1}'
                     
+                    # Publish the finished list in one step for background loads
+                    self.legendary_hands = hands
                     print(f"✅ HandsRepository loaded {len(self.legendary_hands)} legendary hands")
                     break
         except Exception as e:
@@ -108,14 +138,15 @@ class HandsRepository:
     
     def _create_default_collections(self):
         """Create default collections."""
-        if self.legendary_hands:
+        hands = self.legendary_hands
+        if hands:
             # Create collections by pot size ranges
             self.collections["High Stakes"] = [
-                hand['hand_id'] for hand in self.legendary_hands 
+                hand['hand_id'] for hand in hands 
                 if hand.get('pot_size', 0) > 1000
             ]
             self.collections["Tournament Classics"] = [
-                hand['hand_id'] for hand in self.legendary_hands 
+                hand['hand_id'] for hand in hands 
                 if any(keyword in hand.get('description', '').lower() 
                       for keyword in ['wsop', 'tournament', 'final table'])
             ]
@@ -21,6 +21,8 @@ except ImportError:
     from ...core.session_logger import get_session_logger
     from ...core.poker_types import Player
 
+from .replay_timeline import ReplayTimeline, compile_timeline, get_timeline_cache, thaw
+
 
 @dataclass
 class HandsReviewState:
@@ -62,6 +64,10 @@ class HandsReviewSessionManager:
         # Decision engine for hand replay
         self.decision_engine: Optional[HandModelDecisionEngine] = None
         
+        # Compiled per-step display states; stepping and seeking index into it
+        self.timeline: Optional[ReplayTimeline] = None
+        self.timeline_cache = get_timeline_cache()
+        
         print("🎯 HandsReviewSessionManager: Initialized per architecture guidelines")
     
     def load_hand(self, hand_data: Dict[str, Any]) -> HandsReviewState:
@@ -70,14 +76,15 @@ class HandsReviewSessionManager:
             # Create Hand object from data
             self.current_hand = Hand.from_dict(hand_data)
             
-            # Initialize PPSM with hand data
-            self._initialize_ppsm_for_hand()
-            
             # Create decision engine for replay
             self.decision_engine = HandModelDecisionEngine(self.current_hand)
             
-            # Count total actions across all streets
-            self.total_actions = sum(len(street_state.actions) for street_state in self.current_hand.streets.values())
+            # Run the hand through PPSM once (or reuse the cached timeline)
+            hand = self.current_hand
+            self.timeline = self.timeline_cache.get_or_compile(
+                hand.metadata.hand_id, lambda: compile_timeline(hand, self.ppsm)
+            )
+            self.total_actions = self.timeline.total_actions
             
             # Reset to beginning
             self.current_action_index = 0
@@ -96,81 +103,49 @@ class HandsReviewSessionManager:
             
             print(f"🎯 HandsReviewSessionManager: Loaded hand {self.current_hand.metadata.hand_id} with {self.total_actions} actions")
             
-            return HandsReviewState(
-                current_hand=self.current_hand,
-                current_action_index=self.current_action_index,
-                total_actions=self.total_actions,
-                is_playing=self.is_playing,
-                playback_speed=self.playback_speed,
-                **initial_state
-            )
+            return self._review_state(initial_state)
             
         except Exception as e:
             print(f"❌ HandsReviewSessionManager: Error loading hand: {e}")
             raise
     
     def execute_action(self) -> HandsReviewState:
-        """Execute next action through PPSM - business logic only."""
+        """Advance one action along the compiled timeline - business logic only."""
         try:
-            if not self.current_hand:
+            if not self.current_hand or not self.timeline:
                 raise ValueError("No hand loaded")
             
-            # Get action from hand data (need to find which street it's in)
             if self.current_action_index >= self.total_actions:
                 print("🎯 HandsReviewSessionManager: All actions completed")
                 return self._get_current_state()
             
-            # Find the action across all streets
-            action = self._get_action_by_index(self.current_action_index)
-            
-            # Convert action to PPSM format
-            player = self._get_player_by_uid(action.actor_uid)
-            action_type = action.action
-            to_amount = action.to_amount if action.to_amount is not None else action.amount
-            
-            # Execute in PPSM
-            result = self.ppsm.execute_action(player, action_type, to_amount)
-            
-            # Update action index
             self.current_action_index += 1
-            
-            # Create new table state
-            new_state = self._create_table_state()
+            step = self.timeline[self.current_action_index]
+            new_state = thaw(step.state)
             
             # Add action effects
-            self._add_action_effects(action, result)
+            self._emit_step_effects(step)
             
             # Update store (not UI directly)
             self.store.dispatch({
                 "type": "HANDS_REVIEW_ACTION_EXECUTED",
                 "action_index": self.current_action_index - 1,
-                "action": action,
+                "action": thaw(step.action),
                 "state": new_state
             })
             
             print(f"🎯 HandsReviewSessionManager: Executed action {self.current_action_index}/{self.total_actions}")
             
-            return HandsReviewState(
-                current_hand=self.current_hand,
-                current_action_index=self.current_action_index,
-                total_actions=self.total_actions,
-                is_playing=self.is_playing,
-                playback_speed=self.playback_speed,
-                street=new_state.get('street', 'PREFLOP'),
-                board=new_state.get('board', []),
-                seats=new_state.get('seats', []),
-                pot=new_state.get('pot', {}),
-                dealer=new_state.get('dealer', {}),
-                action=new_state.get('action', {}),
-                effects=new_state.get('effects', []),
-                table=new_state.get('table', {}),
-                animation=new_state.get('animation', {})
-            )
+            return self._review_state(new_state)
             
         except Exception as e:
             print(f"❌ HandsReviewSessionManager: Error executing action: {e}")
             raise
     
+    def step_back(self) -> HandsReviewState:
+        """Reverse playback by one action (no effects replayed)."""
+        return self.seek(self.current_action_index - 1)
+    
     def _get_action_by_index(self, action_index: int) -> Dict[str, Any]:
         """Get action by global index across all streets."""
         if not self.current_hand:
@@ -185,39 +160,6 @@ class HandsReviewSessionManager:
         
         raise IndexError(f"Action index {action_index} out of range")
     
-    def _get_player_by_uid(self, player_uid: str) -> Player:
-        """Get Player object by UID from PPSM."""
-        if not self.ppsm:
-            raise ValueError("PPSM not initialized")
-        
-        # Get current game state
-        game_state = self.ppsm.get_game_state()
-        
-        # Find player by name/UID
-        for player_data in game_state.get('players', []):
-            if player_data.get('name') == player_uid:
-                # Create Player object from data
-                from core.poker_types import Player
-                return Player(
-                    name=player_data.get('name', 'Unknown'),
-                    stack=player_data.get('current_stack', 1000),
-                    position=player_data.get('position', ''),
-                    is_human=False,
-                    is_active=player_data.get('acting', False),
-                    cards=player_data.get('hole_cards', [])
-                )
-        
-        # If not found, create a default player
-        from core.poker_types import Player
-        return Player(
-            name=player_uid,
-            stack=1000,
-            position='',
-            is_human=False,
-            is_active=False,
-            cards=[]
-        )
-    
     def play(self) -> None:
         """Start autoplay - business logic only."""
         if not self.is_playing and self.current_action_index < self.total_actions:
@@ -256,30 +198,15 @@ class HandsReviewSessionManager:
             print("🎯 HandsReviewSessionManager: Autoplay paused")
     
     def seek(self, action_index: int) -> HandsReviewState:
-        """Seek to specific action - business logic only."""
-        if not self.current_hand:
+        """Seek/scrub to specific action - an index into the timeline."""
+        if not self.current_hand or not self.timeline:
             raise ValueError("No hand loaded")
         
         # Validate action index
-        action_index = max(0, min(action_index, self.total_actions))
-        
-        # Reset PPSM to beginning
-        self._initialize_ppsm_for_hand()
-        
-        # Execute actions up to target index
-        self.current_action_index = 0
-        for i in range(action_index):
-            action = self._get_action_by_index(i)
-            # Convert action to PPSM format
-            player = self._get_player_by_uid(action.actor_uid)
-            action_type = action.action
-            to_amount = action.to_amount if action.to_amount is not None else action.amount
-            
-            self.ppsm.execute_action(player, action_type, to_amount)
-            self.current_action_index += 1
+        self.current_action_index = self.timeline.clamp(action_index)
         
         # Create table state
-        new_state = self._create_table_state()
+        new_state = thaw(self.timeline.state_at(self.current_action_index))
         
         # Update store
         self.store.dispatch({
@@ -290,14 +217,7 @@ class HandsReviewSessionManager:
         
         print(f"🎯 HandsReviewSessionManager: Seeked to action {self.current_action_index}")
         
-        return HandsReviewState(
-            current_hand=self.current_hand,
-            current_action_index=self.current_action_index,
-            total_actions=self.total_actions,
-            is_playing=self.is_playing,
-            playback_speed=self.playback_speed,
-            **new_state
-        )
+        return self._review_state(new_state)
     
     def set_playback_speed(self, speed: float) -> None:
         """Set playback speed - business logic only."""
@@ -315,154 +235,24 @@ class HandsReviewSessionManager:
         
         print(f"🎯 HandsReviewSessionManager: Playback speed set to {self.playback_speed}x")
     
-    def _initialize_ppsm_for_hand(self) -> None:
-        """Initialize PPSM with hand data - business logic only."""
-        if not self.current_hand:
-            return
-        
-        # Create game config from hand data
-        config = GameConfig(
-            num_players=len(self.current_hand.seats),
-            small_blind=self.current_hand.metadata.small_blind,
-            big_blind=self.current_hand.metadata.big_blind,
-            starting_stack=1000  # Default, could be configurable
-        )
-        
-        # Initialize PPSM
-        self.ppsm.initialize_game(config)
-        
-        # Add players from seats
-        for seat in self.current_hand.seats:
-            self.ppsm.add_player(seat.player_uid, seat.starting_stack)
-        
-        # Set dealer position (default to seat 0 for now)
-        self.ppsm.set_dealer_position(0)
-    
     def _create_table_state(self) -> Dict[str, Any]:
-        """Create table state from PPSM - business logic only."""
-        try:
-            # Get current game state from PPSM
-            game_state = self.ppsm.get_game_state()
-            
-            # Extract relevant information
-            seats = []
-            for player in game_state.get('players', []):
-                seats.append({
-                    'player_uid': player.get('name', 'Unknown'),
-                    'name': player.get('name', 'Unknown'),
-                    'starting_stack': player.get('starting_stack', 1000),
-                    'current_stack': player.get('current_stack', 1000),
-                    'current_bet': player.get('current_bet', 0),
-                    'stack': player.get('current_stack', 1000),
-                    'bet': player.get('current_bet', 0),
-                    'cards': player.get('hole_cards', []),
-                    'folded': player.get('folded', False),
-                    'all_in': player.get('all_in', False),
-                    'acting': player.get('acting', False),
-                    'position': player.get('position', ''),
-                    'last_action': player.get('last_action', '')
-                })
-            
-            # Determine current street
-            street = "PREFLOP"
-            board = game_state.get('board', [])
-            if len(board) >= 3:
-                street = "FLOP"
-            if len(board) >= 4:
-                street = "TURN"
-            if len(board) >= 5:
-                street = "RIVER"
-            
-            return {
-                'table': {
-                    'width': 1200,
-                    'height': 800
-                },
-                'seats': seats,
-                'board': board,
-                'street': street,
-                'pot': {
-                    'amount': game_state.get('pot', 0),
-                    'side_pots': game_state.get('side_pots', [])
-                },
-                'dealer': {
-                    'position': game_state.get('dealer_position', 0)
-                },
-                'action': {
-                    'current_player': game_state.get('current_player', -1),
-                    'action_type': game_state.get('last_action_type', ''),
-                    'amount': game_state.get('last_action_amount', 0)
-                },
-                'animation': {},
-                'effects': []
-            }
-            
-        except Exception as e:
-            print(f"⚠️ HandsReviewSessionManager: Error creating table state: {e}")
-            # Return default state
-            return {
-                'table': {'width': 1200, 'height': 800},
-                'seats': [],
-                'board': [],
-                'street': 'PREFLOP',
-                'pot': {'amount': 0, 'side_pots': []},
-                'dealer': {'position': 0},
-                'action': {'current_player': -1, 'action_type': '', 'amount': 0},
-                'animation': {},
-                'effects': []
-            }
-    
-    def _add_action_effects(self, action, result) -> None:
-        """Add action effects - business logic only."""
-        try:
-            # Get action type from Action object
-            action_type = action.action.value if hasattr(action.action, 'value') else str(action.action)
-            actor_uid = action.actor_uid if hasattr(action, 'actor_uid') else 'Unknown'
-            
-            # Debug: log what action type we're getting
-            print(f"🎯 DEBUG: Action type: '{action_type}' (type: {type(action.action)})")
-            
-            # Add sound effects via EffectBus
-            if self.effect_bus:
-                self.effect_bus.add_poker_action_effects(action_type, actor_uid)
-            
-            # Add animation effects for ALL betting actions (not just end-of-street)
-            if action_type in ["BET", "RAISE", "CALL", "CHECK", "FOLD"]:
-                # Betting action animation - chips to pot
-                if self.event_bus:
-                    print(f"🎬 Triggering betting animation for action: {action_type}")
-                    self.event_bus.publish("effect_bus:animate", {
-                        "name": "betting_action",
-                        "ms": 300,
-                        "action_type": action_type,
-                        "actor_uid": actor_uid
-                    })
-            
-            # Add animation effects for specific actions
-            if action_type in ["DEAL_BOARD", "DEAL_FLOP", "DEAL_TURN", "DEAL_RIVER"]:
-                # End-of-street animation
-                if self.event_bus:
-                    print(f"🎬 Triggering end-of-street animation for: {action_type}")
-                    self.event_bus.publish("effect_bus:animate", {
-                        "name": "chips_to_pot",
-                        "ms": 260
-                    })
-            
-            # Add showdown effects
-            if action_type == "SHOWDOWN":
-                if self.event_bus:
-                    print(f"🎬 Triggering showdown animation")
-                    self.event_bus.publish("effect_bus:animate", {
-                        "name": "pot_to_winner",
-                        "ms": 520
-                    })
-            
-        except Exception as e:
-            print(f"⚠️ HandsReviewSessionManager: Error adding action effects: {e}")
+        """Table state for the current action index, from the timeline."""
+        if self.timeline and len(self.timeline):
+            return thaw(self.timeline.state_at(self.current_action_index))
+        # Return default state
+        return {
+            'table': {'width': 1200, 'height': 800},
+            'seats': [],
+            'board': [],
+            'street': 'PREFLOP',
+            'pot': {'amount': 0, 'side_pots': []},
+            'dealer': {'position': 0},
+            'action': {'current_player': -1, 'action_type': '', 'amount': 0},
+            'animation': {},
+            'effects': []
+        }
     
-    def _get_current_state(self) -> HandsReviewState:
-        """Get current session state."""
-        table_state = self._create_table_state()
+    def _review_state(self, table_state: Dict[str, Any]) -> HandsReviewState:
         return HandsReviewState(
             current_hand=self.current_hand,
             current_action_index=self.current_action_index,
@@ -472,6 +262,27 @@ class HandsReviewSessionManager:
             **table_state
         )
     
+    def _emit_step_effects(self, step) -> None:
+        """Trigger the effects compiled for a timeline step - business logic only."""
+        try:
+            for effect in step.effects:
+                kind = effect.get("type")
+                if kind == "sound":
+                    # Add sound effects via EffectBus
+                    if self.effect_bus:
+                        self.effect_bus.add_poker_action_effects(
+                            effect.get("action_type", ""), effect.get("actor", "")
+                        )
+                elif kind == "animate" and self.event_bus:
+                    payload = {k: v for k, v in effect.items() if k != "type"}
+                    self.event_bus.publish("effect_bus:animate", payload)
+        except Exception as e:
+            print(f"⚠️ HandsReviewSessionManager: Error adding action effects: {e}")
+    
+    def _get_current_state(self) -> HandsReviewState:
+        """Get current session state."""
+        return self._review_state(self._create_table_state())
+    
     def cleanup(self) -> None:
         """Clean up session resources."""
         try:
@@ -481,6 +292,7 @@ class HandsReviewSessionManager:
             
             # Reset state
             self.current_hand = None
+            self.timeline = None
             self.current_action_index = 0
             self.total_actions = 0
             self.is_playing = False
@@ -0,0 +1,139 @@
+"""
+RenderScheduler - Frame-coalescing bridge between Store and renderers.
+
+Store.dispatch notifies subscribers synchronously, so bursts of dispatches
+(autoplay, effects, rapid seeks) would otherwise each trigger a full table
+render. The scheduler marks the view dirty on every state change and renders
+the latest state at most once per frame budget via TimerManager.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class RenderScheduler:
+    """
+    Collapses multiple state changes into a single render per frame.
+
+    Usage:
+        scheduler = RenderScheduler(timers, renderer_fn)
+        store.subscribe(scheduler.mark_dirty)
+    """
+
+    def __init__(
+        self,
+        timers,
+        render_fn: Callable[[Any], None],
+        frame_budget_ms: int = 16,
+    ) -> None:
+        self.timers = timers
+        self.render_fn = render_fn
+        self.frame_budget_ms = max(1, int(frame_budget_ms))
+
+        self._dirty = False
+        self._pending_state: Any = None
+        self._after_id: Optional[str] = None
+        self._marks_in_frame = 0
+        self._last_render_ms: Optional[float] = None
+
+        # Stats
+        self.frames_rendered = 0
+        self.frames_merged = 0
+        self.frames_dropped = 0
+        self.last_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+
+    def mark_dirty(self, state: Any = None) -> None:
+        """Store subscriber: remember latest state and request a frame."""
+        self._pending_state = state
+        self._marks_in_frame += 1
+        if self._dirty:
+            return
+        self._dirty = True
+        self._request_frame()
+
+    def flush(self) -> None:
+        """Render immediately if dirty (e.g. on seek end or tab show)."""
+        if self._after_id is not None:
+            try:
+                self.timers.cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if self._dirty:
+            self._render_frame()
+
+    def _request_frame(self) -> None:
+        if self._after_id is not None:
+            return
+        delay = self.frame_budget_ms
+        if self._last_render_ms is not None:
+            # Keep a steady cadence: wait only for the rest of the budget
+            elapsed = self._now_ms() - self._last_render_ms
+            delay = max(0, int(self.frame_budget_ms - elapsed))
+        self._after_id = self.timers.after(delay, self._on_frame)
+
+    def _on_frame(self) -> None:
+        self._after_id = None
+        if self._dirty:
+            self._render_frame()
+
+    def _render_frame(self) -> None:
+        state = self._pending_state
+        merged = max(0, self._marks_in_frame - 1)
+        self._dirty = False
+        self._pending_state = None
+        self._marks_in_frame = 0
+
+        start = self._now_ms()
+        try:
+            self.render_fn(state)
+        except Exception as e:
+            print(f"⚠️ RenderScheduler: render error: {e}")
+        end = self._now_ms()
+
+        frame_ms = end - start
+        self.frames_rendered += 1
+        self.frames_merged += merged
+        self.last_frame_ms = frame_ms
+        self.max_frame_ms = max(self.max_frame_ms, frame_ms)
+        if frame_ms > self.frame_budget_ms:
+            # Frames we could not present because this render overran
+            self.frames_dropped += int(frame_ms // self.frame_budget_ms)
+        self._last_render_ms = end
+
+        # State changed during render: schedule a follow-up frame
+        if self._dirty:
+            self._request_frame()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "frame_budget_ms": self.frame_budget_ms,
+            "frames_rendered": self.frames_rendered,
+            "frames_merged": self.frames_merged,
+            "frames_dropped": self.frames_dropped,
+            "last_frame_ms": round(self.last_frame_ms, 3),
+            "max_frame_ms": round(self.max_frame_ms, 3),
+            "pending": self._dirty,
+        }
+
+    def reset_stats(self) -> None:
+        self.frames_rendered = 0
+        self.frames_merged = 0
+        self.frames_dropped = 0
+        self.last_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+
+    def dispose(self) -> None:
+        if self._after_id is not None:
+            try:
+                self.timers.cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        self._dirty = False
+        self._pending_state = None
+
+    def _now_ms(self) -> float:
+        return time.perf_counter() * 1000.0
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+ReplayTimeline - Hands review playback compiled ahead of time.
+
+compile_timeline() runs a Hand through the PPSM once and records an
+immutable display state after every executed action, along with the diff
+from the previous step and the effects (sounds, animations) that step
+should trigger. Stepping, seeking, scrubbing and reverse playback are then
+plain array indexing. Compiled timelines are kept per hand_id in an LRU.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+
+STATE_KEYS = ("table", "seats", "board", "street", "pot", "dealer",
+              "action", "animation", "effects")
+BETTING_ACTIONS = {"BET", "RAISE", "CALL", "CHECK", "FOLD", "ALL_IN"}
+
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen value (dicts and lists)."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class TimelineStep:
+    """Display state after ``index`` actions, plus what changed to get here."""
+    index: int
+    state: Mapping[str, Any]
+    diff: Mapping[str, Any]
+    effects: Tuple[Mapping[str, Any], ...] = ()
+    action: Optional[Mapping[str, Any]] = None
+
+
+class ReplayTimeline:
+    """Immutable sequence of steps; step 0 is the table after the blinds."""
+
+    def __init__(self, hand_id: str, steps: List[TimelineStep], errors: Tuple[str, ...] = ()):
+        self.hand_id = hand_id
+        self.steps: Tuple[TimelineStep, ...] = tuple(steps)
+        self.errors = tuple(errors)
+
+    @property
+    def total_actions(self) -> int:
+        return max(0, len(self.steps) - 1)
+
+    def clamp(self, index: int) -> int:
+        return max(0, min(int(index), len(self.steps) - 1))
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __getitem__(self, index: int) -> TimelineStep:
+        return self.steps[index]
+
+    def step(self, index: int) -> TimelineStep:
+        return self.steps[self.clamp(index)]
+
+    def state_at(self, index: int) -> Mapping[str, Any]:
+        return self.steps[self.clamp(index)].state
+
+
+def diff_states(prev: Optional[Mapping[str, Any]], cur: Mapping[str, Any]) -> Dict[str, Any]:
+    """Top-level keys that changed, and per-seat fields that changed."""
+    if prev is None:
+        return {"keys": tuple(k for k in cur if k != "effects"), "seats": {}}
+    keys = tuple(k for k in cur if k != "effects" and prev.get(k) != cur.get(k))
+    seats: Dict[int, Tuple[str, ...]] = {}
+    if "seats" in keys:
+        old_seats = prev.get("seats") or ()
+        for i, seat in enumerate(cur.get("seats") or ()):
+            old = old_seats[i] if i < len(old_seats) else {}
+            changed = tuple(f for f in seat if old.get(f) != seat.get(f))
+            if changed:
+                seats[i] = changed
+    return {"keys": keys, "seats": seats}
+
+
+def step_effects(action: Optional[Mapping[str, Any]], prev: Optional[Mapping[str, Any]],
+                 cur: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Effects for one step, mirroring what live replay used to trigger."""
+    effects: List[Dict[str, Any]] = []
+    if action:
+        action_type = action.get("action_type", "")
+        actor = action.get("actor", "")
+        effects.append({"type": "sound", "action_type": action_type, "actor": actor})
+        if action_type in BETTING_ACTIONS:
+            effects.append({"type": "animate", "name": "betting_action", "ms": 300,
+                            "action_type": action_type, "actor_uid": actor})
+    if prev is not None and prev.get("street") != cur.get("street"):
+        effects.append({"type": "animate", "name": "chips_to_pot", "ms": 260})
+    if cur.get("street") == "SHOWDOWN" and (prev is None or prev.get("street") != "SHOWDOWN"):
+        effects.append({"type": "animate", "name": "pot_to_winner", "ms": 520})
+    return effects
+
+
+class TimelineBuilder:
+    """Accumulates snapshots into a ReplayTimeline."""
+
+    def __init__(self, hand_id: str):
+        self.hand_id = hand_id
+        self._steps: List[TimelineStep] = []
+        self._prev: Optional[Mapping[str, Any]] = None
+
+    def add(self, state: Dict[str, Any], action: Optional[Dict[str, Any]] = None,
+            final: bool = False) -> bool:
+        """Append a step; a final snapshot showing the same table as the last is dropped."""
+        prev = self._prev
+        if final and prev is not None and all(
+            prev.get(k) == freeze(state.get(k)) for k in STATE_KEYS
+            if k not in ("action", "effects")
+        ):
+            return False
+        effects = step_effects(action, prev, state)
+        state = dict(state, effects=effects)
+        frozen = freeze({k: state.get(k) for k in STATE_KEYS})
+        self._steps.append(TimelineStep(
+            index=len(self._steps),
+            state=frozen,
+            diff=freeze(diff_states(prev, frozen)),
+            effects=freeze(effects),
+            action=freeze(action) if action else None,
+        ))
+        self._prev = frozen
+        return True
+
+    def build(self, errors=()) -> ReplayTimeline:
+        return ReplayTimeline(self.hand_id, self._steps, tuple(errors or ()))
+
+
+def snapshot_ppsm(ppsm, last_actions: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Display state for the PPSM's current game state."""
+    gs = ppsm.game_state
+    last_actions = last_actions or {}
+    acting_idx = getattr(ppsm, "action_player_index", -1)
+    seats = []
+    for i, p in enumerate(gs.players):
+        seats.append({
+            'player_uid': p.name,
+            'name': p.name,
+            'starting_stack': p.stack + p.total_invested,
+            'current_stack': p.stack,
+            'current_bet': p.current_bet,
+            'stack': p.stack,
+            'bet': p.current_bet,
+            'cards': list(p.cards),
+            'folded': p.has_folded,
+            'all_in': p.is_all_in,
+            'acting': i == acting_idx and not p.has_folded,
+            'position': p.position,
+            'last_action': last_actions.get(p.name, ''),
+        })
+    state_name = getattr(getattr(ppsm, "current_state", None), "name", "")
+    street = "SHOWDOWN" if state_name in ("SHOWDOWN", "END_HAND") else str(gs.street).upper()
+    return {
+        'table': {'width': 1200, 'height': 800},
+        'seats': seats,
+        'board': list(gs.board),
+        'street': street,
+        'pot': {'amount': gs.displayed_pot(), 'side_pots': []},
+        'dealer': {'position': getattr(ppsm, "dealer_position", 0)},
+        'action': {'current_player': acting_idx, 'action_type': '', 'amount': 0},
+        'animation': {},
+        'effects': [],
+    }
+
+
+def compile_timeline(hand, ppsm=None) -> ReplayTimeline:
+    """Run ``hand`` through the PPSM once, recording a step per action."""
+    if ppsm is None:
+        try:
+            from core.pure_poker_state_machine import PurePokerStateMachine, GameConfig
+        except ImportError:
+            from ...core.pure_poker_state_machine import PurePokerStateMachine, GameConfig
+        ppsm = PurePokerStateMachine(GameConfig(
+            num_players=len(hand.seats),
+            small_blind=hand.metadata.small_blind,
+            big_blind=hand.metadata.big_blind,
+        ))
+
+    builder = TimelineBuilder(hand.metadata.hand_id)
+    last_actions: Dict[str, str] = {}
+
+    def record_step(step: Optional[Dict[str, Any]]) -> None:
+        if step is None:  # Blinds posted
+            builder.add(snapshot_ppsm(ppsm, last_actions))
+            return
+        name = str(getattr(step["action_type"], "value", step["action_type"])).upper()
+        if step["ok"]:
+            last_actions[step["actor"]] = name.lower()
+        state = snapshot_ppsm(ppsm, last_actions)
+        state['action'] = {'current_player': state['action']['current_player'],
+                           'action_type': name, 'amount': step["amount"] or 0}
+        builder.add(state, action={"actor": step["actor"], "action_type": name,
+                                   "amount": step["amount"], "ok": step["ok"]})
+
+    result = ppsm.replay_hand_model(hand, on_step=record_step) or {}
+
+    builder.add(snapshot_ppsm(ppsm, last_actions), final=True)
+    return builder.build(result.get('errors', ()))
+
+
+class TimelineCache:
+    """LRU of compiled timelines keyed by hand_id."""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = max(1, int(maxsize))
+        self._timelines: "OrderedDict[str, ReplayTimeline]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, hand_id: str) -> Optional[ReplayTimeline]:
+        timeline = self._timelines.get(hand_id)
+        if timeline is not None:
+            self._timelines.move_to_end(hand_id)
+        return timeline
+
+    def get_or_compile(self, hand_id: str, compile_fn: Callable[[], ReplayTimeline]) -> ReplayTimeline:
+        timeline = self.get(hand_id)
+        if timeline is not None:
+            self.hits += 1
+            return timeline
+        self.misses += 1
+        timeline = compile_fn()
+        self._timelines[hand_id] = timeline
+        while len(self._timelines) > self.maxsize:
+            self._timelines.popitem(last=False)
+        return timeline
+
+    def invalidate(self, hand_id: Optional[str] = None) -> None:
+        if hand_id is None:
+            self._timelines.clear()
+        else:
+            self._timelines.pop(hand_id, None)
+
+    def __len__(self) -> int:
+        return len(self._timelines)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"size": len(self._timelines), "maxsize": self.maxsize,
+                "hits": self.hits, "misses": self.misses}
+
+
+_timeline_cache: Optional[TimelineCache] = None
+
+
+def get_timeline_cache() -> TimelineCache:
+    global _timeline_cache
+    if _timeline_cache is None:
+        _timeline_cache = TimelineCache()
+    return _timeline_cache
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+StartupProfiler - Wall-clock timing of application startup.
+
+AppShell wraps each subsystem it brings up in ``phase()`` and marks
+milestones such as the first window; ``report()`` prints time-to-first-
+window and the cost of every subsystem, including work deferred until
+after the window appeared (audio, lazily built tabs, background loads).
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# Taken at import so module import time of the shell counts as startup
+_PROCESS_T0 = time.perf_counter()
+
+FIRST_WINDOW = "first_window"
+
+
+class StartupProfiler:
+    """Records named phases and milestones relative to a start time."""
+
+    def __init__(
+        self,
+        t0: Optional[float] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._clock = clock
+        self.t0 = clock() if t0 is None else t0
+        self.phases: List[Dict[str, Any]] = []
+        self.marks: Dict[str, float] = {}
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name: str, deferred: bool = False) -> Iterator[None]:
+        """Time the enclosed block as subsystem ``name``."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, (self._clock() - start) * 1000.0, start, deferred)
+
+    def record(self, name: str, ms: float, start: Optional[float] = None,
+               deferred: bool = False) -> None:
+        """Record a phase timed elsewhere (e.g. on a worker thread)."""
+        start = self._clock() - ms / 1000.0 if start is None else start
+        self.phases.append({
+            "name": name,
+            "start_ms": round((start - self.t0) * 1000.0, 2),
+            "ms": round(ms, 2),
+            "deferred": bool(deferred),
+        })
+
+    def mark(self, name: str) -> float:
+        """Record milestone ``name`` (first call wins); returns ms since t0."""
+        if name not in self.marks:
+            self.marks[name] = round((self._clock() - self.t0) * 1000.0, 2)
+        return self.marks[name]
+
+    def time_to_first_window_ms(self) -> Optional[float]:
+        return self.marks.get(FIRST_WINDOW)
+
+    def report(self) -> Dict[str, Any]:
+        blocking = [p for p in self.phases if not p["deferred"]]
+        deferred = [p for p in self.phases if p["deferred"]]
+        return {
+            "time_to_first_window_ms": self.time_to_first_window_ms(),
+            "blocking_ms": round(sum(p["ms"] for p in blocking), 2),
+            "deferred_ms": round(sum(p["ms"] for p in deferred), 2),
+            "phases": list(self.phases),
+            "marks": dict(self.marks),
+        }
+
+    def format_report(self) -> str:
+        data = self.report()
+        ttfw = data["time_to_first_window_ms"]
+        lines = [
+            "⏱️ Startup report",
+            f"   time to first window: {ttfw:.1f} ms" if ttfw is not None
+            else "   time to first window: (not reached)",
+        ]
+        for p in sorted(self.phases, key=lambda p: -p["ms"]):
+            tag = " (deferred)" if p["deferred"] else ""
+            lines.append(f"   {p['name']:<28} {p['ms']:>8.1f} ms{tag}")
+        lines.append(
+            f"   blocking total {data['blocking_ms']:.1f} ms, "
+            f"deferred total {data['deferred_ms']:.1f} ms"
+        )
+        return "\n".join(lines)
+
+    def print_report(self) -> None:
+        self.reported = True
+        print(self.format_report())
+
+
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler(t0=_PROCESS_T0)
+    return _startup_profiler
@@ -33,6 +33,7 @@ def get_theme_loader():
 
     return _Accessor()
 from .theme_derive import get_player_state_style
+from ..tableview.render_profiler import get_render_profiler
 
 
 class StateStyler:
@@ -397,7 +398,10 @@ class StateStyler:
         Update all animated state effects.
         Should be called regularly (e.g., every 50ms) for smooth animations.
         """
+        with get_render_profiler().section("StateStyler.update_animations", canvas):
+            self._update_animations(canvas, seats_data, theme_id)
 
+    def _update_animations(self, canvas, seats_data: list, theme_id: str) -> None:
         for idx, seat in enumerate(seats_data):
             # Clear old effects first
             self.clear_state_effects(canvas, idx)
@@ -0,0 +1,187 @@
+"""
+Theme compiler for the config-driven poker theme system.
+
+Flattens each theme built by theme_factory into a single-level
+token -> value dict so ThemeManager.get() is one dict lookup instead of a
+dotted-path walk. Compiled themes are persisted to a cache file keyed by a
+hash of poker_themes.json and built lazily, only when a theme is selected.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .theme_loader import ThemeLoader, get_theme_loader
+
+
+# Bump when theme_factory derivation changes so stale caches are rebuilt
+COMPILER_VERSION = 1
+
+
+def flatten_tokens(tokens: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a token dict so every dotted path resolves with one lookup.
+
+    Top-level keys are kept as-is (including dict values, which callers
+    may still want whole). Nested dicts are additionally expanded to
+    "parent.child" paths; these take precedence over an identically named
+    top-level key, matching the nested-walk-first order of the old lookup.
+    """
+    flat: Dict[str, Any] = dict(tokens)
+
+    def expand(prefix: str, value: Dict[str, Any]) -> None:
+        for key, sub in value.items():
+            path = f"{prefix}.{key}"
+            flat[path] = sub
+            if isinstance(sub, dict):
+                expand(path, sub)
+
+    for key, value in tokens.items():
+        if isinstance(value, dict):
+            expand(key, value)
+    return flat
+
+
+class LazyThemes(MutableMapping):
+    """
+    Theme name -> compiled tokens mapping that compiles on first access.
+
+    Names are known up front (cheap), so membership tests and iteration
+    never build a theme; only indexing does.
+    """
+
+    def __init__(self, compiler: "ThemeCompiler", names: List[str]):
+        self._compiler = compiler
+        self._names = list(names)
+        self._built: Dict[str, Dict[str, Any]] = {}
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        if name in self._built:
+            return self._built[name]
+        if name not in self._names:
+            raise KeyError(name)
+        tokens = self._compiler.compile(name)
+        self._built[name] = tokens
+        return tokens
+
+    def __setitem__(self, name: str, tokens: Dict[str, Any]) -> None:
+        if name not in self._names:
+            self._names.append(name)
+        self._built[name] = tokens
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self._names:
+            raise KeyError(name)
+        self._names.remove(name)
+        self._built.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def built_names(self) -> List[str]:
+        """Names of themes compiled so far (for diagnostics)."""
+        return list(self._built)
+
+
+class ThemeCompiler:
+    """Compiles, caches and lazily serves flattened theme token tables."""
+
+    def __init__(
+        self,
+        loader: Optional[ThemeLoader] = None,
+        cache_path: Optional[str] = None,
+    ):
+        self.loader = loader or get_theme_loader()
+        if cache_path is None:
+            source = Path(self.loader.theme_pack_path)
+            cache_path = str(source.with_name(source.stem + ".compiled.json"))
+        self.cache_path = cache_path
+        self._cache: Optional[Dict[str, Any]] = None
+        self.compiled_count = 0
+        self.cache_hits = 0
+
+    def source_hash(self) -> str:
+        """Hash of the theme pack source plus compiler version."""
+        digest = hashlib.sha256(f"v{COMPILER_VERSION}".encode("utf-8"))
+        try:
+            with open(self.loader.theme_pack_path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"<missing>")
+        return digest.hexdigest()
+
+    def theme_ids(self) -> Dict[str, str]:
+        """Map display name -> theme id without building any theme."""
+        return {info["name"]: info["id"] for info in self.loader.get_theme_list()}
+
+    def lazy_themes(self) -> LazyThemes:
+        return LazyThemes(self, list(self.theme_ids().keys()))
+
+    def compile(self, name: str) -> Dict[str, Any]:
+        """Get the flattened token table for a theme display name."""
+        cache = self._load_cache()
+        cached = cache["themes"].get(name)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        from .theme_factory import build_theme_from_config
+
+        theme_id = self.theme_ids().get(name, name)
+        tokens = flatten_tokens(build_theme_from_config(theme_id, loader=self.loader))
+        self.compiled_count += 1
+        cache["themes"][name] = tokens
+        self._save_cache()
+        return tokens
+
+    def invalidate(self) -> None:
+        """Forget the in-memory cache; the file is re-validated on next use."""
+        self._cache = None
+
+    def _load_cache(self) -> Dict[str, Any]:
+        source_hash = self.source_hash()
+        if self._cache is not None and self._cache.get("source_hash") == source_hash:
+            return self._cache
+
+        cache = None
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (data.get("source_hash") == source_hash and
+                    isinstance(data.get("themes"), dict)):
+                cache = data
+        except (OSError, ValueError):
+            pass
+
+        self._cache = cache or {"source_hash": source_hash, "themes": {}}
+        return self._cache
+
+    def _save_cache(self) -> None:
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"⚠️ ThemeCompiler: Could not write cache: {e}")
+
+
+# Global instance for easy access
+_theme_compiler = None
+
+
+def get_theme_compiler() -> ThemeCompiler:
+    """Get the global theme compiler instance."""
+    global _theme_compiler
+    if _theme_compiler is None:
+        _theme_compiler = ThemeCompiler()
+    return _theme_compiler
@@ -647,17 +647,18 @@ def _get_theme_emphasis_colors(theme_name: str) -> dict:
     )
 
 
-def build_theme_from_config(theme_id: str) -> dict:
+def build_theme_from_config(theme_id: str, loader=None) -> dict:
     """
     Build theme using new config-driven system.
 
     Args:
         theme_id: ID of theme to build from poker_themes.json
+        loader: ThemeLoader to read from (defaults to the global loader)
 
     Returns:
         Complete theme token set
     """
-    loader = get_theme_loader()
+    loader = loader or get_theme_loader()
     defaults = loader.get_defaults()
     theme_config = loader.get_theme_by_id(theme_id)
 
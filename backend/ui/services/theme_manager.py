@@ -7,7 +7,7 @@ import os
 
 # Import the new token-driven theme system
 try:
-    from .theme_factory import build_all_themes
+    from .theme_compiler import flatten_tokens, get_theme_compiler
     from .theme_loader import get_theme_loader
     from .state_styler import (
         get_state_styler,
@@ -38,6 +38,10 @@ class ThemeManager:
         self._fonts: Dict[str, Any]
         self._themes: Dict[str, Dict[str, Any]] = {}
         self._current: str | None = None
+        # Flat token table for the active theme (see get())
+        self._flat: Dict[str, Any] = {}
+        self._flat_src: Dict[str, Any] | None = None
+        self._flat_len = 0
         self._subs: List[Callable[["ThemeManager"], None]] = []
         # Load defaults from codebase
         try:
@@ -54,11 +58,9 @@ class ThemeManager:
                 "small": ("Consolas", 16),  # -4 for smaller text
                 "header": ("Arial", 22, "bold")  # +2 for headers
             }
+        # Register built-in packs (compiled lazily, only when selected)
+        self._themes = self._builtin_packs()
         # Apply persisted config if present
-        # Register built-in packs
-        packs = self._builtin_packs()
-        for name, tokens in packs.items():
-            self.register(name, tokens)
         self._load_config()
         if not self._current:
             # Use Forest Green Professional as safe default
@@ -73,9 +75,12 @@ class ThemeManager:
         """Get built-in theme packs - now using token-driven system"""
         if TOKEN_DRIVEN_THEMES_AVAILABLE:
             try:
-                # Use the new deterministic token system
-                themes = build_all_themes()
-                print(f"🎨 ThemeManager: Loaded {len(themes)} themes: {list(themes.keys())}")
+                # Lazy mapping: each theme is compiled (or read from the
+                # compiled cache) the first time it is selected
+                themes = get_theme_compiler().lazy_themes()
+                if not len(themes):
+                    raise ValueError("no themes in theme pack")
+                print(f"🎨 ThemeManager: Found {len(themes)} themes: {list(themes)}")
                 return themes
             except Exception as e:
                 print(f"⚠️ ThemeManager: Config-driven themes failed: {e}")
@@ -107,9 +112,6 @@ class ThemeManager:
         """Reload themes from file - critical for Theme Manager integration."""
         print("🔄 ThemeManager: Reloading themes from file...")
         
-        # Clear cached themes
-        self._themes = {}
-        
         # Reload using the same logic as __init__
         if TOKEN_DRIVEN_THEMES_AVAILABLE:
             try:
@@ -118,26 +120,25 @@ class ThemeManager:
                 if hasattr(loader, 'reload'):
                     loader.reload()
                 
-                # Rebuild all themes
-                themes = build_all_themes()
-                
-                # Register all themes
-                for name, tokens in themes.items():
-                    self.register(name, tokens)
+                # Compiled tables are keyed by the file hash, so only
+                # themes whose source changed get rebuilt
+                compiler = get_theme_compiler()
+                compiler.invalidate()
+                current_name = self.current_profile_name()
+                self._themes = compiler.lazy_themes()
                 
-                print(f"🔄 ThemeManager: Reloaded {len(themes)} themes from file")
+                print(f"🔄 ThemeManager: Reloaded {len(self._themes)} themes from file")
                 
                 # Reload current theme if it still exists
-                current_name = self.current_profile_name()
                 if current_name in self._themes:
                     self._theme = self._themes[current_name]
                     print(f"🎯 ThemeManager: Restored current theme: {current_name}")
                 else:
                     # Fallback to first available theme
                     if self._themes:
-                        first_theme_name = list(self._themes.keys())[0]
+                        first_theme_name = next(iter(self._themes))
                         self._theme = self._themes[first_theme_name]
-                        self._current_profile = first_theme_name
+                        self._current = first_theme_name
                         print(f"🔄 ThemeManager: Switched to: {first_theme_name}")
                 
             except Exception as e:
@@ -232,6 +233,8 @@ class ThemeManager:
             pass
 
     def current_profile_name(self) -> str:
+        if self._current and self._current in self._themes:
+            return self._current
         for name, theme in self._themes.items():
             if all(self._theme.get(k) == theme.get(k) for k in ("table.felt",)):
                 return name
@@ -241,13 +244,19 @@ class ThemeManager:
         # Dot-path lookup in current theme; fallback to fonts when font.* requested
         if token.startswith("font."):
             return self._theme.get(token) or self._fonts.get(token[5:], default)
-        cur = self._theme
-        for part in token.split("."):
-            if isinstance(cur, dict) and part in cur:
-                cur = cur[part]
+        return self._flat_tokens().get(token, default)
+
+    def _flat_tokens(self) -> Dict[str, Any]:
+        """Flattened view of the active theme, rebuilt only when it changes."""
+        theme = self._theme
+        if self._flat_src is not theme or self._flat_len != len(theme):
+            if TOKEN_DRIVEN_THEMES_AVAILABLE:
+                self._flat = flatten_tokens(theme)
             else:
-                return self._theme.get(token, default)
-        return cur
+                self._flat = dict(theme)
+            self._flat_src = theme
+            self._flat_len = len(theme)
+        return self._flat
     
     def get_all_tokens(self) -> Dict[str, Any]:
         """Get complete token dictionary for current theme"""
@@ -9,20 +9,18 @@ class TimerManager:
         self._after_ids: set[str] = set()
 
     def after(self, ms: int, fn):
-        after_id = self.root.after(ms, self._wrap(fn, after_id_ref=None))
-        # Cannot capture after_id before it's created; store and best-effort
-        # cleanup
+        after_id_ref: list = []
+        after_id = self.root.after(ms, self._wrap(fn, after_id_ref))
+        after_id_ref.append(after_id)
         self._after_ids.add(after_id)
         return after_id
 
     def _wrap(self, fn, after_id_ref):
         def _inner():
-            try:
-                fn()
-            finally:
-                # Best-effort: we don't get the after_id here; callers may
-                # remove manually; otherwise cancel_all will clear leftovers.
-                pass
+            # Forget fired timers so per-frame scheduling does not grow the set
+            for after_id in after_id_ref:
+                self._after_ids.discard(after_id)
+            fn()
         return _inner
 
     def cancel(self, after_id) -> None:
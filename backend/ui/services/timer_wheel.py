@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+TimerWheel - Hierarchical timing wheel on the monotonic clock.
+
+Used by GameDirector for effect gates and autoplay. Scheduling and
+cancellation are O(1); each advance() returns every timer that came due
+since the previous call as one batch, ordered by due time then insertion.
+Dispatch latency (actual minus requested due time) is kept as a histogram.
+"""
+from __future__ import annotations
+
+import itertools
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Level 0 has 256 slots of one tick; levels 1-3 have 64 slots, each
+# covering a whole lower level. With 1 ms ticks that spans ~18.6 hours;
+# later timers wait in an overflow bucket.
+_LEVEL0_BITS = 8
+_LEVEL_BITS = 6
+_LEVELS = 4
+
+# Upper bounds (ms) of the latency histogram buckets; the last is open
+LATENCY_BUCKETS_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class Timer:
+    __slots__ = ("id", "due_ns", "due_tick", "payload", "slot")
+
+    def __init__(self, timer_id: int, due_ns: int, due_tick: int, payload: Any):
+        self.id = timer_id
+        self.due_ns = due_ns
+        self.due_tick = due_tick
+        self.payload = payload
+        self.slot: Optional[Dict[int, "Timer"]] = None
+
+
+class TimerWheel:
+    """Hierarchical timing wheel (Varghese & Lauck) with latency stats."""
+
+    def __init__(
+        self,
+        tick_ms: float = 1.0,
+        clock_ns: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        self.tick_ns = max(1, int(tick_ms * 1_000_000))
+        self._clock_ns = clock_ns
+        self._origin_ns = clock_ns()
+        self._current = 0  # next tick to expire
+
+        sizes = [1 << _LEVEL0_BITS] + [1 << _LEVEL_BITS] * (_LEVELS - 1)
+        self._levels: List[List[Dict[int, Timer]]] = [
+            [{} for _ in range(size)] for size in sizes
+        ]
+        self._overflow: Dict[int, Timer] = {}
+        self._timers: Dict[int, Timer] = {}
+        self._ids = itertools.count(1)
+
+        # Stats
+        self.scheduled = 0
+        self.cancelled = 0
+        self.dispatched = 0
+        self.batches = 0
+        self.max_batch = 0
+        self._latency_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
+
+    # Scheduling
+    def schedule(self, delay_ms: float, payload: Any = None) -> int:
+        """Schedule ``payload`` to come due after ``delay_ms``; returns an id."""
+        due_ns = self._clock_ns() + max(0, int(delay_ms * 1_000_000))
+        # Round up so a timer never fires before its due time
+        due_tick = max(self._current, -(-(due_ns - self._origin_ns) // self.tick_ns))
+        timer = Timer(next(self._ids), due_ns, due_tick, payload)
+        self._timers[timer.id] = timer
+        self._place(timer)
+        self.scheduled += 1
+        return timer.id
+
+    def cancel(self, timer_id: int) -> bool:
+        """Cancel a pending timer in O(1)."""
+        timer = self._timers.pop(timer_id, None)
+        if timer is None:
+            return False
+        if timer.slot is not None:
+            timer.slot.pop(timer.id, None)
+            timer.slot = None
+        self.cancelled += 1
+        return True
+
+    def cancel_if(self, predicate: Callable[[Any], bool]) -> int:
+        """Cancel every pending timer whose payload matches ``predicate``."""
+        ids = [tid for tid, t in self._timers.items() if predicate(t.payload)]
+        for tid in ids:
+            self.cancel(tid)
+        return len(ids)
+
+    def clear(self) -> None:
+        for timer in list(self._timers.values()):
+            if timer.slot is not None:
+                timer.slot.pop(timer.id, None)
+                timer.slot = None
+        self.cancelled += len(self._timers)
+        self._timers.clear()
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    # Expiry
+    def advance(self, now_ns: Optional[int] = None) -> List[Any]:
+        """Expire every timer due by ``now_ns``; returns their payloads in order."""
+        if now_ns is None:
+            now_ns = self._clock_ns()
+        target = (now_ns - self._origin_ns) // self.tick_ns
+        expired: List[Timer] = []
+        level0 = self._levels[0]
+        mask0 = (1 << _LEVEL0_BITS) - 1
+
+        while self._current <= target:
+            if not self._timers:
+                # Nothing pending: jump straight to the target tick
+                self._current = target + 1
+                break
+            index = self._current & mask0
+            if index == 0:
+                self._cascade()
+            slot = level0[index]
+            if slot:
+                for timer in slot.values():
+                    timer.slot = None
+                    self._timers.pop(timer.id, None)
+                    expired.append(timer)
+                slot.clear()
+            self._current += 1
+
+        if not expired:
+            return []
+        expired.sort(key=lambda t: (t.due_ns, t.id))
+        self._record_batch(expired, now_ns)
+        return [t.payload for t in expired]
+
+    # Stats
+    def get_latency_histogram(self) -> Dict[str, int]:
+        labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return dict(zip(labels, self._latency_counts))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._timers),
+            "scheduled": self.scheduled,
+            "cancelled": self.cancelled,
+            "dispatched": self.dispatched,
+            "batches": self.batches,
+            "max_batch": self.max_batch,
+            "latency_mean_ms": round(self._latency_total_ms / self.dispatched, 3)
+            if self.dispatched else 0.0,
+            "latency_max_ms": round(self._latency_max_ms, 3),
+            "latency_histogram": self.get_latency_histogram(),
+        }
+
+    def reset_stats(self) -> None:
+        self.scheduled = self.cancelled = self.dispatched = 0
+        self.batches = self.max_batch = 0
+        self._latency_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
+
+    # Internals
+    def _place(self, timer: Timer) -> None:
+        delta = timer.due_tick - self._current
+        due = timer.due_tick
+        if delta < (1 << _LEVEL0_BITS):
+            slot = self._levels[0][due & ((1 << _LEVEL0_BITS) - 1)]
+        else:
+            slot = self._overflow
+            for level in range(1, _LEVELS):
+                shift = _LEVEL0_BITS + level * _LEVEL_BITS
+                if delta < (1 << shift):
+                    index = (due >> (shift - _LEVEL_BITS)) & ((1 << _LEVEL_BITS) - 1)
+                    slot = self._levels[level][index]
+                    break
+        slot[timer.id] = timer
+        timer.slot = slot
+
+    def _cascade(self) -> None:
+        """Move the next slot of each higher level down as its range begins."""
+        for level in range(1, _LEVELS):
+            shift = _LEVEL0_BITS + (level - 1) * _LEVEL_BITS
+            index = (self._current >> shift) & ((1 << _LEVEL_BITS) - 1)
+            self._replace_all(self._levels[level][index])
+            if index != 0:
+                return
+        # Every level wrapped: bring overflow timers back into range
+        self._replace_all(self._overflow)
+
+    def _replace_all(self, slot: Dict[int, Timer]) -> None:
+        if not slot:
+            return
+        timers = list(slot.values())
+        slot.clear()
+        for timer in timers:
+            self._place(timer)
+
+    def _record_batch(self, expired: List[Timer], now_ns: int) -> None:
+        self.batches += 1
+        self.max_batch = max(self.max_batch, len(expired))
+        self.dispatched += len(expired)
+        for timer in expired:
+            latency_ms = max(0.0, (now_ns - timer.due_ns) / 1_000_000)
+            self._latency_total_ms += latency_ms
+            self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if latency_ms <= bound:
+                    self._latency_counts[i] += 1
+                    break
+            else:
+                self._latency_counts[-1] += 1
@@ -10,6 +10,36 @@ from .actions import (
 )
 
 
+def _assoc(mapping: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+    """Return ``mapping`` updated with ``changes``, sharing structure.
+
+    The original dict is returned when no value actually changes, and
+    unchanged values keep their identity, so memoized selectors and
+    components can detect "nothing changed" with ``is``.
+    """
+    updated = None
+    for key, value in changes.items():
+        if key in mapping:
+            current = mapping[key]
+            if current is value or current == value:
+                continue
+        if updated is None:
+            updated = dict(mapping)
+        updated[key] = value
+    return mapping if updated is None else updated
+
+
+def _assoc_in(
+    state: Dict[str, Any], key: str, changes: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Update the sub-dict ``state[key]`` with ``changes``, sharing structure."""
+    sub = state.get(key, {})
+    new_sub = _assoc(sub, changes)
+    if new_sub is sub and key in state:
+        return state
+    return {**state, key: new_sub}
+
+
 def root_reducer(
     state: Dict[str, Any], action: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -17,35 +47,31 @@ def root_reducer(
     
     # Table/game state actions
     if action_type == SET_TABLE_DIM:
-        table = state.get("table", {})
-        return {**state, "table": {**table, "dim": action["dim"]}}
+        return _assoc_in(state, "table", {"dim": action["dim"]})
     if action_type == SET_POT:
-        return {**state, "pot": {"amount": action["amount"]}}
+        return _assoc(state, {"pot": {"amount": action["amount"]}})
     if action_type == SET_SEATS:
-        return {**state, "seats": action["seats"]}
+        return _assoc(state, {"seats": action["seats"]})
     if action_type == SET_BOARD:
-        return {**state, "board": action["board"]}
+        return _assoc(state, {"board": action["board"]})
     if action_type == SET_DEALER:
-        return {**state, "dealer": action["dealer"]}
+        return _assoc(state, {"dealer": action["dealer"]})
     if action_type == SET_ACTIVE_TAB:
-        return {**state, "active_tab": action["name"]}
+        return _assoc(state, {"active_tab": action["name"]})
     
     # Review state actions
     if action_type == SET_REVIEW_HANDS:
-        review = state.get("review", {})
-        return {**state, "review": {**review, "hands": action["hands"]}}
+        return _assoc_in(state, "review", {"hands": action["hands"]})
     if action_type == SET_REVIEW_FILTER:
-        review = state.get("review", {})
-        return {**state, "review": {**review, "filter": action["filter"]}}
+        return _assoc_in(state, "review", {"filter": action["filter"]})
     if action_type == SET_LOADED_HAND:
-        review = state.get("review", {})
-        return {**state, "review": {**review, "loaded_hand": action["hand"]}}
+        return _assoc_in(state, "review", {"loaded_hand": action["hand"]})
     if action_type == SET_STUDY_MODE:
-        review = state.get("review", {})
-        return {**state, "review": {**review, "study_mode": action["mode"]}}
+        return _assoc_in(state, "review", {"study_mode": action["mode"]})
     if action_type == SET_REVIEW_COLLECTION:
-        review = state.get("review", {})
-        return {**state, "review": {**review, "collection": action["collection"]}}
+        return _assoc_in(
+            state, "review", {"collection": action["collection"]}
+        )
     
     # Enhanced RPGW actions
     if action_type in [
@@ -106,25 +132,18 @@ def enhanced_rpgw_reducer(state, action):
         return new_state
     
     elif action['type'] == UPDATE_ENHANCED_RPGW_STATE:
-        # Update state from PPSM execution results
-        return {
-            **state,
-            'enhanced_rpgw': {
-                **state.get('enhanced_rpgw', {}),
-                **action['updates'],
-                'execution_status': 'completed'
-            }
-        }
+        # Update state from PPSM execution results; untouched keys keep
+        # their identity so selectors can skip unchanged sub-objects
+        return _assoc_in(state, 'enhanced_rpgw', {
+            **action['updates'],
+            'execution_status': 'completed'
+        })
     
     elif action['type'] == ENHANCED_RPGW_ANIMATION_EVENT:
         # Handle animation events
-        return {
-            **state,
-            'enhanced_rpgw': {
-                **state.get('enhanced_rpgw', {}),
-                'animation_event': action['animation_data']
-            }
-        }
+        return _assoc_in(state, 'enhanced_rpgw', {
+            'animation_event': action['animation_data']
+        })
     
     return state
 
@@ -209,24 +228,16 @@ def hands_review_reducer(state, action):
     
     elif action_type == SET_REVIEW_PROGRESS:
         # Set progress information
-        return {
-            **state,
-            'review': {
-                **review,
-                'current_step': action.get('current_step', 0),
-                'total_steps': action.get('total_steps', 0)
-            }
-        }
+        return _assoc_in(state, 'review', {
+            'current_step': action.get('current_step', 0),
+            'total_steps': action.get('total_steps', 0)
+        })
     
     elif action_type == SET_REVIEW_STATUS:
         # Set review status
-        return {
-            **state,
-            'review': {
-                **review,
-                'status': action.get('status', 'idle')
-            }
-        }
+        return _assoc_in(state, 'review', {
+            'status': action.get('status', 'idle')
+        })
     
     elif action_type == HANDS_REVIEW_NEXT_ACTION:
         # Architecture compliant: trigger service layer via event
@@ -3,10 +3,47 @@ Selectors for Hands Review Session - Pure functions for deriving UI state
 All selectors must be pure and memoized where appropriate.
 """
 
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, Callable, List, Optional
 import math
 
 
+def create_selector(*input_selectors: Callable, combiner: Callable) -> Callable:
+    """
+    Build a memoized selector.
+
+    The combiner runs only when the result of any input selector is not
+    identical (``is``) to the previous call's. Otherwise the previous output
+    object is returned, so callers can skip work with an identity check.
+    """
+    cache: Dict[str, Any] = {"inputs": None, "result": None}
+
+    def selector(state: Dict[str, Any], *args: Any) -> Any:
+        inputs = tuple(sel(state, *args) for sel in input_selectors)
+        last = cache["inputs"]
+        if last is not None and all(a is b for a, b in zip(inputs, last)):
+            return cache["result"]
+        result = combiner(*inputs)
+        cache["inputs"] = inputs
+        cache["result"] = result
+        return result
+
+    def clear_cache() -> None:
+        cache["inputs"] = None
+        cache["result"] = None
+
+    selector.clear_cache = clear_cache
+    return selector
+
+
+def _enhanced_rpgw(state: Dict[str, Any]) -> Dict[str, Any]:
+    return state.get('enhanced_rpgw', {})
+
+
+def _rpgw_seats(state: Dict[str, Any], *_: Any) -> List[Dict[str, Any]]:
+    return state.get('enhanced_rpgw', {}).get('seats', [])
+
+
 def current_street(state: Dict[str, Any]) -> str:
     """Get current street from state."""
     enhanced_rpgw = state.get('enhanced_rpgw', {})
@@ -31,14 +68,33 @@ def pot_amount(state: Dict[str, Any]) -> int:
     return enhanced_rpgw.get('pot_amount', 0)
 
 
+_EMPTY_SEAT_VIEW = {
+    'name': 'Unknown',
+    'stack': 0,
+    'bet': 0,
+    'folded': False,
+    'acting': False,
+    'cards': []
+}
+
+# uid -> (seats list the view was derived from, view), least recently used first
+_seat_view_cache: "OrderedDict[str, tuple]" = OrderedDict()
+# A few full tables' worth of seats; older uids (past hands/tables) are evicted
+MAX_SEAT_VIEWS = 64
+
+
 def seat_view(state: Dict[str, Any], uid: str) -> Dict[str, Any]:
-    """Get seat view data for a specific player."""
-    enhanced_rpgw = state.get('enhanced_rpgw', {})
-    seats = enhanced_rpgw.get('seats', [])
-    
+    """Get seat view data for a specific player (memoized per uid)."""
+    seats = _rpgw_seats(state)
+    cached = _seat_view_cache.get(uid)
+    if cached is not None and cached[0] is seats:
+        _seat_view_cache.move_to_end(uid)
+        return cached[1]
+
+    view = _EMPTY_SEAT_VIEW
     for seat in seats:
         if seat.get('player_uid') == uid:
-            return {
+            view = {
                 'name': seat.get('name', 'Unknown'),
                 'stack': seat.get('current_stack', 0),
                 'bet': seat.get('current_bet', 0),
@@ -46,15 +102,16 @@ def seat_view(state: Dict[str, Any], uid: str) -> Dict[str, Any]:
                 'acting': seat.get('acting', False),
                 'cards': seat.get('cards', [])
             }
-    
-    return {
-        'name': 'Unknown',
-        'stack': 0,
-        'bet': 0,
-        'folded': False,
-        'acting': False,
-        'cards': []
-    }
+            break
+
+    # Reuse the previous view when the seat itself did not change
+    if cached is not None and cached[1] == view:
+        view = cached[1]
+    _seat_view_cache[uid] = (seats, view)
+    _seat_view_cache.move_to_end(uid)
+    while len(_seat_view_cache) > MAX_SEAT_VIEWS:
+        _seat_view_cache.popitem(last=False)
+    return view
 
 
 def board_cards(state: Dict[str, Any]) -> List[str]:
@@ -74,9 +131,7 @@ def review_progress(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def enhanced_rpgw_state(state: Dict[str, Any]) -> Dict[str, Any]:
-    """Get complete Enhanced RPGW state for rendering."""
-    enhanced_rpgw = state.get('enhanced_rpgw', {})
+def _build_enhanced_rpgw_state(enhanced_rpgw: Dict[str, Any]) -> Dict[str, Any]:
     return {
         'table': enhanced_rpgw.get('table', {}),
         'pot': enhanced_rpgw.get('pot', {}),
@@ -88,6 +143,12 @@ def enhanced_rpgw_state(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Get complete Enhanced RPGW state for rendering.
+enhanced_rpgw_state = create_selector(
+    _enhanced_rpgw, combiner=_build_enhanced_rpgw_state
+)
+
+
 def can_execute_action(state: Dict[str, Any]) -> bool:
     """Check if an action can be executed."""
     enhanced_rpgw = state.get('enhanced_rpgw', {})
@@ -125,15 +186,27 @@ def get_num_seats(state: Dict[str, Any]) -> int:
     return len(seats) if seats else 6  # Default to 6 seats
 
 
+_seat_positions_cache: Dict[tuple, List[tuple]] = {}
+
+
 def get_seat_positions(
     state: Dict[str, Any], 
     seat_count: Optional[int] = None,
     canvas_width: Optional[int] = None,
     canvas_height: Optional[int] = None
 ) -> List[tuple]:
-    """Get seat positions for rendering. Returns list of (x, y) coordinates."""
+    """Get seat positions for rendering. Returns list of (x, y) coordinates.
+
+    Positions depend only on seat count and canvas size, so the same list
+    object is returned for repeated calls. Callers must not mutate it.
+    """
     if seat_count is None:
         seat_count = get_num_seats(state)
+
+    key = (seat_count, canvas_width or None, canvas_height or None)
+    positions = _seat_positions_cache.get(key)
+    if positions is not None:
+        return positions
     
     # Use actual canvas dimensions if provided, otherwise use reasonable defaults
     if canvas_width and canvas_height:
@@ -160,7 +233,11 @@ def get_seat_positions(
         
         # Debug: Log the positioning calculation
         print(f"🎯 Seat {i} positioning: angle={theta:.2f}° -> ({x}, {y})")
-    
+
+    # Canvas sizes change rarely; keep the cache from growing on resize drags
+    if len(_seat_positions_cache) > 64:
+        _seat_positions_cache.clear()
+    _seat_positions_cache[key] = positions
     return positions
 
 
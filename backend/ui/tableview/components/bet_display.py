@@ -1,5 +1,6 @@
 from ...state.selectors import get_seat_positions, get_num_seats
 from ...services.theme_manager import ThemeManager
+from .item_pool import ItemPool
 
 try:
     from .chip_graphics import ChipGraphics, BetDisplay as ChipBetDisplay
@@ -46,14 +47,25 @@ class BetDisplay:
         self._bet_elements = {}  # Store bet display elements per seat
         self._chip_graphics = None  # Will be initialized when canvas is available
         self._chip_bet_display = None
+        # Canvas items reused across renders, keyed by (seat, role)
+        self.pool = ItemPool("bets")
     
     def render(self, state, canvas_manager, layer_manager) -> None:
-        THEME, FONTS = _tokens(canvas_manager.canvas)
         c = canvas_manager.canvas
         w, h = canvas_manager.size()
         if w <= 1 or h <= 1:
             return
         
+        self.pool.begin(c)
+        try:
+            self._render_bets(state, c, w, h)
+        finally:
+            # Stacks and bets not drawn this frame are hidden
+            self.pool.end()
+    
+    def _render_bets(self, state, c, w: int, h: int) -> None:
+        pool = self.pool
+        
         # Initialize chip graphics if needed
         if self._chip_graphics is None:
             self._chip_graphics = ChipGraphics(c)
@@ -69,17 +81,9 @@ class BetDisplay:
         positions = get_seat_positions(state, seat_count=count, 
                                      canvas_width=w, canvas_height=h)
         
-        # Clear old bet displays that are no longer needed
-        current_seats = set(range(len(seats_data)))
-        old_seats = set(self._bet_elements.keys()) - current_seats
-        for old_seat in old_seats:
-            if old_seat in self._bet_elements:
-                for element_id in self._bet_elements[old_seat].values():
-                    try:
-                        c.delete(element_id)
-                    except Exception:
-                        pass
-                del self._bet_elements[old_seat]
+        # Forget seats that left the table (their pooled items are hidden)
+        for old_seat in set(self._bet_elements) - set(range(len(seats_data))):
+            del self._bet_elements[old_seat]
         
         for idx, (x, y) in enumerate(positions):
             if idx >= len(seats_data):
@@ -97,11 +101,11 @@ class BetDisplay:
                 self._bet_elements[idx] = {}
             
             # Always show stack size, even when no bet
-            self._add_stack_display(c, x, y, seat, idx)
+            self._add_stack_display(pool.scope(idx, "stack"), x, y, seat, idx)
             
             # Show current bet if any
             if current_bet > 0:
-                self._add_bet_display(c, x, y, current_bet, idx)
+                self._add_bet_display(pool.scope(idx, "bet_badge"), x, y, current_bet, idx)
             
             if current_bet > 0:
                 # Position bet display prominently in front of the player
@@ -123,15 +127,6 @@ class BetDisplay:
                 print(f"🎯 Bet positioning for seat {idx}: seat({x},{y}) -> bet({bet_x},{bet_y})")
                 print(f"   Angle: {math.degrees(seat_angle):.1f}°, offset: ({offset_x}, {offset_y})")
                 
-                # Clear old bet elements for this seat
-                if idx in self._bet_elements:
-                    for element_id in self._bet_elements[idx].values():
-                        try:
-                            c.delete(element_id)
-                        except Exception:
-                            pass
-                    self._bet_elements[idx] = {}
-                
                 # Determine bet type for styling
                 is_acting = seat.get('acting', False)
                 last_action = seat.get('last_action', '')
@@ -151,7 +146,7 @@ class BetDisplay:
                     
                     # Place bet chips in front of player (NOT flying to pot)
                     chip_elements = chip_anim.place_bet_chips(
-                        c, bet_x, bet_y, current_bet, 
+                        pool.scope(idx, "bet_chips"), bet_x, bet_y, current_bet, 
                         self._get_theme_tokens(c),
                         tags=("layer:bets", f"bet:{idx}")
                     )
@@ -166,16 +161,11 @@ class BetDisplay:
                 except Exception as e:
                     print(f"⚠️ Could not create chip-based bet display: {e}")
                     # Fallback to simple text display
-                    self._create_fallback_bet_display(c, bet_x, bet_y, current_bet, last_action, idx)
+                    self._create_fallback_bet_display(pool.scope(idx, "bet_fallback"), bet_x, bet_y,
+                                                      current_bet, last_action, idx)
             else:
-                # No bet - hide bet display
-                if idx in self._bet_elements:
-                    for element_id in self._bet_elements[idx].values():
-                        try:
-                            c.delete(element_id)
-                        except Exception:
-                            pass
-                    self._bet_elements[idx] = {}
+                # No bet - its pooled items are hidden when the frame ends
+                self._bet_elements[idx] = {}
     
     def _add_stack_display(self, canvas, x, y, seat, idx):
         """Add stack size display for the player"""
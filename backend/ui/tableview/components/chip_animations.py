@@ -4,11 +4,13 @@ Token-driven animations with smooth easing and particle effects
 """
 
 import math
-from ...services.theme_utils import ease_in_out_cubic
+from ...services.animation_engine import get_animation_engine
 
 class ChipAnimations:
-    def __init__(self, theme_manager):
+    def __init__(self, theme_manager, engine=None):
         self.theme = theme_manager
+        # All motion runs on the shared single-ticker engine
+        self.engine = engine or get_animation_engine()
         self.active_animations = {}
         
     def draw_chip(self, canvas, x, y, denom_key, text="", r=14, tags=None):
@@ -77,143 +79,97 @@ class ChipAnimations:
         """Animate chips flying from player bet area to pot - ONLY at end of street"""
         animation_id = f"bet_to_pot_{from_x}_{from_y}"
         tokens = self.theme.get_all_tokens()
+        glow_color = tokens.get("bet.glow", "#FFD700")
+        self.engine.cancel_group(animation_id)
         
         # Create temporary chips for animation with proper denominations
         chip_plan = self._break_down_amount(amount)
-        chip_ids = []
+        chip_size = 12  # Standard chip size for animations
+        flights = []
         
         for i, denom in enumerate(chip_plan):
             # Slight spread for natural look
             start_x = from_x + (i - len(chip_plan)//2) * 8
             start_y = from_y + (i - len(chip_plan)//2) * 4
             
-            # Create chip with proper denomination and label
-            chip_size = 12  # Standard chip size for animations
-            chip_id = self._create_chip_with_label(canvas, start_x, start_y, denom, 
-                                                 tokens, chip_size, tags=["flying_chip", "temp_animation"])
-            chip_ids.append((chip_id, start_x, start_y, denom))
-        
-        # Animation parameters - slower for visibility
-        frames = 30  # Increased from 20 for better visibility
-        
-        def animate_step(frame):
-            if frame >= frames:
-                # Animation complete
-                self._cleanup_flying_chips(canvas, chip_ids)
-                if animation_id in self.active_animations:
-                    del self.active_animations[animation_id]
-                if callback:
-                    callback()
-                return
-            
-            # Calculate progress with easing
-            progress = frame / frames
-            eased_progress = ease_in_out_cubic(progress)
-            
-            # Update each chip position
-            for i, (chip_id, start_x, start_y, denom) in enumerate(chip_ids):
-                # Calculate current position with slight arc
-                current_x = start_x + (to_x - start_x) * eased_progress
-                current_y = start_y + (to_y - start_y) * eased_progress
-                
-                # Add arc effect (parabolic path)
-                arc_height = 30 * math.sin(progress * math.pi)
-                current_y -= arc_height
-                
-                # Add slight randomness for natural movement
-                wobble_x = math.sin(frame * 0.3 + i) * 3
-                wobble_y = math.cos(frame * 0.2 + i) * 2
-                
-                # Update chip position
-                try:
-                    canvas.coords(chip_id, 
-                                current_x + wobble_x - 14, current_y + wobble_y - 14,
-                                current_x + wobble_x + 14, current_y + wobble_y + 14)
-                except:
-                    pass  # Chip may have been deleted
-            
-            # Add motion blur/glow effect
-            if frame % 2 == 0:  # Every 2nd frame for more glow
-                glow_color = tokens.get("bet.glow", "#FFD700")
-                for _, (chip_id, _, _, _) in enumerate(chip_ids):
-                    try:
-                        bbox = canvas.bbox(chip_id)
-                        if bbox:
-                            x1, y1, x2, y2 = bbox
-                            canvas.create_oval(
-                                x1 - 4, y1 - 4, x2 + 4, y2 + 4,
-                                outline=glow_color, width=2,
-                                tags=("motion_glow", "temp_animation")
-                            )
-                    except:
-                        pass
-            
-            # Schedule next frame - slower for visibility
-            canvas.after(80, lambda: animate_step(frame + 1))  # Increased from 40ms
+            # Chip, label and motion glow share a tag so they move together
+            chip_tag = f"{animation_id}_chip_{i}"
+            self._create_chip_with_label(canvas, start_x, start_y, denom, tokens, chip_size,
+                                         tags=("flying_chip", "temp_animation", chip_tag))
+            canvas.create_oval(
+                start_x - chip_size - 4, start_y - chip_size - 4,
+                start_x + chip_size + 4, start_y + chip_size + 4,
+                outline=glow_color, width=2,
+                tags=("motion_glow", "temp_animation", chip_tag)
+            )
+            flights.append((chip_tag, start_x, start_y))
+        
+        def on_all_landed():
+            self._cleanup_flying_chips(canvas, [tag for tag, _, _ in flights])
+            self.active_animations.pop(animation_id, None)
+            if callback:
+                callback()
         
-        self.active_animations[animation_id] = animate_step
-        animate_step(0)
+        self.active_animations[animation_id] = [tag for tag, _, _ in flights]
+        self._run_flights(canvas, flights, (to_x, to_y), 2400, 30,
+                          animation_id, on_all_landed)
     
     def fly_pot_to_winner(self, canvas, pot_x, pot_y, winner_x, winner_y, amount, callback=None):
         """Animate pot chips flying to winner with celebration effect"""
         animation_id = f"pot_to_winner_{winner_x}_{winner_y}"
         tokens = self.theme.get_all_tokens()
+        self.engine.cancel_group(animation_id)
         
         # Create explosion of chips from pot
-        explosion_positions = []
         num_stacks = 6
+        flights = []
         
         for i in range(num_stacks):
             angle = (i / num_stacks) * 2 * math.pi
             radius = 30
             exp_x = pot_x + radius * math.cos(angle)
             exp_y = pot_y + radius * math.sin(angle)
-            explosion_positions.append((exp_x, exp_y))
-        
-        # Create chip stacks for animation
-        all_chip_ids = []
-        for exp_x, exp_y in explosion_positions:
-            stack_chips = self.draw_chip_stack(canvas, exp_x, exp_y, amount // num_stacks,
-                                             tags=["flying_chip", "temp_animation"])
-            all_chip_ids.extend([(chip_id, exp_x, exp_y) for chip_id in stack_chips])
-        
-        frames = 30
-        
-        def animate_step(frame):
-            if frame >= frames:
-                # Show winner celebration
-                self._show_winner_celebration(canvas, winner_x, winner_y, tokens)
-                self._cleanup_flying_chips(canvas, all_chip_ids)
-                if animation_id in self.active_animations:
-                    del self.active_animations[animation_id]
-                if callback:
-                    callback()
-                return
             
-            progress = frame / frames
-            eased_progress = ease_in_out_cubic(progress)
-            
-            # Move all chips toward winner
-            for chip_id, start_x, start_y in all_chip_ids:
-                # Calculate trajectory with arc
-                current_x = start_x + (winner_x - start_x) * eased_progress
-                current_y = start_y + (winner_y - start_y) * eased_progress
-                
-                # Higher arc for dramatic effect
-                arc_height = 40 * math.sin(progress * math.pi)
-                current_y -= arc_height
-                
-                try:
-                    canvas.coords(chip_id,
-                                current_x - 14, current_y - 14,
-                                current_x + 14, current_y + 14)
-                except:
-                    pass
-            
-            canvas.after(35, lambda: animate_step(frame + 1))
-        
-        self.active_animations[animation_id] = animate_step
-        animate_step(0)
+            # Each stack moves as one tagged group
+            stack_tag = f"{animation_id}_stack_{i}"
+            if self.draw_chip_stack(canvas, exp_x, exp_y, amount // num_stacks,
+                                    tags=["flying_chip", "temp_animation", stack_tag]):
+                flights.append((stack_tag, exp_x, exp_y))
+        
+        def on_all_landed():
+            # Show winner celebration
+            self._show_winner_celebration(canvas, winner_x, winner_y, tokens)
+            self._cleanup_flying_chips(canvas, [tag for tag, _, _ in flights])
+            self.active_animations.pop(animation_id, None)
+            if callback:
+                callback()
+        
+        self.active_animations[animation_id] = [tag for tag, _, _ in flights]
+        # Higher arc for dramatic effect
+        self._run_flights(canvas, flights, (winner_x, winner_y), 1050, 40,
+                          animation_id, on_all_landed)
+    
+    def _run_flights(self, canvas, flights, target, duration_ms, arc_height,
+                     group, on_all_landed):
+        """Tween every (tag, x, y) to target; call on_all_landed once at the end"""
+        if not flights:
+            on_all_landed()
+            return
+        
+        remaining = [len(flights)]
+        
+        def on_landed():
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                on_all_landed()
+        
+        for tag, start_x, start_y in flights:
+            self.engine.add_tween(
+                canvas, tag, (start_x, start_y), target, duration_ms,
+                easing="ease_in_out_cubic", arc_height=arc_height,
+                group=group, on_complete=on_landed,
+                on_cancel=lambda tag=tag: canvas.delete(tag),
+            )
     
     def place_bet_chips(self, canvas, x, y, amount, tokens, tags=()):
         """Place bet chips in front of player (NOT flying to pot) - for betting rounds"""
@@ -362,37 +318,30 @@ class ChipAnimations:
         )
         
         # Auto-cleanup after 2 seconds
-        canvas.after(2000, lambda: canvas.delete("celebration_particle", "winner_flash"))
+        def clear_celebration():
+            canvas.delete("celebration_particle", "winner_flash")
+
+        self.engine.add_delay(
+            2000, clear_celebration, group="winner_celebration", canvas=canvas,
+            on_cancel=clear_celebration,
+        )
     
     def _animate_particle(self, canvas, particle_id, start_x, start_y, end_x, end_y):
         """Animate a single celebration particle"""
-        frames = 15
-        
-        def particle_step(frame):
-            if frame >= frames:
-                try:
-                    canvas.delete(particle_id)
-                except:
-                    pass
-                return
-            
-            progress = frame / frames
-            current_x = start_x + (end_x - start_x) * progress
-            current_y = start_y + (end_y - start_y) * progress
-            
+        def remove_particle():
             try:
-                canvas.coords(particle_id,
-                            current_x - 3, current_y - 3,
-                            current_x + 3, current_y + 3)
-            except:
+                canvas.delete(particle_id)
+            except Exception:
                 pass
-            
-            canvas.after(30, lambda: particle_step(frame + 1))
         
-        particle_step(0)
+        self.engine.add_tween(
+            canvas, particle_id, (start_x, start_y), (end_x, end_y), 450,
+            easing="linear", group="winner_celebration",
+            on_complete=remove_particle, on_cancel=remove_particle,
+        )
     
     def _cleanup_flying_chips(self, canvas, chip_ids):
-        """Clean up temporary animation chips"""
+        """Clean up temporary animation chips (ids or group tags)"""
         for chip_data in chip_ids:
             if isinstance(chip_data, tuple):
                 chip_id = chip_data[0]
@@ -409,26 +358,33 @@ class ChipAnimations:
     def pulse_pot(self, canvas, pot_x, pot_y, tokens):
         """Subtle pot pulse when amount increases"""
         glow_color = tokens.get("glow.medium", "#FFD700")
+        self.engine.cancel_group("pot_pulse")
+        canvas.delete("pot_pulse")
         
-        def pulse_step(radius, intensity):
-            if intensity <= 0:
-                canvas.delete("pot_pulse")
-                return
-            
-            # Create expanding ring
-            canvas.create_oval(
-                pot_x - radius, pot_y - radius,
-                pot_x + radius, pot_y + radius,
-                outline=glow_color, width=2,
-                tags=("pot_pulse", "temp_animation")
-            )
-            
-            canvas.after(60, lambda: pulse_step(radius + 8, intensity - 1))
+        # One expanding ring instead of a new oval per step
+        ring = canvas.create_oval(
+            pot_x - 20, pot_y - 20, pot_x + 20, pot_y + 20,
+            outline=glow_color, width=2,
+            tags=("pot_pulse", "temp_animation")
+        )
         
-        pulse_step(20, 5)
+        def grow(t):
+            radius = 20 + 32 * t
+            canvas.coords(ring, pot_x - radius, pot_y - radius,
+                          pot_x + radius, pot_y + radius)
+        
+        self.engine.add_callback(
+            grow, 300, easing="ease_out_cubic", group="pot_pulse",
+            on_complete=lambda: canvas.delete("pot_pulse"), canvas=canvas,
+            on_cancel=lambda: canvas.delete("pot_pulse"),
+        )
     
     def stop_all_animations(self):
         """Stop all active chip animations"""
+        for animation_id in list(self.active_animations):
+            self.engine.cancel_group(animation_id)
+        self.engine.cancel_group("winner_celebration")
+        self.engine.cancel_group("pot_pulse")
         self.active_animations.clear()
     
     def cleanup_temp_elements(self, canvas):
@@ -3,6 +3,7 @@ from ...state.selectors import (
     get_dealer_position,
 )
 from ...services.theme_manager import ThemeManager
+from .item_pool import ItemPool
 
 
 def _tokens(canvas):
@@ -28,6 +29,7 @@ class DealerButton:
     def __init__(self):
         self._button_id = None
         self._text_id = None
+        self.pool = ItemPool("dealer")
     
     def render(self, state, canvas_manager, layer_manager) -> None:
         THEME, FONTS = _tokens(canvas_manager.canvas)
@@ -76,51 +78,27 @@ class DealerButton:
         # Make dealer button more prominent
         button_radius = int(min(w, h) * 0.025)  # Larger button
         
-        # Dealer button background with border
-        if not self._button_id:
-            self._button_id = c.create_oval(
-                button_x - button_radius,
-                button_y - button_radius,
-                button_x + button_radius,
-                button_y + button_radius,
+        # Pooled so the button survives the pipeline's per-frame clear
+        self.pool.begin(c)
+        try:
+            # Dealer button background with border
+            self._button_id = self.pool.item(
+                "button", "oval",
+                (button_x - button_radius, button_y - button_radius,
+                 button_x + button_radius, button_y + button_radius),
+                tags=("layer:seats", "dealer_button"),
                 fill=THEME.get("dealer.buttonBg", "#FDE68A"),
                 outline=THEME.get("dealer.buttonBorder", "#D97706"),
                 width=2,
-                tags=("layer:seats", "dealer_button"),
-            )
-        else:
-            c.coords(
-                self._button_id,
-                button_x - button_radius,
-                button_y - button_radius,
-                button_x + button_radius,
-                button_y + button_radius
-            )
-            c.itemconfig(
-                self._button_id,
-                fill=THEME.get("dealer.buttonBg", "#FDE68A"),
-                outline=THEME.get("dealer.buttonBorder", "#D97706")
             )
-        
-        # Dealer button text
-        if not self._text_id:
-            self._text_id = c.create_text(
-                button_x,
-                button_y,
+            
+            # Dealer button text
+            self._text_id = self.pool.item(
+                "label", "text", (button_x, button_y),
+                tags=("layer:seats", "dealer_button_label"),
                 text="D",
                 font=FONTS.get("font.body", ("Arial", 14, "bold")),
                 fill=THEME.get("dealer.buttonFg", "#0B1220"),
-                tags=("layer:seats", "dealer_button_label"),
-            )
-        else:
-            c.coords(self._text_id, button_x, button_y)
-            c.itemconfig(
-                self._text_id,
-                fill=THEME.get("dealer.buttonFg", "#0B1220")
             )
-        
-        # Ensure proper layering
-        c.addtag_withtag("layer:seats", self._button_id or "")
-        c.addtag_withtag("layer:seats", self._text_id or "")
-
-
+        finally:
+            self.pool.end()
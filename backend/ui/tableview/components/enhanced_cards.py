@@ -5,9 +5,21 @@ Professional card rendering using the complete theme token system
 
 import math
 
+from .sprite_cache import (
+    get_sprite_cache, get_card_face_sprite, get_card_back_sprite
+)
+from ...services.animation_engine import get_animation_engine
+
 class EnhancedCards:
     def __init__(self, theme_manager):
         self.theme = theme_manager
+
+    def _sync_sprite_theme(self):
+        """Drop cached card sprites when the active theme changes."""
+        try:
+            get_sprite_cache().set_theme(self.theme.current())
+        except Exception:
+            pass
         
     # Suit symbols
     SUIT_SYMBOLS = {
@@ -33,19 +45,27 @@ class EnhancedCards:
         if tags:
             card_tags.extend(tags)
         
-        # Main card rectangle with rounded corners effect
-        canvas.create_rectangle(
-            x, y, x + w, y + h,
-            fill=bg, outline=border, width=2,
-            tags=tuple(card_tags)
-        )
-        
-        # Inner border for depth
-        canvas.create_rectangle(
-            x + 2, y + 2, x + w - 2, y + h - 2,
-            fill="", outline=border, width=1,
-            tags=tuple(card_tags)
-        )
+        self._sync_sprite_theme()
+        sprite = get_card_face_sprite(canvas, int(w), int(h), bg, border)
+        if sprite is not None:
+            # Card body pre-rendered once per (size, colors)
+            canvas.create_image(
+                x, y, image=sprite, anchor="nw", tags=tuple(card_tags)
+            )
+        else:
+            # Main card rectangle with rounded corners effect
+            canvas.create_rectangle(
+                x, y, x + w, y + h,
+                fill=bg, outline=border, width=2,
+                tags=tuple(card_tags)
+            )
+            
+            # Inner border for depth
+            canvas.create_rectangle(
+                x + 2, y + 2, x + w - 2, y + h - 2,
+                fill="", outline=border, width=1,
+                tags=tuple(card_tags)
+            )
         
         # Calculate font sizes based on card size
         rank_font_size = max(10, w // 5)
@@ -101,6 +121,15 @@ class EnhancedCards:
         if tags:
             card_tags.extend(tags)
         
+        self._sync_sprite_theme()
+        sprite = get_card_back_sprite(canvas, int(w), int(h), bg, border, pattern)
+        if sprite is not None:
+            # Whole card back pre-rendered once per (size, colors)
+            canvas.create_image(
+                x, y, image=sprite, anchor="nw", tags=tuple(card_tags)
+            )
+            return card_tags
+        
         # Main card rectangle
         canvas.create_rectangle(
             x, y, x + w, y + h,
@@ -196,12 +225,16 @@ class EnhancedCards:
     def animate_card_flip(self, canvas, x, y, w, h, from_card, to_card, callback=None):
         """Animate card flip with token-aware colors"""
         flip_steps = 10
+        engine = get_animation_engine()
+        engine.cancel_group("card_flip")
+        drawn_step = [-1]
         
-        def flip_step(step):
-            if step >= flip_steps:
-                if callback:
-                    callback()
+        def flip_step(t):
+            # Redraw only when the 10-step flip advances a step
+            step = min(flip_steps - 1, int(t * flip_steps))
+            if step == drawn_step[0]:
                 return
+            drawn_step[0] = step
             
             # Calculate flip progress (0 to 1)
             progress = step / flip_steps
@@ -213,33 +246,27 @@ class EnhancedCards:
                 # First half: shrink to nothing (show original card)
                 scale = 1 - (progress * 2)
                 scaled_w = int(w * scale)
-                
-                if scaled_w > 0:
-                    if from_card and from_card != "XX":
-                        rank, suit = from_card[:-1], from_card[-1]
-                        self.draw_card_face(canvas, x + (w - scaled_w)//2, y, 
-                                          rank, suit, scaled_w, h, ["card_flip"])
-                    else:
-                        self.draw_card_back(canvas, x + (w - scaled_w)//2, y, 
-                                          scaled_w, h, ["card_flip"])
+                card = from_card
             else:
                 # Second half: grow from nothing (show new card)
                 scale = (progress - 0.5) * 2
                 scaled_w = int(w * scale)
-                
-                if scaled_w > 0:
-                    if to_card and to_card != "XX":
-                        rank, suit = to_card[:-1], to_card[-1]
-                        self.draw_card_face(canvas, x + (w - scaled_w)//2, y,
-                                          rank, suit, scaled_w, h, ["card_flip"])
-                    else:
-                        self.draw_card_back(canvas, x + (w - scaled_w)//2, y,
-                                          scaled_w, h, ["card_flip"])
+                card = to_card
             
-            # Schedule next step
-            canvas.after(40, lambda: flip_step(step + 1))
+            if scaled_w > 0:
+                if card and card != "XX":
+                    rank, suit = card[:-1], card[-1]
+                    self.draw_card_face(canvas, x + (w - scaled_w)//2, y,
+                                      rank, suit, scaled_w, h, ["card_flip"])
+                else:
+                    self.draw_card_back(canvas, x + (w - scaled_w)//2, y,
+                                      scaled_w, h, ["card_flip"])
         
-        flip_step(0)
+        # 10 steps at 40 ms, ticked by the shared animation engine
+        engine.add_callback(
+            flip_step, flip_steps * 40, group="card_flip",
+            on_complete=callback, canvas=canvas,
+        )
     
     def add_card_glow(self, canvas, x, y, w, h, glow_type="soft"):
         """Add subtle glow effect around card"""
@@ -257,5 +284,6 @@ class EnhancedCards:
     
     def clear_card_effects(self, canvas):
         """Clear all card animation and effect elements"""
+        get_animation_engine().cancel_group("card_flip")
         canvas.delete("card_flip")
         canvas.delete("card_glow")
@@ -0,0 +1,215 @@
+"""
+Canvas item pooling for table painters.
+
+Painters that redraw the same shapes every frame (seats, bets, pot) keep
+their canvas items in an ItemPool keyed by (seat, role) instead of creating
+fresh ones. A reused item only gets ``coords``/``itemconfig`` calls for what
+actually changed, and items not drawn in a frame are hidden rather than
+deleted, so item ids and counts stay flat over a long session.
+
+Usage inside a component's ``render``::
+
+    self.pool.begin(canvas)
+    try:
+        draw_seat(self.pool.scope(idx, "seat"), ...)   # plain create_* calls
+    finally:
+        self.pool.end()
+
+RendererPipeline clears everything except items tagged POOL_TAG each frame.
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+POOL_TAG = "pooled"
+# Tag expression matching every item that is not pooled
+UNPOOLED = f"!{POOL_TAG}"
+
+
+def _flatten(args: Iterable[Any]) -> Tuple[float, ...]:
+    flat: List[float] = []
+    for a in args:
+        if isinstance(a, (list, tuple)):
+            flat.extend(_flatten(a))
+        else:
+            flat.append(a)
+    return tuple(flat)
+
+
+def _normalize_tags(tags: Any) -> Tuple[str, ...]:
+    if not tags:
+        return ()
+    if isinstance(tags, str):
+        return tuple(tags.split())
+    return tuple(str(t) for t in tags)
+
+
+class _Slot:
+    __slots__ = ("id", "kind", "coords", "options", "tags", "hidden")
+
+    def __init__(self, item_id, kind, coords, options, tags):
+        self.id = item_id
+        self.kind = kind
+        self.coords = coords
+        self.options = options
+        self.tags = tags
+        self.hidden = False
+
+
+class ItemPool:
+    """Reusable canvas items for one component, keyed by (seat, role)."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.tag = f"pool:{name}"
+        self._slots: Dict[Hashable, _Slot] = {}
+        self._used: set = set()
+        self._canvas = None
+
+        # Counters
+        self.created = 0
+        self.reused = 0
+        self.hidden = 0
+
+    # Frame lifecycle
+    def begin(self, canvas) -> None:
+        """Start a frame; forget items deleted behind the pool's back."""
+        if canvas is not self._canvas:
+            self._slots.clear()
+            self._canvas = canvas
+        elif self._slots:
+            try:
+                alive = set(canvas.find_withtag(self.tag))
+            except Exception:
+                alive = set()
+            if len(alive) != len(self._slots):
+                self._slots = {k: s for k, s in self._slots.items() if s.id in alive}
+        self._used = set()
+
+    def end(self) -> int:
+        """Hide every pooled item not drawn this frame; returns how many."""
+        canvas = self._canvas
+        count = 0
+        for key, slot in self._slots.items():
+            if key in self._used or slot.hidden:
+                continue
+            try:
+                canvas.itemconfig(slot.id, state="hidden")
+            except Exception:
+                continue
+            slot.hidden = True
+            count += 1
+        self.hidden += count
+        return count
+
+    # Drawing
+    def item(self, key: Hashable, kind: str, coords: Iterable[Any],
+             tags: Any = (), **options) -> int:
+        """Draw item ``key`` of type ``kind`` (e.g. "oval"), reusing it if pooled."""
+        canvas = self._canvas
+        coords = _flatten(coords)
+        tags = _normalize_tags(tags) + (POOL_TAG, self.tag)
+        self._used.add(key)
+
+        slot = self._slots.get(key)
+        if slot is not None and slot.kind == kind:
+            if slot.coords != coords:
+                canvas.coords(slot.id, *coords)
+                slot.coords = coords
+            changed = {k: v for k, v in options.items()
+                       if k not in slot.options or slot.options[k] != v}
+            if slot.tags != tags:
+                changed["tags"] = tags
+                slot.tags = tags
+            if slot.hidden:
+                changed["state"] = "normal"
+                slot.hidden = False
+            if changed:
+                canvas.itemconfig(slot.id, **changed)
+                slot.options.update(options)
+            self.reused += 1
+            return slot.id
+
+        if slot is not None:  # same key, different item type
+            try:
+                canvas.delete(slot.id)
+            except Exception:
+                pass
+        item_id = getattr(canvas, f"create_{kind}")(*coords, tags=tags, **options)
+        self._slots[key] = _Slot(item_id, kind, coords, dict(options), tags)
+        self.created += 1
+        return item_id
+
+    def scope(self, *key: Hashable) -> "PooledCanvas":
+        """Canvas facade whose create_* calls draw pooled items under ``key``."""
+        return PooledCanvas(self, key)
+
+    def clear(self) -> None:
+        """Delete every pooled item (e.g. when the table is torn down)."""
+        if self._canvas is not None:
+            try:
+                self._canvas.delete(self.tag)
+            except Exception:
+                pass
+        self._slots.clear()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "items": len(self._slots),
+            "visible": sum(1 for s in self._slots.values() if not s.hidden),
+            "created": self.created,
+            "reused": self.reused,
+            "hidden": self.hidden,
+        }
+
+
+class PooledCanvas:
+    """
+    Stand-in canvas for existing painters: the n-th create_* call under a
+    scope maps to pooled item (key, n). Everything else goes to the real
+    canvas, available as ``real_canvas``.
+    """
+
+    def __init__(self, pool: ItemPool, key: Tuple[Hashable, ...]):
+        self._pool = pool
+        self._key = key
+        self._n = 0
+        self.real_canvas = pool._canvas
+
+    def _create(self, kind: str, args: tuple, kw: Dict[str, Any]) -> int:
+        tags = kw.pop("tags", ())
+        n = self._n
+        self._n += 1
+        return self._pool.item(self._key + (n,), kind, args, tags, **kw)
+
+    def create_arc(self, *args, **kw) -> int:
+        return self._create("arc", args, kw)
+
+    def create_image(self, *args, **kw) -> int:
+        return self._create("image", args, kw)
+
+    def create_line(self, *args, **kw) -> int:
+        return self._create("line", args, kw)
+
+    def create_oval(self, *args, **kw) -> int:
+        return self._create("oval", args, kw)
+
+    def create_polygon(self, *args, **kw) -> int:
+        return self._create("polygon", args, kw)
+
+    def create_rectangle(self, *args, **kw) -> int:
+        return self._create("rectangle", args, kw)
+
+    def create_text(self, *args, **kw) -> int:
+        return self._create("text", args, kw)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.real_canvas, name)
+
+
+def real_canvas(canvas) -> Any:
+    """The underlying canvas of a PooledCanvas (or ``canvas`` itself)."""
+    return getattr(canvas, "real_canvas", canvas)
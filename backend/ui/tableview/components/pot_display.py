@@ -1,5 +1,6 @@
 from ...services.theme_manager import ThemeManager
 from .chip_graphics import ChipGraphics
+from .item_pool import ItemPool
 
 try:
     from .premium_chips import draw_pot_chip, pulse_pot_glow
@@ -42,6 +43,8 @@ class PotDisplay:
         self._pot_label_id = None
         self._chip_graphics = None
         self._pot_chips = []  # Track pot chip elements
+        # Badge and chips are reused across renders
+        self.pool = ItemPool("pot")
 
     def render(self, state, canvas_manager, layer_manager) -> None:
         THEME, FONTS = _tokens(canvas_manager.canvas)
@@ -74,76 +77,45 @@ class PotDisplay:
         font = FONTS.get("font.display", ("Arial", 24, "bold"))
         label_font = FONTS.get("font.body", ("Arial", 12, "normal"))
 
-        # Pot background (rounded rectangle)
-        bg_width, bg_height = 120, 50
-        if not self._pot_bg_id:
-            self._pot_bg_id = c.create_rectangle(
-                center_x - bg_width//2,
-                center_y - bg_height//2,
-                center_x + bg_width//2,
-                center_y + bg_height//2,
+        pool = self.pool
+        pool.begin(c)
+        try:
+            # Pot background (rounded rectangle)
+            bg_width, bg_height = 120, 50
+            self._pot_bg_id = pool.item(
+                "pot_bg", "rectangle",
+                (center_x - bg_width//2, center_y - bg_height//2,
+                 center_x + bg_width//2, center_y + bg_height//2),
+                tags=("layer:pot", "pot_bg"),
                 fill=bg_fill,
                 outline=border_color,
                 width=2,
-                tags=("layer:pot", "pot_bg"),
-            )
-        else:
-            # Update background position and colors
-            c.coords(
-                self._pot_bg_id,
-                center_x - bg_width//2,
-                center_y - bg_height//2,
-                center_x + bg_width//2,
-                center_y + bg_height//2
             )
-            c.itemconfig(self._pot_bg_id, fill=bg_fill, outline=border_color)
 
-        # Pot label ("POT")
-        if not self._pot_label_id:
-            self._pot_label_id = c.create_text(
-                center_x,
-                center_y - 15,
+            # Pot label ("POT")
+            self._pot_label_id = pool.item(
+                "pot_label", "text", (center_x, center_y - 15),
+                tags=("layer:pot", "pot_label"),
                 text="POT",
                 font=label_font,
                 fill=THEME.get("pot.label", "#9CA3AF"),
-                tags=("layer:pot", "pot_label"),
             )
-        else:
-            c.coords(self._pot_label_id, center_x, center_y - 15)
-            c.itemconfig(self._pot_label_id, fill=THEME.get("pot.label", "#9CA3AF"))
 
-        # Pot amount
-        if not self._pot_text_id:
-            self._pot_text_id = c.create_text(
-                center_x,
-                center_y + 5,
+            # Pot amount
+            self._pot_text_id = pool.item(
+                "pot_text", "text", (center_x, center_y + 5),
+                tags=("layer:pot", "pot_text"),
                 text=text_value,
                 font=font,
                 fill=text_fill,
-                tags=("layer:pot", "pot_text"),
             )
-        else:
-            c.coords(self._pot_text_id, center_x, center_y + 5)
-            c.itemconfig(self._pot_text_id, text=text_value, fill=text_fill, font=font)
-            
-        # Clear old pot chips
-        for chip_id in self._pot_chips:
-            try:
-                c.delete(chip_id)
-            except Exception:
-                pass
-        self._pot_chips = []
-        
-        # Render premium pot chips if amount > 0
-        if amount > 0:
-            self._render_premium_pot_chips(c, center_x, center_y, amount, THEME)
-        
-        # Ensure proper layering
-        c.addtag_withtag("layer:pot", self._pot_bg_id or "")
-        c.addtag_withtag("layer:pot", self._pot_label_id or "")
-        c.addtag_withtag("layer:pot", self._pot_text_id or "")
-        for chip_id in self._pot_chips:
-            c.addtag_withtag("layer:pot", chip_id)
+
+            # Render premium pot chips if amount > 0; unused chips are hidden
+            self._pot_chips = []
+            if amount > 0:
+                self._render_premium_pot_chips(c, center_x, center_y, amount, THEME)
+        finally:
+            pool.end()
 
     def _render_premium_pot_chips(self, canvas, center_x: int, center_y: int, 
                                   amount: int, tokens: dict) -> None:
@@ -181,7 +153,7 @@ class PotDisplay:
                 # Add subtle breathing effect for large pots
                 breathing = amount > 1000
                 chip_id = draw_pot_chip(
-                    canvas, chip_x, chip_y, chip_value, tokens,
+                    self.pool.scope("pot_chip", i), chip_x, chip_y, chip_value, tokens,
                     r=chip_r, breathing=breathing,
                     tags=("layer:pot", "pot_chips", f"pot_chip_{i}")
                 )
@@ -17,6 +17,9 @@ Features:
 import math
 from typing import Tuple, List, Optional
 
+from .sprite_cache import get_chip_sprite
+from ...services.animation_engine import get_animation_engine
+
 
 # Standard casino denominations with base colors
 CHIP_DENOMINATIONS = [
@@ -57,6 +60,19 @@ def draw_chip_base(canvas, x: int, y: int, r: int, face: str, edge: str, rim: st
     Returns:
         Canvas item ID of the main chip disc
     """
+    font_size = max(8, int(r * 0.4))  # Scale text with chip size
+
+    # Fast path: disc, stripes and rim pre-rendered once as a sprite
+    sprite = get_chip_sprite(canvas, r, face, edge, rim, denom_color)
+    if sprite is not None:
+        chip_id = canvas.create_image(x, y, image=sprite, tags=tags)
+        canvas.create_text(
+            x, y, text=text, fill=text_color,
+            font=("Inter", font_size, "bold"),
+            tags=tags
+        )
+        return chip_id
+
     # Main chip disc
     chip_id = canvas.create_oval(
         x - r, y - r, x + r, y + r,
@@ -84,7 +100,6 @@ def draw_chip_base(canvas, x: int, y: int, r: int, face: str, edge: str, rim: st
     )
     
     # Denomination text
-    font_size = max(8, int(r * 0.4))  # Scale text with chip size
     canvas.create_text(
         x, y, text=text, fill=text_color,
         font=("Inter", font_size, "bold"),
@@ -283,38 +298,22 @@ def animate_chip_bet(canvas, start_pos: Tuple[int, int], end_pos: Tuple[int, int
         frames: Number of animation frames
         callback: Optional function to call when animation completes
     """
-    x0, y0 = start_pos
-    x1, y1 = end_pos
-    glow_color = tokens.get("chip.bet.glow", "#A888CC")
+    engine = get_animation_engine()
+    engine.cancel_group("flying_chip")
+    canvas.delete("flying_chip")
     
-    def animate_frame(frame: int):
-        if frame >= frames:
-            if callback:
-                callback()
-            return
-        
-        # Cubic easing for smooth motion
-        t = frame / frames
-        ease_t = t * t * (3 - 2 * t)
-        
-        # Position with arc (parabolic path)
-        x = x0 + (x1 - x0) * ease_t
-        y = y0 + (y1 - y0) * ease_t - 20 * math.sin(math.pi * ease_t)
-        
-        # Clear previous frame
-        canvas.delete("flying_chip")
-        
-        # Draw chip at current position
-        draw_bet_chip(
-            canvas, int(x), int(y), amount, tokens, r=r, hovering=True,
-            tags=("flying_chip",)
-        )
-        
-        # Schedule next frame
-        canvas.after(50, lambda: animate_frame(frame + 1))
+    # Draw the chip once; the engine moves it each frame
+    draw_bet_chip(
+        canvas, int(start_pos[0]), int(start_pos[1]), amount, tokens, r=r,
+        hovering=True, tags=("flying_chip",)
+    )
     
-    # Start animation
-    animate_frame(0)
+    # Same 50 ms/frame pacing as before, with a parabolic arc
+    engine.add_tween(
+        canvas, "flying_chip", start_pos, end_pos, frames * 50,
+        easing="smoothstep", arc_height=20, group="flying_chip",
+        on_complete=callback, on_cancel=lambda: canvas.delete("flying_chip"),
+    )
 
 
 def pulse_pot_glow(canvas, center_pos: Tuple[int, int], tokens: dict,
@@ -333,40 +332,39 @@ def pulse_pot_glow(canvas, center_pos: Tuple[int, int], tokens: dict,
     glow_color = tokens.get("chip.pot.glow", "#E6D078")
     
     pulse_sequence = [0.0, 0.4, 0.8, 1.0, 0.8, 0.4, 0.0]
+    # Original pacing: 80 ms per frame plus a 100 ms pause between pulses
+    pulse_ms = len(pulse_sequence) * 80 + 100
     
-    def animate_pulse(pulse_num: int, frame: int):
-        if pulse_num >= pulses:
-            canvas.delete("pot_pulse")
-            return
-            
-        if frame >= len(pulse_sequence):
-            # Move to next pulse
-            canvas.after(100, lambda: animate_pulse(pulse_num + 1, 0))
-            return
-        
-        # Clear previous pulse
-        canvas.delete("pot_pulse")
-        
-        # Draw current pulse ring
-        intensity = pulse_sequence[frame]
+    engine = get_animation_engine()
+    engine.cancel_group("pot_pulse")
+    canvas.delete("pot_pulse")
+    ring = canvas.create_oval(
+        x - r, y - r, x + r, y + r,
+        outline=glow_color, fill="", width=3,
+        tags=("pot_pulse",)
+    )
+    
+    def update_ring(t: float):
+        # Sample the pulse curve for this point of the overall timeline
+        pos = t * pulses * pulse_ms
+        frame = int((pos % pulse_ms) // 80)
+        intensity = pulse_sequence[min(frame, len(pulse_sequence) - 1)]
         pulse_r = r + int(8 * intensity)
-        alpha_val = int(255 * (0.6 - 0.4 * intensity))  # Fade as it expands
-        
-        canvas.create_oval(
-            x - pulse_r, y - pulse_r, x + pulse_r, y + pulse_r,
-            outline=glow_color, fill="", width=max(1, int(3 * (1 - intensity))),
-            tags=("pot_pulse",)
-        )
-        
-        # Schedule next frame
-        canvas.after(80, lambda: animate_pulse(pulse_num, frame + 1))
+        canvas.coords(ring, x - pulse_r, y - pulse_r, x + pulse_r, y + pulse_r)
+        canvas.itemconfig(ring, width=max(1, int(3 * (1 - intensity))))
     
-    # Start pulsing
-    animate_pulse(0, 0)
+    engine.add_callback(
+        update_ring, pulses * pulse_ms, group="pot_pulse",
+        on_complete=lambda: canvas.delete("pot_pulse"), canvas=canvas,
+        on_cancel=lambda: canvas.delete("pot_pulse"),
+    )
 
 
 def clear_chip_animations(canvas) -> None:
     """Clear all chip animation elements from the canvas."""
+    engine = get_animation_engine()
+    engine.cancel_group("flying_chip")
+    engine.cancel_group("pot_pulse")
     canvas.delete("flying_chip")
     canvas.delete("pot_pulse")
     canvas.delete("glow")
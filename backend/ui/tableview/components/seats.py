@@ -6,6 +6,7 @@ Renders player seats, hole cards, and stack information on the poker table.
 import math
 from typing import List, Dict, Any, Optional
 from .sizing_utils import create_sizing_system
+from .item_pool import ItemPool
 
 # Fallback chip graphics if premium_chips module is not available
 try:
@@ -42,6 +43,8 @@ class Seats:
         self.sizing_system = None
         self._stack_chips = {}
         self._blind_elements = {}
+        # Canvas items reused across renders, keyed by (seat, role)
+        self.pool = ItemPool("seats")
     
     def render(self, state, canvas_manager, layer_manager) -> None:
         """Render all player seats on the table."""
@@ -52,6 +55,16 @@ class Seats:
         if w <= 1 or h <= 1:
             return
         
+        self.pool.begin(canvas)
+        try:
+            self._render_seats(state, w, h)
+        finally:
+            # Seats, cards or blinds not drawn this frame are hidden
+            self.pool.end()
+    
+    def _render_seats(self, state, w: int, h: int) -> None:
+        pool = self.pool
+        
         # Get seats data from state
         seats_data = state.get("seats", [])
         if not seats_data:
@@ -93,23 +106,24 @@ class Seats:
             print(f"   Position: {seat.get('position', '')}")
             
             # Render seat background
-            self._render_seat_background(canvas, x, y, idx, seat)
+            self._render_seat_background(pool.scope(idx, "seat"), x, y, idx, seat)
             
             # Render player name
-            self._render_player_name(canvas, x, y, idx, seat)
+            self._render_player_name(pool.scope(idx, "name"), x, y, idx, seat)
             
             # Render hole cards
             if seat.get('cards'):
-                self._render_hole_cards(canvas, x, y, idx, seat, card_width, card_height)
+                self._render_hole_cards(pool.scope(idx, "hole_cards"), x, y, idx, seat,
+                                        card_width, card_height)
             
             # Render player stack chips
             if seat.get('stack', 0) > 0:
-                self._render_stack_chips(canvas, x, y, idx, seat)
+                self._render_stack_chips(pool.scope(idx, "stack"), x, y, idx, seat)
             
             # Draw SB/BB indicators if applicable
             position = seat.get('position', '')
             if position in ['SB', 'BB']:
-                self._draw_blind_indicator(canvas, x, y, position, seat, idx)
+                self._draw_blind_indicator(pool.scope(idx, "blind"), x, y, position, seat, idx)
         
         print(f"🪑 Calculated positions for {len(seats_data)} seats on {w}x{h} canvas")
         print(f"🪑 Seat positions: {seat_positions}")
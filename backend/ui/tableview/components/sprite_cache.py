@@ -0,0 +1,265 @@
+"""
+Sprite Cache for Chips and Cards
+================================
+
+Rasterizes the geometric parts of chips and cards (discs, denomination
+stripes, rims, card borders and the card-back lattice) once per
+(size, colors) into a Tk ``PhotoImage`` so painters can draw them with a
+single ``create_image`` instead of a dozen primitives per render.
+
+Glyphs (denomination text, ranks and suit symbols) stay as canvas text
+items: Tk cannot rasterize fonts into a ``PhotoImage`` without an imaging
+library, which this project does not depend on.
+
+Images are kept in a bounded LRU and dropped whenever the active theme
+changes.
+"""
+
+import math
+import tkinter as tk
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+# Set to False to fall back to primitive drawing everywhere
+USE_SPRITES = True
+
+
+class SpriteCache:
+    """LRU cache of rasterized ``PhotoImage`` sprites."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, int(max_entries))
+        self._images: "OrderedDict[Hashable, tk.PhotoImage]" = OrderedDict()
+        self._theme_key: Optional[Hashable] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def set_theme(self, theme_key: Hashable) -> None:
+        """Drop all sprites when the active theme changes."""
+        if theme_key != self._theme_key:
+            if self._theme_key is not None:
+                self.clear()
+            self._theme_key = theme_key
+
+    def get(self, key: Hashable, build: Callable[[], tk.PhotoImage]) -> tk.PhotoImage:
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+        self.misses += 1
+        image = build()
+        self._images[key] = image
+        while len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+            self.evictions += 1
+        return image
+
+    def clear(self) -> None:
+        self.evictions += len(self._images)
+        self._images.clear()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._images),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
+
+
+_sprite_cache: Optional[SpriteCache] = None
+
+
+def get_sprite_cache() -> SpriteCache:
+    """Get the process-wide sprite cache."""
+    global _sprite_cache
+    if _sprite_cache is None:
+        _sprite_cache = SpriteCache()
+    return _sprite_cache
+
+
+# ---------------------------------------------------------------------------
+# Rasterization helpers
+# ---------------------------------------------------------------------------
+
+Pixels = List[List[Optional[str]]]
+
+
+def _blank(w: int, h: int) -> Pixels:
+    return [[None] * w for _ in range(h)]
+
+
+def _to_image(master, pixels: Pixels) -> tk.PhotoImage:
+    """Copy a pixel grid into a PhotoImage; ``None`` stays transparent."""
+    h = len(pixels)
+    w = len(pixels[0]) if h else 0
+    image = tk.PhotoImage(master=master, width=w, height=h)
+    for y, row in enumerate(pixels):
+        x = 0
+        while x < w:
+            if row[x] is None:
+                x += 1
+                continue
+            start = x
+            while x < w and row[x] is not None:
+                x += 1
+            image.put("{" + " ".join(row[start:x]) + "}", to=(start, y))
+    return image
+
+
+def _rect_outline(pixels: Pixels, x0: int, y0: int, x1: int, y1: int,
+                  color: str, width: int = 1) -> None:
+    h = len(pixels)
+    w = len(pixels[0]) if h else 0
+    for y in range(max(0, y0), min(h, y1)):
+        for x in range(max(0, x0), min(w, x1)):
+            if (x - x0 < width or x1 - 1 - x < width or
+                    y - y0 < width or y1 - 1 - y < width):
+                pixels[y][x] = color
+
+
+def _line(pixels: Pixels, x0: int, y0: int, x1: int, y1: int, color: str) -> None:
+    """Bresenham line, clipped to the grid."""
+    h = len(pixels)
+    w = len(pixels[0]) if h else 0
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        if 0 <= x0 < w and 0 <= y0 < h:
+            pixels[y0][x0] = color
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
+
+
+def rasterize_chip(master, r: int, face: str, edge: str, rim: str,
+                   denom_color: str) -> tk.PhotoImage:
+    """Chip disc with edge, eight denomination stripes and inner rim."""
+    size = 2 * r + 1
+    pixels = _blank(size, size)
+    inner_r = int(r * 0.70)
+    for py in range(size):
+        dy = py - r
+        for px in range(size):
+            dx = px - r
+            d = math.hypot(dx, dy)
+            if d > r:
+                continue
+            if d > r - 2:
+                pixels[py][px] = edge
+                continue
+            color = face
+            if d <= r - 3:
+                # Tk arc angles run counter-clockwise from 3 o'clock
+                angle = math.degrees(math.atan2(-dy, dx)) % 360
+                if angle % 45 < 15:
+                    color = denom_color
+            if abs(d - inner_r) <= 1:
+                color = rim
+            pixels[py][px] = color
+    return _to_image(master, pixels)
+
+
+def rasterize_card_face(master, w: int, h: int, bg: str, border: str) -> tk.PhotoImage:
+    """Card face body: background, outer border and inner depth border."""
+    pixels = [[bg] * (w + 1) for _ in range(h + 1)]
+    _rect_outline(pixels, 0, 0, w + 1, h + 1, border, width=2)
+    _rect_outline(pixels, 2, 2, w - 1, h - 1, border, width=1)
+    return _to_image(master, pixels)
+
+
+def rasterize_card_back(master, w: int, h: int, bg: str, border: str,
+                        pattern: str) -> tk.PhotoImage:
+    """Card back: background, borders, diamond lattice and center plate."""
+    pixels = [[bg] * (w + 1) for _ in range(h + 1)]
+    _rect_outline(pixels, 0, 0, w + 1, h + 1, border, width=2)
+    _rect_outline(pixels, 2, 2, w - 1, h - 1, pattern, width=1)
+    step = max(6, w // 8)
+    for i in range(0, w + step, step):
+        _line(pixels, i, 0, 0, i, pattern)
+        _line(pixels, w - i, 0, w, i, pattern)
+        _line(pixels, i, h, 0, h - i, pattern)
+        _line(pixels, w - i, h, w, h - i, pattern)
+    center_size = min(w, h) // 4
+    _rect_outline(
+        pixels,
+        w // 2 - center_size // 2, h // 2 - center_size // 4,
+        w // 2 + center_size // 2 + 1, h // 2 + center_size // 4 + 1,
+        pattern, width=1,
+    )
+    return _to_image(master, pixels)
+
+
+# ---------------------------------------------------------------------------
+# Cached accessors used by painters
+# ---------------------------------------------------------------------------
+
+def _sprites_supported(canvas) -> bool:
+    return USE_SPRITES and isinstance(canvas, tk.Misc)
+
+
+def _host(canvas):
+    # Pooled painters draw through a facade; images need the real widget
+    return getattr(canvas, "real_canvas", canvas)
+
+
+def get_chip_sprite(canvas, r: int, face: str, edge: str, rim: str,
+                    denom_color: str) -> Optional[tk.PhotoImage]:
+    """Cached chip sprite, or None when the canvas cannot host images."""
+    canvas = _host(canvas)
+    if not _sprites_supported(canvas) or r <= 0:
+        return None
+    key = ("chip", id(canvas.tk), r, face, edge, rim, denom_color)
+    try:
+        return get_sprite_cache().get(
+            key, lambda: rasterize_chip(canvas, r, face, edge, rim, denom_color)
+        )
+    except Exception:
+        return None
+
+
+def get_card_face_sprite(canvas, w: int, h: int, bg: str,
+                         border: str) -> Optional[tk.PhotoImage]:
+    """Cached card face body, or None when sprites are unavailable."""
+    canvas = _host(canvas)
+    if not _sprites_supported(canvas) or w <= 4 or h <= 4:
+        return None
+    key = ("card_face", id(canvas.tk), w, h, bg, border)
+    try:
+        return get_sprite_cache().get(
+            key, lambda: rasterize_card_face(canvas, w, h, bg, border)
+        )
+    except Exception:
+        return None
+
+
+def get_card_back_sprite(canvas, w: int, h: int, bg: str, border: str,
+                         pattern: str) -> Optional[tk.PhotoImage]:
+    """Cached card back, or None when sprites are unavailable."""
+    canvas = _host(canvas)
+    if not _sprites_supported(canvas) or w <= 4 or h <= 4:
+        return None
+    key = ("card_back", id(canvas.tk), w, h, bg, border, pattern)
+    try:
+        return get_sprite_cache().get(
+            key, lambda: rasterize_card_back(canvas, w, h, bg, border, pattern)
+        )
+    except Exception:
+        return None
@@ -0,0 +1,376 @@
+"""
+Headless recording canvas for render benchmarking.
+
+RecordingCanvas implements the subset of the ``tk.Canvas`` API the table
+components use (``create_*``, ``coords``, ``itemconfig``, ``delete``,
+``tag_raise`` and friends). It keeps an item table and per-operation
+counters instead of drawing, so full table renders run without a display.
+HeadlessCanvasManager wraps it with the CanvasManager interface expected by
+RendererPipeline.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+ITEM_TYPES = ("arc", "bitmap", "image", "line", "oval", "polygon",
+              "rectangle", "text", "window")
+
+
+class RecordedItem:
+    __slots__ = ("id", "type", "coords", "options", "tags")
+
+    def __init__(self, item_id: int, item_type: str, coords: List[float],
+                 options: Dict[str, Any], tags: Tuple[str, ...]):
+        self.id = item_id
+        self.type = item_type
+        self.coords = coords
+        self.options = options
+        self.tags = tags
+
+
+def _flatten(args: Iterable[Any]) -> List[float]:
+    flat: List[float] = []
+    for a in args:
+        if isinstance(a, (list, tuple)):
+            flat.extend(_flatten(a))
+        else:
+            flat.append(float(a))
+    return flat
+
+
+def _normalize_tags(tags: Any) -> Tuple[str, ...]:
+    if tags is None or tags == "":
+        return ()
+    if isinstance(tags, str):
+        return tuple(tags.split())
+    return tuple(str(t) for t in tags)
+
+
+class RecordingCanvas:
+    """Drop-in ``tk.Canvas`` stand-in that records operations without drawing."""
+
+    def __init__(self, width: int = 1200, height: int = 800, master: Any = None,
+                 keep_log: bool = False):
+        self.width = int(width)
+        self.height = int(height)
+        self.master = master
+        self.keep_log = keep_log
+
+        self.items: Dict[int, RecordedItem] = {}
+        self._order: List[int] = []  # display list, bottom to top
+        self._ids = itertools.count(1)
+        self.ops: Counter = Counter()
+        self.log: List[Tuple[str, Any]] = []
+        self.created = 0
+        self.deleted = 0
+
+        self._after_ids = itertools.count(1)
+        self.pending_after: Dict[str, Tuple[int, Callable, tuple]] = {}
+        self._options: Dict[str, Any] = {}
+
+    # Recording helpers
+    def _record(self, op: str, detail: Any = None) -> None:
+        self.ops[op] += 1
+        if self.keep_log:
+            self.log.append((op, detail))
+
+    def reset_counts(self) -> None:
+        self.ops.clear()
+        self.log.clear()
+        self.created = 0
+        self.deleted = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "live_items": len(self.items),
+            "created": self.created,
+            "deleted": self.deleted,
+            "ops": dict(self.ops),
+        }
+
+    # Item creation
+    def _create(self, item_type: str, args: tuple, kw: Dict[str, Any]) -> int:
+        item_id = next(self._ids)
+        tags = _normalize_tags(kw.pop("tags", None))
+        self.items[item_id] = RecordedItem(item_id, item_type, _flatten(args), kw, tags)
+        self._order.append(item_id)
+        self.created += 1
+        self._record(f"create_{item_type}", item_id)
+        return item_id
+
+    def create_arc(self, *args, **kw) -> int:
+        return self._create("arc", args, kw)
+
+    def create_bitmap(self, *args, **kw) -> int:
+        return self._create("bitmap", args, kw)
+
+    def create_image(self, *args, **kw) -> int:
+        return self._create("image", args, kw)
+
+    def create_line(self, *args, **kw) -> int:
+        return self._create("line", args, kw)
+
+    def create_oval(self, *args, **kw) -> int:
+        return self._create("oval", args, kw)
+
+    def create_polygon(self, *args, **kw) -> int:
+        return self._create("polygon", args, kw)
+
+    def create_rectangle(self, *args, **kw) -> int:
+        return self._create("rectangle", args, kw)
+
+    def create_text(self, *args, **kw) -> int:
+        return self._create("text", args, kw)
+
+    def create_window(self, *args, **kw) -> int:
+        return self._create("window", args, kw)
+
+    # Lookup
+    def _find(self, tag_or_id: Any) -> List[int]:
+        """Item ids matching an id, numeric string, tag or "all", bottom to top."""
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        tag = str(tag_or_id)
+        if tag.isdigit():
+            return self._find(int(tag))
+        if tag == "all":
+            return list(self._order)
+        if "!" in tag or "&&" in tag or "||" in tag:
+            return [i for i in self._order if self._matches(tag, self.items[i].tags)]
+        return [i for i in self._order if tag in self.items[i].tags]
+
+    @staticmethod
+    def _matches(expr: str, tags: Tuple[str, ...]) -> bool:
+        """Evaluate a Tk tag expression of ||, && and ! terms (no parentheses)."""
+        for alternative in expr.split("||"):
+            ok = True
+            for term in alternative.split("&&"):
+                term = term.strip()
+                negate = term.startswith("!")
+                name = term.lstrip("!").strip()
+                if ((name in tags) or name == "all") == negate:
+                    ok = False
+                    break
+            if ok:
+                return True
+        return False
+
+    def find_withtag(self, tag_or_id: Any) -> Tuple[int, ...]:
+        self._record("find_withtag")
+        return tuple(self._find(tag_or_id))
+
+    def find_all(self) -> Tuple[int, ...]:
+        return tuple(self._order)
+
+    def gettags(self, tag_or_id: Any) -> Tuple[str, ...]:
+        ids = self._find(tag_or_id)
+        return self.items[ids[0]].tags if ids else ()
+
+    def type(self, tag_or_id: Any) -> Optional[str]:
+        ids = self._find(tag_or_id)
+        return self.items[ids[0]].type if ids else None
+
+    def bbox(self, *tags_or_ids: Any) -> Optional[Tuple[int, int, int, int]]:
+        xs: List[float] = []
+        ys: List[float] = []
+        for t in tags_or_ids:
+            for i in self._find(t):
+                c = self.items[i].coords
+                xs.extend(c[0::2])
+                ys.extend(c[1::2])
+        if not xs:
+            return None
+        return int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))
+
+    # Mutation
+    def coords(self, tag_or_id: Any, *args) -> List[float]:
+        ids = self._find(tag_or_id)
+        if not args:
+            self._record("coords_get")
+            return list(self.items[ids[0]].coords) if ids else []
+        self._record("coords")
+        if ids:
+            self.items[ids[0]].coords = _flatten(args)
+        return []
+
+    def itemconfig(self, tag_or_id: Any, cnf: Optional[Dict[str, Any]] = None, **kw) -> None:
+        self._record("itemconfig")
+        if cnf:
+            kw = {**cnf, **kw}
+        tags = kw.pop("tags", None)
+        for i in self._find(tag_or_id):
+            item = self.items[i]
+            item.options.update(kw)
+            if tags is not None:
+                item.tags = _normalize_tags(tags)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag_or_id: Any, option: str) -> Any:
+        ids = self._find(tag_or_id)
+        if not ids:
+            return ""
+        item = self.items[ids[0]]
+        if option == "tags":
+            return " ".join(item.tags)
+        return item.options.get(option, "")
+
+    def move(self, tag_or_id: Any, dx: float, dy: float) -> None:
+        self._record("move")
+        for i in self._find(tag_or_id):
+            c = self.items[i].coords
+            c[0::2] = [x + dx for x in c[0::2]]
+            c[1::2] = [y + dy for y in c[1::2]]
+
+    def scale(self, tag_or_id: Any, x0: float, y0: float, sx: float, sy: float) -> None:
+        self._record("scale")
+        for i in self._find(tag_or_id):
+            c = self.items[i].coords
+            c[0::2] = [x0 + (x - x0) * sx for x in c[0::2]]
+            c[1::2] = [y0 + (y - y0) * sy for y in c[1::2]]
+
+    def addtag_withtag(self, new_tag: str, tag_or_id: Any) -> None:
+        for i in self._find(tag_or_id):
+            item = self.items[i]
+            if new_tag not in item.tags:
+                item.tags = item.tags + (new_tag,)
+
+    def dtag(self, tag_or_id: Any, tag_to_delete: Optional[str] = None) -> None:
+        tag_to_delete = tag_to_delete if tag_to_delete is not None else str(tag_or_id)
+        for i in self._find(tag_or_id):
+            item = self.items[i]
+            item.tags = tuple(t for t in item.tags if t != tag_to_delete)
+
+    def delete(self, *tags_or_ids: Any) -> None:
+        self._record("delete")
+        doomed = set()
+        for t in tags_or_ids:
+            doomed.update(self._find(t))
+        if not doomed:
+            return
+        for i in doomed:
+            del self.items[i]
+        self._order = [i for i in self._order if i not in doomed]
+        self.deleted += len(doomed)
+
+    # Stacking order
+    def _restack(self, tag_or_id: Any, above: bool, relative_to: Any = None) -> None:
+        moving = self._find(tag_or_id)
+        if not moving:
+            return
+        moving_set = set(moving)
+        rest = [i for i in self._order if i not in moving_set]
+        if relative_to is None:
+            pos = len(rest) if above else 0
+        else:
+            anchor = [i for i in self._find(relative_to) if i not in moving_set]
+            if not anchor:
+                return
+            pos = rest.index(anchor[-1]) + 1 if above else rest.index(anchor[0])
+        self._order = rest[:pos] + moving + rest[pos:]
+
+    def tag_raise(self, tag_or_id: Any, above: Any = None) -> None:
+        self._record("tag_raise")
+        self._restack(tag_or_id, True, above)
+
+    def tag_lower(self, tag_or_id: Any, below: Any = None) -> None:
+        self._record("tag_lower")
+        self._restack(tag_or_id, False, below)
+
+    lift = tag_raise
+    lower = tag_lower
+
+    # Widget surface used by components and CanvasManager
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    winfo_reqwidth = winfo_width
+    winfo_reqheight = winfo_height
+
+    def winfo_exists(self) -> bool:
+        return True
+
+    def after(self, ms: int, func: Optional[Callable] = None, *args) -> str:
+        """Record a timer; nothing runs until run_pending_after()."""
+        self._record("after")
+        after_id = f"after#{next(self._after_ids)}"
+        if func is not None:
+            self.pending_after[after_id] = (int(ms), func, args)
+        return after_id
+
+    def after_idle(self, func: Callable, *args) -> str:
+        return self.after(0, func, *args)
+
+    def after_cancel(self, after_id: str) -> None:
+        self.pending_after.pop(after_id, None)
+
+    def run_pending_after(self) -> int:
+        """Run the timers queued so far (once); returns how many ran."""
+        pending, self.pending_after = self.pending_after, {}
+        for _, func, args in sorted(pending.values(), key=lambda p: p[0]):
+            try:
+                func(*args)
+            except Exception:
+                pass
+        return len(pending)
+
+    def configure(self, cnf: Optional[Dict[str, Any]] = None, **kw) -> None:
+        self._options.update(cnf or {}, **kw)
+        if "width" in kw:
+            self.width = int(kw["width"])
+        if "height" in kw:
+            self.height = int(kw["height"])
+
+    config = configure
+
+    def cget(self, option: str) -> Any:
+        return self._options.get(option, "")
+
+    def bind(self, *args, **kw) -> None:
+        return None
+
+    def tag_bind(self, *args, **kw) -> None:
+        return None
+
+    def unbind(self, *args, **kw) -> None:
+        return None
+
+    def grid(self, *args, **kw) -> None:
+        return None
+
+    def pack(self, *args, **kw) -> None:
+        return None
+
+    def place(self, *args, **kw) -> None:
+        return None
+
+    def update(self) -> None:
+        return None
+
+    def update_idletasks(self) -> None:
+        return None
+
+
+class HeadlessCanvasManager:
+    """CanvasManager stand-in over a RecordingCanvas (always ready)."""
+
+    def __init__(self, canvas: Optional[RecordingCanvas] = None,
+                 width: int = 1200, height: int = 800):
+        self.canvas = canvas if canvas is not None else RecordingCanvas(width, height)
+        self.overlay = None
+
+    def size(self) -> Tuple[int, int]:
+        return self.canvas.winfo_width(), self.canvas.winfo_height()
+
+    def is_ready(self) -> bool:
+        return True
+
+    def defer_render(self, render_func: Callable[[], None]) -> None:
+        render_func()
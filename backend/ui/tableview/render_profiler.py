@@ -0,0 +1,183 @@
+"""
+Per-component render profiler for the table view.
+
+RendererPipeline times every component's ``render`` through a shared
+RenderProfiler, along with the canvas items each one creates. Rolling
+p50/p95 values over the last ``window`` frames can be drawn as an
+on-canvas debug overlay (toggle with F3 on the table) or dumped to JSON
+(Shift+F3). When profiling is off, ``section()`` is a no-op.
+
+Enable at startup with ``POKER_RENDER_PROFILE=1``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Deque, Dict, Iterator, Optional
+
+
+OVERLAY_TAG = "render_profiler"
+FRAME = "frame"
+
+
+def _percentile(ordered, q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _item_mark(canvas) -> int:
+    """Marker for counting items created after this point."""
+    created = getattr(canvas, "created", None)
+    if created is not None:  # RecordingCanvas keeps a running count
+        return created
+    try:
+        ids = canvas.find_all()
+        return max(ids) if ids else 0
+    except Exception:
+        return -1
+
+
+def _items_since(canvas, mark: int) -> int:
+    if mark < 0:
+        return 0
+    created = getattr(canvas, "created", None)
+    if created is not None:
+        return created - mark
+    try:
+        # Tk item ids are monotonic, so live ids above the mark are new
+        return sum(1 for i in canvas.find_all() if i > mark)
+    except Exception:
+        return 0
+
+
+class RenderProfiler:
+    """Rolling per-section render timings and item counts."""
+
+    def __init__(self, window: int = 120, enabled: bool = False):
+        self.window = max(1, int(window))
+        self.enabled = enabled
+        self.overlay_visible = False
+        self._ms: Dict[str, Deque[float]] = {}
+        self._items: Dict[str, Deque[int]] = {}
+        self.frames = 0
+
+    # Recording
+    def record(self, name: str, ms: float, items: Optional[int] = None) -> None:
+        samples = self._ms.get(name)
+        if samples is None:
+            samples = self._ms[name] = deque(maxlen=self.window)
+            self._items[name] = deque(maxlen=self.window)
+        samples.append(ms)
+        if items is not None:
+            self._items[name].append(items)
+        if name == FRAME:
+            self.frames += 1
+
+    @contextmanager
+    def _timed(self, name: str, canvas) -> Iterator[None]:
+        mark = _item_mark(canvas) if canvas is not None else -1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - start) * 1000.0
+            items = _items_since(canvas, mark) if canvas is not None else None
+            self.record(name, ms, items)
+
+    def section(self, name: str, canvas=None):
+        """Time a block (and count items created on ``canvas``) while enabled."""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name, canvas)
+
+    def reset(self) -> None:
+        self._ms.clear()
+        self._items.clear()
+        self.frames = 0
+
+    # Reporting
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        out: Dict[str, Dict[str, Any]] = {}
+        for name, samples in self._ms.items():
+            ordered = sorted(samples)
+            entry: Dict[str, Any] = {
+                "samples": len(ordered),
+                "p50_ms": round(_percentile(ordered, 0.50), 3),
+                "p95_ms": round(_percentile(ordered, 0.95), 3),
+                "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+            }
+            items = sorted(self._items.get(name, ()))
+            if items:
+                entry["items_p50"] = _percentile(items, 0.50)
+                entry["items_p95"] = _percentile(items, 0.95)
+            out[name] = entry
+        return out
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"frames": self.frames, "window": self.window, "sections": self.stats()},
+            indent=2,
+        )
+
+    def dump_json(self, path: str = "render_profile.json") -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+        print(f"📊 RenderProfiler: wrote {path}")
+        return path
+
+    def overlay_lines(self):
+        stats = self.stats()
+        lines = [f"render p50/p95 ms (last {min(self.frames, self.window)} frames)"]
+        frame = stats.pop(FRAME, None)
+        if frame:
+            lines.append(f"{'frame':<20}{frame['p50_ms']:>7.2f}{frame['p95_ms']:>7.2f}")
+        for name, s in sorted(stats.items(), key=lambda kv: -kv[1]["p95_ms"]):
+            items = f"{s['items_p50']:>5}" if "items_p50" in s else ""
+            lines.append(f"{name[:20]:<20}{s['p50_ms']:>7.2f}{s['p95_ms']:>7.2f}{items}")
+        return lines
+
+    # Overlay
+    def toggle_overlay(self) -> bool:
+        """Show/hide the overlay; showing it turns profiling on."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+        return self.overlay_visible
+
+    def draw_overlay(self, canvas) -> None:
+        try:
+            canvas.delete(OVERLAY_TAG)
+        except Exception:
+            pass
+        if not self.overlay_visible:
+            return
+        lines = self.overlay_lines()
+        line_h = 14
+        x, y = 8, 8
+        width = 8 * max(len(line) for line in lines) + 12
+        tags = ("layer:overlay", OVERLAY_TAG)
+        canvas.create_rectangle(
+            x, y, x + width, y + line_h * len(lines) + 10,
+            fill="#000000", outline="#22C55E", stipple="gray50", tags=tags,
+        )
+        canvas.create_text(
+            x + 6, y + 5, text="\n".join(lines), anchor="nw",
+            fill="#22C55E", font=("Courier", 10), tags=tags,
+        )
+
+
+_render_profiler: Optional[RenderProfiler] = None
+
+
+def get_render_profiler() -> RenderProfiler:
+    global _render_profiler
+    if _render_profiler is None:
+        _render_profiler = RenderProfiler(
+            enabled=os.environ.get("POKER_RENDER_PROFILE", "") not in ("", "0")
+        )
+    return _render_profiler
@@ -1,8 +1,14 @@
+from .components.item_pool import UNPOOLED
+from .render_profiler import FRAME, get_render_profiler
+
+
 class RendererPipeline:
-    def __init__(self, canvas_manager, layer_manager, components):
+    def __init__(self, canvas_manager, layer_manager, components, profiler=None):
         self.cm = canvas_manager
         self.lm = layer_manager
         self.components = components
+        # Shared so the overlay toggle and JSON dump see every table
+        self.profiler = profiler if profiler is not None else get_render_profiler()
 
     def render_once(self, state, force=False):
         # Gate rendering until the canvas is created/sized to avoid small initial artifacts
@@ -20,25 +26,34 @@ class RendererPipeline:
             print(f"⚠️ Skipping render - invalid dimensions: {w}x{h}")
             return
 
-        # Thorough clear to ensure no remnants from any previous pass
-        try:
-            c.delete("all")
-        except Exception:
-            pass
-
-        # Render all components
-        for component in self.components:
+        profiler = self.profiler
+        with profiler.section(FRAME, c):
+            # Thorough clear of everything but pooled items, which their
+            # components reuse or hide
+            try:
+                c.delete(UNPOOLED)
+            except Exception:
+                pass
+
+            # Render all components
+            for component in self.components:
+                try:
+                    with profiler.section(component.__class__.__name__, c):
+                        component.render(state, self.cm, self.lm)
+                except Exception as e:
+                    print(f"⚠️ Component {component.__class__.__name__} render error: {e}")
+
+            # Apply layer ordering
             try:
-                component.render(state, self.cm, self.lm)
+                with profiler.section("LayerManager.raise_to_policy"):
+                    self.lm.raise_to_policy()
             except Exception as e:
-                print(f"⚠️ Component {component.__class__.__name__} render error: {e}")
+                print(f"⚠️ Layer manager error: {e}")
 
-        # Apply layer ordering
-        try:
-            self.lm.raise_to_policy()
-        except Exception as e:
-            print(f"⚠️ Layer manager error: {e}")
+        if profiler.overlay_visible:
+            try:
+                profiler.draw_overlay(c)
+            except Exception as e:
+                print(f"⚠️ Render profiler overlay error: {e}")
 
         print(f"🎨 Rendered poker table: {w}x{h} with {len(self.components)} components")
-
-
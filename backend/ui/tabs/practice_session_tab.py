@@ -66,8 +66,13 @@ class PracticeSessionTab(ttk.Frame):
         )
         self.manager.start()
 
-        # Subscribe store → renderer
-        self.store.subscribe(self._on_store_change)
+        # Subscribe store → renderer; coalesce bursts into one render per frame
+        from ..services.render_scheduler import RenderScheduler
+        from ..services.timer_manager import TimerManager
+        self.render_scheduler = RenderScheduler(
+            TimerManager(self), self._on_store_change
+        )
+        self.store.subscribe(self.render_scheduler.mark_dirty)
 
     def _on_store_change(self, state=None):
         state = state or self.store.get_state()
@@ -9,10 +9,33 @@ Uses pygame for cross-platform audio support.
 import os
 import json
 import pygame
-from typing import Optional
+from typing import Dict, Optional
+from .sound_preloader import (
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_NOW,
+    SoundPreloader,
+    resolve_sound_file,
+)
 from .voice_manager import VoiceManager
 
 
+# Event -> file fallbacks used when the sound config has no mapping
+EVENT_FALLBACKS = {
+    "card_dealing": "card_deal.wav",
+    "card_shuffle": "shuffle-cards-46455.mp3",
+    "chip_bet": "chip_bet.wav",
+    "chip_collect": "pot_split.wav",
+    "winner_announce": "winner_announce.wav",
+    "turn_notification": "turn_notify.wav",
+    "ui_click": "button_move.wav"
+}
+
+
+def _decode_sound(path: str) -> pygame.mixer.Sound:
+    return pygame.mixer.Sound(path)
+
+
 class SoundManager:
     """Manages sound effects for the poker application."""
     
@@ -26,14 +49,16 @@ class SoundManager:
         self.sounds_dir = sounds_dir or os.path.join(
             os.path.dirname(__file__), '..', 'sounds'
         )
-        self.sound_cache: dict[str, pygame.mixer.Sound] = {}
+        # Decoded sounds live in the preloader's byte-budgeted LRU
+        self.preloader = SoundPreloader(_decode_sound, start=False)
+        self._sound_paths: Dict[str, Optional[str]] = {}
         self.enabled = True
         self.volume = 0.7
         self.test_mode = test_mode
         self.animation_mode = False  # Track if we're in animation mode
         
-        # Initialize voice manager
-        self.voice_manager = VoiceManager()
+        # Initialize voice manager (shares the preloader and its budget)
+        self.voice_manager = VoiceManager(preloader=self.preloader)
         
         # Initialize pygame mixer
         try:
@@ -42,6 +67,8 @@ class SoundManager:
             )
             # Sound system initialized successfully
             self._load_sound_mapping()
+            self._resolve_sound_paths()
+            self.preloader.start()
         except (pygame.error, OSError) as e:
             # Could not initialize sound system - using fallback mode
             self.enabled = False
@@ -57,14 +84,17 @@ class SoundManager:
                 with open(poker_config_file, 'r') as f:
                     poker_config = json.load(f)
                 self.poker_sound_events = poker_config.get("poker_sound_events", {})
+                self.config_sounds = poker_config.get("sounds", {})
                 print(f"🔥 SOUND_DEBUG: Loaded {len(self.poker_sound_events)} poker sound events")
                 print(f"🔥 SOUND_DEBUG: Voice events: {[k for k in self.poker_sound_events.keys() if 'player_action' in k]}")
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 print(f"🔥 SOUND_DEBUG: Error loading config: {e}")
                 self.poker_sound_events = {}
+                self.config_sounds = {}
         else:
             print(f"🔥 SOUND_DEBUG: Config file not found, using empty events")
             self.poker_sound_events = {}
+            self.config_sounds = {}
         
         # Load the legacy sound mapping for backward compatibility
         mapping_file = os.path.join(self.sounds_dir, 'sound_mapping.json')
@@ -98,61 +128,65 @@ class SoundManager:
                 }
             }
     
+    def _resolve_sound_paths(self):
+        """Resolve every configured sound once and queue it for decoding.
+        
+        Action and chip cues decode first since they are heard in the
+        first hand; card, UI and event cues follow.
+        """
+        first = []
+        for group in ("poker_actions", "chip_actions"):
+            first.extend(self.sound_mapping.get(group, {}).values())
+        rest = []
+        for group, sounds in self.sound_mapping.items():
+            if group not in ("poker_actions", "chip_actions") and isinstance(sounds, dict):
+                rest.extend(sounds.values())
+        rest.extend(self.poker_sound_events.values())
+        rest.extend(self.config_sounds.values())
+        rest.extend(EVENT_FALLBACKS.values())
+        
+        for names, priority in ((first, PRIORITY_HIGH), (rest, PRIORITY_NORMAL)):
+            for sound_name in names:
+                if isinstance(sound_name, str) and sound_name not in self._sound_paths:
+                    path = resolve_sound_file(sound_name, [self.sounds_dir])
+                    self._sound_paths[sound_name] = path
+                    self.preloader.register(f"sfx:{sound_name}", path, priority)
+    
     def _get_sound_path(self, sound_name: str) -> Optional[str]:
         """Get the full path to a sound file.
         
+        Paths are resolved once at startup; names outside the config are
+        resolved on first use and remembered.
+        
         Args:
             sound_name: Name of the sound file
             
         Returns:
             Full path to the sound file, or None if not found
         """
-        # Try exact match first
-        sound_path = os.path.join(self.sounds_dir, sound_name)
-        if os.path.exists(sound_path):
-            return sound_path
-        
-        # Try with .wav extension
-        sound_path = os.path.join(self.sounds_dir, f"{sound_name}.wav")
-        if os.path.exists(sound_path):
-            return sound_path
-        
-        # Try with .mp3 extension
-        sound_path = os.path.join(self.sounds_dir, f"{sound_name}.mp3")
-        if os.path.exists(sound_path):
-            return sound_path
-        
-        return None
+        if sound_name not in self._sound_paths:
+            path = resolve_sound_file(sound_name, [self.sounds_dir])
+            self._sound_paths[sound_name] = path
+            self.preloader.register(f"sfx:{sound_name}", path, PRIORITY_NOW)
+        return self._sound_paths[sound_name]
     
     def _load_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
-        """Load a sound file into memory.
+        """Get a decoded sound from the preloader without blocking.
         
         Args:
             sound_name: Name of the sound file
             
         Returns:
-            pygame Sound object, or None if loading failed
+            pygame Sound object, or None if missing or still decoding
         """
         if not self.enabled:
             return None
         
-        # Check cache first
-        if sound_name in self.sound_cache:
-            return self.sound_cache[sound_name]
-        
-        sound_path = self._get_sound_path(sound_name)
-        if not sound_path:
+        if not self._get_sound_path(sound_name):
             # Sound file not found - using silent fallback
             return None
         
-        try:
-            sound = pygame.mixer.Sound(sound_path)
-            sound.set_volume(self.volume)
-            self.sound_cache[sound_name] = sound
-            return sound
-        except Exception as e:
-            # Could not load sound - using silent fallback
-            return None
+        return self.preloader.get(f"sfx:{sound_name}")
     
     def play(self, sound_name: str):
         """Play a sound by name.
@@ -174,6 +208,7 @@ class SoundManager:
         if sound:
             try:
                 print(f"🔥 SOUND_DEBUG: About to call sound.play()")
+                sound.set_volume(self.volume)
                 sound.play()
                 print(f"🔥 SOUND_DEBUG: sound.play() completed successfully")
             except Exception as e:
@@ -287,17 +322,7 @@ class SoundManager:
                 return
         
         # Fallback to legacy system for common events
-        fallback_mapping = {
-            "card_dealing": "card_deal.wav",
-            "card_shuffle": "shuffle-cards-46455.mp3",
-            "chip_bet": "chip_bet.wav",
-            "chip_collect": "pot_split.wav",
-            "winner_announce": "winner_announce.wav",
-            "turn_notification": "turn_notify.wav",
-            "ui_click": "button_move.wav"
-        }
-        
-        fallback_sound = fallback_mapping.get(event_name)
+        fallback_sound = EVENT_FALLBACKS.get(event_name)
         if fallback_sound:
             print(f"🔥 SOUND_DEBUG: Using fallback sound: {fallback_sound}")
             self.play(fallback_sound)
@@ -380,8 +405,7 @@ class SoundManager:
             volume: Volume level (0.0 to 1.0)
         """
         self.volume = max(0.0, min(1.0, volume))
-        for sound in self.sound_cache.values():
-            sound.set_volume(self.volume)
+        # Volume is applied to each sound when it is played
     
     def enable(self):
         """Enable sound playback."""
@@ -409,6 +433,8 @@ class SoundManager:
     
     def cleanup(self):
         """Clean up resources."""
+        self.preloader.stop()
+        self.preloader.clear()
         try:
             pygame.mixer.quit()
         except (pygame.error, OSError):
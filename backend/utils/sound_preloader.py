@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Sound Preloader for Poker Strategy Practice System
+
+Decodes sound and voice files on a background worker thread in priority
+order and keeps the decoded objects in a byte-budgeted LRU cache, so the
+Tk thread never touches the disk when a cue is played.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+# Priority levels (lower decodes first)
+PRIORITY_NOW = 0       # Requested by play() but not decoded yet
+PRIORITY_HIGH = 10     # Action and chip cues heard in the first hand
+PRIORITY_NORMAL = 20   # Card, UI and event cues
+PRIORITY_LOW = 30      # Alternate voice packs, rarely used cues
+
+DEFAULT_BUDGET_BYTES = 48 * 1024 * 1024
+
+
+def resolve_sound_file(name: str, search_dirs: Iterable[str],
+                       extensions: Tuple[str, ...] = ("", ".wav", ".mp3")) -> Optional[str]:
+    """Resolve a sound name to an absolute, non-empty file path."""
+    candidates = [name] if os.path.isabs(name) else []
+    for directory in search_dirs:
+        candidates.extend(os.path.join(directory, name + ext) for ext in extensions)
+    for path in candidates:
+        try:
+            if os.path.isfile(path) and os.path.getsize(path) > 0:
+                return os.path.abspath(path)
+        except OSError:
+            continue
+    return None
+
+
+def estimate_sound_bytes(sound: Any, path: str) -> int:
+    """Approximate decoded size: 16-bit stereo PCM at 44.1kHz, else file size."""
+    try:
+        return int(sound.get_length() * 44100 * 2 * 2)
+    except Exception:
+        pass
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class SoundPreloader:
+    """Priority-ordered background decoder with a byte-budgeted LRU cache.
+
+    ``get()`` never blocks: a decoded sound is returned immediately, and a
+    miss schedules the file at the front of the decode queue and returns
+    None so the caller can skip the cue rather than stall the UI.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[str], Any],
+        budget_bytes: int = DEFAULT_BUDGET_BYTES,
+        size_of: Callable[[Any, str], int] = estimate_sound_bytes,
+        start: bool = True,
+    ):
+        self.decode = decode
+        self.size_of = size_of
+        self.budget_bytes = max(1, int(budget_bytes))
+
+        self._paths: Dict[str, str] = {}
+        self._cache: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._queue: list = []
+        self._queued: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._worker: Optional[threading.Thread] = None
+        self._stopped = False
+        self._busy = False
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.decoded = 0
+        self.failed = 0
+        self.evictions = 0
+
+        if start:
+            self.start()
+
+    # Registration
+    def register(self, key: str, path: Optional[str],
+                 priority: int = PRIORITY_NORMAL) -> bool:
+        """Remember the resolved path for ``key`` and queue it for decoding."""
+        if not path:
+            return False
+        with self._lock:
+            self._paths[key] = path
+            self._enqueue_locked(key, priority)
+        return True
+
+    def prioritize(self, key: str, priority: int = PRIORITY_NOW) -> None:
+        """Move a registered key ahead in the decode queue."""
+        with self._lock:
+            if key in self._paths:
+                self._enqueue_locked(key, priority)
+
+    def has_path(self, key: str) -> bool:
+        return key in self._paths
+
+    # Lookup
+    def get(self, key: str) -> Optional[Any]:
+        """Return the decoded sound for ``key`` without blocking."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            if key in self._paths:
+                self._enqueue_locked(key, PRIORITY_NOW)
+        return None
+
+    def get_blocking(self, key: str) -> Optional[Any]:
+        """Decode on the calling thread if needed (tests and tools only)."""
+        sound = self.get(key)
+        if sound is None and key in self._paths:
+            sound = self._decode_and_store(key)
+        return sound
+
+    def cached_values(self) -> list:
+        with self._lock:
+            return [sound for sound, _ in self._cache.values()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+
+    # Worker
+    def start(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stopped = False
+        self._worker = threading.Thread(
+            target=self._run, name="SoundPreloader", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            self._wakeup.notify_all()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Wait until the decode queue is empty (tests and tools only)."""
+        with self._lock:
+            return self._wakeup.wait_for(
+                lambda: not self._queued and not self._busy, timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._stopped and not self._queued:
+                    self._wakeup.wait()
+                if self._stopped:
+                    return
+                key = self._pop_locked()
+                if key is None:
+                    continue
+                self._busy = True
+            try:
+                self._decode_and_store(key)
+            finally:
+                with self._lock:
+                    self._busy = False
+                    self._wakeup.notify_all()
+
+    def _decode_and_store(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._cache.get(key)
+            path = self._paths.get(key)
+        if entry is not None:
+            return entry[0]
+        if not path:
+            return None
+        try:
+            sound = self.decode(path)
+        except Exception as e:
+            print(f"⚠️ SoundPreloader: could not decode {path}: {e}")
+            sound = None
+        if sound is None:
+            # Forget the path so play() does not keep retrying a bad file
+            with self._lock:
+                self._paths.pop(key, None)
+                self.failed += 1
+            return None
+        size = max(0, int(self.size_of(sound, path)))
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = (sound, size)
+                self._cache_bytes += size
+                self.decoded += 1
+                self._evict_locked(keep=key)
+        return sound
+
+    # Internals (call with lock held)
+    def _enqueue_locked(self, key: str, priority: int) -> None:
+        if key in self._cache:
+            return
+        current = self._queued.get(key)
+        if current is not None and current <= priority:
+            return
+        # Older, lower-priority heap entries become stale and are skipped
+        self._queued[key] = priority
+        heapq.heappush(self._queue, (priority, next(self._seq), key))
+        self._wakeup.notify()
+
+    def _pop_locked(self) -> Optional[str]:
+        while self._queue:
+            priority, _, key = heapq.heappop(self._queue)
+            if self._queued.get(key) == priority:
+                del self._queued[key]
+                return key
+        return None
+
+    def _evict_locked(self, keep: str) -> None:
+        while self._cache_bytes > self.budget_bytes and len(self._cache) > 1:
+            oldest = next(iter(self._cache))
+            if oldest == keep:
+                self._cache.move_to_end(oldest)
+                oldest = next(iter(self._cache))
+            _, size = self._cache.pop(oldest)
+            self._cache_bytes -= size
+            self.evictions += 1
+
+    # Status
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "registered": len(self._paths),
+                "cached": len(self._cache),
+                "cached_bytes": self._cache_bytes,
+                "budget_bytes": self.budget_bytes,
+                "queued": len(self._queued),
+                "hits": self.hits,
+                "misses": self.misses,
+                "decoded": self.decoded,
+                "failed": self.failed,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / total) if total else 0.0,
+            }
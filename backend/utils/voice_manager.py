@@ -11,20 +11,39 @@ import random
 import pygame
 from typing import Optional, Dict, List
 
+from .sound_preloader import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NOW,
+    SoundPreloader,
+    resolve_sound_file,
+)
+
+
+def _decode_voice(path: str) -> pygame.mixer.Sound:
+    return pygame.mixer.Sound(path)
+
 
 class VoiceManager:
     """Manages human voice announcements for poker actions."""
     
-    def __init__(self, voice_dir: str = None):
+    def __init__(self, voice_dir: str = None, preloader: Optional[SoundPreloader] = None):
         """Initialize the voice manager.
         
         Args:
             voice_dir: Directory containing voice files (defaults to ../sounds/voice/)
+            preloader: Shared background decoder (one is created if omitted)
         """
         self.voice_dir = voice_dir or os.path.join(
             os.path.dirname(__file__), '..', 'sounds', 'voice'
         )
-        self.voice_cache = {}
+        # Decoded voices live in the preloader's bounded LRU; decoding starts
+        # once the mixer is up (see start_preloading)
+        self.preloader = preloader or SoundPreloader(_decode_voice, start=False)
+        self._voice_paths: Dict[str, Optional[str]] = {}
+        self._file_paths: Dict[str, Optional[str]] = {}
+        self._file_keys: Dict[str, str] = {}
+        self._keys_by_path: Dict[str, str] = {}
         self.enabled = True
         self.volume = 0.8
         self.current_voice_type = "announcer_female"  # Default voice
@@ -49,6 +68,39 @@ class VoiceManager:
             "your_turn": "your_turn.wav",
             "winner": "winner.wav"
         }
+        
+        self._resolve_voice_paths()
+        self.start_preloading()
+    
+    def _resolve_voice_paths(self):
+        """Resolve every voice file once and queue them by priority.
+        
+        The selected voice pack decodes first; the other packs follow at
+        low priority so switching voices later does not hit the disk.
+        """
+        for voice_type in self.voice_types:
+            priority = PRIORITY_HIGH if voice_type == self.current_voice_type else PRIORITY_LOW
+            for action, voice_file in self.voice_mappings.items():
+                key = self._voice_key(voice_type, action)
+                path = os.path.join(self.voice_dir, voice_type, voice_file)
+                path = path if os.path.isfile(path) else None
+                self._voice_paths[key] = path
+                if path:
+                    self._keys_by_path[os.path.realpath(path)] = key
+                self.preloader.register(key, path, priority)
+    
+    def start_preloading(self) -> bool:
+        """Start background decoding once the pygame mixer is initialized."""
+        try:
+            if not pygame.mixer.get_init():
+                return False
+        except Exception:
+            return False
+        self.preloader.start()
+        return True
+    
+    def _voice_key(self, voice_type: str, action: str) -> str:
+        return f"voice:{voice_type}_{action}"
     
     def set_voice_type(self, voice_type: str):
         """Set the voice type to use.
@@ -58,6 +110,8 @@ class VoiceManager:
         """
         if voice_type in self.voice_types:
             self.current_voice_type = voice_type
+            for action in self.voice_mappings:
+                self.preloader.prioritize(self._voice_key(voice_type, action), PRIORITY_HIGH)
     
     def get_available_voice_types(self):
         """Get list of available voice types.
@@ -87,44 +141,26 @@ class VoiceManager:
         if action not in self.voice_mappings:
             return None
         
-        voice_file = self.voice_mappings[action]
-        voice_path = os.path.join(self.voice_dir, self.current_voice_type, voice_file)
-        
-        if os.path.exists(voice_path):
-            return voice_path
-        
-        return None
+        return self._voice_paths.get(self._voice_key(self.current_voice_type, action))
     
     def _load_voice(self, action: str) -> Optional[pygame.mixer.Sound]:
-        """Load a voice file into memory.
+        """Get a decoded voice from the preloader without blocking.
         
         Args:
             action: The action to load voice for
             
         Returns:
-            pygame Sound object, or None if loading failed
+            pygame Sound object, or None if missing or still decoding
         """
         if not self.enabled:
             return None
         
-        # Check cache first
-        cache_key = f"{self.current_voice_type}_{action}"
-        if cache_key in self.voice_cache:
-            return self.voice_cache[cache_key]
-        
-        voice_path = self._get_voice_path(action)
-        if not voice_path:
+        if not self._get_voice_path(action):
             # Voice file not found - using silent fallback
             return None
         
-        try:
-            voice = pygame.mixer.Sound(voice_path)
-            voice.set_volume(self.volume)
-            self.voice_cache[cache_key] = voice
-            return voice
-        except Exception as e:
-            # Could not load voice - using silent fallback
-            return None
+        self.start_preloading()
+        return self.preloader.get(self._voice_key(self.current_voice_type, action))
     
     def play_voice(self, action: str):
         """Play a voice announcement for an action.
@@ -138,6 +174,7 @@ class VoiceManager:
         voice = self._load_voice(action)
         if voice:
             try:
+                voice.set_volume(self.volume)
                 voice.play()
             except Exception as e:
                 print(f"Warning: Could not play voice for {action}: {e}")
@@ -185,45 +222,72 @@ class VoiceManager:
             self.play_voice("your_turn")
 
     # --- Direct file playback support for EffectBus ---
+    def register_voice_files(self, voice_sounds: Dict[str, Dict[str, str]],
+                             voice_type: Optional[str] = None) -> None:
+        """Queue config-mapped voice files (``voice_sounds``) before first use.
+        
+        Args:
+            voice_sounds: voice type -> {action: file path}, as in
+                poker_sound_config.json
+            voice_type: Pack decoded first (defaults to the current voice type)
+        """
+        voice_type = voice_type or self.current_voice_type
+        for pack, table in (voice_sounds or {}).items():
+            priority = PRIORITY_HIGH if pack == voice_type else PRIORITY_LOW
+            for rel_path in (table or {}).values():
+                self._file_key(rel_path, priority)
+    
+    def _file_key(self, rel_path: str, priority: int) -> Optional[str]:
+        """Preloader key for a voice file, resolving and registering it once.
+        
+        The path is tried as-is, under voice_dir, then under backend/sounds/
+        next to this module. A file that is also a voice pack entry reuses
+        that ``voice:`` key so it is decoded and cached only once.
+        """
+        if rel_path in self._file_paths:
+            return self._file_keys.get(rel_path)
+        here = os.path.dirname(__file__)
+        chosen = resolve_sound_file(
+            rel_path,
+            [os.getcwd(), self.voice_dir, os.path.join(here, '..', 'sounds')],
+            extensions=("",),
+        )
+        self._file_paths[rel_path] = chosen
+        if not chosen:
+            return None
+        key = self._keys_by_path.get(os.path.realpath(chosen))
+        if key is None:
+            key = f"voice-file:{rel_path}"
+            self.preloader.register(key, chosen, priority)
+        self._file_keys[rel_path] = key
+        return key
+    
     def play(self, rel_path: str) -> None:
         """Play a specific audio file path (relative or absolute).
 
         This is used by the EffectBus when a config maps voice lines
-        directly to files. It attempts several resolution strategies:
-        - Absolute path as provided
-        - Relative to configured voice_dir
-        - Relative to the project's sounds directory next to this module
+        directly to files. Files registered through register_voice_files()
+        are already decoding; an unknown path is queued now and skipped
+        until it is ready rather than stalling the UI.
         """
         if not self.enabled:
             return
         try:
-            # Candidate 1: use path as-is
-            path_candidates = [rel_path]
-
-            # Candidate 2: under voice_dir
-            path_candidates.append(os.path.join(self.voice_dir, rel_path))
-
-            # Candidate 3: backend/sounds/<rel_path>
-            here = os.path.dirname(__file__)
-            path_candidates.append(os.path.join(here, '..', 'sounds', rel_path))
-
-            chosen = None
-            for p in path_candidates:
-                p_abs = os.path.abspath(p)
-                if os.path.exists(p_abs) and os.path.getsize(p_abs) > 0:
-                    chosen = p_abs
-                    break
-
-            if not chosen:
+            key = self._file_key(rel_path, PRIORITY_NOW)
+            if not key:
                 print(f"⚠️ VoiceManager: missing voice file {rel_path}")
                 return
 
+            self.start_preloading()
+            snd = self.preloader.get(key)
+            if snd is None:
+                # Still decoding in the background; skip rather than stall
+                return
             try:
-                snd = pygame.mixer.Sound(chosen)
                 snd.set_volume(self.volume)
                 snd.play()
             except Exception as e:
-                print(f"⚠️ VoiceManager: failed to play {chosen}: {e}")
+                print(f"⚠️ VoiceManager: failed to play {rel_path}: {e}")
         except Exception as e:
             print(f"⚠️ VoiceManager: error resolving {rel_path}: {e}")
     
@@ -243,8 +307,7 @@ class VoiceManager:
             volume: Volume level (0.0 to 1.0)
         """
         self.volume = max(0.0, min(1.0, volume))
-        for voice in self.voice_cache.values():
-            voice.set_volume(self.volume)
+        # Volume is applied to each voice when it is played
     
     def enable(self):
         """Enable voice announcements."""
@@ -260,4 +323,4 @@ class VoiceManager:
     
     def cleanup(self):
         """Clean up resources."""
-        self.voice_cache.clear() 
\ No newline at end of file
+        self.preloader.clear()
\ No newline at end of file
@@ -19,6 +19,14 @@ import time
 # Import our existing enums and classes
 from shared.poker_state_machine_enhanced import PokerState, ActionType, Player, GameState
 
+try:
+    from gto.solver.hand_strength import get_hand_strength_service
+except ImportError:
+    try:
+        from backend.gto.solver.hand_strength import get_hand_strength_service
+    except ImportError:  # NumPy not installed: fall back to PokerKit
+        get_hand_strength_service = None
+
 # Define HandHistoryLog for compatibility
 @dataclass
 class HandHistoryLog:
@@ -555,7 +563,18 @@ class PokerKitWrapper:
         return "low_card"
 
     def get_postflop_hand_strength(self, cards: List[str], board: List[str]) -> int:
-        """Get postflop hand strength."""
+        """Get postflop hand strength (0-100 HS percentile).
+
+        Uses the evaluator-backed hand-strength service shared with the
+        GTO bots; falls back to PokerKit when it is unavailable.
+        """
+        if get_hand_strength_service is not None and board and len(cards) == 2:
+            try:
+                hs = get_hand_strength_service().hand_strength(cards, board)
+                return int(round(hs * 100))
+            except (ValueError, KeyError, IndexError):
+                pass  # Malformed cards: use the PokerKit calculation
+
         try:
             hole_cards = [Card.parse(card) for card in cards]
             board_cards = [Card.parse(card) for card in board]
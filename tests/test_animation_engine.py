@@ -0,0 +1,82 @@
+"""
+Tests for the single-ticker AnimationEngine.
+"""
+
+from backend.ui.services.animation_engine import AnimationEngine
+from backend.ui.services.game_director import GameDirector
+
+
+class FakeCanvas:
+    """Records item offsets applied through canvas.move()."""
+
+    def __init__(self):
+        self.offsets = {}
+
+    def move(self, item, dx, dy):
+        x, y = self.offsets.get(item, (0.0, 0.0))
+        self.offsets[item] = (x + dx, y + dy)
+
+
+def test_tween_reaches_target_and_completes():
+    engine = AnimationEngine()
+    canvas = FakeCanvas()
+    done = []
+    engine.add_tween(canvas, "chip", (0, 0), (100, 50), 100,
+                     easing="linear", on_complete=lambda: done.append(True))
+
+    engine.tick(now_ms=0)
+    engine.tick(now_ms=50)
+    assert engine.active_count() == 1
+    engine.tick(now_ms=150)
+
+    assert done == [True]
+    assert engine.active_count() == 0
+    x, y = canvas.offsets["chip"]
+    assert abs(x - 100) < 1e-6 and abs(y - 50) < 1e-6
+
+
+def test_cancel_group_only_removes_that_group():
+    engine = AnimationEngine()
+    canvas = FakeCanvas()
+    engine.add_tween(canvas, "a", (0, 0), (10, 10), 100, group="pot")
+    engine.add_tween(canvas, "b", (0, 0), (10, 10), 100, group="pot")
+    engine.add_tween(canvas, "c", (0, 0), (10, 10), 100, group="cards")
+
+    assert engine.cancel_group("pot") == 2
+    assert engine.active_count() == 1
+    assert engine.get_stats()["tweens_cancelled"] == 2
+
+
+def test_game_director_update_ticks_engine():
+    engine = AnimationEngine()
+    director = GameDirector()
+    director.attach_animation_engine(engine)
+    seen = []
+    engine.add_callback(seen.append, 1000)
+
+    director.update()
+    assert engine.get_stats()["frames"] == 1
+    assert len(seen) == 1
+
+
+def test_cancelled_chip_flights_remove_their_items():
+    from backend.ui.tableview.components.chip_animations import ChipAnimations
+    from backend.ui.tableview.recording_canvas import RecordingCanvas
+
+    class Theme:
+        def get_all_tokens(self):
+            return {}
+
+    engine = AnimationEngine()
+    engine.driver_attached = True
+    canvas = RecordingCanvas()
+    chips = ChipAnimations(Theme(), engine=engine)
+    landed = []
+    chips.fly_chips_to_pot(canvas, 0, 0, 200, 100, 130, callback=lambda: landed.append(True))
+    engine.tick(now_ms=0)
+    engine.tick(now_ms=100)
+    assert canvas.find_withtag("flying_chip")
+
+    chips.stop_all_animations()
+    assert not canvas.find_withtag("temp_animation")
+    assert engine.active_count() == 0 and landed == []
@@ -0,0 +1,62 @@
+"""
+Tests for the precomputed board texture table.
+"""
+
+import random
+
+import pytest
+
+try:
+    from backend.core.board_texture import (
+        CARD_BIT, _mask_signature, board_mask, compute_texture, get_texture_table,
+    )
+except (ImportError, SyntaxError):
+    pytest.skip("backend.core is not importable on this interpreter", allow_module_level=True)
+
+
+def _reference(board):
+    """classify_board_texture as it was before the table."""
+    values = sorted("23456789TJQKA".index(c[0]) + 2 for c in board)
+    suits = [c[1] for c in board]
+    wetness = max(suits.count(s) for s in set(suits)) / len(board)
+    connected = sum(1 for a, b in zip(values, values[1:]) if b - a <= 2)
+    dynamism = connected / (len(values) - 1)
+    if wetness >= 0.6 or dynamism >= 0.7:
+        return "wet", wetness, dynamism
+    if wetness <= 0.4 and dynamism <= 0.3:
+        return "dry", wetness, dynamism
+    return "medium", wetness, dynamism
+
+
+def test_table_matches_reference_on_all_streets():
+    table = get_texture_table()
+    deck = list(CARD_BIT)
+    rng = random.Random(5)
+    for _ in range(500):
+        board = rng.sample(deck, 5)
+        flop = table.lookup_cards(board[:3])
+        mask, turn = table.extend(board_mask(board[:3]), board[3])
+        _, river = table.extend(mask, board[4])
+        for cards, texture in ((board[:3], flop), (board[:4], turn), (board, river)):
+            assert (texture.type, texture.wetness, texture.dynamism) == _reference(cards)
+            assert texture == compute_texture(_mask_signature(board_mask(cards)))
+            assert table.lookup_cards(cards) == texture
+
+
+def test_texture_features():
+    table = get_texture_table()
+    monotone = table.lookup_cards(["Ah", "Kh", "Qh"])
+    assert monotone.flush_possible and monotone.straight_possible and not monotone.flush_draw
+    assert monotone.type == "wet" and monotone.high_card == "ace"
+
+    rainbow = table.lookup_cards(["2c", "7d", "7h"])
+    assert rainbow.paired and not rainbow.trips and not rainbow.flush_draw
+    assert not rainbow.straight_draw and rainbow.high_card == "middle"
+
+    two_tone = table.lookup_cards(["9s", "8s", "2d"])
+    assert two_tone.flush_draw and two_tone.straight_draw and not two_tone.straight_possible
+    _, river = table.extend(board_mask(["9s", "8s", "2d", "3c"]), "Kh")
+    assert not river.flush_draw and not river.straight_draw
+
+    wheel = table.lookup_cards(["Ac", "2d", "4h"])
+    assert wheel.straight_possible
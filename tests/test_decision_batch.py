@@ -0,0 +1,168 @@
+"""
+Tests for the batch decision API.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from backend.core.decision_batch import decide_batch
+    from backend.core.decision_engine import GTODecisionEngine
+    from backend.core.hand_model import ActionType
+    from backend.core.poker_types import Player
+    from backend.core.pure_poker_state_machine import GameConfig
+    from backend.core.sessions.gto_session import GTOSession
+    from backend.core.strategy_engine import GTOStrategyEngine
+    from backend.gto.industry_gto_engine import IndustryGTOEngine
+    from backend.gto.unified_types import PlayerState, StandardGameState
+except (ImportError, SyntaxError):
+    pytest.skip("backend.core is not importable on this interpreter", allow_module_level=True)
+
+
+def test_decide_batch_falls_back_to_single_decisions():
+    class Single:
+        def get_decision(self, name, state):
+            return (name, state)
+
+    assert decide_batch(Single(), [("a", 1), ("b", 2)]) == [("a", 1), ("b", 2)]
+
+
+def test_strategy_engine_batch_matches_single_calls():
+    engine = GTOStrategyEngine(6)
+    hands = [["As", "Ah"], ["7c", "2d"], ["Kh", "Qh"], ["As", "Ah"]]
+    boards = [[], ["Ah", "Kd", "7c"], ["Ah", "Kd", "7c"], ["2s", "2d", "9h"]]
+    requests = []
+    for cards, board in zip(hands, boards):
+        player = Player(name="P", stack=100.0, position="BTN", is_human=False,
+                        is_active=True, cards=cards)
+        state = SimpleNamespace(street="flop" if board else "preflop", board=board,
+                                current_bet=2.0, min_raise=2.0, big_blind=2.0, pot=6.0,
+                                players=[player])
+        requests.append((player, state))
+
+    random.seed(7)
+    single = [engine.get_gto_bot_action(p, s) for p, s in requests]
+    random.seed(7)
+    assert engine.get_gto_bot_actions_batch(requests) == single
+
+
+def test_gto_decision_engine_batch_converts_each_state_once():
+    class Strategy:
+        def __init__(self):
+            self.states = []
+
+        def get_gto_bot_action(self, player, state):
+            self.states.append(state)
+            return ActionType.CALL, state.current_bet - player.current_bet
+
+    engine = GTODecisionEngine(num_players=2)
+    engine.gto_strategies = {0: Strategy(), 1: Strategy()}
+    table = {"street": "preflop", "current_bet": 2.0, "pot": 3.0,
+             "players": [{"name": "A", "current_bet": 1.0}, {"name": "B", "current_bet": 2.0}]}
+    decisions = engine.get_decisions_batch([(0, table), (1, table), (5, table), (0, table)])
+
+    assert [d["action"] for d in decisions] == [ActionType.CALL, ActionType.CALL,
+                                                ActionType.FOLD, ActionType.CALL]
+    assert decisions[0]["amount"] == 1.0 and decisions[1]["amount"] == 0.0
+    states = engine.gto_strategies[0].states + engine.gto_strategies[1].states
+    assert len({id(s) for s in states}) == 1
+
+    # Strategies with the GTOStrategyEngine batch method decide their share in one call
+    class BatchStrategy(Strategy):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def get_gto_bot_actions_batch(self, points):
+            self.batches.append(len(points))
+            return [self.get_gto_bot_action(player, state) for player, state in points]
+
+    engine.gto_strategies = {0: BatchStrategy(), 1: BatchStrategy()}
+    batched = engine.get_decisions_batch([(0, table), (1, table), (0, table)])
+    assert [(d["action"], d["amount"]) for d in batched] == [(ActionType.CALL, 1.0), (ActionType.CALL, 0.0),
+                                                            (ActionType.CALL, 1.0)]
+    assert engine.gto_strategies[0].batches == [2] and engine.gto_strategies[1].batches == [1]
+    assert callable(GTOStrategyEngine.get_gto_bot_actions_batch)
+
+
+def test_gto_decision_engine_batch_matches_single_calls_with_real_strategy():
+    engine = GTODecisionEngine(num_players=3)
+    engine.gto_strategies = {i: GTOStrategyEngine(3) for i in range(3)}
+
+    def table(street, board, current_bet):
+        return {"street": street, "board": board, "current_bet": current_bet, "pot": 6.0,
+                "big_blind": 2.0,
+                "players": [{"name": "A", "cards": ["As", "Ah"], "current_bet": 0.0, "stack": 200.0},
+                            {"name": "B", "cards": ["7c", "2d"], "current_bet": 1.0, "stack": 200.0},
+                            {"name": "C", "cards": ["Kh", "Qh"], "current_bet": 2.0, "stack": 200.0}]}
+
+    preflop, flop = table("preflop", [], 2.0), table("flop", ["Ah", "Kd", "7c"], 0.0)
+    requests = [(0, preflop), (1, preflop), (2, preflop), (0, flop), (2, flop)]
+
+    def without_counter(decisions):
+        return [{k: v for k, v in d.items() if k != "decision_number"} for d in decisions]
+
+    random.seed(3)
+    single = without_counter(engine.get_decision(*r) for r in requests)
+    random.seed(3)
+    batched = without_counter(engine.get_decisions_batch(requests))
+    assert batched == single
+    assert not any(d["explanation"].startswith("GTO engine error") for d in single)
+    assert {d["action"] for d in single} != {ActionType.FOLD}
+
+
+def test_industry_engine_batch_matches_single_calls():
+    engine = IndustryGTOEngine(player_count=2)
+
+    def state(cards, board):
+        hero = PlayerState("Hero", 100, "BTN", tuple(cards), 0, True, False)
+        return StandardGameState(pot=20, street="flop" if board else "preflop",
+                                 board=tuple(board), players=(hero,),
+                                 current_bet_to_call=5, to_act_player_index=0,
+                                 legal_actions=frozenset())
+
+    requests = [("Hero", state(["Ah", "Ad"], [])),
+                ("Hero", state(["Kh", "Qh"], ["Kd", "Kc", "2h"])),
+                ("Hero", state(["Kh", "Qh"], ["2h", "5h", "9h"])),
+                ("Hero", state(["7c", "2d"], ["Kd", "Kc", "2h"]))]
+
+    random.seed(1)
+    single = [engine.get_decision(*r) for r in requests]
+    random.seed(1)
+    assert engine.get_decisions_batch(requests) == single
+    assert engine._batch_cache is None
+
+
+def test_gto_sessions_run_a_hand_with_one_decision_call_per_step():
+    class TableEngine:
+        """Checks or calls; records how many tables each batch covered."""
+
+        def __init__(self):
+            self.batches = []
+
+        def get_decisions_batch(self, requests):
+            self.batches.append(len(requests))
+            decisions = []
+            for index, game_state in requests:
+                to_call = game_state["current_bet"] - game_state["players"][index]["current_bet"]
+                if to_call > 0:
+                    decisions.append({"action": ActionType.CALL, "amount": game_state["current_bet"]})
+                else:
+                    decisions.append({"action": ActionType.CHECK, "amount": 0.0})
+            return decisions
+
+    engine = TableEngine()
+    sessions = []
+    for seed in range(3):
+        session = GTOSession(GameConfig(num_players=2), seed=seed)
+        assert session.initialize_session()
+        session.decision_engines = {"GTO_Bot_1": engine, "GTO_Bot_2": engine}
+        sessions.append(session)
+
+    assert GTOSession.run_hands_batch(sessions) == [True, True, True]
+    assert all(session.is_hand_complete() for session in sessions)
+    assert all(len(session.fpsm.game_state.board) == 5 for session in sessions)
+    # Every step decided all three tables together
+    assert engine.batches and set(engine.batches) == {3}
@@ -0,0 +1,70 @@
+"""
+Tests for EffectQueue ordering, coalescing and drop policies.
+"""
+
+from backend.ui.services.effect_bus import Effect, EffectBus
+from backend.ui.services.effect_queue import EffectQueue
+
+
+def test_drains_by_priority_then_arrival():
+    queue = EffectQueue(coalesce_window_ms=0)
+    queue.push(Effect(type="banner", id="b1", name="hello"))
+    queue.push(Effect(type="sound", id="s1", name="CHIP_BET"))
+    queue.push(Effect(type="animation", id="a1", name="chips_to_pot"))
+    queue.push(Effect(type="sound", id="s2", name="FOLD"))
+
+    assert [e.id for e in queue.drain()] == ["s1", "s2", "a1", "b1"]
+    assert len(queue) == 0
+    assert queue.get_stats()["processed"] == 4
+
+
+def test_identical_effects_coalesce_within_window():
+    queue = EffectQueue(coalesce_window_ms=10_000)
+    first = queue.push(Effect(type="sound", id="s1", name="CHIP_BET"))
+    for i in range(4):
+        assert queue.push(Effect(type="sound", id=f"dup{i}", name="CHIP_BET")) == first
+    queue.push(Effect(type="sound", id="s2", name="FOLD"))
+
+    drained = queue.drain()
+    assert [e.id for e in drained] == ["s1", "s2"]
+    assert drained[0].args["coalesced"] == 5
+    stats = queue.get_stats()
+    assert stats["queued"] == 2 and stats["coalesced"] == 4
+
+    assert queue.coalesce_immediate("sound", "CHIP_BET") is False
+    assert queue.coalesce_immediate("sound", "CHIP_BET") is True
+
+
+def test_remove_and_drop_stale_after_seek():
+    queue = EffectQueue(coalesce_window_ms=0)
+    queue.push(Effect(type="sound", id="s1", name="BET"))
+    queue.push(Effect(type="animation", id="a1", name="chips_to_pot"))
+    queue.push(Effect(type="banner", id="b1", name="Player wins"))
+    queue.push(Effect(type="sound", id="s2", name="CALL"))
+
+    assert queue.remove("s2") is True
+    assert queue.remove("s2") is False
+    assert queue.drop_stale() == 2  # sound + animation; banner survives
+
+    assert [e.id for e in queue.drain()] == ["b1"]
+    assert queue.get_stats()["dropped"] == 2
+
+
+def test_coalesced_voice_line_is_not_published():
+    class Events:
+        def __init__(self):
+            self.published = []
+
+        def publish(self, topic, payload):
+            self.published.append((topic, payload))
+
+    bus = EffectBus(defer_audio=True)
+    bus.voice_manager = None
+    bus.queue = EffectQueue(coalesce_window_ms=10_000)
+    bus.event_bus = Events()
+    for _ in range(3):
+        bus.add_poker_action_effects("CALL", "Hero")
+    bus.add_poker_action_effects("HAND_START")
+
+    voices = [payload for topic, payload in bus.event_bus.published if topic == "effect_bus:voice"]
+    assert voices == [{"type": "POKER_ACTION", "action": "call", "player": "Hero"}]
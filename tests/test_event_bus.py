@@ -0,0 +1,55 @@
+"""
+Tests for EventBus wildcard topics, deferred dispatch and stats.
+"""
+
+from backend.ui.services.event_bus import EventBus
+
+
+def test_exact_wildcard_and_prefix_subscriptions():
+    bus = EventBus()
+    seen = []
+    bus.subscribe("s1:ui:action", lambda p: seen.append(("exact", p)))
+    bus.subscribe("s1:*:action", lambda p: seen.append(("one", p)))
+    unsub = bus.subscribe_prefix("s1", lambda p: seen.append(("prefix", p)))
+
+    bus.publish("s1:ui:action", 1)
+    assert sorted(seen) == [("exact", 1), ("one", 1), ("prefix", 1)]
+
+    seen.clear()
+    bus.publish("s1:ui:other", 2)
+    bus.publish("s2:ui:action", 3)
+    assert seen == [("prefix", 2)]
+
+    unsub()
+    seen.clear()
+    bus.publish("s1:ui:other", 4)
+    assert seen == []
+    assert not bus.has_subscribers("s1:ui:other")
+
+
+def test_deferred_events_wait_for_drain():
+    bus = EventBus()
+    seen = []
+    bus.subscribe("frame:tick", seen.append)
+    bus.publish_deferred("frame:tick", 1)
+    bus.publish_deferred("frame:tick", 2)
+    bus.publish_deferred("nobody:listens", 3)
+    assert seen == []
+    assert bus.pending_deferred() == 2
+
+    assert bus.drain_deferred() == 2
+    assert seen == [1, 2]
+
+
+def test_publish_counts_and_handler_latency():
+    bus = EventBus()
+    bus.subscribe("a:b", lambda p: None)
+    bus.profiling = True
+    for _ in range(3):
+        bus.publish("a:b", None)
+    bus.publish("no:subs", None)
+
+    topics = bus.get_stats()["topics"]
+    assert topics["a:b"]["published"] == 3
+    assert topics["a:b"]["handler_calls"] == 3
+    assert topics["no:subs"] == {"published": 1}
@@ -0,0 +1,80 @@
+"""
+Tests for GameDirector fast-forward (turbo) playback.
+"""
+
+import time
+
+from backend.ui.services.game_director import GameDirector
+
+
+def _director(total_steps):
+    director = GameDirector()
+    clock = {"now": time.monotonic_ns()}
+    director._now_ns = lambda: clock["now"]
+    director.set_total_steps(total_steps)
+    advanced, rendered = [], []
+    director.set_advance_callback(advanced.append)
+    director.set_step_change_callback(rendered.append)
+    return director, clock, advanced, rendered
+
+
+def test_turbo_speed_skips_gates_and_renders_final_state():
+    director, clock, advanced, rendered = _director(50)
+    director.set_speed(5.0)
+    assert director.fast_forward is True
+
+    director.gate_begin()
+    assert director.schedule(300, {"type": "SOUND_COMPLETE"}) == "skipped"
+    assert director._gate_count == 0
+
+    director.play()
+    for _ in range(5):
+        clock["now"] += 16_000_000
+        director.update()
+        if director.current_step == 50:
+            break
+
+    assert director.current_step == 50
+    assert advanced == list(range(1, 51))
+    assert rendered[-1] == 50
+    assert len(rendered) < len(advanced)
+
+
+def test_returning_to_1x_restores_gating():
+    director, _, _, _ = _director(10)
+    director.set_speed(4.0)
+    director.set_speed(2.0)
+    assert director.fast_forward is True  # still turbo until 1x
+
+    director.set_speed(1.0)
+    assert director.fast_forward is False
+    director.gate_begin()
+    assert director._gate_count == 1
+    assert director.schedule(100, {"type": "SOUND_COMPLETE"}) != "skipped"
+
+
+def test_fast_forward_to_renders_once():
+    director, _, advanced, rendered = _director(30)
+    director.fast_forward_to(25)
+    assert advanced == list(range(1, 26))
+    assert rendered == [25]
+
+
+def test_fast_forward_toggle_keeps_a_single_autoplay_chain():
+    director, clock, advanced, _ = _director(1000)
+    director.set_autoplay_interval(100)
+    director.play()
+    director.set_speed(4.0)
+    director.set_speed(1.0)
+    director.play()  # pressing play again must not add a chain either
+
+    for _ in range(1000):  # one second of 1 ms frames
+        clock["now"] += 1_000_000
+        director.update()
+
+    # Turbo may have advanced a batch; at 1x a 100 ms interval is 10 steps/s
+    before = len(advanced)
+    for _ in range(1000):
+        clock["now"] += 1_000_000
+        director.update()
+    assert len(advanced) - before == 10
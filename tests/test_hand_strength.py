@@ -0,0 +1,123 @@
+"""
+Tests for the evaluator-backed hand-strength service.
+"""
+
+import random
+from collections import Counter
+from itertools import combinations
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.gto.solver.evaluator import evaluate7
+from backend.gto.solver.hand_classes import card_index
+from backend.gto.solver.hand_strength import HandStrengthService
+
+
+def _brute_force_hs(hole, board):
+    hole = [card_index(c) for c in hole]
+    board = [card_index(c) for c in board]
+    hero = evaluate7(np.array([hole + board]))[0]
+    rest = [c for c in range(52) if c not in hole + board]
+    opp = evaluate7(np.array([list(o) + board for o in combinations(rest, 2)]))
+    return (np.count_nonzero(hero > opp) + 0.5 * np.count_nonzero(hero == opp)) / len(opp)
+
+
+def test_strength_matches_brute_force_and_sees_straights():
+    service = HandStrengthService()
+    for hole, board in [(["9h", "8h"], ["7c", "6d", "5s"]),
+                        (["Ac", "Kd"], ["Ah", "7c", "2s", "Td"]),
+                        (["2c", "7d"], ["Ah", "Kd", "Qs", "Jc", "3h"])]:
+        assert service.hand_strength(hole, board) == pytest.approx(_brute_force_hs(hole, board))
+
+    assert service.hand_strength(["9h", "8h"], ["7c", "6d", "5s"]) > 0.95
+    assert service.hand_strength(["Ah", "Kh"], ["Qh", "Jh", "Th"]) == 1.0
+
+
+def test_suit_isomorphic_spots_share_the_cache():
+    service = HandStrengthService()
+    first = service.hand_strength(["Ah", "Kh"], ["Qh", "7h", "2c"])
+    assert service.hand_strength(["As", "Ks"], ["2d", "Qs", "7s"]) == first
+    stats = service.get_stats()
+    assert stats["spots"]["hits"] == 1 and stats["boards"]["size"] == 1
+
+    with pytest.raises(ValueError):
+        service.hand_strength(["Ah", "Ah"], ["Qh", "7h", "2c"])
+
+
+def test_potential_for_draws_and_made_hands():
+    service = HandStrengthService()
+    draw = service.evaluate(["9h", "8h"], ["7h", "6c", "2h"], potential=True)
+    made = service.evaluate(["Ac", "Ad"], ["As", "7c", "2d"], potential=True)
+    assert draw["ppot"] > made["ppot"] and made["npot"] < 0.1
+    assert draw["hs2"] > draw["hs"] ** 2  # draws gain from variance
+    assert 0.0 <= made["hs2"] <= 1.0
+
+    river = service.evaluate(["Ac", "Ad"], ["As", "7c", "2d", "9h", "Ts"], potential=True)
+    assert river["ppot"] == river["npot"] == 0.0
+
+
+def _random_flops(count, seed):
+    deck = [r + s for r in "23456789TJQKA" for s in "cdhs"]
+    rng = random.Random(seed)
+    for _ in range(count):
+        cards = rng.sample(deck, 5)
+        yield cards[:2], cards[2:]
+
+
+def _shares(actions):
+    counts = Counter(actions)
+    return {name: counts[name] / len(actions) for name in counts}
+
+
+def test_strategy_engine_postflop_frequencies_on_the_percentile_scale():
+    try:
+        from backend.core.poker_types import Player
+        from backend.core.strategy_engine import GTOStrategyEngine
+    except (ImportError, SyntaxError):
+        pytest.skip("backend.core is not importable on this interpreter")
+
+    engine = GTOStrategyEngine(6)
+    checked_to, facing_bet = [], []
+    for hole, board in _random_flops(600, seed=5):
+        player = Player(name="P", stack=1000.0, position="BTN", is_human=False,
+                        is_active=True, cards=hole)
+        state = SimpleNamespace(street="flop", board=board, current_bet=0.0, min_raise=2.0,
+                                big_blind=2.0, pot=20.0, players=[player])
+        checked_to.append(engine.get_gto_bot_action(player, state)[0].name)
+        # Pot-sized odds of 25%: the HS call floor decides the folds
+        state = SimpleNamespace(street="flop", board=board, current_bet=10.0, min_raise=10.0,
+                                big_blind=2.0, pot=30.0, players=[player])
+        facing_bet.append(engine.get_gto_bot_action(player, state)[0].name)
+
+    checked_to, facing_bet = _shares(checked_to), _shares(facing_bet)
+    assert checked_to["BET"] == pytest.approx(0.45, abs=0.06)
+    assert facing_bet["RAISE"] == pytest.approx(0.20, abs=0.05)
+    assert facing_bet["FOLD"] == pytest.approx(0.30, abs=0.06)
+    assert facing_bet["CALL"] == pytest.approx(0.50, abs=0.07)
+
+
+def test_industry_engine_postflop_frequencies_on_the_percentile_scale():
+    try:
+        from backend.gto.industry_gto_engine import IndustryGTOEngine
+        from backend.gto.unified_types import PlayerState, StandardGameState
+    except (ImportError, SyntaxError):
+        pytest.skip("backend.core is not importable on this interpreter")
+
+    engine = IndustryGTOEngine(player_count=2)
+    random.seed(0)  # bluffs
+    facing_bet = []
+    for hole, board in _random_flops(600, seed=5):
+        hero = PlayerState("Hero", 1000, "BTN", tuple(hole), 0, True, False)
+        state = StandardGameState(pot=20, street="flop", board=tuple(board), players=(hero,),
+                                  current_bet_to_call=10, to_act_player_index=0,
+                                  legal_actions=frozenset())
+        facing_bet.append(engine.get_decision("Hero", state)[0].name)
+
+    # Value bets with the top ~15%, continues with the better half, bluffs 15% of the rest
+    shares = _shares(facing_bet)
+    assert shares["BET"] == pytest.approx(0.15 + 0.5 * 0.15, abs=0.06)
+    assert shares["CALL"] == pytest.approx(0.35, abs=0.06)
+    assert shares["FOLD"] == pytest.approx(0.5 * 0.85, abs=0.06)
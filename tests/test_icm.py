@@ -0,0 +1,58 @@
+"""
+Tests for the ICM engine and push/fold charts.
+"""
+
+import pytest
+
+try:
+    from backend.core.sessions.icm import ICMCalculator, build_push_fold_chart
+except (ImportError, SyntaxError) as e:  # backend.core needs Python 3.12+
+    pytest.skip(f"backend.core unavailable: {e}", allow_module_level=True)
+
+
+def test_malmuth_harville_known_values_and_cache():
+    calc = ICMCalculator([50, 30, 20])
+    ev = calc.equities([5000, 3000, 2000])
+    assert ev == pytest.approx([38.392857, 32.75, 28.857143], abs=1e-5)
+    assert calc.equities([5000, 3000, 2000]) == ev
+    assert calc.get_stats()["hits"] == 1
+
+    assert calc.equities([100, 100, 100]) == pytest.approx([100 / 3] * 3)
+    assert calc.equities([100, 0, 100]) == pytest.approx([40, 0, 40])  # busted stack, places left unfilled
+    with pytest.raises(ValueError):
+        calc.equities([100, -1])
+
+
+def test_final_table_exact_and_sampled_agree():
+    payouts = [40, 25, 15, 10, 5, 3, 2]
+    stacks = [10, 20, 30, 40, 50, 60, 70, 80, 90]
+    calc = ICMCalculator(payouts)
+    assert calc.exact_states(len(stacks)) < 1000
+
+    exact = calc.equities(stacks)
+    assert sum(exact) == pytest.approx(sum(payouts))
+    assert exact == sorted(exact)  # more chips, more money, less than proportionally
+    assert exact[-1] / exact[0] < stacks[-1] / stacks[0]
+
+    sampled = ICMCalculator(payouts, samples=20000).equities(stacks, approximate=True)
+    assert sampled == pytest.approx(exact, abs=0.5)
+
+    field = ICMCalculator(payouts, max_exact_states=100, samples=500)
+    assert sum(field.equities([1000] * 60)) == pytest.approx(sum(payouts))
+
+
+def test_push_fold_chart_tightens_under_icm():
+    np = pytest.importorskip("numpy")
+    from backend.gto.solver.equity import compute_equity_matrix
+
+    eq = compute_equity_matrix(rounds=32)
+    chip_ev = build_push_fold_chart(ICMCalculator([100]), [10, 10], 0, 1, [0.5, 1], equity_matrix=eq)
+    bubble = build_push_fold_chart(ICMCalculator([50, 30, 20]), [10, 10, 10, 10], 2, 3,
+                                   [0, 0, 0.5, 1], equity_matrix=eq)
+
+    for chart in (chip_ev, bubble):
+        assert chart.action(["Ah", "Ad"]) == "push"
+        assert chart.action(["Ah", "Ad"], facing_shove=True) == "call"
+        assert chart.action(["7c", "2d"], facing_shove=True) == "fold"
+    assert len(bubble.call_range()) < len(chip_ev.call_range())
+    assert np.isfinite(list(bubble.push_margin.values())).all()
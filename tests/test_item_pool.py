@@ -0,0 +1,91 @@
+"""
+Tests for canvas item pooling in the seat, bet and pot painters.
+"""
+
+import contextlib
+import io
+
+from backend.ui.tableview.components.bet_display import BetDisplay
+from backend.ui.tableview.components.dealer_button import DealerButton
+from backend.ui.tableview.components.item_pool import POOL_TAG, ItemPool
+from backend.ui.tableview.components.pot_display import PotDisplay
+from backend.ui.tableview.components.seats import Seats
+from backend.ui.tableview.components.table_felt import TableFelt
+from backend.ui.tableview.layer_manager import LayerManager
+from backend.ui.tableview.recording_canvas import HeadlessCanvasManager, RecordingCanvas
+from backend.ui.tableview.renderer_pipeline import RendererPipeline
+
+
+def test_pool_reuses_changes_and_hides_items():
+    canvas = RecordingCanvas()
+    pool = ItemPool("t")
+
+    pool.begin(canvas)
+    a = pool.item((0, "bg"), "oval", (0, 0, 10, 10), tags=("layer:seats",), fill="red")
+    b = pool.scope(0, "label").create_text(5, 5, text="P1", tags="layer:seats")
+    pool.end()
+
+    canvas.reset_counts()
+    pool.begin(canvas)
+    assert pool.item((0, "bg"), "oval", (0, 0, 10, 10), tags=("layer:seats",), fill="red") == a
+    pool.end()
+    # Unchanged item: no Tk traffic; the unused label gets hidden once
+    assert canvas.ops["coords"] == 0 and canvas.created == 0
+    assert canvas.itemcget(b, "state") == "hidden"
+
+    pool.begin(canvas)
+    pool.item((0, "bg"), "oval", (1, 1, 11, 11), tags=("layer:seats",), fill="blue")
+    assert pool.scope(0, "label").create_text(5, 5, text="P2", tags="layer:seats") == b
+    pool.end()
+    assert canvas.coords(a) == [1.0, 1.0, 11.0, 11.0]
+    assert canvas.itemcget(a, "fill") == "blue"
+    assert canvas.itemcget(b, "state") == "normal" and canvas.itemcget(b, "text") == "P2"
+    assert POOL_TAG in canvas.gettags(a)
+
+    # Items deleted behind the pool's back are recreated
+    canvas.delete("all")
+    pool.begin(canvas)
+    assert pool.item((0, "bg"), "oval", (0, 0, 10, 10), fill="red") != a
+    pool.end()
+
+
+def _state(frame, seats):
+    acting = frame % seats
+    return {
+        "seats": [
+            {
+                "name": f"P{i}",
+                "stack": 1000 - 10 * ((frame + i) % 7),
+                "cards": ["As", "Kd"],
+                "position": ("SB", "BB", "BTN")[i % 3],
+                "current_bet": 20 * ((frame + i) % 3),
+                "acting": i == acting,
+            }
+            for i in range(seats)
+        ],
+        "pot": {"amount": 30 + 50 * (frame % 20)},
+        "dealer": {"position": frame % seats},
+    }
+
+
+def test_item_counts_stay_flat_over_many_hands():
+    cm = HeadlessCanvasManager()
+    pooled = [Seats(), BetDisplay(), PotDisplay(), DealerButton()]
+    pipeline = RendererPipeline(cm, LayerManager(cm.canvas, None), [TableFelt()] + pooled)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in range(60):
+            pipeline.render_once(_state(frame, 6))
+        live = len(cm.canvas.items)
+        pool_sizes = [len(c.pool) for c in pooled]
+        ids_before = max(cm.canvas.items)
+        for frame in range(60, 600):
+            pipeline.render_once(_state(frame, 6))
+
+    assert len(cm.canvas.items) == live
+    assert [len(c.pool) for c in pooled] == pool_sizes
+    # Only the unpooled felt allocates new ids each frame
+    felt_per_frame = len(cm.canvas.find_withtag("!" + POOL_TAG))
+    assert max(cm.canvas.items) - ids_before == felt_per_frame * 540
+    # The pot badge and dealer button survive the pipeline's clear
+    assert cm.canvas.find_withtag("pot_text") and cm.canvas.find_withtag("dealer_button")
@@ -0,0 +1,55 @@
+"""
+Tests for the precomputed preflop lookup.
+"""
+
+import pytest
+
+try:
+    from backend.core.preflop_lookup import (
+        CARD_INDEX, GRID, HAND_CLASSES, lookup, lookup_cards, normalize_notation, tier_for_strength,
+    )
+    from backend.core.gui_models import HandFormatHelper, StrategyData
+except (ImportError, SyntaxError) as e:  # backend.core needs Python 3.12+
+    pytest.skip(f"backend.core unavailable: {e}", allow_module_level=True)
+
+
+def test_every_combo_in_both_orders_and_as_ints():
+    seen = set()
+    for a, ia in CARD_INDEX.items():
+        for b, ib in CARD_INDEX.items():
+            if a == b:
+                assert lookup(ia, ib) is None
+                continue
+            entry = lookup(a, b)
+            assert entry == lookup(b, a) == lookup(ia, ib)
+            assert HAND_CLASSES[entry.index] == entry.notation
+            seen.add(frozenset((a, b)))
+    assert len(seen) == 1326 and len(HAND_CLASSES) == 169
+
+    assert lookup_cards(["Ah", "Kh"]).notation == "AKs"
+    assert lookup_cards(["Td", "Tc"]).notation == "TT"
+    assert lookup_cards(["7c", "2d"]).notation == "72o"
+    assert lookup_cards(["Ah"]) is None and lookup_cards(["Xx", "Ah"]) is None
+
+
+def test_grid_layout_strength_and_tiers():
+    assert GRID[0][0] == "AA" and GRID[0][1] == "AKs" and GRID[1][0] == "AKo"
+    assert GRID[12][12] == "22"
+
+    aces = lookup("Ah", "Ad")
+    assert aces.strength == 95 and aces.tier == "Premium"
+    assert lookup("7c", "2d").strength == 57 and lookup("7c", "2d").tier == "Playable"
+    assert tier_for_strength(10) is None
+    assert tier_for_strength(65) == ("Strong", 65, 79)
+
+
+def test_normalization_and_strategy_tiers():
+    assert normalize_notation("AhKs") == "AKo"
+    assert normalize_notation("kas") == "AKs"
+    assert HandFormatHelper.normalize_hand_format(" AhKh ") == "AKs"
+    assert HandFormatHelper.normalize_hand_format("TT") == "TT"
+    assert HandFormatHelper.normalize_hand_format("xyz") == "XYZ"
+
+    data = StrategyData()
+    data._create_tiers_from_strategy({"hand_strength_tables": {"preflop": {"AA": 100, "72o": 10, "KQs": 70}}})
+    assert {t.name: t.hands for t in data.tiers} == {"Premium": {"AA"}, "Strong": {"KQs"}}
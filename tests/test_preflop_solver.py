@@ -0,0 +1,85 @@
+"""
+Tests for the vectorized preflop CFR solver.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.gto.solver import (
+    CFR_PLUS, OPEN_3BET, GameConfig, PreflopSolver, compute_equity_matrix,
+    to_gto_preflop_ranges,
+)
+from backend.gto.solver.evaluator import FLUSH, FULL_HOUSE, STRAIGHT, category, evaluate7
+from backend.gto.solver.hand_classes import (
+    CLASS_COMBOS, CLASS_INDEX, HAND_CLASSES, blocker_matrix, card_index, hand_class,
+)
+
+
+@pytest.fixture(scope="module")
+def equity():
+    return compute_equity_matrix(rounds=16, seed=3)
+
+
+def _score(hand):
+    return evaluate7(np.array([[card_index(c) for c in hand.split()]]))[0]
+
+
+def test_evaluator_and_hand_classes():
+    assert category(_score("Ac 2d 3h 4s 5c Kc Kd")) == STRAIGHT
+    assert category(_score("2h 5h 9h Jh Kh Ac Ad")) == FLUSH
+    assert category(_score("Ks Kd Kh Qc Qd Qh 3c")) == FULL_HOUSE
+    assert _score("Kc Kd 7h 7s 2c 2d Ah") > _score("Kc Kd 7h 7s 2c 2d Qh")
+
+    assert len(HAND_CLASSES) == 169 and CLASS_COMBOS.sum() == 1326
+    assert hand_class(["Kd", "As"]) == "AKo" and hand_class(["7h", "2h"]) == "72s"
+    blockers = blocker_matrix()
+    assert blockers[CLASS_INDEX["AA"], CLASS_INDEX["AA"]] == 6
+    assert blockers[CLASS_INDEX["AA"], CLASS_INDEX["KK"]] == 36
+
+
+def test_heads_up_push_fold_converges(equity):
+    solver = PreflopSolver(GameConfig(players=2, stack_bb=10), equity=equity)
+    stats = solver.solve(150, eval_every=50)
+
+    history = [h["exploitability_bb"] for h in solver.history]
+    assert history[-1] < history[0] and stats["exploitability_mbb"] < 5
+    assert stats["iterations_per_sec"] > 0
+
+    ranges = to_gto_preflop_ranges(solver)
+    assert set(ranges) == {"SB", "BB"}
+    assert set(ranges["SB"]) == {"rfi", "vs_rfi", "vs_three_bet"}
+    shove = ranges["SB"]["rfi"]
+    assert "AA" in shove["range"] and "72o" not in shove["range"]
+    assert 0.45 < len(shove["range"]) / 169 < 0.8
+    call = ranges["BB"]["vs_rfi"]["range"]
+    assert "KK" in call and len(call) < len(shove["range"])
+
+
+def test_checkpoint_resume_matches_uninterrupted_run(equity, tmp_path):
+    config = GameConfig(game=OPEN_3BET, players=3, stack_bb=40)
+    straight = PreflopSolver(config, equity=equity, algorithm=CFR_PLUS)
+    straight.solve(12, eval_every=0)
+
+    first = PreflopSolver(config, equity=equity, algorithm=CFR_PLUS)
+    path = str(tmp_path / "solve.npz")
+    first.solve(7, eval_every=0, checkpoint_path=path)
+    resumed = PreflopSolver.from_checkpoint(path, equity=equity)
+    resumed.solve(5, eval_every=0)
+
+    assert resumed.iteration == 12
+    for a, b in zip(straight.average_strategy(), resumed.average_strategy()):
+        np.testing.assert_allclose(a, b)
+
+    other = PreflopSolver(GameConfig(players=3, stack_bb=40), equity=equity)
+    with pytest.raises(ValueError):
+        other.load_checkpoint(path)
+
+
+def test_nine_handed_open_three_bet_tree(equity):
+    solver = PreflopSolver(GameConfig(game=OPEN_3BET, players=9, stack_bb=100), equity=equity)
+    assert len(solver.decisions) == 116
+    solver.solve(3, eval_every=0)
+    ranges = to_gto_preflop_ranges(solver)
+    assert list(ranges) == ["UTG", "UTG+1", "UTG+2", "MP", "MP+1", "CO", "BTN", "SB", "BB"]
+    assert ranges["BB"]["rfi"]["range"] == []
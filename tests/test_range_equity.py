@@ -0,0 +1,64 @@
+"""
+Tests for range-vs-range equity.
+"""
+
+from itertools import combinations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.gto.solver.evaluator import evaluate7
+from backend.gto.solver.hand_classes import COMBOS, card_index
+from backend.gto.solver.range_equity import RangeEquityEngine, combo_weights
+
+
+def _brute_force(range_a, range_b, board):
+    board = [card_index(c) for c in board]
+    wa, wb = combo_weights(range_a), combo_weights(range_b)
+    rest = [c for c in range(52) if c not in board]
+    win = total = 0.0
+    for runout in combinations(rest, 5 - len(board)):
+        full = board + list(runout)
+        for i in np.flatnonzero(wa):
+            for j in np.flatnonzero(wb):
+                cards = set(COMBOS[i]) | set(COMBOS[j])
+                if len(cards) < 4 or cards & set(full):
+                    continue
+                a = evaluate7(np.array([list(COMBOS[i]) + full]))[0]
+                b = evaluate7(np.array([list(COMBOS[j]) + full]))[0]
+                w = wa[i] * wb[j]
+                win += w * ((a > b) + 0.5 * (a == b))
+                total += w
+    return win / total
+
+
+def test_heads_up_turn_is_exact_and_cached_across_suits():
+    engine = RangeEquityEngine(workers=1)
+    hero, villain = {"AKs": 1.0, "AKo": 0.5}, ["QQ", "T9s"]
+    board = ["Ah", "Qc", "Ts", "9d"]
+    equity = engine.equity([hero, villain], board)
+    assert equity[0] == pytest.approx(_brute_force(hero, villain, board))
+    assert sum(equity) == pytest.approx(1.0)
+
+    assert engine.equity([hero, villain], ["As", "Qd", "Th", "9c"]) == equity
+    assert engine.get_stats()["hits"] == 1
+
+
+def test_sampled_preflop_and_card_removal():
+    engine = RangeEquityEngine(samples=20000, workers=1)
+    aa, kk = engine.equity([["AA"], ["KK"]])
+    assert aa == pytest.approx(0.82, abs=0.015)
+
+    # Exact hole cards against a range: with three kings dead, only AcAs is left
+    equity = engine.equity([["Ah", "Ad"], ["AA", "KK"]], dead=["Kc", "Kd", "Ks"])
+    assert equity[0] == pytest.approx(0.5, abs=0.02)
+    with pytest.raises(ValueError):
+        engine.equity([["Ah", "Ad"], ["AA"]], board=["Ac", "As", "2d"])
+
+
+def test_multiway_on_a_process_pool():
+    with RangeEquityEngine(samples=6000, workers=2) as engine:
+        equity = engine.equity([["AA"], ["KK"], ["QQ"]], board=["2c", "7d", "9h"])
+    assert sum(equity) == pytest.approx(1.0)
+    assert equity[0] > equity[1] > equity[2]
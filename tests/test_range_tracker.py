@@ -0,0 +1,67 @@
+"""
+Tests for Bayesian range tracking.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from backend.gto.solver.hand_classes import CLASS_INDEX
+from backend.gto.solver.range_tracker import RangeTracker, StrategyEnginePolicy
+
+
+class FakeEngine:
+    """Just enough of GTOStrategyEngine for the policy: premium pairs open."""
+
+    gto_preflop_ranges = {"BTN": {"rfi": {"range": ["AA", "KK"], "freq": 1.0}}}
+
+    def is_hand_in_range(self, hand, range_list):
+        return hand in range_list
+
+    def get_preflop_hand_strength(self, cards):
+        return 90 if cards[0][0] == cards[1][0] else 50
+
+
+def test_dead_cards_and_reveal():
+    tracker = RangeTracker(3)
+    tracker.deal_board(["As", "Kd", "7c"])
+    assert np.count_nonzero(tracker.weights[0]) == 1326 - 3 * 51 + 3
+    tracker.reveal(1, ["Ah", "Ac"])
+    assert np.count_nonzero(tracker.weights[1]) == 1
+    assert tracker.class_weights(2)[CLASS_INDEX["AA"]] == 0.0  # three aces gone
+
+
+def test_actions_narrow_ranges_through_the_policy():
+    tracker = RangeTracker(2, StrategyEnginePolicy(FakeEngine(), floor=0.0))
+    tracker.observe_action(0, "RAISE", position="BTN", spot="rfi")
+    weights = tracker.class_weights(0)
+    assert set(np.flatnonzero(weights > 0)) == {CLASS_INDEX["AA"], CLASS_INDEX["KK"]}
+
+    tracker.observe_action(1, "fold", position="BTN", spot="rfi")
+    assert tracker.class_weights(1)[CLASS_INDEX["AA"]] == 0.0
+
+    # Postflop: a bet is a strong hand on this board
+    tracker.reset()
+    board = ["Qs", "Jh", "2c"]
+    tracker.deal_board(board)
+    tracker.observe_action(0, SimpleNamespace(value="BET"), street="flop", board=board,
+                           facing_bet=False)
+    weights = tracker.class_weights(0)
+    assert weights[CLASS_INDEX["QQ"]] > 0 and weights[CLASS_INDEX["AQo"]] > 0
+    assert weights[CLASS_INDEX["73o"]] == 0 and weights[CLASS_INDEX["65s"]] == 0
+    assert tracker.strength_vs_range(["7d", "3d"], 0, board) < 0.1
+
+
+def test_nine_seats_update_under_a_millisecond():
+    tracker = RangeTracker(9, StrategyEnginePolicy(FakeEngine()))
+    board = ["9s", "8s", "2d"]
+    tracker.deal_board(board)
+    tracker.observe_action(0, "bet", street="flop", board=board, facing_bet=False)  # warm cache
+
+    start = time.perf_counter()
+    for i in range(90):
+        tracker.observe_action(i % 9, "call", street="flop", board=board, pot_odds=0.25)
+    assert (time.perf_counter() - start) / 90 < 1e-3
@@ -0,0 +1,66 @@
+"""
+Tests for the headless recording canvas and render benchmark.
+"""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+
+from backend.ui.tableview.layer_manager import LayerManager
+from backend.ui.tableview.recording_canvas import HeadlessCanvasManager, RecordingCanvas
+from backend.ui.tableview.renderer_pipeline import RendererPipeline
+from backend.ui.tableview.components.seats import Seats
+from backend.ui.tableview.components.table_felt import TableFelt
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_canvas_records_items_tags_and_stacking():
+    c = RecordingCanvas(400, 300)
+    a = c.create_oval(0, 0, 10, 10, fill="red", tags=("layer:seats", "seat:0"))
+    b = c.create_text((5, 5), text="hi", tags="layer:overlay")
+    d = c.create_rectangle(0, 0, 20, 20, tags=("layer:felt",))
+
+    c.coords(a, 1, 2, 11, 12)
+    c.itemconfig("seat:0", fill="blue")
+    assert c.coords(a) == [1.0, 2.0, 11.0, 12.0]
+    assert c.itemcget(a, "fill") == "blue"
+    assert c.find_withtag("layer:overlay") == (b,)
+
+    c.tag_raise("layer:felt")
+    c.tag_raise("layer:seats")
+    assert c.find_all() == (b, d, a)
+
+    c.delete("layer:overlay")
+    assert b not in c.items and c.deleted == 1
+    c.delete("all")
+    assert not c.items
+    assert c.get_stats()["created"] == 3
+    assert c.ops["create_oval"] == 1 and c.ops["tag_raise"] == 2
+
+
+def test_pipeline_renders_headlessly():
+    cm = HeadlessCanvasManager(width=1000, height=700)
+    pipeline = RendererPipeline(cm, LayerManager(cm.canvas, None), [TableFelt(), Seats()])
+    state = {"seats": [{"name": f"P{i}", "stack": 500, "cards": ["As", "Kd"]} for i in range(6)]}
+    with contextlib.redirect_stdout(io.StringIO()):
+        pipeline.render_once(state)
+    assert cm.canvas.created > 0
+    tagged = cm.canvas.find_withtag("layer:seats")
+    assert tagged
+
+
+def test_benchmark_reports_items_and_component_ms():
+    out = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "backend", "tools", "render_benchmark.py"),
+         "--seats", "2", "9", "--frames", "3", "--json"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    results = json.loads(out)
+    assert [r["seats"] for r in results] == [2, 9]
+    assert results[1]["items_per_frame"] > results[0]["items_per_frame"]
+    assert "Seats" in results[0]["components"]
+    assert all("ms_mean" in c for c in results[0]["components"].values())
@@ -0,0 +1,103 @@
+"""
+Tests for the per-component render profiler.
+"""
+
+import contextlib
+import io
+import json
+
+from backend.ui.tableview.layer_manager import LayerManager
+from backend.ui.tableview.recording_canvas import HeadlessCanvasManager
+from backend.ui.tableview.render_profiler import OVERLAY_TAG, RenderProfiler
+from backend.ui.tableview.renderer_pipeline import RendererPipeline
+
+
+class Dots:
+    def __init__(self, count):
+        self.count = count
+
+    def render(self, state, canvas_manager, layer_manager):
+        for i in range(self.count):
+            canvas_manager.canvas.create_oval(i, i, i + 4, i + 4, tags=("layer:seats",))
+
+
+class Labels(Dots):
+    def render(self, state, canvas_manager, layer_manager):
+        for i in range(self.count):
+            canvas_manager.canvas.create_text(i, i, text="x", tags=("layer:status",))
+
+
+def _render(pipeline, frames):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(frames):
+            pipeline.render_once({})
+
+
+def test_records_percentiles_and_items_per_component():
+    profiler = RenderProfiler(window=10, enabled=True)
+    cm = HeadlessCanvasManager()
+    pipeline = RendererPipeline(cm, LayerManager(cm.canvas, None), [Dots(3), Labels(5)], profiler)
+    _render(pipeline, 12)
+
+    stats = profiler.stats()
+    assert stats["Dots"]["samples"] == 10  # rolling window
+    assert stats["Dots"]["items_p50"] == 3
+    assert stats["Labels"]["items_p95"] == 5
+    assert stats["frame"]["items_p50"] == 8
+    assert stats["frame"]["p95_ms"] >= stats["frame"]["p50_ms"] >= 0
+    assert profiler.frames == 12
+    assert json.loads(profiler.to_json())["sections"]["Dots"]["items_p50"] == 3
+
+
+def test_disabled_profiler_records_nothing_and_overlay_toggles():
+    profiler = RenderProfiler()
+    cm = HeadlessCanvasManager()
+    pipeline = RendererPipeline(cm, LayerManager(cm.canvas, None), [Dots(2)], profiler)
+    _render(pipeline, 2)
+    assert profiler.stats() == {}
+
+    assert profiler.toggle_overlay() is True and profiler.enabled
+    _render(pipeline, 2)
+    assert len(cm.canvas.find_withtag(OVERLAY_TAG)) == 2
+    assert "Dots" in "\n".join(profiler.overlay_lines())
+
+    profiler.toggle_overlay()
+    _render(pipeline, 1)
+    assert not cm.canvas.find_withtag(OVERLAY_TAG)
+
+
+def test_f3_is_bound_once_per_app_and_toggles_each_profiler_once():
+    from types import SimpleNamespace
+
+    from backend.ui.renderers.poker_table_renderer import PokerTableRenderer
+
+    class Root:
+        def __init__(self):
+            self.bindings = {}
+
+        def bind_all(self, sequence, callback, add=None):
+            self.bindings.setdefault(sequence, []).append(callback)
+
+    class Table:
+        _bind_profiler_keys = PokerTableRenderer._bind_profiler_keys
+
+        def __init__(self, root, profiler):
+            self.root = root
+            self.renderer = SimpleNamespace(profiler=profiler)
+            self.redraws = 0
+
+        def _root(self):
+            return self.root
+
+        def _redraw_profiler_overlay(self):
+            self.redraws += 1
+
+    root, profiler = Root(), RenderProfiler()
+    practice, gto = Table(root, profiler), Table(root, profiler)
+    practice._bind_profiler_keys()
+    gto._bind_profiler_keys()
+    assert len(root.bindings["<F3>"]) == len(root.bindings["<Shift-F3>"]) == 1
+
+    root.bindings["<F3>"][0](None)
+    assert profiler.overlay_visible
+    assert practice.redraws == gto.redraws == 1
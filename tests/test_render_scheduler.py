@@ -0,0 +1,71 @@
+"""
+Tests for RenderScheduler frame coalescing.
+"""
+
+from backend.ui.services.render_scheduler import RenderScheduler
+from backend.ui.services.timer_manager import TimerManager
+
+
+class FakeRoot:
+    """Minimal stand-in for Tk after()/after_cancel()."""
+
+    def __init__(self):
+        self.pending = {}
+        self._next = 0
+
+    def after(self, ms, fn):
+        self._next += 1
+        after_id = f"after#{self._next}"
+        self.pending[after_id] = fn
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        for after_id, fn in list(self.pending.items()):
+            self.pending.pop(after_id, None)
+            fn()
+
+
+def test_multiple_dispatches_render_once():
+    root = FakeRoot()
+    rendered = []
+    scheduler = RenderScheduler(TimerManager(root), rendered.append)
+
+    for i in range(5):
+        scheduler.mark_dirty({"step": i})
+    assert rendered == []
+    assert len(root.pending) == 1
+
+    root.run_pending()
+    assert rendered == [{"step": 4}]
+    stats = scheduler.get_stats()
+    assert stats["frames_rendered"] == 1
+    assert stats["frames_merged"] == 4
+    assert stats["pending"] is False
+
+
+def test_flush_renders_immediately_and_cancels_frame():
+    root = FakeRoot()
+    rendered = []
+    timers = TimerManager(root)
+    scheduler = RenderScheduler(timers, rendered.append)
+
+    scheduler.mark_dirty({"step": 1})
+    scheduler.flush()
+    assert rendered == [{"step": 1}]
+    assert root.pending == {}
+    assert timers._after_ids == set()
+
+
+def test_fired_timers_are_forgotten():
+    root = FakeRoot()
+    timers = TimerManager(root)
+    scheduler = RenderScheduler(timers, lambda state: None)
+
+    for i in range(3):
+        scheduler.mark_dirty({"step": i})
+        root.run_pending()
+    assert timers._after_ids == set()
+    assert scheduler.get_stats()["frames_rendered"] == 3
@@ -0,0 +1,163 @@
+"""
+Tests for the precomputed hands review timeline.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend.ui.services.replay_timeline import (
+    TimelineBuilder,
+    TimelineCache,
+    compile_timeline,
+    thaw,
+)
+
+
+class FakeGameState:
+    def __init__(self, names):
+        self.players = [
+            SimpleNamespace(name=n, stack=100, current_bet=0, total_invested=0,
+                            cards=["As", "Kd"], has_folded=False, is_all_in=False,
+                            position=i)
+            for i, n in enumerate(names)
+        ]
+        self.board = []
+        self.street = "preflop"
+
+    def displayed_pot(self):
+        return sum(p.total_invested for p in self.players)
+
+
+class FakePPSM:
+    """Scripted stand-in with the PPSM surface compile_timeline relies on."""
+
+    def __init__(self, script):
+        self.game_state = FakeGameState(["P1", "P2"])
+        self.action_player_index = 0
+        self.dealer_position = 0
+        self.current_state = SimpleNamespace(name="PREFLOP_BETTING")
+        self.script = script
+        self.replays = 0
+
+    def start_hand(self):
+        self.action_player_index = 0
+
+    def execute_action(self, player, action_type, to_amount=None):
+        if to_amount:
+            player.stack -= to_amount - player.current_bet
+            player.total_invested += to_amount - player.current_bet
+            player.current_bet = to_amount
+        if action_type == "FOLD":
+            player.has_folded = True
+            self.current_state = SimpleNamespace(name="END_HAND")
+        self.action_player_index = 1 - self.action_player_index
+        return True
+
+    def replay_hand_model(self, hand, on_step=None):
+        self.replays += 1
+        self.start_hand()
+        on_step(None)
+        players = self.game_state.players
+        for i, (action_type, amount) in enumerate(self.script):
+            ok = self.execute_action(players[i % 2], action_type, amount)
+            on_step({"actor": players[i % 2].name, "action_type": action_type,
+                     "amount": amount, "ok": ok})
+        return {"errors": []}
+
+
+def make_hand(hand_id="H1"):
+    return SimpleNamespace(metadata=SimpleNamespace(hand_id=hand_id),
+                           seats=[None, None])
+
+
+def test_compile_records_a_step_per_action():
+    ppsm = FakePPSM([("RAISE", 6), ("CALL", 6), ("FOLD", None)])
+    timeline = compile_timeline(make_hand(), ppsm)
+
+    # Blinds snapshot + three actions; the fold already ends the hand
+    assert timeline.total_actions == 3
+    assert timeline[0].action is None
+    assert timeline[1].action["action_type"] == "RAISE"
+    assert timeline[1].state["seats"][0]["current_bet"] == 6
+    assert timeline[2].state["pot"]["amount"] == 12
+    assert timeline.state_at(99) is timeline[-1].state
+    assert timeline[-1].state["street"] == "SHOWDOWN"
+    assert "street" in timeline[-1].diff["keys"]
+    assert timeline[3].state["seats"][0]["folded"] is True
+    assert [e.get("name") for e in timeline[3].effects][-2:] == ["chips_to_pot", "pot_to_winner"]
+
+    # Recorded through the on_step hook; the PPSM itself is left untouched
+    assert "execute_action" not in vars(ppsm)
+    assert "start_hand" not in vars(ppsm)
+
+    # States are read-only; thaw gives a mutable copy
+    with pytest.raises(TypeError):
+        timeline[1].state["pot"]["amount"] = 0
+    state = thaw(timeline[1].state)
+    state["pot"]["amount"] = 0
+    assert timeline[1].state["pot"]["amount"] == 6
+
+
+def test_builder_diffs_and_effects():
+    builder = TimelineBuilder("H")
+    base = {"street": "PREFLOP", "seats": [{"stack": 100, "bet": 0}],
+            "pot": {"amount": 0}, "board": []}
+    builder.add(base)
+    builder.add(dict(base, seats=[{"stack": 90, "bet": 10}], pot={"amount": 10}),
+                action={"actor": "P1", "action_type": "BET", "amount": 10})
+    builder.add(dict(base, street="FLOP", seats=[{"stack": 90, "bet": 0}],
+                     pot={"amount": 10}, board=["Ah", "Kh", "2c"]))
+    # Identical final snapshot is dropped
+    assert builder.add(dict(base, street="FLOP", seats=[{"stack": 90, "bet": 0}],
+                            pot={"amount": 10}, board=["Ah", "Kh", "2c"]),
+                       final=True) is False
+    timeline = builder.build()
+
+    assert len(timeline) == 3
+    assert timeline[1].diff["seats"] == {0: ("stack", "bet")}
+    assert [e["type"] for e in timeline[1].effects] == ["sound", "animate"]
+    assert timeline[2].effects[-1]["name"] == "chips_to_pot"
+    assert set(timeline[2].diff["keys"]) == {"street", "seats", "board"}
+
+
+def test_cache_is_lru_per_hand_id():
+    cache = TimelineCache(maxsize=2)
+    ppsm = FakePPSM([("CALL", 2)])
+    compile_hand = lambda hid: (lambda: compile_timeline(make_hand(hid), FakePPSM([("CALL", 2)])))
+
+    first = cache.get_or_compile("A", lambda: compile_timeline(make_hand("A"), ppsm))
+    assert cache.get_or_compile("A", lambda: compile_timeline(make_hand("A"), ppsm)) is first
+    assert ppsm.replays == 1
+
+    cache.get_or_compile("B", compile_hand("B"))
+    cache.get("A")
+    cache.get_or_compile("C", compile_hand("C"))
+    assert cache.get("B") is None and cache.get("A") is first
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 3
+
+
+def test_compile_through_the_real_ppsm_step_hook(monkeypatch):
+    import json
+    import os
+
+    # The PPSM imports its siblings as top-level ``core``, as the app does
+    backend_dir = os.path.join(os.path.dirname(__file__), "..", "backend")
+    monkeypatch.syspath_prepend(backend_dir)
+    try:
+        from core.hand_model import Hand
+    except (ImportError, SyntaxError):
+        pytest.skip("backend.core is not importable on this interpreter")
+
+    path = os.path.join(backend_dir, "test_hand_with_flop.json")
+    with open(path) as f:
+        hand = Hand.from_dict(json.load(f)[0])
+    timeline = compile_timeline(hand)
+
+    # Blinds snapshot, one step per executed action, then the final state
+    assert timeline[0].action is None
+    actions = [step.action for step in timeline if step.action]
+    assert len(actions) == timeline.total_actions
+    assert all(a["ok"] for a in actions)
+    assert actions[0]["actor"] == "Player1"
+    assert actions[-1]["action_type"] == "FOLD"
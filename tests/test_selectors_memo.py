@@ -0,0 +1,74 @@
+"""
+Tests for memoized selectors and structural sharing in reducers.
+"""
+
+from backend.ui.state import selectors
+from backend.ui.state.actions import (
+    SET_POT, SET_REVIEW_STATUS, UPDATE_ENHANCED_RPGW_STATE
+)
+from backend.ui.state.reducers import root_reducer
+
+
+def _state():
+    return {
+        "pot": {"amount": 10},
+        "review": {"status": "idle"},
+        "enhanced_rpgw": {
+            "seats": [{"player_uid": "p1", "name": "Alice", "current_stack": 100}],
+            "board": ["As", "Kd", "7c"],
+        },
+    }
+
+
+def test_reducer_returns_same_state_when_nothing_changes():
+    state = _state()
+    assert root_reducer(state, {"type": SET_POT, "amount": 10}) is state
+    assert root_reducer(state, {"type": SET_REVIEW_STATUS, "status": "idle"}) is state
+
+
+def test_reducer_preserves_unchanged_sub_objects():
+    state = _state()
+    new_state = root_reducer(state, {
+        "type": UPDATE_ENHANCED_RPGW_STATE,
+        "updates": {"board": ["As", "Kd", "7c", "2h"]},
+    })
+    assert new_state is not state
+    assert new_state["pot"] is state["pot"]
+    assert new_state["enhanced_rpgw"]["seats"] is state["enhanced_rpgw"]["seats"]
+
+
+def test_enhanced_rpgw_state_is_memoized_on_identity():
+    state = _state()
+    first = selectors.enhanced_rpgw_state(state)
+    assert selectors.enhanced_rpgw_state(state) is first
+    changed = root_reducer(state, {
+        "type": UPDATE_ENHANCED_RPGW_STATE, "updates": {"board": []},
+    })
+    assert selectors.enhanced_rpgw_state(changed) is not first
+
+
+def test_seat_view_reuses_output_for_unchanged_seats():
+    state = _state()
+    view = selectors.seat_view(state, "p1")
+    assert view["name"] == "Alice"
+    assert selectors.seat_view(state, "p1") is view
+    changed = root_reducer(state, {
+        "type": UPDATE_ENHANCED_RPGW_STATE,
+        "updates": {"seats": [dict(state["enhanced_rpgw"]["seats"][0])]},
+    })
+    assert selectors.seat_view(changed, "p1") is view
+
+
+def test_seat_view_cache_is_bounded():
+    state = _state()
+    for i in range(selectors.MAX_SEAT_VIEWS * 3):
+        selectors.seat_view(state, f"uid-{i}")
+    assert len(selectors._seat_view_cache) == selectors.MAX_SEAT_VIEWS
+    assert "uid-0" not in selectors._seat_view_cache
+
+
+def test_seat_positions_are_cached_per_geometry():
+    first = selectors.get_seat_positions({}, seat_count=6, canvas_width=800, canvas_height=600)
+    again = selectors.get_seat_positions({}, seat_count=6, canvas_width=800, canvas_height=600)
+    assert first is again
+    assert len(first) == 6
@@ -0,0 +1,134 @@
+"""
+Tests for the background sound preloader and its byte-budgeted LRU.
+"""
+
+import pytest
+
+from backend.utils.sound_preloader import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    SoundPreloader,
+    resolve_sound_file,
+)
+
+
+def _fixed_size(size):
+    return lambda sound, path: size
+
+
+def test_decodes_in_priority_order_and_get_never_blocks():
+    order = []
+    preloader = SoundPreloader(lambda p: order.append(p) or p, start=False)
+    preloader.register("low", "low.wav", PRIORITY_LOW)
+    preloader.register("normal", "normal.wav", PRIORITY_NORMAL)
+    preloader.register("high", "high.wav", PRIORITY_HIGH)
+
+    # Nothing decoded yet: get() returns immediately and bumps the key
+    assert preloader.get("low") is None
+    assert order == []
+
+    preloader.start()
+    assert preloader.wait_idle()
+    preloader.stop()
+    assert order == ["low.wav", "high.wav", "normal.wav"]
+    assert preloader.get("high") == "high.wav"
+    stats = preloader.get_stats()
+    assert stats["decoded"] == 3
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_lru_respects_byte_budget():
+    preloader = SoundPreloader(
+        lambda p: p, budget_bytes=250, size_of=_fixed_size(100), start=False
+    )
+    for key in ("a", "b", "c"):
+        preloader.register(key, f"{key}.wav")
+    preloader.get_blocking("a")
+    preloader.get_blocking("b")
+    preloader.get("a")  # a becomes most recently used
+    preloader.get_blocking("c")
+
+    stats = preloader.get_stats()
+    assert stats["cached"] == 2
+    assert stats["cached_bytes"] == 200
+    assert stats["evictions"] == 1
+    assert preloader.get("a") == "a.wav"
+    assert preloader.get("b") is None
+
+
+def test_failed_decode_is_not_retried():
+    calls = []
+
+    def broken(path):
+        calls.append(path)
+        raise RuntimeError("bad file")
+
+    preloader = SoundPreloader(broken, start=False)
+    preloader.register("x", "x.wav")
+    assert preloader.get_blocking("x") is None
+    assert preloader.get_blocking("x") is None
+    assert calls == ["x.wav"]
+    assert preloader.get_stats()["failed"] == 1
+
+
+def test_resolve_sound_file_tries_extensions(tmp_path):
+    (tmp_path / "chip.wav").write_bytes(b"RIFF")
+    (tmp_path / "empty.wav").write_bytes(b"")
+    assert resolve_sound_file("chip", [str(tmp_path)]) == str(tmp_path / "chip.wav")
+    assert resolve_sound_file("empty.wav", [str(tmp_path)]) is None
+    assert resolve_sound_file("missing", [str(tmp_path)]) is None
+
+
+class _FakeSound:
+    def __init__(self, path):
+        self.path = path
+        self.plays = 0
+
+    def set_volume(self, volume):
+        pass
+
+    def play(self):
+        self.plays += 1
+
+
+def test_effect_bus_decodes_sounds_off_the_calling_thread():
+    from backend.ui.services.effect_bus import EffectBus
+
+    bus = EffectBus(defer_audio=True)
+    decoded = []
+    bus.preloader = SoundPreloader(lambda p: decoded.append(p) or _FakeSound(p), start=False)
+    bus.pygame_available = True
+    bus._load_sounds()
+
+    # Registering queues the files; nothing is decoded synchronously
+    assert decoded == []
+    # Actions mapped to the same file share one preloader entry
+    assert bus.sounds["BET"] == bus.sounds["CALL"]
+
+    bus.preloader.start()
+    assert bus.preloader.wait_idle()
+    bus.preloader.stop()
+    assert len(decoded) == len(set(bus.sounds.values()))
+
+    bus.add_sound_effect("CHECK")
+    assert bus.preloader.get(bus.sounds["CHECK"]).plays == 1
+
+
+def test_config_voice_files_are_decoded_before_first_play():
+    pytest.importorskip("pygame")
+    from backend.utils.voice_manager import VoiceManager
+
+    preloader = SoundPreloader(_FakeSound, start=False)
+    voices = VoiceManager(preloader=preloader)
+    voices.register_voice_files({
+        "announcer_female": {"call": "voice/announcer_female/call.wav"},
+    })
+    # Same file as the voice pack entry: no second registration
+    assert not preloader.has_path("voice-file:voice/announcer_female/call.wav")
+
+    preloader.start()
+    assert preloader.wait_idle()
+    preloader.stop()
+    voices.play("voice/announcer_female/call.wav")
+    assert preloader.get("voice:announcer_female_call").plays == 1
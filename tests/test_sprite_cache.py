@@ -0,0 +1,42 @@
+"""
+Tests for the chip/card sprite cache.
+"""
+
+from backend.ui.tableview.components.sprite_cache import (
+    SpriteCache, get_chip_sprite
+)
+
+
+def test_lru_eviction_and_hits():
+    cache = SpriteCache(max_entries=2)
+    built = []
+
+    def builder(name):
+        def build():
+            built.append(name)
+            return name
+        return build
+
+    assert cache.get("a", builder("a")) == "a"
+    assert cache.get("b", builder("b")) == "b"
+    assert cache.get("a", builder("a")) == "a"  # hit, "a" now most recent
+    cache.get("c", builder("c"))                 # evicts "b"
+    cache.get("b", builder("b"))
+    assert built == ["a", "b", "c", "b"]
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["entries"] == 2
+
+
+def test_theme_change_clears_cache():
+    cache = SpriteCache()
+    cache.set_theme("Forest")
+    cache.get("a", lambda: "a")
+    cache.set_theme("Forest")
+    assert len(cache) == 1
+    cache.set_theme("Ruby")
+    assert len(cache) == 0
+
+
+def test_non_tk_canvas_falls_back_to_primitives():
+    assert get_chip_sprite(object(), 14, "#111", "#222", "#333", "#444") is None
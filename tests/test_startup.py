@@ -0,0 +1,42 @@
+"""
+Tests for startup timing and background hand library loading.
+"""
+
+from backend.ui.services.hands_repository import HandsRepository
+from backend.ui.services.startup_profiler import FIRST_WINDOW, StartupProfiler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_profiler_reports_first_window_and_phase_costs():
+    clock = FakeClock()
+    profiler = StartupProfiler(clock=clock)
+    with profiler.phase("theme_manager"):
+        clock.now += 0.020
+    clock.now += 0.005
+    assert profiler.mark(FIRST_WINDOW) == 25.0
+    with profiler.phase("audio", deferred=True):
+        clock.now += 0.040
+    profiler.record("hands (background)", 12.5, deferred=True)
+
+    report = profiler.report()
+    assert report["time_to_first_window_ms"] == 25.0
+    assert report["blocking_ms"] == 20.0
+    assert report["deferred_ms"] == 52.5
+    assert [p["name"] for p in report["phases"]] == ["theme_manager", "audio", "hands (background)"]
+    assert "time to first window: 25.0 ms" in profiler.format_report()
+
+
+def test_background_load_matches_synchronous_load():
+    eager = HandsRepository()
+    lazy = HandsRepository(background=True)
+    assert lazy.wait_until_loaded(timeout=10)
+    assert lazy.is_loaded() and eager.is_loaded()
+    assert lazy.get_stats() == eager.get_stats()
+    assert lazy.get_collections() == eager.get_collections()
@@ -0,0 +1,130 @@
+"""
+Tests for the strategy compiler and hot reload.
+"""
+
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+try:
+    from backend.core.strategy_compiler import (
+        HAND_CLASSES, StrategyWatcher, compile_file, compile_strategy, compiled_path,
+    )
+except (ImportError, SyntaxError) as e:  # backend.core needs Python 3.12+
+    pytest.skip(f"backend.core unavailable: {e}", allow_module_level=True)
+
+REPO_STRATEGY = os.path.join(os.path.dirname(__file__), "..", "backend", "modern_strategy.json")
+
+
+@pytest.fixture
+def strategy_file(tmp_path):
+    path = tmp_path / "strategy.json"
+    shutil.copy(REPO_STRATEGY, path)
+    return str(path)
+
+
+def test_compiled_tables_match_source_rules(strategy_file):
+    with open(strategy_file) as f:
+        source = json.load(f)
+    compiled = compile_file(strategy_file)
+    assert len(compiled.hand_strength) == len(HAND_CLASSES) == 169
+
+    preflop_hs = source["hand_strength_tables"]["preflop"]
+    for position, rule in source["preflop"]["open_rules"].items():
+        for hand in ("AA", "72o", "KQs"):
+            action, sizing = compiled.open_decision(position, hand)
+            assert action == ("raise" if preflop_hs.get(hand, 0) >= rule["threshold"] else "fold")
+            assert sizing == rule["sizing"]
+    assert compiled.vs_raise_decision("BTN", "AA")[0] == "raise"
+    assert compiled.open_decision("XX", "AA") == ("fold", 0.0)
+
+
+def test_cache_is_reused_until_source_changes(strategy_file):
+    first = compile_file(strategy_file)
+    assert os.path.exists(compiled_path(strategy_file))
+    assert compile_file(strategy_file) == first
+
+    with open(strategy_file) as f:
+        source = json.load(f)
+    source["preflop"]["open_rules"]["UTG"]["threshold"] = 0
+    with open(strategy_file, "w") as f:
+        json.dump(source, f)
+    second = compile_file(strategy_file)
+    assert second.source_hash != first.source_hash
+    assert second.open_decision("UTG", "72o")[0] == "raise"
+
+
+def test_watcher_swaps_on_change_and_keeps_strategy_on_bad_file(strategy_file):
+    watcher = StrategyWatcher(strategy_file)
+    seen = []
+    watcher.add_listener(lambda compiled, strategy: seen.append(compiled))
+    original = watcher.current
+    assert not watcher.poll()
+
+    with open(strategy_file, "w") as f:
+        f.write("{ not json")
+    os.utime(strategy_file, ns=(1, 1))
+    assert not watcher.poll() and watcher.current is original
+
+    strategy = compile_strategy({"hand_strength_tables": {"preflop": {"AA": 50}},
+                                 "preflop": {"open_rules": {"BTN": {"threshold": 40, "sizing": 2.5}}}})
+    assert strategy.open_decision("BTN", "AA") == ("raise", 2.5)
+    with open(strategy_file, "w") as f:
+        json.dump({"hand_strength_tables": {"preflop": {"AA": 50}},
+                   "preflop": {"open_rules": {"BTN": {"threshold": 40, "sizing": 2.5}}}}, f)
+    os.utime(strategy_file, ns=(2, 2))
+    assert watcher.poll()
+    assert watcher.reload_count == 1 and seen == [watcher.current]
+    assert watcher.current.open_decision("BTN", "AA") == ("raise", 2.5)
+    assert watcher.current.open_decision("UTG", "AA")[0] == "fold"
+
+
+def test_wrong_shape_keeps_strategy_and_polling_continues(strategy_file):
+    watcher = StrategyWatcher(strategy_file, interval=0.01)
+    original = watcher.current
+    with open(strategy_file, "w") as f:
+        json.dump({"preflop": {"open_rules": {"BTN": 5}}}, f)
+    os.utime(strategy_file, ns=(1, 1))
+    assert not watcher.poll() and watcher.current is original
+
+    # The polling thread survives the bad edit and picks up the next good one
+    watcher.start()
+    try:
+        with open(strategy_file, "w") as f:
+            json.dump({"preflop": {"open_rules": {"BTN": {"threshold": 0, "sizing": 3}}}}, f)
+        os.utime(strategy_file, ns=(2, 2))
+        deadline = time.time() + 5
+        while watcher.reload_count == 0 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+    assert watcher.current.open_decision("BTN", "72o") == ("raise", 3.0)
+
+
+def test_strategy_data_swaps_dict_tiers_and_tables_together(strategy_file):
+    from backend.core.gui_models import StrategyData
+
+    data = StrategyData()
+    assert data.load_strategy_from_file(strategy_file)
+    watcher = data.watch_strategy_file(interval=60)
+    try:
+        data.watch_strategy_file(interval=60)
+        assert len(watcher._listeners) == 1
+
+        with open(strategy_file) as f:
+            source = json.load(f)
+        source["hand_strength_tables"]["preflop"] = {"AA": 90, "72o": 25}
+        with open(strategy_file, "w") as f:
+            json.dump(source, f)
+        os.utime(strategy_file, ns=(1, 1))
+        assert watcher.poll()
+        assert data.compiled is watcher.current
+        assert data.strategy_dict is watcher.strategy
+        assert [(t.name, t.hands) for t in data.tiers] == [("Premium", {"AA"}), ("Marginal", {"72o"})]
+    finally:
+        data.stop_watching()
+        watcher.stop()
+    assert watcher._listeners == []
@@ -0,0 +1,59 @@
+"""
+Tests for suit-isomorphic spot canonicalization and the spot cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from backend.core.poker_types import Player
+    from backend.core.strategy_engine import GTOStrategyEngine
+    from backend.gto.suit_isomorphism import (
+        SpotCache, canonical_board, canonical_flops, canonical_key, get_spot_cache,
+    )
+except (ImportError, SyntaxError):
+    pytest.skip("backend.core is not importable on this interpreter", allow_module_level=True)
+
+
+def test_isomorphic_spots_share_a_key():
+    assert canonical_key(["Ah", "Kh"], ["Qh", "7h", "2c"]) == \
+        canonical_key(["Ks", "As"], ["2d", "Qs", "7s"])
+    assert canonical_key(["Ah", "Kh"], ["Qh", "7h", "2c"]) != \
+        canonical_key(["Ah", "Kd"], ["Qh", "7h", "2c"])
+    # Turn and river are distinct streets
+    assert canonical_board(["2c", "5d", "9h", "Kc", "Ah"]) != \
+        canonical_board(["2c", "5d", "9h", "Ah", "Kc"])
+
+
+def test_there_are_1755_distinct_flops():
+    flops = canonical_flops()
+    assert len(flops) == 1755
+    assert sum(flops.values()) == 22100
+
+
+def test_spot_cache_is_lru_and_reports_hit_rate():
+    cache = SpotCache(maxsize=2)
+    start = cache.snapshot()
+    for key in ["a", "b", "a", "c", "b"]:
+        cache.get_or_compute(key, lambda: key.upper())
+    stats = cache.get_stats(since=start)
+    assert (stats["hits"], stats["misses"], len(cache)) == (1, 4, 2)
+    assert stats["hit_rate"] == pytest.approx(0.2)
+
+
+def test_postflop_decisions_are_shared_across_suit_permutations():
+    engine = GTOStrategyEngine(6)
+    cache = get_spot_cache()
+
+    def act(cards, board):
+        player = Player(name="P", stack=100.0, position="BTN", is_human=False,
+                        is_active=True, cards=cards)
+        state = SimpleNamespace(street="flop", board=board, current_bet=0.0,
+                                min_raise=2.0, big_blind=2.0, pot=10.0, players=[player])
+        return engine.get_gto_bot_action(player, state)
+
+    first = act(["Ah", "Ad"], ["Ac", "7h", "2s"])
+    start = cache.snapshot()
+    assert act(["As", "Ac"], ["Ad", "7s", "2h"]) == first
+    assert cache.get_stats(since=start)["hits"] == 2
@@ -0,0 +1,68 @@
+"""
+Tests for the flattened, cached theme compiler.
+"""
+
+import json
+from pathlib import Path
+
+from backend.ui.services.theme_compiler import ThemeCompiler, flatten_tokens
+from backend.ui.services.theme_loader import ThemeLoader
+
+
+SHIPPED_PACK = Path(__file__).resolve().parents[1] / "backend" / "data" / "poker_themes.json"
+
+
+def _write_pack(path, felt="#112233"):
+    shipped = json.loads(SHIPPED_PACK.read_text(encoding="utf-8"))
+    palette = dict(shipped["themes"][0]["palette"], felt=felt)
+    pack = {
+        "version": "1.0",
+        "defaults": shipped.get("defaults", {}),
+        "themes": [
+            {"id": "alpha", "name": "Alpha", "palette": palette},
+            {"id": "beta", "name": "Beta", "palette": dict(palette)},
+        ],
+    }
+    path.write_text(json.dumps(pack), encoding="utf-8")
+
+
+def test_flatten_expands_nested_paths():
+    flat = flatten_tokens({"a.b": "top", "a": {"b": "nested", "c": {"d": 1}}, "x": "y"})
+    assert flat["a.b"] == "nested"
+    assert flat["a.c.d"] == 1
+    assert flat["a"] == {"b": "nested", "c": {"d": 1}}
+    assert flat["x"] == "y"
+
+
+def test_themes_compile_lazily_and_hit_disk_cache(tmp_path):
+    source = tmp_path / "poker_themes.json"
+    cache = tmp_path / "compiled.json"
+    _write_pack(source)
+
+    compiler = ThemeCompiler(ThemeLoader(str(source)), str(cache))
+    themes = compiler.lazy_themes()
+    assert list(themes) == ["Alpha", "Beta"]
+    assert themes.built_names() == []
+
+    alpha = themes["Alpha"]
+    assert alpha["theme.id"] == "alpha"
+    assert compiler.compiled_count == 1
+    assert cache.exists()
+
+    warm = ThemeCompiler(ThemeLoader(str(source)), str(cache))
+    assert warm.lazy_themes()["Alpha"] == alpha
+    assert warm.compiled_count == 0
+    assert warm.cache_hits == 1
+
+
+def test_cache_invalidated_when_source_changes(tmp_path):
+    source = tmp_path / "poker_themes.json"
+    cache = tmp_path / "compiled.json"
+    _write_pack(source)
+    ThemeCompiler(ThemeLoader(str(source)), str(cache)).compile("Alpha")
+
+    _write_pack(source, felt="#998877")
+    compiler = ThemeCompiler(ThemeLoader(str(source)), str(cache))
+    compiler.compile("Alpha")
+    assert compiler.compiled_count == 1
+    assert compiler.cache_hits == 0
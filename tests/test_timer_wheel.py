@@ -0,0 +1,79 @@
+"""
+Tests for the hierarchical timer wheel and GameDirector scheduling.
+"""
+
+import random
+import time
+
+from backend.ui.services.game_director import GameDirector
+from backend.ui.services.timer_wheel import TimerWheel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.monotonic_ns()
+
+    def __call__(self):
+        return self.now
+
+    def advance_ms(self, ms):
+        self.now += int(ms * 1_000_000)
+
+
+def test_batches_due_timers_in_due_order_across_levels():
+    clock = FakeClock()
+    wheel = TimerWheel(clock_ns=clock)
+    wheel.schedule(30_000, "far")       # lands on a higher level
+    wheel.schedule(10, "b")
+    wheel.schedule(5, "a")
+    wheel.schedule(10, "c")
+
+    assert wheel.advance() == []
+    clock.advance_ms(10)
+    assert wheel.advance() == ["a", "b", "c"]
+    clock.advance_ms(29_989)
+    assert wheel.advance() == []
+    clock.advance_ms(1)
+    assert wheel.advance() == ["far"]
+    assert wheel.get_stats()["batches"] == 2
+
+
+def test_cancel_is_real_and_matches_brute_force():
+    rng = random.Random(7)
+    clock = FakeClock()
+    wheel = TimerWheel(clock_ns=clock)
+    pending = {}
+    for _ in range(2000):
+        if rng.random() < 0.4:
+            delay = rng.choice([0, 3, 50, 700, 20_000, 90_000]) * rng.random()
+            tid = wheel.schedule(delay, None)
+            wheel._timers[tid].payload = tid
+            pending[tid] = clock.now + int(delay * 1_000_000)
+        if pending and rng.random() < 0.1:
+            tid = rng.choice(sorted(pending))
+            assert wheel.cancel(tid)
+            del pending[tid]
+        clock.advance_ms(rng.choice([1, 16, 16, 400, 5_000]) * rng.random())
+        for tid in wheel.advance():
+            assert pending.pop(tid) <= clock.now
+        assert all(due > clock.now - 1_000_000 for due in pending.values())
+    assert len(wheel) == len(pending)
+
+
+def test_director_cancel_and_latency_histogram():
+    director = GameDirector()
+    clock = FakeClock()
+    director._now_ns = clock
+    fired = []
+    keep = director.schedule(100, {"type": "X"}, callback=lambda: fired.append("keep"))
+    drop = director.schedule(100, {"type": "X"}, callback=lambda: fired.append("drop"))
+    director.cancel(drop)
+
+    clock.advance_ms(103)
+    director.update()
+    assert fired == ["keep"]
+    assert keep != drop
+
+    stats = director.get_scheduler_stats()
+    assert stats["dispatched"] == 1 and stats["cancelled"] == 1
+    assert stats["latency_histogram"]["<=4ms"] == 1